@@ -0,0 +1,30 @@
+"""Add order_index to the contentsections start_seconds index as a tie-breaker
+
+Revision ID: 1e6b9d3f4a52
+Revises: 8c2f6a1d4b97
+Create Date: 2026-10-17 21:14:08.630512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1e6b9d3f4a52'
+down_revision: Union[str, None] = '8c2f6a1d4b97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # get_section_at_async는 ORDER BY start_seconds DESC, order_index DESC LIMIT 1
+    # 시작 시각이 같은 섹션이 있어도 결과가 항상 같고, 정렬 없이 인덱스 역방향 탐색 한 번으로 끝나도록 order_index를 포함
+    op.create_index('ix_contentsections_content_id_start_seconds_order_index', 'contentsections', ['content_id', 'start_seconds', 'order_index'], unique=False)
+    op.drop_index('ix_contentsections_content_id_start_seconds', table_name='contentsections')
+
+
+def downgrade() -> None:
+    op.create_index('ix_contentsections_content_id_start_seconds', 'contentsections', ['content_id', 'start_seconds'], unique=False)
+    op.drop_index('ix_contentsections_content_id_start_seconds_order_index', table_name='contentsections')
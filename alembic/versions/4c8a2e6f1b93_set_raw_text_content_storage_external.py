@@ -0,0 +1,56 @@
+"""Store learningcontent.raw_text_content uncompressed out-of-line for chunked reads
+
+Revision ID: 4c8a2e6f1b93
+Revises: 1e6b9d3f4a52
+Create Date: 2026-10-17 21:32:47.118094
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c8a2e6f1b93'
+down_revision: Union[str, None] = '1e6b9d3f4a52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+REWRITE_BATCH_SIZE = 100 # 배치당 learningcontent 행 수 (raw_text_content가 행마다 수 MB일 수 있어 다른 backfill보다 작게)
+
+# 배치 하나의 raw_text_content를 다시 써서 EXTERNAL(비압축)로 저장합니다. 반환값은 배치의 마지막 id (다음 배치 시작점)
+REWRITE_BATCH_SQL = sa.text("""
+WITH batch AS (
+    SELECT id
+    FROM learningcontent
+    WHERE raw_text_content IS NOT NULL AND (CAST(:after AS uuid) IS NULL OR id > CAST(:after AS uuid))
+    ORDER BY id
+    LIMIT :batch_size
+), rewritten AS (
+    UPDATE learningcontent l
+    SET raw_text_content = l.raw_text_content || ''
+    FROM batch
+    WHERE l.id = batch.id
+)
+SELECT id FROM batch ORDER BY id DESC LIMIT 1
+""")
+
+
+def upgrade() -> None:
+    # iter_raw_text는 substr로 값을 나누어 읽음. 압축된(EXTENDED) TOAST 값은 substr 호출마다 앞부분부터 압축을 풀어야 하므로
+    # 전체 읽기가 O(n^2)가 됨. EXTERNAL은 압축 없이 out-of-line으로 저장해 필요한 위치까지의 청크만 읽음
+    op.execute("ALTER TABLE learningcontent ALTER COLUMN raw_text_content SET STORAGE EXTERNAL")
+    # SET STORAGE는 이후 저장되는 값에만 적용되므로 기존 값을 다시 써서 비압축으로 저장
+    # id 순으로 REWRITE_BATCH_SIZE 건씩, 배치마다 commit 하여 행 락과 WAL을 한 트랜잭션에 몰지 않음 (중단 후 재실행 가능)
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        after = None
+        while True:
+            after = bind.execute(REWRITE_BATCH_SQL, {"after": after, "batch_size": REWRITE_BATCH_SIZE}).scalar()
+            if after is None:
+                break
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE learningcontent ALTER COLUMN raw_text_content SET STORAGE EXTENDED")
@@ -0,0 +1,28 @@
+"""Add keyset pagination indexes on learningcontent
+
+Revision ID: 5b1e7c93d2a4
+Revises: a326e836a285
+Create Date: 2026-10-17 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e7c93d2a4'
+down_revision: Union[str, None] = 'a326e836a285'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_learningcontent_created_at_id', 'learningcontent', ['created_at', 'id'], unique=False)
+    op.create_index('ix_learningcontent_certificate_id_created_at_id', 'learningcontent', ['certificate_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_learningcontent_certificate_id_created_at_id', table_name='learningcontent')
+    op.drop_index('ix_learningcontent_created_at_id', table_name='learningcontent')
@@ -0,0 +1,36 @@
+"""Add generated tsvector column with GIN index on contentsections
+
+Revision ID: 7a3f9c1d5e28
+Revises: e2d9b4f7a610
+Create Date: 2026-10-17 13:20:41.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a3f9c1d5e28'
+down_revision: Union[str, None] = 'e2d9b4f7a610'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # STORED generated column: 기존 행은 ADD COLUMN 시 한 번에 계산됨 (테이블 재작성)
+    op.add_column('contentsections', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed("to_tsvector('simple'::regconfig, coalesce(section_title, '') || ' ' || section_text)", persisted=True),
+        nullable=True,
+        comment='section_title/section_text로부터 생성되는 전문 검색용 tsvector (generated column)',
+    ))
+    op.create_index('ix_contentsections_search_vector', 'contentsections', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contentsections_search_vector', table_name='contentsections', postgresql_using='gin')
+    op.drop_column('contentsections', 'search_vector')
@@ -0,0 +1,28 @@
+"""Add token_count to contentsections for token-budgeted prompt context
+
+Revision ID: 8c2f6a1d4b97
+Revises: f3a8c5d1e7b2
+Create Date: 2026-10-17 19:02:31.447205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2f6a1d4b97'
+down_revision: Union[str, None] = 'f3a8c5d1e7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 행은 scripts/backfill_section_token_counts.py로 채움 (content_service.count_tokens와 같은 값을 Python으로 계산)
+    # 채워지기 전에는 컨텍스트 조립 시 글자 수 기준 추정값을 사용
+    op.add_column('contentsections', sa.Column('token_count', sa.Integer(), nullable=True, comment='section_text의 LLM 토큰 수 (근사값, 프롬프트 컨텍스트 조립 시 재계산하지 않기 위함)'))
+
+
+def downgrade() -> None:
+    op.drop_column('contentsections', 'token_count')
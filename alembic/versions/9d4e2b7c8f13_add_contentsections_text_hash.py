@@ -0,0 +1,38 @@
+"""Add text_hash to contentsections for incremental reprocessing
+
+Revision ID: 9d4e2b7c8f13
+Revises: 7a3f9c1d5e28
+Create Date: 2026-10-17 14:05:12.552817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4e2b7c8f13'
+down_revision: Union[str, None] = '7a3f9c1d5e28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    op.add_column('contentsections', sa.Column('text_hash', sa.String(length=64), nullable=True, comment='section_text의 SHA-256 (증분 재처리 시 변경 여부 비교용)'))
+
+    # 기존 행 backfill: app.services.content_service.section_text_hash와 같은 값을 SQL로 계산, BACKFILL_BATCH_SIZE 건씩 처리
+    bind = op.get_bind()
+    while True:
+        result = bind.execute(sa.text(
+            "UPDATE contentsections SET text_hash = encode(sha256(convert_to(section_text, 'UTF8')), 'hex') "
+            "WHERE id IN (SELECT id FROM contentsections WHERE text_hash IS NULL LIMIT :limit)"
+        ), {"limit": BACKFILL_BATCH_SIZE})
+        if result.rowcount == 0:
+            break
+
+
+def downgrade() -> None:
+    op.drop_column('contentsections', 'text_hash')
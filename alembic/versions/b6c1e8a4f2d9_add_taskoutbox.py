@@ -0,0 +1,39 @@
+"""Add taskoutbox table for transactional task dispatch
+
+Revision ID: b6c1e8a4f2d9
+Revises: 9d4e2b7c8f13
+Create Date: 2026-10-17 14:52:37.104928
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6c1e8a4f2d9'
+down_revision: Union[str, None] = '9d4e2b7c8f13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('taskoutbox',
+    sa.Column('id', sa.UUID(), nullable=False, comment='outbox 항목의 고유 식별자'),
+    sa.Column('task_name', sa.String(), nullable=False, comment='발행할 Celery 태스크 이름 (예: "process_content_task")'),
+    sa.Column('task_kwargs', postgresql.JSONB(astext_type=sa.Text()), nullable=False, comment='태스크 키워드 인자'),
+    sa.Column('attempts', sa.Integer(), nullable=False, comment='발행 실패 횟수'),
+    sa.Column('last_error', sa.Text(), nullable=True, comment='마지막 발행 실패 사유'),
+    sa.Column('available_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False, comment='이 시간 이후에 발행 (실패 시 backoff)'),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False, comment='outbox 항목 생성 시간'),
+    sa.PrimaryKeyConstraint('id'),
+    comment='도메인 변경과 같은 트랜잭션에서 기록되어 relay가 Celery로 발행할 태스크 목록 (transactional outbox)'
+    )
+    op.create_index('ix_taskoutbox_available_at_created_at', 'taskoutbox', ['available_at', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_taskoutbox_available_at_created_at', table_name='taskoutbox')
+    op.drop_table('taskoutbox')
@@ -0,0 +1,26 @@
+"""Add (content_id, order_index) index on contentsections
+
+Revision ID: c84f1a6e0b37
+Revises: 5b1e7c93d2a4
+Create Date: 2026-10-17 11:03:27.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c84f1a6e0b37'
+down_revision: Union[str, None] = '5b1e7c93d2a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_contentsections_content_id_order_index', 'contentsections', ['content_id', 'order_index'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contentsections_content_id_order_index', table_name='contentsections')
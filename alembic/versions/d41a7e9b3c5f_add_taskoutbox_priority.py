@@ -0,0 +1,26 @@
+"""Add priority to taskoutbox
+
+Revision ID: d41a7e9b3c5f
+Revises: b6c1e8a4f2d9
+Create Date: 2026-10-17 16:08:12.531746
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41a7e9b3c5f'
+down_revision: Union[str, None] = 'b6c1e8a4f2d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('taskoutbox', sa.Column('priority', sa.Integer(), nullable=True, comment='브로커 메시지 우선순위 (작을수록 먼저 처리, NULL이면 기본 우선순위)'))
+
+
+def downgrade() -> None:
+    op.drop_column('taskoutbox', 'priority')
@@ -0,0 +1,70 @@
+"""Add numeric start/end seconds to contentsections with batched backfill
+
+Revision ID: e2d9b4f7a610
+Revises: c84f1a6e0b37
+Create Date: 2026-10-17 11:48:05.671290
+
+"""
+import re
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2d9b4f7a610'
+down_revision: Union[str, None] = 'c84f1a6e0b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+# 마이그레이션은 앱 코드 변경에 영향을 받지 않도록 파서를 복사해 둠
+# (app.services.learning_content_service.parse_timestamp_seconds와 동일)
+_TIMESTAMP_PATTERN = re.compile(r"^\s*(?:(\d+):)?(?:(\d+):)?(\d+)(?:[.,]\d+)?\s*$")
+
+
+def _parse(value: Optional[str]) -> Optional[int]:
+    if not value:
+        return None
+    match = _TIMESTAMP_PATTERN.match(value)
+    if not match:
+        return None
+    seconds = 0
+    for part in match.groups():
+        if part is not None:
+            seconds = seconds * 60 + int(part)
+    return seconds
+
+
+def upgrade() -> None:
+    op.add_column('contentsections', sa.Column('start_seconds', sa.Integer(), nullable=True, comment='start_timestamp를 초 단위로 변환한 값 (재생 위치 조회용)'))
+    op.add_column('contentsections', sa.Column('end_seconds', sa.Integer(), nullable=True, comment='end_timestamp를 초 단위로 변환한 값'))
+
+    # 기존 행 backfill: 거대한 단일 UPDATE 대신 id 순서로 BACKFILL_BATCH_SIZE 건씩 처리
+    # (운영 중 대용량 테이블은 scripts/backfill_section_seconds.py로 배치마다 commit 하며 실행 가능)
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        query = "SELECT id, start_timestamp, end_timestamp FROM contentsections WHERE (start_timestamp IS NOT NULL OR end_timestamp IS NOT NULL)"
+        params = {"limit": BACKFILL_BATCH_SIZE}
+        if last_id is not None:
+            query += " AND id > :last_id"
+            params["last_id"] = last_id
+        rows = bind.execute(sa.text(query + " ORDER BY id LIMIT :limit"), params).fetchall()
+        if not rows:
+            break
+        bind.execute(
+            sa.text("UPDATE contentsections SET start_seconds = :start_seconds, end_seconds = :end_seconds WHERE id = :id"),
+            [{"id": r.id, "start_seconds": _parse(r.start_timestamp), "end_seconds": _parse(r.end_timestamp)} for r in rows],
+        )
+        last_id = rows[-1].id
+
+    op.create_index('ix_contentsections_content_id_start_seconds', 'contentsections', ['content_id', 'start_seconds'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contentsections_content_id_start_seconds', table_name='contentsections')
+    op.drop_column('contentsections', 'end_seconds')
+    op.drop_column('contentsections', 'start_seconds')
@@ -0,0 +1,130 @@
+"""Add append-only tutor chat tables and move chat_history_json into them
+
+Revision ID: f3a8c5d1e7b2
+Revises: d41a7e9b3c5f
+Create Date: 2026-10-17 18:21:44.903517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8c5d1e7b2'
+down_revision: Union[str, None] = 'd41a7e9b3c5f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EXPLODE_BATCH_SIZE = 500 # 배치당 (user_id, content_id) 대화 수
+
+# (user_id, content_id) 배치 하나의 chat_history_json 배열을 메시지 행으로 펼치고 대화별 last_seq를 기록합니다.
+# userlearningprogress에는 (user_id, content_id) 유니크 제약이 없으므로 행 단위가 아니라 대화 단위로 펼칩니다.
+# 같은 대화의 진행 행이 여러 개면 updated_at 순으로 이어 붙여 seq를 매기고, 내용이 같은 기록은 한 번만 넣습니다.
+# (행 단위로 펼치면 두 번째 행의 seq가 첫 번째 행과 겹쳐 ON CONFLICT로 메시지가 사라짐)
+# 기록 형식: [{"role": ..., "content": ...}, ...] 또는 {"messages": [...]} (role/content 대신 sender/message/text 키도 허용)
+# seq가 대화 안에서 결정적으로 매겨지므로 ON CONFLICT로 중단 후 다시 실행해도 같은 결과가 됩니다.
+# 반환값은 배치의 마지막 (user_id, content_id) (다음 배치 시작점)
+EXPLODE_BATCH_SQL = sa.text("""
+WITH pairs AS (
+    SELECT DISTINCT user_id, content_id
+    FROM userlearningprogress
+    WHERE chat_history_json IS NOT NULL
+      AND (CAST(:after_user_id AS uuid) IS NULL
+           OR (user_id, content_id) > (CAST(:after_user_id AS uuid), CAST(:after_content_id AS uuid)))
+    ORDER BY user_id, content_id
+    LIMIT :batch_size
+), histories AS (
+    SELECT DISTINCT ON (p.user_id, p.content_id, p.chat_history_json)
+           p.id, p.user_id, p.content_id, p.chat_history_json AS history, p.updated_at
+    FROM userlearningprogress p
+    JOIN pairs USING (user_id, content_id)
+    WHERE p.chat_history_json IS NOT NULL
+    ORDER BY p.user_id, p.content_id, p.chat_history_json, p.updated_at, p.id
+), messages AS (
+    SELECT h.user_id, h.content_id,
+           row_number() OVER (PARTITION BY h.user_id, h.content_id ORDER BY h.updated_at, h.id, m.pos) AS seq,
+           m.message, h.updated_at
+    FROM histories h
+    CROSS JOIN LATERAL jsonb_array_elements(
+        CASE
+            WHEN jsonb_typeof(h.history) = 'array' THEN h.history
+            WHEN jsonb_typeof(h.history -> 'messages') = 'array' THEN h.history -> 'messages'
+            ELSE '[]'::jsonb
+        END
+    ) WITH ORDINALITY AS m(message, pos)
+), inserted AS (
+    INSERT INTO tutorchatmessages (user_id, content_id, seq, role, message_text, created_at)
+    SELECT user_id, content_id, seq,
+           COALESCE(message ->> 'role', message ->> 'sender', 'user'),
+           COALESCE(message ->> 'content', message ->> 'message', message ->> 'text', message #>> '{}'),
+           updated_at
+    FROM messages
+    ON CONFLICT (user_id, content_id, seq) DO NOTHING
+), threads AS (
+    INSERT INTO tutorchatthreads (user_id, content_id, last_seq, summarized_through_seq, updated_at)
+    SELECT user_id, content_id, max(seq), 0, max(updated_at)
+    FROM messages
+    GROUP BY user_id, content_id
+    ON CONFLICT (user_id, content_id) DO UPDATE SET last_seq = GREATEST(tutorchatthreads.last_seq, EXCLUDED.last_seq)
+)
+SELECT user_id, content_id FROM pairs ORDER BY user_id DESC, content_id DESC LIMIT 1
+""")
+
+
+def upgrade() -> None:
+    op.create_table('tutorchatthreads',
+    sa.Column('user_id', sa.UUID(), nullable=False, comment='대화한 사용자의 ID'),
+    sa.Column('content_id', sa.UUID(), nullable=False, comment='대화 대상 LearningContent의 ID'),
+    sa.Column('last_seq', sa.Integer(), nullable=False, comment='마지막으로 할당된 메시지 순번 (메시지 추가 시 증가)'),
+    sa.Column('summary_text', sa.Text(), nullable=True, comment='summarized_through_seq까지의 대화 누적 요약'),
+    sa.Column('summarized_through_seq', sa.Integer(), nullable=False, comment='누적 요약에 반영된 마지막 메시지 순번'),
+    sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False, comment='대화 마지막 업데이트 시간'),
+    sa.ForeignKeyConstraint(['content_id'], ['learningcontent.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'content_id'),
+    comment='사용자-콘텐츠별 AI 튜터 대화의 메타데이터 (메시지 순번 할당, 누적 요약)를 저장합니다.'
+    )
+    op.create_table('tutorchatmessages',
+    sa.Column('user_id', sa.UUID(), nullable=False, comment='대화한 사용자의 ID'),
+    sa.Column('content_id', sa.UUID(), nullable=False, comment='대화 대상 LearningContent의 ID'),
+    sa.Column('seq', sa.Integer(), nullable=False, comment='대화 안에서의 메시지 순번 (1부터, TutorChatThread.last_seq로 할당)'),
+    sa.Column('role', sa.String(), nullable=False, comment='메시지 작성자 (예: "user", "assistant")'),
+    sa.Column('message_text', sa.Text(), nullable=False, comment='메시지 내용'),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False, comment='메시지 기록 시간'),
+    sa.ForeignKeyConstraint(['content_id'], ['learningcontent.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'content_id', 'seq'),
+    comment='AI 튜터 대화 메시지를 한 행에 하나씩 추가만 하는 방식(append-only)으로 저장합니다.'
+    )
+    op.alter_column('userlearningprogress', 'chat_history_json',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               comment='(deprecated) AI 튜터와의 채팅 기록 (JSONB 형식). tutorchatmessages로 이전됨, 더 이상 기록하지 않음',
+               existing_comment='AI 튜터와의 채팅 기록 (JSONB 형식)',
+               existing_nullable=True)
+
+    # 기존 JSONB 기록을 배치 단위로 펼침. 배치마다 commit 하여 긴 트랜잭션/락 없이 진행 (중단 후 재실행 가능)
+    # chat_history_json은 롤백 대비로 그대로 둠
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        after_user_id = after_content_id = None
+        while True:
+            last = bind.execute(EXPLODE_BATCH_SQL, {
+                "after_user_id": after_user_id, "after_content_id": after_content_id, "batch_size": EXPLODE_BATCH_SIZE,
+            }).first()
+            if last is None:
+                break
+            after_user_id, after_content_id = last
+
+
+def downgrade() -> None:
+    # chat_history_json은 upgrade에서 변경하지 않았으므로 이전 이후에 추가된 메시지만 사라짐
+    op.alter_column('userlearningprogress', 'chat_history_json',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               comment='AI 튜터와의 채팅 기록 (JSONB 형식)',
+               existing_comment='(deprecated) AI 튜터와의 채팅 기록 (JSONB 형식). tutorchatmessages로 이전됨, 더 이상 기록하지 않음',
+               existing_nullable=True)
+    op.drop_table('tutorchatmessages')
+    op.drop_table('tutorchatthreads')
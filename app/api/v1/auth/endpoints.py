@@ -1,18 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.auth import schemas
-from app.services.auth_service import authenticate_user
-from app.services.user_service import create_user # 직접 create_user import
+from app.services.auth_service import authenticate_user_async
+from app.services.user_service import create_user_async # 직접 create_user import
 from app.core.security import create_access_token
-from app.core.dependencies import get_db
+from app.core.dependencies import get_async_db
 
 router = APIRouter()
 
 @router.post("/register", response_model=schemas.UserResponse)
-def register_user(user_in: schemas.UserCreate, db: Session = Depends(get_db)):
-    db_user = create_user(db, email=user_in.email, password=user_in.password, name=user_in.name)
+async def register_user(user_in: schemas.UserCreate, db: AsyncSession = Depends(get_async_db)):
+    db_user = await create_user_async(db, email=user_in.email, password=user_in.password, name=user_in.name)
     if not db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -21,8 +21,8 @@ def register_user(user_in: schemas.UserCreate, db: Session = Depends(get_db)):
     return db_user
 
 @router.post("/login", response_model=schemas.Token)
-def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    user = authenticate_user(db, form_data.username, form_data.password)
+async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
+    user = await authenticate_user_async(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1,26 +1,29 @@
 # certgo-backend/app/api/v1/certificates/endpoints.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional
 from uuid import UUID
 
 from app.api.v1.certificates import schemas
-from app.services import certificate_service, learning_content_service
-from app.core.dependencies import get_db, get_current_user # 인증 필요한 경우 get_current_user 사용
+from app.api.v1.learning_content import schemas as content_schemas # 섹션 검색 결과 스키마 재사용
+from app.api.v1.pagination import invalid_cursor, set_next_page_headers
+from app.services import ai_integration_service, certificate_service, learning_content_service
+from app.core.dependencies import get_async_db, get_current_user # 인증 필요한 경우 get_current_user 사용
+from app.services.pagination import InvalidCursorError
 
 router = APIRouter()
 
 @router.post("/", response_model=schemas.CertificateResponse, status_code=status.HTTP_201_CREATED, summary="Create a new Certificate")
-def create_certificate(
+async def create_certificate(
     certificate_in: schemas.CertificateBase,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user) # 관리자 권한 필요 시, Role-based access control (RBAC) 추가 필요
 ):
     """
     새로운 자격증 정보를 생성합니다.
     """
-    db_certificate = certificate_service.create_certificate(
+    db_certificate = await certificate_service.create_certificate_async(
         db,
         name=certificate_in.name,
         description=certificate_in.description,
@@ -31,39 +34,74 @@ def create_certificate(
     return db_certificate
 
 @router.get("/", response_model=List[schemas.CertificateResponse], summary="Get all Certificates")
-def get_all_certificates(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+async def get_all_certificates(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    limit: int = Query(100, ge=1, le=500),
+    skip: Optional[int] = Query(None, ge=0, deprecated=True, description="offset 방식 (deprecated, cursor 사용 권장)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    모든 자격증 목록을 조회합니다.
+    모든 자격증 목록을 (name, id) 순서로 조회합니다.
+    다음 페이지가 있으면 Link(rel="next") / X-Next-Cursor 헤더로 커서를 전달합니다.
     """
-    certificates = certificate_service.get_certificates(db, skip=skip, limit=limit)
+    if skip is not None:
+        return await certificate_service.get_certificates_async(db, skip=skip, limit=limit)
+    try:
+        certificates, next_cursor = await certificate_service.get_certificates_page_async(db, cursor=cursor, limit=limit)
+    except InvalidCursorError as e:
+        raise invalid_cursor(e)
+    set_next_page_headers(request, response, next_cursor)
     return certificates
 
 @router.get("/{certificate_id}", response_model=schemas.CertificateResponse, summary="Get Certificate by ID")
-def get_certificate_by_id(
+async def get_certificate_by_id(
     certificate_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     특정 ID의 자격증 정보를 조회합니다.
     """
-    certificate = certificate_service.get_certificate(db, certificate_id)
+    certificate = await certificate_service.get_certificate_async(db, certificate_id)
     if certificate is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Certificate not found")
     return certificate
 
 @router.get("/{certificate_id}/contents", response_model=List[schemas.LearningContentResponse], summary="Get Learning Contents by Certificate ID")
-def get_contents_by_certificate(
+async def get_contents_by_certificate(
     certificate_id: UUID,
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    limit: int = Query(100, ge=1, le=500),
+    skip: Optional[int] = Query(None, ge=0, deprecated=True, description="offset 방식 (deprecated, cursor 사용 권장)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    특정 자격증에 속하는 학습 콘텐츠 목록을 조회합니다.
+    특정 자격증에 속하는 학습 콘텐츠 목록을 (created_at, id) 순서로 조회합니다.
+    다음 페이지가 있으면 Link(rel="next") / X-Next-Cursor 헤더로 커서를 전달합니다.
     """
-    contents = learning_content_service.get_learning_contents_by_certificate(db, certificate_id, skip=skip, limit=limit)
-    return contents
\ No newline at end of file
+    if skip is not None:
+        return await learning_content_service.get_learning_contents_by_certificate_async(db, certificate_id, skip=skip, limit=limit)
+    try:
+        contents, next_cursor = await learning_content_service.get_learning_contents_by_certificate_page_async(db, certificate_id, cursor=cursor, limit=limit)
+    except InvalidCursorError as e:
+        raise invalid_cursor(e)
+    set_next_page_headers(request, response, next_cursor)
+    return contents
+
+@router.get("/{certificate_id}/search", response_model=List[content_schemas.SectionSearchResult], summary="Search Content Sections within a Certificate")
+async def search_certificate_sections(
+    certificate_id: UUID,
+    q: str = Query(..., min_length=1, max_length=500, description="검색어"),
+    limit: int = Query(10, ge=1, le=50),
+    mode: Literal["hybrid", "vector", "lexical"] = Query("hybrid", description="hybrid: 키워드 + 의미 검색 결합 / vector: 의미 검색 / lexical: 키워드 검색"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    특정 자격증에 속하는 콘텐츠의 섹션 중 검색어와 관련된 섹션을 관련도 순으로 조회합니다.
+    """
+    if await certificate_service.get_certificate_async(db, certificate_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Certificate not found")
+    return await ai_integration_service.search_sections_async(db, q, limit=limit, certificate_id=certificate_id, mode=mode)
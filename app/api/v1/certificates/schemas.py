@@ -41,6 +41,8 @@ class ContentSectionResponse(BaseModel):
     section_text: str
     start_timestamp: Optional[str] = None
     end_timestamp: Optional[str] = None
+    start_seconds: Optional[int] = None
+    end_seconds: Optional[int] = None
     order_index: int
 
     class Config:
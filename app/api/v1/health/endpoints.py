@@ -0,0 +1,59 @@
+# certgo-backend/app/api/v1/health/endpoints.py
+
+import asyncio
+import os
+
+from fastapi import APIRouter
+
+from app.api.v1.health import schemas
+from app.core.config import settings
+from app.core.hashing import password_hasher
+from app.core.principal_cache import principal_cache
+from app.database.connection import engine, async_engine
+from app.database.pool_metrics import pool_snapshot
+from app.services.embedding_cache import embedding_cache
+from app.services.result_cache import result_cache
+
+router = APIRouter()
+
+@router.get("/db-pool", response_model=schemas.DbPoolResponse, summary="Get DB connection pool stats")
+async def get_db_pool_stats():
+    """
+    현재 워커 프로세스의 DB 커넥션 풀 상태(체크아웃 수, overflow, 대기 시간 히스토그램)를 조회합니다.
+    saturation이 1에 가까워지면 풀 고갈(타임아웃, 5xx) 직전 상태입니다.
+    """
+    return {
+        "pid": os.getpid(),
+        "web_concurrency": settings.WEB_CONCURRENCY,
+        "sync_engine": pool_snapshot(engine.pool),
+        "async_engine": pool_snapshot(async_engine.sync_engine.pool),
+    }
+
+@router.get("/principal-cache", response_model=schemas.PrincipalCacheResponse, summary="Get principal cache stats")
+async def get_principal_cache_stats():
+    """
+    인증 사용자(principal) 캐시의 적중률을 조회합니다. (현재 워커 프로세스 기준)
+    """
+    return {"pid": os.getpid(), **principal_cache.stats()}
+
+@router.get("/password-hasher", response_model=schemas.PasswordHasherResponse, summary="Get password hashing pool stats")
+async def get_password_hasher_stats():
+    """
+    bcrypt 전용 프로세스 풀의 대기 작업 수와 거절(503) 횟수를 조회합니다. (현재 워커 프로세스 기준)
+    """
+    return {"pid": os.getpid(), **password_hasher.stats()}
+
+@router.get("/embedding-cache", response_model=schemas.EmbeddingCacheResponse, summary="Get embedding cache stats")
+async def get_embedding_cache_stats():
+    """
+    임베딩 캐시 적중률을 조회합니다. (현재 워커 프로세스 기준 + Redis에 누적된 전체 기준)
+    """
+    stats = await asyncio.to_thread(embedding_cache.stats) # Redis 조회는 동기 클라이언트 사용
+    return {"pid": os.getpid(), "enabled": settings.EMBEDDING_CACHE_ENABLED, **stats}
+
+@router.get("/result-cache", response_model=schemas.ResultCacheResponse, summary="Get AI result cache stats")
+async def get_result_cache_stats():
+    """
+    AI 생성 결과(요약, 튜터 답변) 캐시의 적중률과 절약한 생성 시간을 조회합니다. (현재 워커 프로세스 기준 + Redis에 누적된 전체 기준)
+    """
+    return {"pid": os.getpid(), "enabled": settings.RESULT_CACHE_ENABLED, **await result_cache.stats()}
@@ -0,0 +1,84 @@
+# certgo-backend/app/api/v1/health/schemas.py
+
+from pydantic import BaseModel
+from typing import Dict, Optional
+
+class PoolStatsResponse(BaseModel):
+    pool_class: str
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    max_overflow: Optional[int] = None
+    timeout_seconds: Optional[float] = None
+    saturation: Optional[float] = None # checked_out / (size + max_overflow)
+    checkouts_total: int = 0
+    checkout_timeouts_total: int = 0
+    wait_ms_avg: float = 0.0
+    wait_ms_max: float = 0.0
+    wait_ms_histogram: Dict[str, int] = {}
+
+class DbPoolResponse(BaseModel):
+    pid: int # 워커 프로세스 ID (Gunicorn 워커마다 풀이 따로 존재)
+    web_concurrency: int
+    sync_engine: PoolStatsResponse # 동기 엔진 (API 워커에서는 DB_API_SYNC_POOL_SIZE로 작게 고정)
+    async_engine: PoolStatsResponse # API 엔드포인트가 사용하는 비동기 엔진
+
+class PrincipalCacheResponse(BaseModel):
+    pid: int
+    enabled: bool
+    redis_enabled: bool
+    entries: int # 프로세스 내 캐시 항목 수
+    local_hits: int
+    redis_hits: int
+    misses: int
+    hit_ratio: float
+
+class PasswordHasherResponse(BaseModel):
+    pid: int
+    workers: int
+    pending: int
+    max_pending: int
+    rejected_total: int # 대기 상한 초과로 503을 반환한 횟수
+
+class EmbeddingCacheSharedStats(BaseModel):
+    lookups: int # Redis 조회 수 (로컬 LRU 미스 건수)
+    misses: int # provider로 새로 임베딩한 수
+    hit_ratio: float
+
+class EmbeddingCacheResponse(BaseModel):
+    pid: int
+    enabled: bool
+    redis_enabled: bool
+    entries: int # 프로세스 내 LRU 항목 수
+    lookups: int
+    local_hits: int
+    redis_hits: int
+    misses: int
+    hit_ratio: float # 현재 워커 프로세스 기준
+    shared: Optional[EmbeddingCacheSharedStats] = None # Redis에 누적된 전체 워커(API + Celery) 기준
+
+class ResultCacheSharedStats(BaseModel):
+    entries: int # Redis에 보관 중인 결과 수 (RESULT_CACHE_MAX_ENTRIES 이하)
+    lookups: int
+    hits: int
+    coalesced: int
+    generations: int
+    evictions: int
+    hit_ratio: float
+    saved_ms: float
+    generation_ms_avg: float
+
+class ResultCacheResponse(BaseModel):
+    pid: int
+    enabled: bool
+    redis_enabled: bool
+    lookups: int
+    hits: int # 캐시 적중
+    coalesced: int # 같은 결과를 생성 중인 다른 요청(같은 프로세스 또는 다른 워커)의 결과를 함께 받은 수
+    generations: int # LLM으로 새로 생성한 수
+    evictions: int # 항목 수 상한으로 제거된 수
+    hit_ratio: float # (hits + coalesced) / lookups
+    saved_ms: float # 적중/공유로 생략한 생성 시간의 합 (처음 생성할 때 걸린 시간 기준)
+    generation_ms_avg: float
+    shared: Optional[ResultCacheSharedStats] = None # Redis에 누적된 전체 워커 기준
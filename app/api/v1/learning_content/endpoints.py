@@ -1,76 +1,269 @@
 # certgo-backend/app/api/v1/learning_content/endpoints.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+import logging
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, List, Literal, Optional
 from uuid import UUID
 
 from app.api.v1.certificates import schemas as certificate_schemas # 자격증 스키마 재사용
 from app.api.v1.learning_content import schemas
-from app.services import learning_content_service
-from app.core.dependencies import get_db, get_current_user # 인증 필요한 경우 get_current_user 사용
+from app.api.v1.pagination import invalid_cursor, set_next_page_headers
+from app.core.config import settings
+from app.services import ai_integration_service, certificate_service, learning_content_service, subscription_service, summary_service
+from app.core.dependencies import get_async_db, get_current_user # 인증 필요한 경우 get_current_user 사용
+from app.services.pagination import InvalidCursorError
+from app.services.progress_events import content_channel, content_status_event, progress_hub
+from app.core.task_routing import task_priority
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"} # 프록시(nginx) 버퍼링 비활성화
+
+BULK_CREATE_MAX = 500 # 일괄 생성 요청당 최대 콘텐츠 수
 
 @router.post("/", response_model=schemas.LearningContentResponse, status_code=status.HTTP_201_CREATED, summary="Create new Learning Content")
-def create_learning_content(
+async def create_learning_content(
     content_in: schemas.LearningContentBase,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user) # 콘텐츠 생성은 로그인 사용자만 가능
 ):
     """
     새로운 학습 콘텐츠를 생성합니다. (초기에는 PENDING 상태로 생성)
     """
-    db_content = learning_content_service.create_learning_content(
+    # 프리미엄 자격증 콘텐츠이거나 유료 사용자가 등록한 콘텐츠는 처리 큐에서 먼저 처리
+    premium = (
+        content_in.certificate_id in await certificate_service.get_premium_certificate_ids_async(db, [content_in.certificate_id])
+        or await subscription_service.is_paying_user_async(db, current_user.id)
+    )
+    db_content = await learning_content_service.create_learning_content_async(
         db,
         certificate_id=content_in.certificate_id, # 이 부분은 LearningContentBase에 포함되어야 함 (아래 스키마 수정 필요)
         title=content_in.title,
         source_url=content_in.source_url,
         description=content_in.description,
         type=content_in.type,
-        duration_minutes=content_in.duration_minutes
+        duration_minutes=content_in.duration_minutes,
+        priority=task_priority(premium)
     )
-    # TODO: Celery task를 이용해 content_processing_tasks.process_content_task.delay(db_content.id) 호출
+    # 처리 태스크(process_content_task)는 같은 트랜잭션에서 outbox에 기록되어 relay가 발행함
     return db_content
 
 
+@router.post("/bulk", response_model=List[schemas.LearningContentResponse], status_code=status.HTTP_201_CREATED, summary="Create Learning Contents in bulk")
+async def create_learning_contents_bulk(
+    contents_in: List[schemas.LearningContentBase] = Body(..., min_length=1, max_length=BULK_CREATE_MAX),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    여러 학습 콘텐츠를 한 트랜잭션으로 생성합니다. (모두 PENDING 상태, 처리 태스크는 outbox를 통해 일괄 발행)
+    source_url이 이미 존재하거나 요청 안에서 중복되면 아무것도 생성하지 않고 409를 반환합니다.
+    존재하지 않는 certificate_id 등 다른 제약 위반은 422를 반환합니다.
+    """
+    paying = await subscription_service.is_paying_user_async(db, current_user.id)
+    premium_certificate_ids = await certificate_service.get_premium_certificate_ids_async(db, (c.certificate_id for c in contents_in))
+    priorities = [task_priority(paying or c.certificate_id in premium_certificate_ids) for c in contents_in]
+    try:
+        return await learning_content_service.create_learning_contents_bulk_async(
+            db, [content_in.model_dump() for content_in in contents_in], priorities
+        )
+    except learning_content_service.DuplicateSourceUrlError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except IntegrityError:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Learning content violates a data constraint (e.g. unknown certificate_id)")
+
+
 @router.get("/", response_model=List[schemas.LearningContentResponse], summary="Get Learning Content All")
-def get_learning_content_all(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+async def get_learning_content_all(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    limit: int = Query(100, ge=1, le=500),
+    skip: Optional[int] = Query(None, ge=0, deprecated=True, description="offset 방식 (deprecated, cursor 사용 권장)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    전체 학습 콘텐츠 정보를 조회합니다. (섹션 정보도 포함)
+    전체 학습 콘텐츠 정보를 (created_at, id) 순서로 조회합니다.
+    다음 페이지가 있으면 Link(rel="next") / X-Next-Cursor 헤더로 커서를 전달합니다.
     """
-    content = learning_content_service.get_all_learning_contents(db)
-    if content is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Learning Content not found")
+    if skip is not None:
+        return await learning_content_service.get_all_learning_contents_async(db, skip=skip, limit=limit)
+    try:
+        content, next_cursor = await learning_content_service.get_all_learning_contents_page_async(db, cursor=cursor, limit=limit)
+    except InvalidCursorError as e:
+        raise invalid_cursor(e)
+    set_next_page_headers(request, response, next_cursor)
     return content
 
 
+@router.get("/search", response_model=List[schemas.SectionSearchResult], summary="Search Content Sections (hybrid / vector / lexical)")
+async def search_sections(
+    q: str = Query(..., min_length=1, max_length=500, description="검색어"),
+    content_id: Optional[UUID] = Query(None, description="특정 학습 콘텐츠 안에서만 검색"),
+    certificate_id: Optional[UUID] = Query(None, description="특정 자격증의 콘텐츠 안에서만 검색"),
+    limit: int = Query(10, ge=1, le=50),
+    mode: Literal["hybrid", "vector", "lexical"] = Query("hybrid", description="hybrid: 키워드 + 의미 검색 결합 / vector: 의미 검색 / lexical: 키워드 검색"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    검색어와 관련된 섹션을 관련도 순으로 조회합니다. (타임스탬프 포함)
+    기본(hybrid)은 법 조항 번호, 함수명 같은 정확한 용어 매칭과 의미 검색 결과를 함께 반영합니다.
+    """
+    return await ai_integration_service.search_sections_async(
+        db, q, limit=limit, content_id=content_id, certificate_id=certificate_id, mode=mode
+    )
+
+
 @router.get("/{content_id}", response_model=schemas.LearningContentResponse, summary="Get Learning Content by ID")
-def get_learning_content_by_id(
+async def get_learning_content_by_id(
     content_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    특정 ID의 학습 콘텐츠 정보를 조회합니다. (섹션 정보도 포함)
+    특정 ID의 학습 콘텐츠 정보를 조회합니다. (섹션은 /{content_id}/sections 에서 조회)
     """
-    content = learning_content_service.get_learning_content(db, content_id)
+    content = await learning_content_service.get_learning_content_async(db, content_id, with_sections=False)
     if content is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Learning Content not found")
     return content
 
+@router.get("/{content_id}/events", summary="Stream Processing Progress for Learning Content (SSE)")
+async def stream_content_events(
+    content_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    콘텐츠 처리 진행 이벤트(stage, percent, sections_done)를 Server-Sent Events로 전달합니다. (완료/실패 이벤트 후 종료)
+    이벤트는 처리 태스크가 Redis pub/sub으로 발행하며, 스트리밍 중에는 DB를 조회하지 않습니다.
+    연결 시점에 processing_status를 한 번 조회하고, Redis에 저장된 마지막 이벤트는 상태가 같을 때만 초기 상태로 보냅니다.
+    (재처리 요청으로 PENDING이 된 콘텐츠에 이전 처리의 COMPLETED/FAILED 이벤트를 보내고 스트림을 닫지 않도록)
+    """
+    channel = content_channel(content_id)
+    queue = await progress_hub.subscribe(channel) # 초기 상태 조회 전에 구독해야 그 사이의 이벤트를 놓치지 않음
+    processing_status = await learning_content_service.get_processing_status_async(db, content_id)
+    if processing_status is None:
+        await progress_hub.unsubscribe(channel, queue)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Learning Content not found")
+    initial = await progress_hub.last_event(channel)
+    if initial is None or initial.get("status") != processing_status:
+        initial = content_status_event(content_id, processing_status)
+    return StreamingResponse(progress_hub.stream(channel, queue, initial), media_type="text/event-stream", headers=SSE_HEADERS)
+
+@router.post("/{content_id}/summary", response_model=schemas.SectionSummaryResponse, summary="Summarize a Section Range (AI)")
+async def summarize_sections(
+    content_id: UUID,
+    summary_in: schemas.SectionSummaryRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    섹션 범위(order_index, 양 끝 포함)를 AI로 요약합니다. 범위에 든 섹션은 SUMMARY_MAX_SECTIONS개 이하여야 합니다.
+    (order_index는 간격을 두고 매겨지므로 범위의 폭이 아니라 실제 섹션 수로 확인)
+    같은 범위의 요약은 (콘텐츠, 섹션 범위와 내용, 프롬프트 버전, 모델) 기준으로 캐시되어 사용자 간에 공유되며,
+    동시에 같은 요약을 요청하면 생성은 한 번만 합니다. 캐시된 요약이어도 플랜의 요약 사용 한도에서 1회 차감합니다.
+    """
+    if summary_in.end_index < summary_in.start_index:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Section range must be ordered")
+    if not await learning_content_service.content_exists_async(db, content_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Learning Content not found")
+    outline = await summary_service.get_section_summary_outline_async(db, content_id, summary_in.start_index, summary_in.end_index)
+    if not outline:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No sections in the given range")
+    if len(outline) > settings.SUMMARY_MAX_SECTIONS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Section range must contain at most {settings.SUMMARY_MAX_SECTIONS} sections",
+        )
+    user_id = current_user.id
+    charge = await subscription_service.charge_summary_quota_async(db, user_id, content_id)
+    if charge is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Summary quota exceeded for the current plan")
+    try:
+        result = await summary_service.get_section_summary_async(content_id, summary_in.start_index, summary_in.end_index, outline)
+    except LookupError:
+        await subscription_service.refund_summary_quota_async(db, user_id, content_id, charge)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No sections in the given range")
+    except Exception:
+        logger.exception("Summary generation failed for content %s", content_id)
+        await subscription_service.refund_summary_quota_async(db, user_id, content_id, charge)
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Summary generation failed")
+    return {
+        "content_id": content_id,
+        "start_index": summary_in.start_index,
+        "end_index": summary_in.end_index,
+        "summary_text": result.text,
+        "cached": result.cached,
+    }
+
 @router.get("/{content_id}/sections", response_model=List[schemas.ContentSectionResponse], summary="Get Sections for Learning Content")
-def get_content_sections(
+async def get_content_sections(
     content_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     특정 학습 콘텐츠의 모든 섹션(타임라인, 트랜스크립트 등)을 조회합니다.
     """
-    content = learning_content_service.get_learning_content(db, content_id) # 다시 콘텐츠를 가져와서 섹션에 접근
+    content = await learning_content_service.get_learning_content_async(db, content_id) # 다시 콘텐츠를 가져와서 섹션에 접근
     if content is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Learning Content not found")
-    return content.sections # LearningContent 모델에 sections 관계가 정의되어 있어야 함
\ No newline at end of file
+    return content.sections # LearningContent 모델에 sections 관계가 정의되어 있어야 함
+
+@router.get("/{content_id}/sections/at", response_model=schemas.ContentSectionResponse, summary="Get Section at playback time")
+async def get_section_at(
+    content_id: UUID,
+    t: float = Query(..., ge=0, description="재생 위치 (초)"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    비디오 재생 위치(t초)에 해당하는 섹션을 조회합니다. (플레이어 seek 이벤트용)
+    """
+    section = await learning_content_service.get_section_at_async(db, content_id, int(t))
+    if section is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No section at the given time")
+    return dict(section)
+
+async def _sections_ndjson(partitions: AsyncIterator[list]) -> AsyncIterator[str]:
+    # 한 줄에 섹션 하나 (application/x-ndjson)
+    async for rows in partitions:
+        yield "".join(schemas.ContentSectionResponse.model_validate(dict(row)).model_dump_json() + "\n" for row in rows)
+
+async def _sections_json_array(partitions: AsyncIterator[list]) -> AsyncIterator[str]:
+    # 청크 단위로 전송되는 JSON 배열
+    yield "["
+    first = True
+    async for rows in partitions:
+        for row in rows:
+            item = schemas.ContentSectionResponse.model_validate(dict(row)).model_dump_json()
+            yield item if first else "," + item
+            first = False
+    yield "]"
+
+@router.get("/{content_id}/sections/stream", summary="Stream Sections for Learning Content")
+async def stream_content_sections(
+    content_id: UUID,
+    from_index: Optional[int] = Query(None, description="시작 order_index (포함)"),
+    to_index: Optional[int] = Query(None, description="끝 order_index (포함)"),
+    from_seconds: Optional[int] = Query(None, ge=0, description="재생 구간 시작 (초)"),
+    to_seconds: Optional[int] = Query(None, ge=0, description="재생 구간 끝 (초)"),
+    format: Literal["ndjson", "json"] = Query("ndjson", description="ndjson: 한 줄에 섹션 하나 / json: 청크 전송 JSON 배열"),
+    batch_size: int = Query(500, ge=10, le=5000),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    학습 콘텐츠의 섹션을 order_index 순서로 스트리밍합니다.
+    긴 강의도 전체를 메모리에 올리지 않고 서버 사이드 커서로 batch_size 건씩 전송하며,
+    from_index/to_index(순서) 또는 from_seconds/to_seconds(재생 구간)로 필요한 부분만 점진적으로 불러올 수 있습니다.
+    """
+    if not await learning_content_service.content_exists_async(db, content_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Learning Content not found")
+    partitions = learning_content_service.stream_content_sections(
+        content_id, from_index, to_index, from_seconds, to_seconds, batch_size=batch_size
+    )
+    if format == "json":
+        return StreamingResponse(_sections_json_array(partitions), media_type="application/json")
+    return StreamingResponse(_sections_ndjson(partitions), media_type="application/x-ndjson")
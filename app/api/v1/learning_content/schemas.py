@@ -1,6 +1,6 @@
 # certgo-backend/app/api/v1/learning_content/schemas.py
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 from uuid import UUID
 
@@ -29,7 +29,23 @@ class ContentSectionResponse(BaseModel):
     section_text: str
     start_timestamp: Optional[str] = None
     end_timestamp: Optional[str] = None
+    start_seconds: Optional[int] = None
+    end_seconds: Optional[int] = None
     order_index: int
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class SectionSearchResult(ContentSectionResponse):
+    score: float # 관련도 점수 (높을수록 관련성 높음, mode에 따라 척도가 다름: vector=코사인 유사도, lexical=ts_rank_cd, hybrid=RRF)
+
+class SectionSummaryRequest(BaseModel):
+    start_index: int = Field(..., ge=0) # 요약할 첫 섹션의 order_index (포함)
+    end_index: int = Field(..., ge=0) # 요약할 마지막 섹션의 order_index (포함)
+
+class SectionSummaryResponse(BaseModel):
+    content_id: UUID
+    start_index: int
+    end_index: int
+    summary_text: str
+    cached: bool # 캐시된 요약(또는 동시 요청과 공유한 생성 결과)이면 True
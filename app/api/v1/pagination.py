@@ -0,0 +1,26 @@
+# certgo-backend/app/api/v1/pagination.py
+
+from typing import Optional
+
+from fastapi import HTTPException, Request, Response, status
+
+from app.services.pagination import InvalidCursorError
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def set_next_page_headers(request: Request, response: Response, next_cursor: Optional[str]):
+    """
+    다음 페이지 커서를 응답 헤더로 전달합니다. (응답 본문은 기존과 같은 목록 형태 유지)
+    - Link: <...?cursor=...>; rel="next"
+    - X-Next-Cursor: 다음 페이지 커서 (마지막 페이지면 헤더 없음)
+    """
+    if not next_cursor:
+        return
+    next_url = request.url.remove_query_params(["cursor", "skip"]).include_query_params(cursor=next_cursor)
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
+    response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+
+def invalid_cursor(e: InvalidCursorError) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
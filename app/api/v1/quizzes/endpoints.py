@@ -0,0 +1,93 @@
+# certgo-backend/app/api/v1/quizzes/endpoints.py
+
+import asyncio
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.quizzes import schemas
+from app.services import learning_content_service, quiz_service, subscription_service
+from app.services.progress_events import progress_hub, quiz_generation_channel
+from app.core.dependencies import get_async_db, get_current_user
+from app.tasks.content_processing_tasks import generate_quizzes_task
+from app.core.task_routing import route_task
+
+router = APIRouter()
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"} # 프록시(nginx) 버퍼링 비활성화
+
+@router.post("/generate", response_model=schemas.QuizGenerationTaskResponse, status_code=status.HTTP_202_ACCEPTED, summary="Request AI Quiz Generation")
+async def generate_quizzes(
+    request_in: schemas.QuizGenerationRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    학습 콘텐츠로 퀴즈 생성을 요청합니다. (interactive 큐에서 비동기 처리)
+    진행 상황은 폴링 대신 /generate/{task_id}/events (SSE)로 받습니다. (요청한 사용자만 구독 가능)
+    """
+    if await learning_content_service.get_processing_status_async(db, request_in.content_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Learning Content not found")
+    premium = (
+        await learning_content_service.is_premium_content_async(db, request_in.content_id)
+        or await subscription_service.is_paying_user_async(db, current_user.id)
+    )
+    task_id = str(uuid.uuid4())
+    await progress_hub.set_owner(quiz_generation_channel(task_id), current_user.id) # 발행 전에 기록해야 바로 구독해도 확인됨
+    await asyncio.to_thread( # 브로커 발행은 동기 클라이언트 사용
+        generate_quizzes_task.apply_async,
+        args=[str(request_in.content_id), request_in.difficulty, request_in.count],
+        task_id=task_id,
+        **route_task(generate_quizzes_task.name, premium),
+    )
+    return schemas.QuizGenerationTaskResponse(task_id=task_id, content_id=request_in.content_id, status="PENDING")
+
+
+@router.get("/generate/{task_id}/events", summary="Stream Quiz Generation Progress (SSE)")
+async def stream_quiz_generation_events(
+    task_id: str,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    퀴즈 생성 진행 이벤트를 Server-Sent Events로 전달합니다. (완료/실패 이벤트 후 종료)
+    DB를 조회하지 않으며, 연결 시점의 상태는 Redis에 저장된 마지막 이벤트로 먼저 보냅니다.
+    생성을 요청한 사용자만 구독할 수 있고, 없는(또는 만료된) 태스크나 다른 사용자의 태스크는 404입니다.
+    """
+    channel = quiz_generation_channel(task_id)
+    if await progress_hub.owner(channel) != str(current_user.id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Quiz generation task not found")
+    queue = await progress_hub.subscribe(channel) # 초기 상태 조회 전에 구독해야 그 사이의 이벤트를 놓치지 않음
+    initial = await progress_hub.last_event(channel)
+    return StreamingResponse(progress_hub.stream(channel, queue, initial), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+@router.post("/attempts", response_model=schemas.QuizAttemptResponse, status_code=status.HTTP_201_CREATED, summary="Submit Quiz Attempt")
+async def submit_quiz_attempt(
+    attempt_in: schemas.QuizAttemptSubmitRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    모의고사/퀴즈 세트의 답안 전체를 한 번에 제출하고 채점 결과를 받습니다.
+    모든 문항의 정답을 한 번에 조회하고 답변을 일괄 저장하므로, 문항 수와 관계없이 DB 왕복 횟수가 일정합니다.
+    점수(0-100), 맞힌 문항 수, 소요 시간은 답변과 같은 트랜잭션에서 시도 기록에 저장됩니다.
+    존재하지 않는 certificate_id나 quiz_id가 있으면 아무것도 저장하지 않고 404입니다.
+    """
+    quiz_ids = [answer.quiz_id for answer in attempt_in.answers]
+    if len(set(quiz_ids)) != len(quiz_ids):
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Each quiz can be answered only once per attempt")
+    try:
+        return await quiz_service.submit_quiz_attempt_async(
+            db,
+            current_user.id,
+            exam_type=attempt_in.exam_type,
+            started_at=attempt_in.started_at,
+            answers=[answer.model_dump() for answer in attempt_in.answers],
+            certificate_id=attempt_in.certificate_id,
+        )
+    except quiz_service.UnknownCertificateError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Certificate not found")
+    except quiz_service.UnknownQuizError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,51 @@
+# certgo-backend/app/api/v1/quizzes/schemas.py
+
+from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+from uuid import UUID
+
+from app.core.config import settings
+
+class QuizGenerationRequest(BaseModel):
+    content_id: UUID
+    difficulty: Literal["easy", "normal", "hard"] = "normal"
+    count: int = Field(5, ge=1, le=50) # 생성할 문항 수
+
+class QuizGenerationTaskResponse(BaseModel):
+    task_id: str # 진행 이벤트 구독용 (/quizzes/generate/{task_id}/events)
+    content_id: UUID
+    status: str
+
+class AnswerSubmission(BaseModel):
+    quiz_id: UUID
+    user_selected_option_id: Optional[str] = None # 선택하지 않은 문항은 None (오답 처리)
+    bookmarked: bool = False
+
+class QuizAttemptSubmitRequest(BaseModel):
+    certificate_id: Optional[UUID] = None
+    exam_type: str # 'full', 'spreadsheet', 'quick', 'custom'
+    started_at: datetime # 응시 시작 시각 (클라이언트 기준, 서버에서 범위 보정)
+    answers: List[AnswerSubmission] = Field(..., min_length=1, max_length=settings.QUIZ_ATTEMPT_MAX_QUESTIONS)
+
+class GradedAnswerResponse(BaseModel):
+    quiz_id: UUID
+    user_selected_option_id: Optional[str] = None
+    correct_answer_id: str
+    is_correct: bool
+    bookmarked: bool
+
+class QuizAttemptResponse(BaseModel):
+    id: UUID
+    certificate_id: Optional[UUID] = None
+    exam_type: str
+    start_time: datetime
+    end_time: datetime
+    time_taken_seconds: int
+    score: int # 0-100
+    total_questions: int
+    correct_count: int
+    answers: List[GradedAnswerResponse]
+
+    class Config:
+        from_attributes = True
@@ -5,6 +5,9 @@ from app.api.v1.users.endpoints import router as user_router
 # 다른 도메인의 라우터도 여기에 임포트하고 include_router로 추가
 from app.api.v1.certificates.endpoints import router as certificates_router # 새로 추가
 from app.api.v1.learning_content.endpoints import router as learning_content_router # 새로 추가
+from app.api.v1.health.endpoints import router as health_router
+from app.api.v1.quizzes.endpoints import router as quizzes_router
+from app.api.v1.tutor.endpoints import router as tutor_router
 
 api_router = APIRouter()
 
@@ -12,7 +15,9 @@ api_router.include_router(auth_router, prefix="/auth", tags=["auth"])
 api_router.include_router(user_router, prefix="/users", tags=["users"])
 api_router.include_router(certificates_router, prefix="/certificates", tags=["certificates"]) # 추가
 api_router.include_router(learning_content_router, prefix="/learning-content", tags=["learning content"]) # 추가
+api_router.include_router(health_router, prefix="/health", tags=["health"])
+api_router.include_router(quizzes_router, prefix="/quizzes", tags=["quizzes"])
+api_router.include_router(tutor_router, prefix="/tutor", tags=["tutor"])
 
-# api_router.include_router(quizzes_router, prefix="/quizzes", tags=["quizzes"])
 # api_router.include_router(analytics_router, prefix="/analytics", tags=["analytics"])
 # api_router.include_router(subscriptions_router, prefix="/subscriptions", tags=["subscriptions"])
\ No newline at end of file
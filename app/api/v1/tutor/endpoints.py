@@ -0,0 +1,99 @@
+# certgo-backend/app/api/v1/tutor/endpoints.py
+
+import time
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, List, Optional
+from uuid import UUID
+
+from app.api.v1.tutor import schemas
+from app.core.config import settings
+from app.core.dependencies import get_async_db, get_current_user
+from app.database.connection import AsyncSessionLocal
+from app.services import ai_integration_service, learning_content_service, subscription_service, tutor_chat_service, tutor_service
+from app.services.result_cache import result_cache
+from app.services.subscription_service import SummaryCharge
+
+router = APIRouter()
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"} # 프록시(nginx) 버퍼링 비활성화
+
+async def _tutor_events(
+    user_id: UUID, content_id: UUID, question: str, messages: list, cache_key: str, charge: SummaryCharge
+) -> AsyncIterator[str]:
+    # StreamingResponse 본문 전송 중에는 요청 의존성 세션이 이미 닫혀 있으므로 저장/요약은 별도 세션에서 수행
+    provider = ai_integration_service.get_llm_provider()
+    cached = await result_cache.lookup(cache_key)
+    started = time.perf_counter()
+
+    async def save_turn(answer: str) -> dict:
+        if cached is None: # 새로 생성한 답변만 캐시에 저장 (생성 시간 = 절약되는 지연)
+            await result_cache.put(cache_key, answer, (time.perf_counter() - started) * 1000)
+        async with AsyncSessionLocal() as db:
+            last_seq = await tutor_chat_service.append_chat_messages_async(db, user_id, content_id, [("user", question), ("assistant", answer)])
+        return {"seq": last_seq, "message_text": answer}
+
+    async def refund():
+        async with AsyncSessionLocal() as db:
+            await subscription_service.refund_summary_quota_async(db, user_id, content_id, charge)
+
+    async for event in tutor_service.tutor_event_stream(provider, messages, save_turn, cached.text if cached else None, refund):
+        yield event
+    async with AsyncSessionLocal() as db:
+        await tutor_service.refresh_chat_summary_async(db, user_id, content_id, provider)
+
+@router.post("/{content_id}/messages", summary="Ask AI Tutor (SSE stream)")
+async def ask_tutor(
+    content_id: UUID,
+    message_in: schemas.TutorMessageRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    학습 콘텐츠에 대해 AI 튜터에게 질문하고 답변을 Server-Sent Events로 받습니다.
+    관련 섹션을 검색해 근거로 넣고, 토큰이 생성되는 대로 token 이벤트로 전달합니다.
+    스트림이 끝나면 질문과 답변을 대화에 저장하고 done 이벤트(seq 포함)를 보냅니다.
+    프롬프트(근거 섹션 + 대화 창 + 질문)가 같은 답변이 캐시에 있으면 LLM을 호출하지 않고 캐시된 답변을 보냅니다.
+    답변은 캐시 여부와 관계없이 플랜의 요약/채팅 사용 한도에서 1회 차감합니다. (생성에 실패하면 환불)
+    """
+    if not await learning_content_service.content_exists_async(db, content_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Learning Content not found")
+    model_id = ai_integration_service.get_llm_provider().model_id
+    messages, cache_key = await tutor_service.prepare_tutor_turn_async(db, current_user.id, content_id, message_in.message, model_id)
+    charge = await subscription_service.charge_summary_quota_async(db, current_user.id, content_id)
+    if charge is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Chat quota exceeded for the current plan")
+    return StreamingResponse(
+        _tutor_events(current_user.id, content_id, message_in.message, messages, cache_key, charge),
+        media_type="text/event-stream", headers=SSE_HEADERS,
+    )
+
+
+@router.get("/{content_id}/messages", response_model=schemas.ChatWindowResponse, summary="Get AI Tutor Chat Window")
+async def get_chat_window(
+    content_id: UUID,
+    last: int = Query(settings.TUTOR_CHAT_WINDOW_MESSAGES, ge=1, le=settings.TUTOR_CHAT_HISTORY_PAGE_MAX, description="최근 메시지 수"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    학습 콘텐츠에 대한 AI 튜터 대화 창을 조회합니다. (최근 메시지 + 그 이전 대화의 누적 요약)
+    대화 길이와 무관하게 최근 메시지만 읽습니다. 이전 메시지는 /{content_id}/messages/history 로 조회합니다.
+    """
+    return await tutor_chat_service.get_chat_window_async(db, current_user.id, content_id, last)
+
+
+@router.get("/{content_id}/messages/history", response_model=List[schemas.ChatMessageResponse], summary="Get Earlier AI Tutor Chat Messages")
+async def get_chat_history(
+    content_id: UUID,
+    before_seq: Optional[int] = Query(None, ge=1, description="이 순번 이전의 메시지 (대화 창의 첫 메시지 seq)"),
+    limit: int = Query(50, ge=1, le=settings.TUTOR_CHAT_HISTORY_PAGE_MAX),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    AI 튜터 대화의 이전 메시지를 before_seq부터 거슬러 limit건 조회합니다. (오래된 순)
+    """
+    return await tutor_chat_service.get_chat_messages_before_async(db, current_user.id, content_id, before_seq, limit)
@@ -0,0 +1,25 @@
+# certgo-backend/app/api/v1/tutor/schemas.py
+
+from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+from app.core.config import settings
+
+class ChatMessageResponse(BaseModel):
+    seq: int # 대화 안에서의 순번 (이전 메시지 조회 시 before_seq로 사용)
+    role: str # 'user', 'assistant'
+    message_text: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class ChatWindowResponse(BaseModel):
+    last_seq: int
+    summary_text: Optional[str] = None # summarized_through_seq까지의 대화 누적 요약
+    summarized_through_seq: int
+    messages: List[ChatMessageResponse] # 최근 메시지 (오래된 순)
+
+class TutorMessageRequest(BaseModel):
+    message: str = Field(..., min_length=1, max_length=settings.TUTOR_MESSAGE_MAX_CHARS)
@@ -1,24 +1,24 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.v1.users import schemas
 from app.database.models import User
-from app.core.dependencies import get_db, get_current_user
-from app.core.security import verify_password
+from app.core.dependencies import get_async_db, get_current_user, get_current_user_for_update
+from app.core.hashing import password_hasher
 from app.services import user_service
 
 router = APIRouter()
 
 @router.get("/me", response_model=schemas.UserResponse)
-def read_current_user(current_user: User = Depends(get_current_user)):
+async def read_current_user(current_user: User = Depends(get_current_user)):
     return current_user
 
 @router.put("/me", response_model=schemas.UserResponse)
-def update_current_user_profile(
+async def update_current_user_profile(
     user_update: schemas.UserProfileUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_for_update),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    updated_user = user_service.update_user_profile(
+    updated_user = await user_service.update_user_profile_async(
         db,
         user=current_user,
         name=user_update.name,
@@ -29,12 +29,12 @@ def update_current_user_profile(
     return updated_user
 
 @router.put("/me/notifications", response_model=schemas.UserResponse)
-def update_current_user_notifications(
+async def update_current_user_notifications(
     notif_update: schemas.UserNotificationUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_for_update),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    updated_user = user_service.update_user_notifications(
+    updated_user = await user_service.update_user_notifications_async(
         db,
         user=current_user,
         email_notifications=notif_update.email_notifications,
@@ -44,12 +44,13 @@ def update_current_user_notifications(
     return updated_user
 
 @router.put("/me/password", response_model=schemas.MessageResponse)
-def update_current_user_password(
+async def update_current_user_password(
     password_update: schemas.UserPasswordUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_for_update),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    if not verify_password(password_update.current_password, current_user.password_hash):
+    is_valid, _ = await password_hasher.verify_password(password_update.current_password, current_user.password_hash)
+    if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
@@ -59,17 +60,17 @@ def update_current_user_password(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="New password and confirmation do not match"
         )
-    user_service.update_user_password(db, current_user, password_update.new_password)
+    await user_service.update_user_password_async(db, current_user, password_update.new_password)
     return {"message": "Password updated successfully"}
 
 @router.delete("/me", response_model=schemas.MessageResponse)
-def delete_current_user(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def delete_current_user(current_user: User = Depends(get_current_user_for_update), db: AsyncSession = Depends(get_async_db)):
     # 실제 계정 삭제 로직 (확인 메일 발송 등 추가 필요)
-    user_service.delete_user(db, current_user)
+    await user_service.delete_user_async(db, current_user)
     return {"message": "Account deletion request received. Please check your email."}
 
 # Login history (requires LoginHistory model and service)
 # @router.get("/me/login-history", response_model=List[schemas.LoginHistoryResponse])
-# def read_user_login_history(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+# def read_user_login_history(current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
 #     history = user_service.get_user_login_history(db, current_user.id)
 #     return history
\ No newline at end of file
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -10,11 +12,148 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 # 24시간
 
+    # 비밀번호 해싱 설정 (bcrypt는 전용 프로세스 풀에서 실행)
+    BCRYPT_ROUNDS: int = 12 # bcrypt cost (변경 시 다음 로그인에서 자동 재해싱)
+    PASSWORD_HASH_WORKERS: int = 2 # 워커 프로세스당 해싱 전용 프로세스 수
+    PASSWORD_HASH_MAX_PENDING: int = 32 # 대기 중인 해싱 작업 상한 (초과 시 503 + Retry-After)
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 2
+
+    # DB 커넥션 풀 설정 (Gunicorn 워커 프로세스마다 별도의 풀이 생성됨)
+    WEB_CONCURRENCY: int = 4 # Gunicorn 워커 수 (Dockerfile의 WEB_CONCURRENCY와 동일하게 유지)
+    DB_MAX_CONNECTIONS: int = 80 # 이 서비스(API 워커 + Celery 워커) 전체가 사용할 최대 커넥션 수 (Postgres max_connections 이하로 설정)
+    DB_POOL_ROLE: str = "api" # api: Gunicorn 워커 프로세스, worker: Celery 워커 프로세스 (scripts/run_worker.sh에서 설정)
+    CELERY_WORKER_PROCESSES: int = 6 # 이 서비스의 Celery 워커 프로세스 수 합계 (기본: content 2 + interactive 4)
+    DB_CELERY_CONNECTIONS_PER_PROCESS: int = 2 # Celery 워커 프로세스당 동기 풀 크기 (프로세스가 태스크를 하나씩 실행하므로 작게, 비동기 엔진 1개는 별도)
+    DB_API_SYNC_POOL_SIZE: int = 2 # API 워커의 동기 엔진 풀 크기 (API는 비동기 엔진을 사용하므로 작게 고정)
+    DB_POOL_SIZE: Optional[int] = None # API 워커의 비동기 엔진 풀. 미설정 시 API 워커당 예산 기준으로 계산
+    DB_MAX_OVERFLOW: Optional[int] = None # API 워커의 비동기 엔진 overflow. 미설정 시 API 워커당 예산 기준으로 계산
+    DB_POOL_TIMEOUT: int = 10 # 풀에서 커넥션을 기다리는 최대 시간 (초)
+    DB_POOL_RECYCLE: int = 1800 # 이 시간(초)보다 오래된 커넥션은 재연결 (방화벽/프록시 유휴 종료 대비)
+    DB_POOL_PRE_PING: bool = True # 체크아웃 시 커넥션 생존 여부 확인
+
+    # 인증 사용자(principal) 캐시 설정 (get_current_user의 users 테이블 조회 생략)
+    PRINCIPAL_CACHE_ENABLED: bool = True
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 300 # Redis(공유) 캐시 TTL
+    PRINCIPAL_CACHE_LOCAL_TTL_SECONDS: int = 15 # 프로세스 내 캐시 TTL (Redis 사용 여부와 무관하게, 다른 워커의 무효화가 반영되는 최대 지연)
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000 # 프로세스 내 LRU 최대 항목 수
+    PRINCIPAL_CACHE_REDIS_ENABLED: bool = False # True면 Redis를 워커 간 공유 캐시로 사용
+
+    # 콘텐츠 처리 파이프라인 (섹션 분할) 설정
+    CHUNK_TARGET_CHARS: int = 1200 # 섹션 하나의 목표 길이 (문자 수)
+    CHUNK_OVERLAP_CHARS: int = 200 # 앞 섹션과 겹치게 포함할 최대 길이 (문자 수)
+    CHUNK_ANCHOR_MODULUS: int = 8 # 목표 길이의 절반 이후 약 1/N 확률의 앵커 문장에서 자름 (수정 후 경계 재동기화용)
+    SECTION_INSERT_BATCH_SIZE: int = 1000 # ContentSection bulk insert 배치 크기
+    RAW_TEXT_READ_CHARS: int = 1_000_000 # raw_text_content를 DB에서 나누어 읽는 크기 (문자 수)
+
+    # Celery 태스크 중복 실행 방지 설정
+    CONTENT_LOCK_TTL_SECONDS: int = 60 # 콘텐츠 처리 락 lease (처리 중에는 ttl/3 마다 자동 연장, 워커가 죽으면 ttl 후 해제)
+    CONTENT_DISPATCH_DEDUPE_SECONDS: int = 3600 # 같은 콘텐츠의 처리 메시지 중복 발행 방지 기간
+    CELERY_VISIBILITY_TIMEOUT_SECONDS: int = 3600 # ack되지 않은 메시지 재전달까지의 시간 (Redis 브로커)
+    CONTENT_EMBED_GROUP_SIZE: int = 32 # 긴 콘텐츠의 임베딩을 나누어 여러 워커로 fan-out 하는 섹션 묶음 크기 (묶음이 하나뿐이면 직접 처리)
+    CONTENT_GROUP_MAX_RETRIES: int = 3 # 섹션 묶음 태스크 실패 시 재시도 횟수 (묶음 단위로 재시도)
+    CONTENT_SUMMARY_PREWARM: bool = True # fan-out 시 섹션 요약(SUMMARY_MAX_SECTIONS 단위)도 묶음별 태스크로 생성해 결과 캐시에 저장
+    CONTENT_CHORD_LEASE_SECONDS: int = 3600 # fan-out 중 콘텐츠 락 lease (큐 대기 시간을 포함하므로 길게, 하위 태스크가 실행될 때마다 갱신)
+
+    # 태스크 outbox 설정
+    OUTBOX_RELAY_BATCH_SIZE: int = 500 # relay가 한 번에 발행하는 outbox 행 수
+    OUTBOX_RELAY_INTERVAL_SECONDS: float = 5.0 # relay 주기 (celery beat)
+    OUTBOX_RELAY_TIME_BUDGET_SECONDS: float = 4.0 # relay 한 번의 최대 실행 시간 (적체 시 배치를 이어서 발행)
+    OUTBOX_MAX_BACKOFF_SECONDS: int = 300 # 발행 실패 시 재시도 간격 상한 (2^attempts 초)
+    CONTENT_STALE_PENDING_MINUTES: int = 15 # 이 시간 이상 PENDING이고 outbox에도 없으면 다시 처리 요청
+    CONTENT_SWEEP_INTERVAL_SECONDS: float = 300.0 # 오래된 PENDING 콘텐츠 스윕 주기 (celery beat)
+
+    # 처리 진행 이벤트 (Redis pub/sub -> SSE) 설정
+    PROGRESS_EVENT_TTL_SECONDS: int = 60 * 60 * 6 # 채널별 마지막 이벤트 보관 시간 (SSE 연결 시 초기 상태)
+    PROGRESS_SSE_KEEPALIVE_SECONDS: float = 15.0 # 이벤트가 없을 때 keep-alive 주석을 보내는 간격
+
+    # AI 튜터 대화 설정
+    TUTOR_CHAT_WINDOW_MESSAGES: int = 20 # 대화 창(최근 메시지 수): 이보다 오래된 메시지는 누적 요약으로 전달
+    TUTOR_CHAT_HISTORY_PAGE_MAX: int = 200 # 이전 메시지 페이지 조회 최대 건수
+    TUTOR_MESSAGE_MAX_CHARS: int = 2000 # 사용자 질문 최대 길이
+    TUTOR_CONTEXT_TOKEN_BUDGET: int = 2000 # 답변 근거로 프롬프트에 넣는 섹션들의 최대 토큰 수
+    TUTOR_SUMMARY_TRIGGER_MESSAGES: int = 20 # 대화 창 밖의 미요약 메시지가 이 수 이상이면 누적 요약 갱신
+
     # AI 관련 설정
     AI_API_KEY: str = "" # AI_API_KEY 설정 (필요시)
     QDRANT_API_KEY: str = "" # Qdrant API Key (클라우드 Qdrant 사용 시)
 
+    # LLM 설정 (튜터 답변, 요약, 퀴즈 생성)
+    LLM_PROVIDER: str = "fake" # fake: 외부 호출 없는 결정적 로컬 LLM (오프라인 테스트/벤치마크용)
+    LLM_MAX_OUTPUT_TOKENS: int = 512 # 응답 하나의 최대 토큰 수
+    FAKE_LLM_FIRST_TOKEN_SECONDS: float = 0.3 # fake provider의 첫 토큰 지연
+    FAKE_LLM_TOKEN_SECONDS: float = 0.02 # fake provider의 토큰 간 지연
+
+    # 프롬프트 컨텍스트 조립 설정 (raw_text 전체 대신 섹션을 골라 토큰 예산 안에서 조립)
+    CONTEXT_RETRIEVAL_CANDIDATES: int = 20 # 질문 기반 조립 시 검색하는 후보 섹션 수
+    CONTEXT_ADJACENCY_WEIGHT: float = 0.5 # 검색된 섹션의 앞/뒤 섹션에 부여하는 점수 비율
+    QUIZ_CONTEXT_TOKEN_BUDGET: int = 4000 # 퀴즈 생성 프롬프트에 넣는 섹션들의 최대 토큰 수
+
+    # AI 생성 결과 캐시 설정 (섹션 요약, 튜터 답변: (콘텐츠, 섹션 범위, 프롬프트 템플릿 버전, 모델) -> 결과)
+    RESULT_CACHE_ENABLED: bool = True # False면 캐시 없이 매번 생성 (같은 프로세스의 동시 요청은 계속 한 번만 생성)
+    RESULT_CACHE_TTL_SECONDS: int = 60 * 60 * 24 * 7 # Redis 캐시 TTL (7일)
+    RESULT_CACHE_MAX_ENTRIES: int = 50000 # Redis에 보관하는 최대 결과 수 (초과 시 오래 안 쓰인 것부터 제거)
+    RESULT_CACHE_LOCK_SECONDS: int = 120 # 한 워커가 생성하는 동안 잡는 락의 만료 시간 (생성 시간보다 길게)
+    RESULT_CACHE_WAIT_SECONDS: float = 60.0 # 다른 워커의 생성 결과를 기다리는 최대 시간 (초과 시 직접 생성)
+
+    # 퀴즈 시도 제출 설정
+    QUIZ_ATTEMPT_MAX_QUESTIONS: int = 200 # 시도 하나에 제출할 수 있는 최대 문항 수
+    QUIZ_ATTEMPT_MAX_SECONDS: int = 60 * 60 * 5 # 응시 시간 상한 (클라이언트가 보낸 시작 시각 보정용)
+
+    # AI 요약 설정
+    SUMMARY_MAX_SECTIONS: int = 30 # 요약 요청 한 번의 최대 섹션 범위
+    SUMMARY_FREE_LIMIT: int = 3 # 구독이 없는 사용자의 요약 사용 한도 (summary_count 합계)
+
+    # 임베딩 / Qdrant 업로드 설정 (QDRANT_HOST=":memory:" 이면 프로세스 내 Qdrant 사용)
+    EMBEDDING_PROVIDER: str = "hashing" # hashing: 외부 호출 없는 결정적 로컬 임베더
+    EMBEDDING_DIMENSION: int = 384
+    QDRANT_COLLECTION_PREFIX: str = "sections" # 섹션 벡터 공유 컬렉션 이름: {prefix}_{model_id}
+    EMBEDDING_BATCH_SIZE: int = 64 # provider.embed 한 번에 보내는 섹션 수
+    QDRANT_UPSERT_BATCH_SIZE: int = 256 # Qdrant upsert 한 번에 보내는 point 수
+    QDRANT_UPLOAD_PARALLEL: int = 4 # 동시에 진행하는 upsert 요청 수
+
+    # 임베딩 캐시 설정 ((model_id, 정규화된 텍스트 해시) -> 벡터)
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_REDIS_ENABLED: bool = True # True면 Redis를 워커 간 공유 캐시로 사용
+    EMBEDDING_CACHE_TTL_SECONDS: int = 60 * 60 * 24 * 30 # Redis 캐시 TTL (30일)
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 10000 # 프로세스 내 LRU 최대 항목 수 (384차원 기준 항목당 약 1.5KB)
+
+    # 섹션 검색 설정 (hybrid: 전문 검색 + 벡터 검색을 RRF로 결합)
+    HYBRID_SEARCH_CANDIDATES: int = 50 # hybrid 모드에서 각 검색이 가져오는 후보 수
+    RRF_K: int = 60 # reciprocal-rank fusion 상수 (클수록 하위 순위 결과의 영향이 커짐)
+
     # pydantic-settings가 .env 파일을 로드하도록 설정
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
+    @property
+    def db_celery_connections(self) -> int:
+        # Celery 워커 프로세스 전체가 사용하는 커넥션 수 (프로세스마다 동기 풀 + 요약/퀴즈 생성용 비동기 엔진 1개)
+        return self.CELERY_WORKER_PROCESSES * (self.DB_CELERY_CONNECTIONS_PER_PROCESS + 1)
+
+    @property
+    def db_connections_per_worker(self) -> int:
+        # API 워커 프로세스 하나의 예산 (동기 + 비동기 엔진 합계). Celery 몫을 뺀 나머지를 API 워커 수로 나눔
+        return max(2, (self.DB_MAX_CONNECTIONS - self.db_celery_connections) // max(1, self.WEB_CONCURRENCY))
+
+    @property
+    def db_async_connections_per_worker(self) -> int:
+        return max(1, self.db_connections_per_worker - self.DB_API_SYNC_POOL_SIZE)
+
+    @property
+    def db_pool_size(self) -> int:
+        # API 워커의 비동기 엔진: 예산의 절반은 상시 유지, 나머지는 overflow로 사용
+        if self.DB_POOL_SIZE is not None:
+            return self.DB_POOL_SIZE
+        return max(1, self.db_async_connections_per_worker // 2)
+
+    @property
+    def db_max_overflow(self) -> int:
+        if self.DB_MAX_OVERFLOW is not None:
+            return self.DB_MAX_OVERFLOW
+        return max(0, self.db_async_connections_per_worker - self.db_pool_size)
+
+    @property
+    def db_sync_pool_size(self) -> int:
+        # 동기 엔진 풀 (overflow 없음): Celery 워커는 태스크용, API 워커는 남아 있는 동기 경로용으로 작게
+        return self.DB_CELERY_CONNECTIONS_PER_PROCESS if self.DB_POOL_ROLE == "worker" else self.DB_API_SYNC_POOL_SIZE
+
 settings = Settings()
\ No newline at end of file
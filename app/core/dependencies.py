@@ -1,23 +1,17 @@
-from typing import Generator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.connection import SessionLocal
+from app.database.connection import get_async_db, get_db # DB 세션 의존성은 connection에 한 번만 정의하고 여기서 함께 제공
+from app.core.config import settings
+from app.core.principal_cache import principal_cache, user_from_cache
 from app.core.security import decode_access_token
 from app.database.models import User
-from app.services.user_service import get_user_by_email # 임시, User 모델 직접 사용 대신 서비스 사용
+from app.services.user_service import get_user_by_email_async # 임시, User 모델 직접 사용 대신 서비스 사용
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login") # Traefik 라우팅 경로 반영
 
-def get_db() -> Generator:
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+def _token_subject(token: str) -> str:
     payload = decode_access_token(token)
     if not payload:
         raise HTTPException(
@@ -32,8 +26,34 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    # 실제 User 서비스에서 유저를 조회하도록 변경
-    user = get_user_by_email(db, user_email)
+    return user_email
+
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> User:
+    """
+    요청 사용자를 반환합니다. principal 캐시 적중 시 users 테이블 조회 없이 읽기 전용 스냅샷(세션에 연결하지 않음)을 반환하므로
+    사용자 행을 수정하거나 비밀번호를 확인하는 엔드포인트는 get_current_user_for_update를 사용합니다.
+    """
+    user_email = _token_subject(token)
+    token_generation = None
+    if settings.PRINCIPAL_CACHE_ENABLED:
+        cached, token_generation = await principal_cache.aget(user_email)
+        if cached is not None:
+            return user_from_cache(cached)
+    user = await get_user_by_email_async(db, user_email)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    if token_generation is not None:
+        # 조회 중에 다른 요청이 사용자 정보를 바꿔 무효화했으면 저장하지 않음
+        await principal_cache.aset(user_email, user, token_generation)
+    return user
+
+async def get_current_user_for_update(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> User:
+    """
+    캐시를 거치지 않고 DB에서 새로 읽은 사용자 행을 반환합니다 (프로필 수정, 비밀번호 변경/확인, 탈퇴용).
+    같은 요청의 엔드포인트도 get_async_db를 쓰면 FastAPI 의존성 캐시로 동일 세션을 공유하므로
+    반환한 user를 그대로 수정/commit 할 수 있고, 이미 삭제된 사용자는 404가 됩니다.
+    """
+    user = await get_user_by_email_async(db, _token_subject(token))
     if user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    return user
\ No newline at end of file
+    return user
@@ -0,0 +1,217 @@
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Tuple
+
+import redis
+import redis.asyncio as aioredis
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.database.models import User
+
+REDIS_KEY_PREFIX = "principal:"
+REDIS_GENERATION_PREFIX = "principal:gen:" # 사용자별 무효화 세대 (무효화할 때마다 INCR)
+EXCLUDED_COLUMNS = {"password_hash"} # 자격 증명은 캐시하지 않음 (비밀번호 확인은 DB에서 새로 읽은 행으로)
+
+# 무효화 세대가 조회 시점과 같을 때만 저장 (조회와 저장 사이에 다른 워커가 무효화했으면 이전 값으로 덮어쓰지 않음)
+_SET_IF_GENERATION_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[3] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return 1
+"""
+
+
+def user_to_cache(user: User) -> dict:
+    """User 컬럼 값(자격 증명 제외)을 JSON 직렬화 가능한 dict로 변환합니다."""
+    data = {}
+    for attr in sa_inspect(User).column_attrs:
+        if attr.key in EXCLUDED_COLUMNS:
+            continue
+        value = getattr(user, attr.key)
+        if isinstance(value, uuid.UUID):
+            value = str(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        data[attr.key] = value
+    return data
+
+
+def user_from_cache(data: dict) -> User:
+    """
+    캐시된 dict로 User를 복원합니다. 세션에 연결하지 않는 읽기 전용 스냅샷이며,
+    사용자 행을 수정하거나 비밀번호를 확인하는 엔드포인트는 DB에서 새로 읽은 행을 사용해야 합니다.
+    캐시하지 않은 컬럼(password_hash)은 만료 상태가 되어 접근하면 DetachedInstanceError가 발생합니다.
+    """
+    values = dict(data)
+    for attr in sa_inspect(User).column_attrs:
+        value = values.get(attr.key)
+        if value is None:
+            continue
+        python_type = attr.columns[0].type.python_type
+        if python_type is uuid.UUID:
+            values[attr.key] = uuid.UUID(value)
+        elif python_type is datetime:
+            values[attr.key] = datetime.fromisoformat(value)
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
+
+class PrincipalCache:
+    """
+    토큰 subject(이메일) -> 사용자 정보 캐시.
+    1차: 프로세스 내 TTL + LRU, 2차(선택): 워커 간 공유되는 Redis.
+    Redis 장애 시에는 캐시 미스로 처리하여 DB 조회로 대체합니다.
+
+    aget()은 캐시 값과 함께 무효화 세대 토큰을 돌려주고, aset()은 토큰이 그대로일 때만 저장합니다.
+    (미스 후 DB 조회 중에 사용자 정보가 바뀌어 무효화되면, 조회한 이전 값을 다시 채우지 않음)
+    """
+
+    def __init__(self, ttl_seconds: int, local_ttl_seconds: int, max_entries: int, redis_url: Optional[str] = None):
+        self.ttl_seconds = ttl_seconds
+        # 다른 워커에서 발생한 무효화는 로컬 캐시에 반영되지 않으므로 (Redis 사용 여부와 무관) 로컬 캐시는 짧은 TTL로 유지
+        self.local_ttl_seconds = min(local_ttl_seconds, ttl_seconds)
+        self.max_entries = max_entries
+        self.redis_url = redis_url
+        self._local: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = None
+        self._aredis = None
+        self._set_script = None
+        self._generation = 0 # 이 프로세스에서 무효화가 일어날 때마다 증가 (조회 중 무효화 감지용)
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    # --- 로컬 LRU ---
+
+    def _local_get(self, subject: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._local.get(subject)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at < time.monotonic():
+                del self._local[subject]
+                return None
+            self._local.move_to_end(subject)
+            return data
+
+    def _local_set(self, subject: str, data: dict):
+        with self._lock:
+            self._local[subject] = (time.monotonic() + self.local_ttl_seconds, data)
+            self._local.move_to_end(subject)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    def _local_delete(self, subject: str):
+        with self._lock:
+            self._local.pop(subject, None)
+            self._generation += 1
+
+    # --- Redis ---
+
+    def _sync_redis(self):
+        if self._redis is None:
+            self._redis = redis.from_url(self.redis_url)
+        return self._redis
+
+    def _async_redis(self):
+        if self._aredis is None:
+            self._aredis = aioredis.from_url(self.redis_url)
+        return self._aredis
+
+    # --- 공개 API ---
+
+    async def aget(self, subject: str) -> Tuple[Optional[dict], tuple]:
+        """(캐시된 사용자 정보 또는 None, 무효화 세대 토큰)을 반환합니다. 미스면 토큰을 aset()에 넘깁니다."""
+        data = self._local_get(subject)
+        if data is not None:
+            self.hits += 1
+            return data, ()
+        token = (self._generation, b"")
+        if self.redis_url:
+            try:
+                raw, generation = await self._async_redis().mget(REDIS_KEY_PREFIX + subject, REDIS_GENERATION_PREFIX + subject)
+            except redis.RedisError:
+                raw, generation = None, None
+            if raw is not None:
+                data = json.loads(raw)
+                self._local_set(subject, data)
+                self.redis_hits += 1
+                return data, ()
+            token = (token[0], generation or b"")
+        self.misses += 1
+        return None, token
+
+    async def aset(self, subject: str, user: User, token: tuple):
+        """aget() 이후 무효화가 없었을 때만 저장합니다."""
+        generation, redis_generation = token
+        if generation != self._generation:
+            return
+        data = user_to_cache(user)
+        if self.redis_url:
+            try:
+                if self._set_script is None:
+                    self._set_script = self._async_redis().register_script(_SET_IF_GENERATION_SCRIPT)
+                stored = await self._set_script(
+                    keys=[REDIS_KEY_PREFIX + subject, REDIS_GENERATION_PREFIX + subject],
+                    args=[json.dumps(data), self.ttl_seconds, redis_generation],
+                )
+            except redis.RedisError:
+                stored = 1 # Redis 장애 시에는 로컬 캐시만 사용
+            if not stored:
+                return
+        if generation == self._generation: # Redis 호출을 기다리는 동안 이 프로세스에서 무효화됐으면 저장하지 않음
+            self._local_set(subject, data)
+
+    def invalidate(self, subject: str):
+        self._local_delete(subject)
+        if self.redis_url:
+            try:
+                pipe = self._sync_redis().pipeline()
+                pipe.delete(REDIS_KEY_PREFIX + subject)
+                pipe.incr(REDIS_GENERATION_PREFIX + subject)
+                pipe.expire(REDIS_GENERATION_PREFIX + subject, self.ttl_seconds)
+                pipe.execute()
+            except redis.RedisError:
+                pass
+
+    async def ainvalidate(self, subject: str):
+        self._local_delete(subject)
+        if self.redis_url:
+            try:
+                pipe = self._async_redis().pipeline()
+                pipe.delete(REDIS_KEY_PREFIX + subject)
+                pipe.incr(REDIS_GENERATION_PREFIX + subject)
+                pipe.expire(REDIS_GENERATION_PREFIX + subject, self.ttl_seconds)
+                await pipe.execute()
+            except redis.RedisError:
+                pass
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.redis_hits + self.misses
+        return {
+            "enabled": settings.PRINCIPAL_CACHE_ENABLED,
+            "redis_enabled": bool(self.redis_url),
+            "entries": len(self._local),
+            "local_hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.hits + self.redis_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    local_ttl_seconds=settings.PRINCIPAL_CACHE_LOCAL_TTL_SECONDS,
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    redis_url=settings.REDIS_URL if settings.PRINCIPAL_CACHE_REDIS_ENABLED else None,
+)
@@ -0,0 +1,34 @@
+# certgo-backend/app/core/task_routing.py
+
+# 태스크 큐와 우선순위. 서비스/API 계층이 app.tasks를 import하지 않도록 여기에 둡니다.
+# 큐 이름. 워커는 큐별로 따로 실행합니다. (scripts/run_worker.sh)
+QUEUE_INTERACTIVE = "interactive" # 사용자가 결과를 기다리는 짧은 태스크 (퀴즈 생성)
+QUEUE_CONTENT = "content" # 수 분 이상 걸리는 콘텐츠 처리 (배치 업로드로 적체될 수 있음)
+QUEUE_MAINTENANCE = "maintenance" # 주기 태스크 (outbox relay, 스윕)
+
+TASK_ROUTES = {
+    "generate_quizzes_task": {"queue": QUEUE_INTERACTIVE},
+    "process_content_task": {"queue": QUEUE_CONTENT},
+    "embed_section_group_task": {"queue": QUEUE_CONTENT}, # process_content_task의 fan-out (chord)
+    "summarize_section_group_task": {"queue": QUEUE_CONTENT}, # 같은 chord의 요약 미리 생성
+    "finalize_content_processing_task": {"queue": QUEUE_CONTENT},
+    "content_processing_failed_task": {"queue": QUEUE_CONTENT},
+    "relay_outbox_task": {"queue": QUEUE_MAINTENANCE},
+    "sweep_stale_pending_contents_task": {"queue": QUEUE_MAINTENANCE},
+}
+
+# Redis 브로커의 메시지 우선순위: 숫자가 작을수록 먼저 처리됩니다.
+# Redis에는 우선순위 큐가 없으므로 단계(PRIORITY_STEPS)마다 별도의 list를 만들고, 워커는 높은 단계부터 꺼냅니다.
+PRIORITY_STEPS = [0, 3, 6, 9]
+PRIORITY_HIGH = 0 # 프리미엄 자격증 콘텐츠, 유료 사용자 요청
+PRIORITY_DEFAULT = 3
+
+
+def task_priority(premium: bool) -> int:
+    """프리미엄 자격증의 콘텐츠이거나 유료 사용자의 요청이면 같은 큐 안에서 먼저 처리합니다."""
+    return PRIORITY_HIGH if premium else PRIORITY_DEFAULT
+
+
+def route_task(task_name: str, premium: bool = False) -> dict:
+    """태스크의 큐와 우선순위. (apply_async / send_task 옵션)"""
+    return {"queue": TASK_ROUTES[task_name]["queue"], "priority": task_priority(premium)}
@@ -1,28 +1,80 @@
+from typing import AsyncGenerator, Generator
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.core.config import settings
+from app.database.pool_metrics import instrumented_pool_class
 
 # DATABASE_URL은 core/config.py에서 가져옴
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-# 엔진 생성
+# 비동기 엔진은 같은 DB를 asyncpg 드라이버로 접속 (postgresql:// -> postgresql+asyncpg://)
+ASYNC_SQLALCHEMY_DATABASE_URL = make_url(SQLALCHEMY_DATABASE_URL).set(drivername="postgresql+asyncpg")
+
+# 커넥션 풀 공통 설정 (크기는 엔진별로 지정, config에서 API/Celery 워커 수 기준으로 계산)
+POOL_OPTIONS = dict(
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+
+# 프로세스마다 두 엔진의 풀이 따로 생기므로 예산을 나눔:
+# - API 워커: 비동기 엔진이 예산 대부분(db_pool_size + db_max_overflow), 동기 엔진은 DB_API_SYNC_POOL_SIZE로 작게 고정
+# - Celery 워커: 동기 엔진 DB_CELERY_CONNECTIONS_PER_PROCESS, 비동기 엔진은 요약/퀴즈 생성 태스크용 1개 (app.tasks.event_loop의 루프 하나에서만 사용)
+# 합계: WEB_CONCURRENCY x db_connections_per_worker + db_celery_connections <= DB_MAX_CONNECTIONS
+if settings.DB_POOL_ROLE == "worker":
+    ASYNC_POOL_SIZE, ASYNC_MAX_OVERFLOW = 1, 0
+else:
+    ASYNC_POOL_SIZE, ASYNC_MAX_OVERFLOW = settings.db_pool_size, settings.db_max_overflow
+
+# 엔진 생성 (동기: Celery 태스크, Alembic, 스크립트용)
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL
+    SQLALCHEMY_DATABASE_URL,
+    poolclass=instrumented_pool_class(QueuePool, "sync"),
+    pool_size=settings.db_sync_pool_size,
+    max_overflow=0,
+    **POOL_OPTIONS,
     # connect_args={"check_same_thread": False} # SQLite 전용, PostgreSQL에는 필요 없음
 )
 
 # 세션 생성 (세션은 데이터베이스와 통신하는 실제 객체)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 생성 (FastAPI 엔드포인트용, 스레드풀 슬롯을 점유하지 않음)
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    poolclass=instrumented_pool_class(AsyncAdaptedQueuePool, "async"),
+    pool_size=ASYNC_POOL_SIZE,
+    max_overflow=ASYNC_MAX_OVERFLOW,
+    **POOL_OPTIONS,
+)
+
+# 비동기 세션 생성
+# expire_on_commit=False: commit 이후 속성 접근 시 암묵적인 lazy load(비동기에서는 불가)를 막기 위함
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # ORM 모델의 베이스 클래스
 Base = declarative_base()
 
-# DB 세션 의존성 (FastAPI에서 사용)
-def get_db():
+# DB 세션 의존성 (FastAPI에서 사용, app.core.dependencies에서 re-export)
+def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# 비동기 DB 세션 의존성 (FastAPI에서 사용, app.core.dependencies에서 re-export)
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
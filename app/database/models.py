@@ -1,7 +1,7 @@
-from sqlalchemy import Column, String, Boolean, Integer, Text, TIMESTAMP, ForeignKey, DECIMAL
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, Boolean, Integer, Text, TIMESTAMP, ForeignKey, DECIMAL, Index, Computed, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 
 from .connection import Base
 
@@ -52,7 +52,12 @@ class Certificate(Base):
 # LearningContent 모델
 class LearningContent(Base):
     __tablename__ = "learningcontent"
-    __table_args__ = {'comment': '동영상, 문서, 텍스트 등 실제 학습 자료의 메타데이터를 저장합니다.'}
+    __table_args__ = (
+        # keyset 페이지네이션용 정렬 인덱스 (created_at, id)
+        Index('ix_learningcontent_created_at_id', 'created_at', 'id'),
+        Index('ix_learningcontent_certificate_id_created_at_id', 'certificate_id', 'created_at', 'id'),
+        {'comment': '동영상, 문서, 텍스트 등 실제 학습 자료의 메타데이터를 저장합니다.'},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=func.uuid_generate_v4(), comment='학습 콘텐츠의 고유 식별자')
     certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id"), nullable=True, comment='이 콘텐츠가 속한 자격증의 ID') #
@@ -60,7 +65,9 @@ class LearningContent(Base):
     source_url = Column(String, unique=True, nullable=False, comment='콘텐츠의 원본 URL (예: YouTube 영상 링크, 웹사이트 URL)') #
     title = Column(String, nullable=False, comment='콘텐츠의 제목') #
     description = Column(Text, comment='콘텐츠에 대한 간단한 설명') #
-    raw_text_content = Column(Text, comment='동영상 트랜스크립트, 문서 내용 등 AI 처리를 위한 원본 텍스트 데이터')
+    # 대용량(TOAST) 텍스트이므로 기본 조회에서 제외 (필요한 곳에서만 undefer 또는 직접 접근 시 로드)
+    # STORAGE EXTERNAL(비압축 out-of-line, 마이그레이션 4c8a2e6f1b93): content_service.iter_raw_text의 substr이 값 전체를 압축 해제하지 않음
+    raw_text_content = deferred(Column(Text, comment='동영상 트랜스크립트, 문서 내용 등 AI 처리를 위한 원본 텍스트 데이터'))
     processing_status = Column(String, default='PENDING', nullable=False, comment='AI 처리 상태 (예: "PENDING", "PROCESSING", "COMPLETED", "FAILED")')
     duration_minutes = Column(Integer, comment='비디오 콘텐츠의 길이 (분)') #
     qdrant_collection_name = Column(String, comment='이 콘텐츠의 벡터 임베딩이 저장된 Qdrant 컬렉션의 이름')
@@ -69,7 +76,7 @@ class LearningContent(Base):
 
     # Relationships
     certificate = relationship("Certificate", back_populates="contents")
-    sections = relationship("ContentSection", back_populates="content")
+    sections = relationship("ContentSection", back_populates="content", order_by="ContentSection.order_index")
     quizzes = relationship("Quiz", back_populates="content")
     user_progresses = relationship("UserLearningProgress", back_populates="content")
 
@@ -77,7 +84,15 @@ class LearningContent(Base):
 # ContentSection 모델
 class ContentSection(Base):
     __tablename__ = "contentsections"
-    __table_args__ = {'comment': '긴 학습 콘텐츠를 의미 있는 작은 단위(섹션)로 분할하여 저장합니다.'}
+    __table_args__ = (
+        # 콘텐츠별 섹션을 order_index 순서/범위로 조회하기 위한 인덱스
+        Index('ix_contentsections_content_id_order_index', 'content_id', 'order_index'),
+        # 재생 위치(초) -> 섹션 조회용 인덱스 (비디오 seek 이벤트, 시작 시각이 같으면 order_index로 결정)
+        Index('ix_contentsections_content_id_start_seconds_order_index', 'content_id', 'start_seconds', 'order_index'),
+        # 전문 검색(키워드 매칭)용 GIN 인덱스
+        Index('ix_contentsections_search_vector', 'search_vector', postgresql_using='gin'),
+        {'comment': '긴 학습 콘텐츠를 의미 있는 작은 단위(섹션)로 분할하여 저장합니다.'},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=func.uuid_generate_v4(), comment='콘텐츠 섹션의 고유 식별자')
     content_id = Column(UUID(as_uuid=True), ForeignKey("learningcontent.id", ondelete="CASCADE"), nullable=False, comment='이 섹션이 속한 LearningContent의 ID')
@@ -85,8 +100,18 @@ class ContentSection(Base):
     section_text = Column(Text, nullable=False, comment='섹션의 실제 텍스트 내용 (예: 비디오 트랜스크립트의 해당 부분)') #
     start_timestamp = Column(String, comment='비디오의 경우, 섹션의 시작 시간 (예: "00:00")') #
     end_timestamp = Column(String, comment='비디오의 경우, 섹션의 종료 시간')
-    order_index = Column(Integer, nullable=False, comment='콘텐츠 내에서 이 섹션의 순서')
+    start_seconds = Column(Integer, comment='start_timestamp를 초 단위로 변환한 값 (재생 위치 조회용)')
+    end_seconds = Column(Integer, comment='end_timestamp를 초 단위로 변환한 값')
+    order_index = Column(Integer, nullable=False, comment='콘텐츠 내에서 이 섹션의 순서 (증분 재처리를 위해 간격을 두고 부여되며 연속적이지 않음)')
+    text_hash = Column(String(64), comment='section_text의 SHA-256 (증분 재처리 시 변경 여부 비교용)')
+    token_count = Column(Integer, comment='section_text의 LLM 토큰 수 (근사값, 프롬프트 컨텍스트 조립 시 재계산하지 않기 위함)')
     qdrant_point_id = Column(UUID(as_uuid=True), comment='Qdrant 벡터 데이터베이스 내 이 섹션의 벡터 포인트 ID')
+    # 'simple' 설정: 형태소 분석 없이 소문자화만 하므로 법 조항 번호, 엑셀 함수명 같은 정확한 용어가 그대로 색인됨
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('simple'::regconfig, coalesce(section_title, '') || ' ' || section_text)", persisted=True),
+        comment='section_title/section_text로부터 생성되는 전문 검색용 tsvector (generated column)',
+    ))
 
     # Relationships
     content = relationship("LearningContent", back_populates="sections")
@@ -166,7 +191,7 @@ class UserLearningProgress(Base):
     content_id = Column(UUID(as_uuid=True), ForeignKey("learningcontent.id", ondelete="CASCADE"), nullable=False, comment='학습 중인 LearningContent의 ID')
     last_viewed_at = Column(TIMESTAMP(timezone=True), nullable=False, comment='사용자가 해당 콘텐츠를 마지막으로 조회한 시간')
     progress_percentage = Column(Integer, comment='콘텐츠의 진행률 (0-100%)')
-    chat_history_json = Column(JSONB, comment='AI 튜터와의 채팅 기록 (JSONB 형식)') #
+    chat_history_json = Column(JSONB, comment='(deprecated) AI 튜터와의 채팅 기록 (JSONB 형식). tutorchatmessages로 이전됨, 더 이상 기록하지 않음') #
     summary_count = Column(Integer, default=0, nullable=False, comment='AI 요약 기능을 사용한 횟수 (플랜 제한과 연동)') #
     updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False, comment='진행 기록 마지막 업데이트 시간')
 
@@ -175,6 +200,36 @@ class UserLearningProgress(Base):
     content = relationship("LearningContent", back_populates="user_progresses")
 
 
+# TutorChatThread 모델
+class TutorChatThread(Base):
+    __tablename__ = "tutorchatthreads"
+    __table_args__ = {'comment': '사용자-콘텐츠별 AI 튜터 대화의 메타데이터 (메시지 순번 할당, 누적 요약)를 저장합니다.'}
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True, comment='대화한 사용자의 ID')
+    content_id = Column(UUID(as_uuid=True), ForeignKey("learningcontent.id", ondelete="CASCADE"), primary_key=True, comment='대화 대상 LearningContent의 ID')
+    last_seq = Column(Integer, default=0, nullable=False, comment='마지막으로 할당된 메시지 순번 (메시지 추가 시 증가)')
+    summary_text = Column(Text, comment='summarized_through_seq까지의 대화 누적 요약')
+    summarized_through_seq = Column(Integer, default=0, nullable=False, comment='누적 요약에 반영된 마지막 메시지 순번')
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False, comment='대화 마지막 업데이트 시간')
+
+
+# TutorChatMessage 모델
+class TutorChatMessage(Base):
+    __tablename__ = "tutorchatmessages"
+    __table_args__ = (
+        # (user_id, content_id, seq) 기본키로 최근 N개 / seq 이전 페이지를 인덱스 범위 조회
+        PrimaryKeyConstraint('user_id', 'content_id', 'seq'),
+        {'comment': 'AI 튜터 대화 메시지를 한 행에 하나씩 추가만 하는 방식(append-only)으로 저장합니다.'},
+    )
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, comment='대화한 사용자의 ID')
+    content_id = Column(UUID(as_uuid=True), ForeignKey("learningcontent.id", ondelete="CASCADE"), nullable=False, comment='대화 대상 LearningContent의 ID')
+    seq = Column(Integer, nullable=False, comment='대화 안에서의 메시지 순번 (1부터, TutorChatThread.last_seq로 할당)')
+    role = Column(String, nullable=False, comment='메시지 작성자 (예: "user", "assistant")')
+    message_text = Column(Text, nullable=False, comment='메시지 내용')
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False, comment='메시지 기록 시간')
+
+
 # SubscriptionPlan 모델
 class SubscriptionPlan(Base):
     __tablename__ = "subscriptionplans"
@@ -223,4 +278,22 @@ class LoginHistory(Base):
     location = Column(String, comment='로그인 발생 위치 (예: "서울, 대한민국")') #
 
     # Relationships
-    user = relationship("User", back_populates="login_histories")
\ No newline at end of file
+    user = relationship("User", back_populates="login_histories")
+
+# TaskOutbox 모델
+class TaskOutbox(Base):
+    __tablename__ = "taskoutbox"
+    __table_args__ = (
+        # relay가 발행 가능한 행을 오래된 순으로 가져오기 위한 인덱스
+        Index('ix_taskoutbox_available_at_created_at', 'available_at', 'created_at'),
+        {'comment': '도메인 변경과 같은 트랜잭션에서 기록되어 relay가 Celery로 발행할 태스크 목록 (transactional outbox)'},
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=func.uuid_generate_v4(), comment='outbox 항목의 고유 식별자')
+    task_name = Column(String, nullable=False, comment='발행할 Celery 태스크 이름 (예: "process_content_task")')
+    task_kwargs = Column(JSONB, nullable=False, default=dict, comment='태스크 키워드 인자')
+    priority = Column(Integer, comment='브로커 메시지 우선순위 (작을수록 먼저 처리, NULL이면 기본 우선순위)')
+    attempts = Column(Integer, default=0, nullable=False, comment='발행 실패 횟수')
+    last_error = Column(Text, comment='마지막 발행 실패 사유')
+    available_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False, comment='이 시간 이후에 발행 (실패 시 backoff)')
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False, comment='outbox 항목 생성 시간')
@@ -0,0 +1,103 @@
+import threading
+import time
+from typing import Dict, List, Type
+
+from sqlalchemy import exc
+from sqlalchemy.pool import Pool
+
+# 커넥션 체크아웃 대기 시간 히스토그램 버킷 (ms, 누적 아님)
+WAIT_BUCKETS_MS: List[float] = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+
+class PoolStats:
+    """
+    커넥션 풀 체크아웃 대기 시간과 타임아웃 횟수를 집계합니다.
+    (워커 프로세스별로 독립적인 값입니다.)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.bucket_counts = [0] * (len(WAIT_BUCKETS_MS) + 1) # 마지막 칸은 +Inf
+        self.checkouts = 0
+        self.wait_sum_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.timeouts = 0
+
+    def observe_wait(self, seconds: float):
+        ms = seconds * 1000
+        index = len(WAIT_BUCKETS_MS)
+        for i, bound in enumerate(WAIT_BUCKETS_MS):
+            if ms <= bound:
+                index = i
+                break
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.checkouts += 1
+            self.wait_sum_ms += ms
+            self.wait_max_ms = max(self.wait_max_ms, ms)
+
+    def observe_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def histogram(self) -> Dict[str, int]:
+        labels = [f"le_{int(b)}ms" for b in WAIT_BUCKETS_MS] + ["le_inf"]
+        return dict(zip(labels, self.bucket_counts))
+
+
+# 엔진 이름("sync", "async") -> 통계
+pool_stats_registry: Dict[str, PoolStats] = {}
+
+
+def instrumented_pool_class(base: Type[Pool], name: str) -> Type[Pool]:
+    """
+    체크아웃 대기 시간을 측정하는 풀 클래스를 만듭니다.
+    Pool.recreate()가 self.__class__로 풀을 다시 만들기 때문에 통계를 클래스 속성으로 유지합니다.
+    """
+    stats = pool_stats_registry.setdefault(name, PoolStats(name))
+
+    class InstrumentedPool(base):
+        _pool_stats = stats
+
+        def connect(self):
+            started = time.perf_counter()
+            try:
+                return super().connect()
+            except exc.TimeoutError:
+                self._pool_stats.observe_timeout()
+                raise
+            finally:
+                self._pool_stats.observe_wait(time.perf_counter() - started)
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+
+def pool_snapshot(pool: Pool) -> dict:
+    """현재 풀 상태 + 누적 대기 시간 통계를 dict로 반환합니다."""
+    stats: PoolStats = getattr(pool, "_pool_stats", None)
+    size = pool.size()
+    checked_out = pool.checkedout()
+    overflow = pool.overflow()
+    snapshot = {
+        "pool_class": type(pool).__name__,
+        "size": size,
+        "checked_in": pool.checkedin(),
+        "checked_out": checked_out,
+        "overflow": max(overflow, 0), # QueuePool은 연결 전 음수 overflow를 보고함
+        "max_overflow": getattr(pool, "_max_overflow", None),
+        "timeout_seconds": getattr(pool, "_timeout", None),
+    }
+    max_overflow = snapshot["max_overflow"] or 0
+    capacity = size + max_overflow
+    snapshot["saturation"] = round(checked_out / capacity, 3) if capacity else None
+    if stats is not None:
+        snapshot.update({
+            "checkouts_total": stats.checkouts,
+            "checkout_timeouts_total": stats.timeouts,
+            "wait_ms_avg": round(stats.wait_sum_ms / stats.checkouts, 3) if stats.checkouts else 0.0,
+            "wait_ms_max": round(stats.wait_max_ms, 3),
+            "wait_ms_histogram": stats.histogram(),
+        })
+    return snapshot
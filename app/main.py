@@ -2,6 +2,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.router import api_router
 from app.core.config import settings
+from app.core.hashing import password_hasher
+from app.services.ai_integration_service import close_async_qdrant_client
+from app.services.progress_events import progress_hub
 from app.database import models # models.py에서 Base와 engine을 가져오기 위함
 
 # FastAPI 애플리케이션 인스턴스 생성
@@ -42,4 +45,13 @@ async def root():
 async def startup_event():
     # Alembic이 마이그레이션을 처리하므로 여기서는 Base.metadata.create_all()을 제거합니다.
     # alembic upgrade head 명령어가 Docker Compose command에 포함되어 있습니다.
-    print("FastAPI application started. Alembic migrations are handled by Docker Compose entrypoint.")
\ No newline at end of file
+    print("FastAPI application started. Alembic migrations are handled by Docker Compose entrypoint.")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    # bcrypt 전용 프로세스 풀 종료
+    password_hasher.shutdown()
+    # 공유 비동기 Qdrant 클라이언트 종료
+    await close_async_qdrant_client()
+    # 진행 이벤트 pub/sub 연결 종료
+    await progress_hub.close()
\ No newline at end of file
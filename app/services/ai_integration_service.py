@@ -0,0 +1,853 @@
+# certgo-backend/app/services/ai_integration_service.py
+
+import asyncio
+import hashlib
+import itertools
+import re
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client import models as qdrant_models
+from qdrant_client.http.exceptions import UnexpectedResponse
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database import models
+from app.services import learning_content_service
+from app.services.content_service import count_tokens
+from app.services.embedding_cache import EmbeddingCache, embedding_cache, normalize_text
+
+
+# --- 임베딩 provider ---
+
+class EmbeddingProvider(ABC):
+    """
+    텍스트 임베딩 provider 인터페이스.
+    model_id는 Qdrant 컬렉션/캐시 키 구분에 사용되므로 모델(및 차원)이 바뀌면 달라져야 합니다.
+    """
+    model_id: str
+    dimension: int
+
+    @abstractmethod
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        ...
+
+    async def aembed(self, texts: Sequence[str]) -> List[List[float]]:
+        # 기본 구현: 동기 embed를 스레드에서 실행 (네트워크 provider는 비동기 구현으로 대체 가능)
+        return await asyncio.to_thread(self.embed, texts)
+
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=200_000)
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class HashingEmbeddingProvider(EmbeddingProvider):
+    """
+    외부 API 없이 동작하는 결정적(deterministic) 로컬 임베더 (feature hashing).
+    단어와 단어 내부 글자 bigram(한국어 조사/어미 대응)을 해싱해 벡터를 만들고 L2 정규화합니다.
+    오프라인 테스트/벤치마크용이며 의미 유사도 품질은 실제 모델보다 낮습니다.
+    """
+
+    def __init__(self, dimension: int = None):
+        self.dimension = dimension or settings.EMBEDDING_DIMENSION
+        self.model_id = f"local-hashing-{self.dimension}"
+
+    def _features(self, text: str) -> Iterator[str]:
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            yield token
+            for i in range(len(token) - 1):
+                yield "#" + token[i:i + 2]
+
+    def _embed_one(self, text: str) -> List[float]:
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        for feature in self._features(text):
+            h = _feature_hash(feature)
+            vector[h % self.dimension] += 1.0 if (h >> 63) & 1 else -1.0
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector.tolist()
+
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        return [self._embed_one(text) for text in texts]
+
+
+class CachedEmbeddingProvider(EmbeddingProvider):
+    """
+    임베딩 캐시를 앞에 둔 provider 래퍼.
+    배치 전체를 캐시에서 한 번에 조회하고, 미스인 텍스트만(배치 내 중복 제거 후) 내부 provider로 임베딩합니다.
+    """
+
+    def __init__(self, provider: EmbeddingProvider, cache: EmbeddingCache):
+        self.provider = provider
+        self.cache = cache
+        self.model_id = provider.model_id
+        self.dimension = provider.dimension
+
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        vectors = self.cache.get_many(self.model_id, texts)
+        missing = {}
+        for i, vector in enumerate(vectors):
+            if vector is None:
+                missing.setdefault(normalize_text(texts[i]), []).append(i)
+        if missing:
+            # 대표 텍스트(정규화 결과가 같은 것 중 첫 번째)만 임베딩
+            miss_texts = [texts[indexes[0]] for indexes in missing.values()]
+            computed = self.provider.embed(miss_texts)
+            self.cache.set_many(self.model_id, miss_texts, computed)
+            for indexes, vector in zip(missing.values(), computed):
+                for i in indexes:
+                    vectors[i] = vector
+        return vectors
+
+
+@lru_cache(maxsize=1)
+def get_embedding_provider() -> EmbeddingProvider:
+    if settings.EMBEDDING_PROVIDER == "hashing":
+        provider = HashingEmbeddingProvider()
+    else:
+        raise ValueError(f"Unknown EMBEDDING_PROVIDER: {settings.EMBEDDING_PROVIDER}")
+    if settings.EMBEDDING_CACHE_ENABLED:
+        provider = CachedEmbeddingProvider(provider, embedding_cache)
+    return provider
+
+
+# --- LLM provider (튜터 답변, 요약, 퀴즈 생성) ---
+
+class LLMProvider(ABC):
+    """
+    채팅 형식 LLM provider 인터페이스.
+    messages는 [{"role": "system" | "user" | "assistant", "content": str}, ...] 형식이며,
+    stream은 생성된 토큰(텍스트 조각)을 도착하는 대로 비동기로 전달합니다. (스트리밍 중 스레드를 점유하지 않음)
+    """
+    model_id: str
+
+    @abstractmethod
+    def stream(self, messages: Sequence[dict], max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        ...
+
+    async def complete(self, messages: Sequence[dict], max_tokens: Optional[int] = None) -> str:
+        return "".join([token async for token in self.stream(messages, max_tokens)])
+
+
+CONTEXT_HEADER = "[참고 자료]" # 시스템 프롬프트에서 검색된 섹션 본문이 시작되는 표시
+
+_SENTENCE_PATTERN = re.compile(r"[^.!?。\n]+[.!?。]?")
+_OUTPUT_TOKEN_PATTERN = re.compile(r"\S+\s*")
+
+
+class FakeLLMProvider(LLMProvider):
+    """
+    외부 API 없이 동작하는 결정적(deterministic) 로컬 LLM.
+    마지막 사용자 메시지와 시스템 프롬프트의 참고 자료 문장들로 답변을 만들고, 단어 단위 토큰으로 나누어
+    첫 토큰까지 first_token_seconds, 이후 토큰마다 token_seconds 만큼 기다리며 전달합니다.
+    오프라인 테스트/벤치마크(time-to-first-token, 동시 스트림 수)용이며 답변 품질은 의미가 없습니다.
+    """
+
+    def __init__(self, first_token_seconds: float = None, token_seconds: float = None):
+        self.first_token_seconds = settings.FAKE_LLM_FIRST_TOKEN_SECONDS if first_token_seconds is None else first_token_seconds
+        self.token_seconds = settings.FAKE_LLM_TOKEN_SECONDS if token_seconds is None else token_seconds
+        self.model_id = "local-fake-llm"
+
+    def _answer(self, messages: Sequence[dict]) -> str:
+        question = next((m["content"] for m in reversed(messages) if m["role"] == "user"), "")
+        system = "\n".join(m["content"] for m in messages if m["role"] == "system")
+        context = system.split(CONTEXT_HEADER, 1)[1] if CONTEXT_HEADER in system else ""
+        sentences = [s.strip() for s in _SENTENCE_PATTERN.findall(context) if len(s.strip()) > 10]
+        picked = sentences[::max(1, len(sentences) // 5)][:5] # 참고 자료 전체에서 고르게 최대 5문장
+        return " ".join([f"질문 \"{question.strip()[:100]}\"에 대한 답변입니다."] + picked)
+
+    async def stream(self, messages: Sequence[dict], max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        tokens = _OUTPUT_TOKEN_PATTERN.findall(self._answer(messages))[:max_tokens or settings.LLM_MAX_OUTPUT_TOKENS]
+        await asyncio.sleep(self.first_token_seconds)
+        for i, token in enumerate(tokens):
+            if i:
+                await asyncio.sleep(self.token_seconds)
+            yield token
+
+
+@lru_cache(maxsize=1)
+def get_llm_provider() -> LLMProvider:
+    if settings.LLM_PROVIDER == "fake":
+        return FakeLLMProvider()
+    raise ValueError(f"Unknown LLM_PROVIDER: {settings.LLM_PROVIDER}")
+
+
+# --- Qdrant ---
+
+@lru_cache(maxsize=1)
+def get_qdrant_client() -> QdrantClient:
+    # QDRANT_HOST=":memory:" 이면 네트워크 없이 프로세스 내 Qdrant(local mode) 사용
+    if settings.QDRANT_HOST == ":memory:":
+        return QdrantClient(location=":memory:")
+    return QdrantClient(url=f"http://{settings.QDRANT_HOST}", api_key=settings.QDRANT_API_KEY or None)
+
+
+@lru_cache(maxsize=1)
+def get_async_qdrant_client() -> AsyncQdrantClient:
+    # API 프로세스에서 공유하는 비동기 클라이언트 (커넥션 재사용, 종료 시 close_async_qdrant_client)
+    if settings.QDRANT_HOST == ":memory:":
+        return AsyncQdrantClient(location=":memory:")
+    return AsyncQdrantClient(url=f"http://{settings.QDRANT_HOST}", api_key=settings.QDRANT_API_KEY or None)
+
+
+async def close_async_qdrant_client():
+    if get_async_qdrant_client.cache_info().currsize:
+        await get_async_qdrant_client().close()
+        get_async_qdrant_client.cache_clear()
+
+
+# 섹션 벡터는 임베딩 모델별 공유 컬렉션 하나에 저장하고 payload 인덱스로 필터링합니다.
+# (콘텐츠별 컬렉션은 컬렉션마다 HNSW 그래프/세그먼트 오버헤드가 생기고 자격증 단위 검색이 fan-out 되므로 사용하지 않음)
+SECTION_PAYLOAD_INDEXES = {
+    "content_id": qdrant_models.PayloadSchemaType.KEYWORD,
+    "certificate_id": qdrant_models.PayloadSchemaType.KEYWORD,
+    "order_index": qdrant_models.PayloadSchemaType.INTEGER,
+}
+
+
+def shared_collection_name(provider: EmbeddingProvider) -> str:
+    model_id = re.sub(r"[^A-Za-z0-9_-]", "_", provider.model_id)
+    return f"{settings.QDRANT_COLLECTION_PREFIX}_{model_id}"
+
+
+LEGACY_COLLECTION_PREFIX = "content_"
+
+
+def content_collection_name(content_id: UUID) -> str:
+    # 이전 레이아웃(콘텐츠별 컬렉션)의 이름. 공유 컬렉션으로의 마이그레이션에만 사용
+    return f"{LEGACY_COLLECTION_PREFIX}{UUID(str(content_id)).hex}"
+
+
+def ensure_collection(client: QdrantClient, collection_name: str, dimension: int, payload_indexes: bool = True):
+    if client.collection_exists(collection_name):
+        return
+    client.create_collection(
+        collection_name=collection_name,
+        vectors_config=qdrant_models.VectorParams(size=dimension, distance=qdrant_models.Distance.COSINE),
+    )
+    if payload_indexes:
+        for field_name, field_schema in SECTION_PAYLOAD_INDEXES.items():
+            client.create_payload_index(collection_name, field_name=field_name, field_schema=field_schema, wait=True)
+
+
+def section_filter(content_id: Optional[UUID] = None, certificate_id: Optional[UUID] = None) -> Optional[qdrant_models.Filter]:
+    must = []
+    if content_id is not None:
+        must.append(qdrant_models.FieldCondition(key="content_id", match=qdrant_models.MatchValue(value=str(content_id))))
+    if certificate_id is not None:
+        must.append(qdrant_models.FieldCondition(key="certificate_id", match=qdrant_models.MatchValue(value=str(certificate_id))))
+    return qdrant_models.Filter(must=must) if must else None
+
+
+def section_payload(content_id: UUID, certificate_id: Optional[UUID], order_index: int) -> dict:
+    return {
+        "content_id": str(content_id),
+        "certificate_id": str(certificate_id) if certificate_id else None,
+        "order_index": order_index,
+    }
+
+
+def embed_and_upsert(
+    sections: Iterable[Tuple[UUID, str, int]],
+    content_id: UUID,
+    collection_name: str,
+    provider: EmbeddingProvider,
+    client: QdrantClient,
+    certificate_id: Optional[UUID] = None,
+    batch_size: int = None,
+    upsert_batch_size: int = None,
+    parallel: int = None,
+) -> Iterator[List[UUID]]:
+    """
+    (section_id, section_text, order_index) 스트림을 임베딩하여 Qdrant에 upsert 합니다.
+    - batch_size 건씩 provider.embed를 한 번 호출하고,
+    - upsert_batch_size 건씩 나눈 upsert를 최대 parallel 개까지 동시에 업로드합니다.
+    업로드가 끝난 섹션 id 목록을 배치 단위로 yield 합니다 (point id = section id).
+    """
+    batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
+    upsert_batch_size = upsert_batch_size or settings.QDRANT_UPSERT_BATCH_SIZE
+    parallel = parallel or settings.QDRANT_UPLOAD_PARALLEL
+
+    def upload(points: List[qdrant_models.PointStruct]) -> List[UUID]:
+        client.upsert(collection_name=collection_name, points=points, wait=True)
+        return [UUID(str(p.id)) for p in points]
+
+    def to_points(batch: List[Tuple[UUID, str, int]]) -> List[qdrant_models.PointStruct]:
+        vectors = provider.embed([text for _, text, _ in batch])
+        return [
+            qdrant_models.PointStruct(
+                id=str(section_id),
+                vector=vector,
+                payload=section_payload(content_id, certificate_id, order_index),
+            )
+            for (section_id, _, order_index), vector in zip(batch, vectors)
+        ]
+
+    in_flight = deque()
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        batch: List[Tuple[UUID, str, int]] = []
+        points: List[qdrant_models.PointStruct] = []
+        for section in itertools.chain(sections, [None]):
+            if section is not None:
+                batch.append(section)
+                if len(batch) < batch_size:
+                    continue
+            if batch:
+                points.extend(to_points(batch))
+                batch = []
+            # 마지막(section is None)에는 upsert_batch_size 미만의 나머지도 업로드
+            while points and (len(points) >= upsert_batch_size or section is None):
+                # 동시 업로드 수를 parallel 개로 제한 (메모리 사용량 상한)
+                while len(in_flight) >= parallel:
+                    yield in_flight.popleft().result()
+                in_flight.append(executor.submit(upload, points[:upsert_batch_size]))
+                points = points[upsert_batch_size:]
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def embed_content_sections(
+    db: Session,
+    content_id: UUID,
+    provider: Optional[EmbeddingProvider] = None,
+    client: Optional[QdrantClient] = None,
+    on_progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    콘텐츠의 아직 임베딩되지 않은 섹션(qdrant_point_id IS NULL)을 임베딩해 Qdrant에 저장하고,
+    point id를 ContentSection.qdrant_point_id에 bulk update 합니다. 성공 시 commit 합니다.
+    on_progress가 있으면 업로드 배치마다 지금까지 임베딩한 섹션 수로 호출합니다. (진행 이벤트)
+    """
+    provider = provider or get_embedding_provider()
+    client = client or get_qdrant_client()
+    collection_name = shared_collection_name(provider)
+    ensure_collection(client, collection_name, provider.dimension)
+    certificate_id = db.execute(
+        select(models.LearningContent.certificate_id).where(models.LearningContent.id == content_id)
+    ).scalar()
+
+    stmt = (
+        select(models.ContentSection.id, models.ContentSection.section_text, models.ContentSection.order_index)
+        .where(models.ContentSection.content_id == content_id, models.ContentSection.qdrant_point_id.is_(None))
+        .order_by(models.ContentSection.order_index)
+        .execution_options(yield_per=settings.EMBEDDING_BATCH_SIZE * 4)
+    )
+    sections = (tuple(row) for row in db.execute(stmt))
+
+    total = 0
+    for section_ids in embed_and_upsert(sections, content_id, collection_name, provider, client, certificate_id):
+        # point id를 기본키 기준 bulk UPDATE로 기록 (스트리밍 커서 유지를 위해 commit은 마지막에 한 번)
+        db.execute(update(models.ContentSection), [{"id": sid, "qdrant_point_id": sid} for sid in section_ids])
+        total += len(section_ids)
+        if on_progress is not None:
+            on_progress(total)
+
+    db.execute(
+        update(models.LearningContent)
+        .where(models.LearningContent.id == content_id)
+        .values(qdrant_collection_name=collection_name)
+    )
+    db.commit()
+    return total
+
+
+def unembedded_section_ids(db: Session, content_id: UUID) -> List[UUID]:
+    """아직 임베딩되지 않은 섹션 id 목록 (order_index 순)."""
+    return list(db.execute(
+        select(models.ContentSection.id)
+        .where(models.ContentSection.content_id == content_id, models.ContentSection.qdrant_point_id.is_(None))
+        .order_by(models.ContentSection.order_index)
+    ).scalars())
+
+
+def embed_section_group(
+    db: Session,
+    content_id: UUID,
+    section_ids: Sequence[UUID],
+    provider: Optional[EmbeddingProvider] = None,
+    client: Optional[QdrantClient] = None,
+) -> List[UUID]:
+    """
+    섹션 묶음(fan-out 처리 단위)을 임베딩해 Qdrant에 upsert 하고, 업로드한 섹션 id를 반환합니다.
+    DB에는 쓰지 않으며 point id 기록은 마무리 단계에서 record_section_points로 한 번에 합니다.
+    point id = section id이므로 재시도해도 같은 point를 덮어쓸 뿐입니다. (그 사이 삭제된 섹션은 건너뜀)
+    """
+    provider = provider or get_embedding_provider()
+    client = client or get_qdrant_client()
+    collection_name = shared_collection_name(provider)
+    ensure_collection(client, collection_name, provider.dimension)
+    certificate_id = db.execute(
+        select(models.LearningContent.certificate_id).where(models.LearningContent.id == content_id)
+    ).scalar()
+    sections = db.execute(
+        select(models.ContentSection.id, models.ContentSection.section_text, models.ContentSection.order_index)
+        .where(models.ContentSection.content_id == content_id, models.ContentSection.id.in_(section_ids))
+        .order_by(models.ContentSection.order_index)
+    ).all()
+    db.rollback() # 업로드 중에 트랜잭션을 열어 두지 않음
+    uploaded: List[UUID] = []
+    for batch_ids in embed_and_upsert((tuple(row) for row in sections), content_id, collection_name, provider, client, certificate_id):
+        uploaded.extend(batch_ids)
+    return uploaded
+
+
+def record_section_points(
+    db: Session,
+    content_id: UUID,
+    section_ids: Sequence[UUID],
+    provider: Optional[EmbeddingProvider] = None,
+) -> int:
+    """embed_section_group으로 업로드한 섹션들의 qdrant_point_id를 bulk UPDATE로 기록하고 commit 합니다."""
+    provider = provider or get_embedding_provider()
+    batch_size = settings.SECTION_INSERT_BATCH_SIZE
+    for i in range(0, len(section_ids), batch_size):
+        db.execute(update(models.ContentSection), [{"id": sid, "qdrant_point_id": sid} for sid in section_ids[i:i + batch_size]])
+    db.execute(
+        update(models.LearningContent)
+        .where(models.LearningContent.id == content_id)
+        .values(qdrant_collection_name=shared_collection_name(provider))
+    )
+    db.commit()
+    return len(section_ids)
+
+
+def delete_section_points(
+    point_ids: Sequence[UUID],
+    provider: Optional[EmbeddingProvider] = None,
+    client: Optional[QdrantClient] = None,
+):
+    """증분 재처리에서 삭제된 섹션들의 point를 batch 단위로 삭제합니다."""
+    if not point_ids:
+        return
+    provider = provider or get_embedding_provider()
+    client = client or get_qdrant_client()
+    collection_name = shared_collection_name(provider)
+    for i in range(0, len(point_ids), settings.QDRANT_UPSERT_BATCH_SIZE):
+        client.delete(
+            collection_name,
+            points_selector=qdrant_models.PointIdsList(points=[str(pid) for pid in point_ids[i:i + settings.QDRANT_UPSERT_BATCH_SIZE]]),
+            wait=True,
+        )
+
+
+def delete_content_points(
+    content_id: UUID,
+    provider: Optional[EmbeddingProvider] = None,
+    client: Optional[QdrantClient] = None,
+):
+    """콘텐츠의 모든 point를 삭제합니다. (전체 재생성 시)"""
+    provider = provider or get_embedding_provider()
+    client = client or get_qdrant_client()
+    collection_name = shared_collection_name(provider)
+    if client.collection_exists(collection_name):
+        client.delete(collection_name, points_selector=qdrant_models.FilterSelector(filter=section_filter(content_id)), wait=True)
+
+
+def update_section_order(
+    order_by_point: dict,
+    provider: Optional[EmbeddingProvider] = None,
+    client: Optional[QdrantClient] = None,
+):
+    """order_index가 다시 매겨진 섹션들의 payload(order_index)를 batch 단위로 갱신합니다."""
+    if not order_by_point:
+        return
+    provider = provider or get_embedding_provider()
+    client = client or get_qdrant_client()
+    collection_name = shared_collection_name(provider)
+    operations = [
+        qdrant_models.SetPayloadOperation(
+            set_payload=qdrant_models.SetPayload(payload={"order_index": order_index}, points=[str(point_id)])
+        )
+        for point_id, order_index in order_by_point.items()
+    ]
+    for i in range(0, len(operations), settings.QDRANT_UPSERT_BATCH_SIZE):
+        client.batch_update_points(collection_name, update_operations=operations[i:i + settings.QDRANT_UPSERT_BATCH_SIZE], wait=True)
+
+
+def migrate_content_collection(
+    client: QdrantClient,
+    source_collection: str,
+    target_collection: str,
+    content_id: UUID,
+    certificate_id: Optional[UUID],
+    batch_size: int = None,
+) -> int:
+    """
+    콘텐츠별 컬렉션의 point들을 scroll로 batch_size 건씩 읽어 공유 컬렉션으로 옮깁니다.
+    벡터는 그대로 복사하고 payload는 공유 레이아웃 형식(content_id/certificate_id/order_index)으로 맞춥니다.
+    point id가 섹션 id와 같으므로 중간에 실패해도 다시 실행하면 같은 point를 덮어씁니다.
+    """
+    batch_size = batch_size or settings.QDRANT_UPSERT_BATCH_SIZE
+    moved = 0
+    offset = None
+    while True:
+        records, offset = client.scroll(
+            source_collection, limit=batch_size, offset=offset, with_payload=True, with_vectors=True,
+        )
+        if records:
+            client.upsert(
+                collection_name=target_collection,
+                points=[
+                    qdrant_models.PointStruct(
+                        id=record.id,
+                        vector=record.vector,
+                        payload=section_payload(content_id, certificate_id, (record.payload or {}).get("order_index")),
+                    )
+                    for record in records
+                ],
+                wait=True,
+            )
+            moved += len(records)
+        if offset is None:
+            return moved
+
+
+# --- 검색 (vector / lexical / hybrid) ---
+
+SEARCH_MODES = ("hybrid", "vector", "lexical")
+
+_existing_collections = set() # 존재가 확인된 컬렉션 (검색마다 collection_exists 왕복을 피하기 위함)
+
+
+async def _collection_exists_async(client: AsyncQdrantClient, collection_name: str) -> bool:
+    if collection_name in _existing_collections:
+        return True
+    if not await client.collection_exists(collection_name):
+        return False
+    _existing_collections.add(collection_name)
+    return True
+
+
+def _is_collection_not_found(error: Exception) -> bool:
+    # 원격 Qdrant는 404 UnexpectedResponse, 프로세스 내 Qdrant(":memory:")는 ValueError("Collection ... not found")
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code == 404
+    return isinstance(error, ValueError) and "not found" in str(error)
+
+
+async def vector_search_async(
+    query: str,
+    limit: int,
+    content_id: Optional[UUID] = None,
+    certificate_id: Optional[UUID] = None,
+    provider: Optional[EmbeddingProvider] = None,
+    client: Optional[AsyncQdrantClient] = None,
+) -> List[Tuple[UUID, float]]:
+    """질의를 임베딩해 공유 컬렉션에서 필터 검색하고 (section_id, 유사도) 목록을 점수 순으로 반환합니다."""
+    provider = provider or get_embedding_provider()
+    client = client or get_async_qdrant_client()
+    collection_name = shared_collection_name(provider)
+    if not await _collection_exists_async(client, collection_name):
+        return [] # 아직 임베딩된 콘텐츠가 없음
+
+    vector = (await provider.aembed([query]))[0]
+    search = dict(
+        collection_name=collection_name,
+        query_vector=vector,
+        query_filter=section_filter(content_id, certificate_id),
+        limit=limit,
+        with_payload=False,
+    )
+    try:
+        hits = await client.search(**search)
+    except (UnexpectedResponse, ValueError) as e:
+        if not _is_collection_not_found(e):
+            raise
+        # 확인 이후 컬렉션이 삭제/재생성된 경우(마이그레이션, 수동 정리): 캐시에서 빼고 존재를 다시 확인한 뒤 한 번 재시도
+        _existing_collections.discard(collection_name)
+        if not await _collection_exists_async(client, collection_name):
+            return []
+        hits = await client.search(**search)
+    return [(UUID(str(hit.id)), hit.score) for hit in hits]
+
+
+def lexical_tsquery(query: str) -> Optional[str]:
+    # 단어별 접두어 매칭을 OR로 연결 (예: "VLOOKUP 함수" -> "vlookup:* | 함수:*")
+    # \w 토큰만 사용하므로 tsquery 문법 문자가 섞이지 않음. 접두어 매칭이므로 질의 "함수"가 본문의 "함수를"과도 매칭됨
+    tokens = _TOKEN_PATTERN.findall(query.lower())
+    if not tokens:
+        return None
+    return " | ".join(f"{token}:*" for token in dict.fromkeys(tokens))
+
+
+async def lexical_search_async(
+    db: AsyncSession,
+    query: str,
+    limit: int,
+    content_id: Optional[UUID] = None,
+    certificate_id: Optional[UUID] = None,
+) -> List[Tuple[UUID, float]]:
+    """search_vector(GIN 인덱스) 전문 검색으로 (section_id, ts_rank_cd) 목록을 점수 순으로 반환합니다."""
+    tsquery_text = lexical_tsquery(query)
+    if tsquery_text is None:
+        return []
+    tsquery = func.to_tsquery("simple", tsquery_text)
+    score = func.ts_rank_cd(models.ContentSection.search_vector, tsquery)
+    stmt = (
+        select(models.ContentSection.id, score.label("score"))
+        .where(models.ContentSection.search_vector.op("@@")(tsquery))
+        .order_by(score.desc(), models.ContentSection.id)
+        .limit(limit)
+    )
+    if content_id is not None:
+        stmt = stmt.where(models.ContentSection.content_id == content_id)
+    if certificate_id is not None:
+        stmt = stmt.where(models.ContentSection.content_id.in_(
+            select(models.LearningContent.id).where(models.LearningContent.certificate_id == certificate_id)
+        ))
+    return [(row.id, float(row.score)) for row in await db.execute(stmt)]
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[Tuple[UUID, float]]], k: int = None) -> List[Tuple[UUID, float]]:
+    """
+    여러 순위 목록을 RRF(score = Σ 1 / (k + rank))로 합칩니다.
+    서로 척도가 다른 점수(ts_rank_cd, 코사인 유사도)를 정규화 없이 순위만으로 결합합니다.
+    """
+    k = settings.RRF_K if k is None else k
+    fused = {}
+    for ranking in rankings:
+        for rank, (section_id, _) in enumerate(ranking, 1):
+            fused[section_id] = fused.get(section_id, 0.0) + 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
+
+
+async def rank_sections_async(
+    db: AsyncSession,
+    query: str,
+    limit: int = 10,
+    content_id: Optional[UUID] = None,
+    certificate_id: Optional[UUID] = None,
+    mode: str = "hybrid",
+    provider: Optional[EmbeddingProvider] = None,
+    client: Optional[AsyncQdrantClient] = None,
+) -> List[Tuple[UUID, float]]:
+    """
+    섹션 검색 순위: (section_id, score) 목록을 점수 순으로 반환합니다. (섹션 본문은 조회하지 않음)
+    mode에 따라 vector(Qdrant) / lexical(Postgres 전문 검색) / hybrid(둘을 동시에 실행 후 RRF 결합).
+    """
+    if mode not in SEARCH_MODES:
+        raise ValueError(f"Unknown search mode: {mode}")
+    if mode == "vector":
+        return await vector_search_async(query, limit, content_id, certificate_id, provider, client)
+    if mode == "lexical":
+        return await lexical_search_async(db, query, limit, content_id, certificate_id)
+    # 세션은 lexical 쪽만 사용하므로 두 검색을 동시에 실행해도 안전함
+    candidates = max(limit, settings.HYBRID_SEARCH_CANDIDATES)
+    lexical, vector = await asyncio.gather(
+        lexical_search_async(db, query, candidates, content_id, certificate_id),
+        vector_search_async(query, candidates, content_id, certificate_id, provider, client),
+    )
+    return reciprocal_rank_fusion([lexical, vector])[:limit]
+
+
+async def search_sections_async(
+    db: AsyncSession,
+    query: str,
+    limit: int = 10,
+    content_id: Optional[UUID] = None,
+    certificate_id: Optional[UUID] = None,
+    mode: str = "hybrid",
+    provider: Optional[EmbeddingProvider] = None,
+    client: Optional[AsyncQdrantClient] = None,
+) -> List[dict]:
+    """
+    섹션 검색. 순위(rank_sections_async)의 섹션을 IN 쿼리 한 번으로 조회해 순위대로 반환합니다. (각 항목: 섹션 컬럼 + score)
+    DB에서 삭제된 섹션의 point가 남아 있으면 결과에서 제외합니다.
+    """
+    ranked = await rank_sections_async(db, query, limit, content_id, certificate_id, mode, provider, client)
+    rows = await learning_content_service.get_sections_by_ids_async(db, [section_id for section_id, _ in ranked])
+    results = []
+    for section_id, score in ranked:
+        row = rows.get(section_id)
+        if row is not None:
+            results.append({**row, "score": score})
+    return results
+
+
+# --- 프롬프트 컨텍스트 조립 (토큰 예산) ---
+# raw_text_content 전체 대신 점수가 높은 섹션(과 그 앞뒤 섹션)만 토큰 예산 안에서 골라 프롬프트에 넣습니다.
+# 섹션 선택은 본문 없이 섹션 목록(outline: id, order_index, text_hash, token_count)만으로 하고, 고른 섹션의 본문만 조회합니다.
+
+CHARS_PER_TOKEN_ESTIMATE = 2 # token_count가 아직 없는 섹션(backfill 전)의 글자 수 기준 추정치
+
+
+@dataclass
+class PromptContext:
+    sections: List[dict] # 선택된 섹션 (order_index 순, 바로 앞 섹션과 겹치는 부분은 section_text에서 제거됨)
+    tokens: int # 조립된 컨텍스트의 토큰 수
+
+
+def section_outline_query(content_id: UUID):
+    token_count = func.coalesce(
+        models.ContentSection.token_count, func.char_length(models.ContentSection.section_text) / CHARS_PER_TOKEN_ESTIMATE
+    )
+    return (
+        select(models.ContentSection.id, models.ContentSection.order_index, models.ContentSection.text_hash, token_count.label("token_count"))
+        .where(models.ContentSection.content_id == content_id)
+        .order_by(models.ContentSection.order_index)
+    )
+
+
+def section_neighborhood_query(content_id: UUID, section_ids: Sequence[UUID]):
+    """
+    section_outline_query 중 section_ids와 그 바로 앞/뒤 섹션만 조회합니다. (order_index 순)
+    position은 콘텐츠 전체에서의 순번으로, 연속한 섹션인지(겹침 제거) 판단할 때 outline 위치 대신 사용합니다.
+    순번은 (content_id, order_index) 인덱스의 id/order_index만으로 매기고, 토큰 수(본문 길이 추정 포함)는 필요한 행만 계산합니다.
+    """
+    numbered = (
+        select(models.ContentSection.id, func.row_number().over(order_by=models.ContentSection.order_index).label("position"))
+        .where(models.ContentSection.content_id == content_id)
+        .cte("numbered")
+    )
+    anchors = select(numbered.c.position).where(numbered.c.id.in_(section_ids)).cte("anchors")
+    needed = (
+        select(numbered.c.id, numbered.c.position)
+        .where(select(anchors.c.position)
+               .where(numbered.c.position.between(anchors.c.position - 1, anchors.c.position + 1))
+               .exists())
+        .subquery("needed")
+    )
+    return section_outline_query(content_id).add_columns(needed.c.position).join(needed, needed.c.id == models.ContentSection.id)
+
+
+def select_context_sections(
+    outline: Sequence,
+    scores: Dict[UUID, float],
+    token_budget: int,
+    adjacency_weight: Optional[float] = None,
+) -> List[Tuple[int, object]]:
+    """
+    outline(order_index 순)에서 점수 순으로 섹션을 골라 token_budget 안에 채우고 (outline 위치, 행) 목록을 순서대로 반환합니다.
+    - 인접: 점수가 있는 섹션의 바로 앞/뒤 섹션에 점수 x adjacency_weight를 부여 (답이 섹션 경계에 걸친 경우 대비)
+    - 중복: text_hash가 같은 섹션(강의 안에서 반복된 내용)은 한 번만 포함
+    - 예산: 넘치는 섹션은 건너뛰고 다음 후보를 시도. 겹침 제거 전 토큰 수로 계산하므로 결과는 항상 예산 이하
+    """
+    weight = settings.CONTEXT_ADJACENCY_WEIGHT if adjacency_weight is None else adjacency_weight
+    position = {row.id: i for i, row in enumerate(outline)}
+    combined = dict(scores)
+    if weight > 0:
+        for section_id, score in scores.items():
+            i = position.get(section_id)
+            if i is None:
+                continue
+            for j in (i - 1, i + 1):
+                if 0 <= j < len(outline):
+                    neighbor = outline[j].id
+                    combined[neighbor] = max(combined.get(neighbor, 0.0), score * weight)
+
+    chosen, seen_hashes, used = [], set(), 0
+    for section_id, _ in sorted(combined.items(), key=lambda item: item[1], reverse=True):
+        i = position.get(section_id)
+        if i is None: # 다른 콘텐츠의 섹션이거나 삭제된 섹션의 point
+            continue
+        row = outline[i]
+        if row.text_hash is not None and row.text_hash in seen_hashes:
+            continue
+        if used + row.token_count > token_budget:
+            continue
+        chosen.append(i)
+        used += row.token_count
+        if row.text_hash is not None:
+            seen_hashes.add(row.text_hash)
+    return [(i, outline[i]) for i in sorted(chosen)]
+
+
+def _overlap_chars(previous: str, text: str, limit: int) -> int:
+    # text 앞부분 중 previous 끝부분과 같은 길이 (분할 시 앞 섹션의 끝 문장을 겹쳐 넣은 부분). 단어 경계에서만 확인
+    limit = min(limit, len(previous), len(text))
+    for end in range(limit, 0, -1):
+        if (end == len(text) or text[end] == " ") and previous.endswith(text[:end]):
+            return end
+    return 0
+
+
+def assemble_context(selected: Sequence[Tuple[int, object]], texts: Dict[UUID, dict]) -> PromptContext:
+    """
+    선택된 섹션 본문을 order_index 순으로 모읍니다. outline에서 연속한 두 섹션이 함께 선택되면
+    뒤 섹션 앞부분의 겹침(CHUNK_OVERLAP_CHARS 이내)을 제거하고 그 부분의 토큰 수만 빼서 계산합니다. (섹션 전체를 다시 토큰화하지 않음)
+    """
+    sections, tokens = [], 0
+    previous_position, previous_text = None, None
+    for position, row in selected:
+        section = texts.get(row.id)
+        if section is None: # 조회 사이에 삭제됨
+            continue
+        text, count = section["section_text"], row.token_count
+        if previous_position == position - 1:
+            cut = _overlap_chars(previous_text, text, settings.CHUNK_OVERLAP_CHARS * 2)
+            if cut:
+                count = max(0, count - count_tokens(text[:cut]))
+                text = text[cut:].lstrip()
+        previous_position, previous_text = position, section["section_text"]
+        sections.append({**section, "section_text": text})
+        tokens += count
+    return PromptContext(sections=sections, tokens=tokens)
+
+
+async def build_query_context_async(
+    db: AsyncSession,
+    content_id: UUID,
+    query: str,
+    token_budget: int,
+    provider: Optional[EmbeddingProvider] = None,
+    client: Optional[AsyncQdrantClient] = None,
+) -> PromptContext:
+    """
+    질문과 관련된 섹션(검색 점수 + 인접 섹션)으로 token_budget 안의 컨텍스트를 조립합니다. (AI 튜터용)
+    outline은 콘텐츠 전체가 아니라 검색된 섹션과 그 앞/뒤 섹션만 읽습니다. (긴 강의에서도 질문당 조회 행 수가 일정)
+    """
+    ranked = await rank_sections_async(
+        db, query, settings.CONTEXT_RETRIEVAL_CANDIDATES, content_id=content_id, provider=provider, client=client
+    )
+    if not ranked:
+        return PromptContext(sections=[], tokens=0)
+    outline = (await db.execute(section_neighborhood_query(content_id, [section_id for section_id, _ in ranked]))).all()
+    selected = select_context_sections(outline, dict(ranked), token_budget)
+    texts = await learning_content_service.get_sections_by_ids_async(db, [row.id for _, row in selected])
+    # 일부만 읽은 outline의 위치는 콘텐츠에서 연속인지 알 수 없으므로 콘텐츠 전체 순번(position)으로 겹침 제거
+    return assemble_context([(row.position, row) for _, row in selected], texts)
+
+
+def coverage_scores(outline: Sequence) -> Dict[UUID, float]:
+    """
+    콘텐츠 전체에 고르게 퍼지도록 섹션 점수를 매깁니다. (0, 1/2, 1/4, 3/4, ... 위치 순으로 높은 점수, van der Corput 수열)
+    점수 순으로 예산만큼 고르면 앞부분에 몰리지 않고 강의 전체를 덮습니다.
+    """
+    n = len(outline)
+    scores: Dict[UUID, float] = {}
+    bits = max(1, (n - 1).bit_length())
+    for k in range(1 << bits):
+        position = int(int(format(k, f"0{bits}b")[::-1], 2) / (1 << bits) * n)
+        section_id = outline[position].id
+        if section_id not in scores:
+            scores[section_id] = 1.0 - len(scores) / n
+    return scores
+
+
+def build_coverage_context(db: Session, content_id: UUID, token_budget: int) -> PromptContext:
+    """질문 없이 콘텐츠 전체에서 고르게 섹션을 골라 token_budget 안의 컨텍스트를 조립합니다. (퀴즈 생성용)"""
+    outline = db.execute(section_outline_query(content_id)).all()
+    if not outline:
+        return PromptContext(sections=[], tokens=0)
+    selected = select_context_sections(outline, coverage_scores(outline), token_budget, adjacency_weight=0)
+    texts = {
+        row["id"]: row for row in db.execute(
+            select(*learning_content_service.SECTION_RESPONSE_COLUMNS)
+            .where(models.ContentSection.id.in_([row.id for _, row in selected]))
+        ).mappings()
+    }
+    return assemble_context(selected, texts)
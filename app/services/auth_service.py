@@ -1,7 +1,10 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.database.models import User
+from app.core.hashing import password_hasher
+from app.core.principal_cache import principal_cache
 from app.core.security import verify_password, create_access_token
-from app.services.user_service import get_user_by_email
+from app.services.user_service import get_user_by_email, get_user_by_email_async
 
 def authenticate_user(db: Session, email: str, password: str):
     user = get_user_by_email(db, email)
@@ -11,6 +14,21 @@ def authenticate_user(db: Session, email: str, password: str):
         return None
     return user
 
+async def authenticate_user_async(db: AsyncSession, email: str, password: str):
+    user = await get_user_by_email_async(db, email)
+    if not user:
+        return None
+    # bcrypt 검증은 전용 프로세스 풀에서 실행 (과부하 시 503 + Retry-After)
+    is_valid, new_hash = await password_hasher.verify_password(password, user.password_hash)
+    if not is_valid:
+        return None
+    if new_hash:
+        # bcrypt cost 설정이 바뀐 경우 로그인 시점에 투명하게 재해싱
+        user.password_hash = new_hash
+        await db.commit()
+        await principal_cache.ainvalidate(user.email)
+    return user
+
 def create_user_account(db: Session, email: str, password: str, name: str):
     existing_user = get_user_by_email(db, email)
     if existing_user:
@@ -1,15 +1,22 @@
 # certgo-backend/app/services/certificate_service.py
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.database import models
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
+from app.services.pagination import apply_keyset, split_page
+
+# 목록 정렬 키 (keyset 페이지네이션 커서 기준, 결과 순서를 안정적으로 유지)
+CERTIFICATE_SORT = (models.Certificate.name, models.Certificate.id)
+
 def get_certificate(db: Session, certificate_id: UUID):
     return db.query(models.Certificate).filter(models.Certificate.id == certificate_id).first()
 
 def get_certificates(db: Session, skip: int = 0, limit: int = 100) -> List[models.Certificate]:
-    return db.query(models.Certificate).offset(skip).limit(limit).all()
+    return db.query(models.Certificate).order_by(*CERTIFICATE_SORT).offset(skip).limit(limit).all()
 
 def create_certificate(db: Session, name: str, description: Optional[str] = None, difficulty_level: Optional[int] = None, category: Optional[str] = None, is_premium: bool = False):
     db_certificate = models.Certificate(
@@ -22,4 +29,43 @@ def create_certificate(db: Session, name: str, description: Optional[str] = None
     db.add(db_certificate)
     db.commit()
     db.refresh(db_certificate)
-    return db_certificate
\ No newline at end of file
+    return db_certificate
+
+
+# --- 비동기 버전 (FastAPI 엔드포인트용) ---
+
+async def get_certificate_async(db: AsyncSession, certificate_id: UUID):
+    result = await db.execute(select(models.Certificate).where(models.Certificate.id == certificate_id))
+    return result.scalars().first()
+
+async def get_certificates_async(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[models.Certificate]:
+    # offset 방식 (deprecated, 하위 호환용). 깊은 페이지일수록 느려지므로 get_certificates_page_async 사용 권장
+    result = await db.execute(select(models.Certificate).order_by(*CERTIFICATE_SORT).offset(skip).limit(limit))
+    return list(result.scalars().all())
+
+async def get_certificates_page_async(db: AsyncSession, cursor: Optional[str] = None, limit: int = 100) -> Tuple[List[models.Certificate], Optional[str]]:
+    # (name, id) 기준 keyset 페이지네이션. (현재 페이지, 다음 커서) 반환
+    stmt = apply_keyset(select(models.Certificate), CERTIFICATE_SORT, cursor, limit)
+    result = await db.execute(stmt)
+    return split_page(list(result.scalars().all()), CERTIFICATE_SORT, limit)
+
+async def create_certificate_async(db: AsyncSession, name: str, description: Optional[str] = None, difficulty_level: Optional[int] = None, category: Optional[str] = None, is_premium: bool = False):
+    db_certificate = models.Certificate(
+        name=name,
+        description=description,
+        difficulty_level=difficulty_level,
+        category=category,
+        is_premium=is_premium
+    )
+    db.add(db_certificate)
+    await db.commit()
+    await db.refresh(db_certificate)
+    return db_certificate
+
+async def get_premium_certificate_ids_async(db: AsyncSession, certificate_ids: Iterable[Optional[UUID]]) -> Set[UUID]:
+    # 주어진 자격증 중 프리미엄인 것의 id (태스크 우선순위 결정용)
+    ids = {cid for cid in certificate_ids if cid is not None}
+    if not ids:
+        return set()
+    result = await db.execute(select(models.Certificate.id).where(models.Certificate.id.in_(ids), models.Certificate.is_premium.is_(True)))
+    return set(result.scalars().all())
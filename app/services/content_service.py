@@ -0,0 +1,362 @@
+# certgo-backend/app/services/content_service.py
+
+import difflib
+import hashlib
+import re
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database import models
+from app.services.learning_content_service import parse_timestamp_seconds
+
+# 문장 경계: 문장부호 뒤 공백, 또는 줄바꿈
+_UNIT_BOUNDARY = re.compile(r"(?<=[.!?。？！])\s+|\n+")
+# 줄/문장 앞의 타임스탬프 표시 (예: "[00:01:23]", "(01:23)", "01:23:45 ")
+_TIMESTAMP_MARKER = re.compile(r"^\s*[\[(]?(\d{1,2}:\d{2}(?::\d{2})?)[\])]?\s*")
+# 섹션 사이에 order_index 간격을 두어, 이후 증분 재처리에서 섹션을 끼워 넣을 때 기존 행을 다시 번호 매기지 않도록 함
+ORDER_INDEX_STEP = 1024
+
+
+# LLM 토큰 수 근사: 영문 약 4글자, 숫자 3자리, 한글 등 2글자, 문장부호 1개를 토큰 하나로 셈 (BPE tokenizer와 비슷한 수준)
+_LLM_TOKEN_PATTERN = re.compile(r"[A-Za-z]{1,4}|\d{1,3}|[^\W\d_A-Za-z]{1,2}|[^\w\s]")
+
+
+def count_tokens(text: str) -> int:
+    # 프롬프트 토큰 예산 계산용 근사값. 섹션별 값은 ContentSection.token_count에 저장해 재계산하지 않음
+    return len(_LLM_TOKEN_PATTERN.findall(text))
+
+
+def section_text_hash(text: str) -> str:
+    # migration의 SQL backfill(encode(sha256(convert_to(section_text, 'UTF8')), 'hex'))과 같은 값
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SectionDraft:
+    order_index: int
+    section_text: str
+    start_timestamp: Optional[str] = None
+    end_timestamp: Optional[str] = None
+
+    def to_row(self, content_id: UUID, order_index: Optional[int] = None) -> dict:
+        return {
+            "content_id": content_id,
+            "section_text": self.section_text,
+            "text_hash": section_text_hash(self.section_text),
+            "token_count": count_tokens(self.section_text),
+            "start_timestamp": self.start_timestamp,
+            "end_timestamp": self.end_timestamp,
+            "start_seconds": parse_timestamp_seconds(self.start_timestamp),
+            "end_seconds": parse_timestamp_seconds(self.end_timestamp),
+            "order_index": self.order_index if order_index is None else order_index,
+        }
+
+
+def iter_raw_text(db: Session, content_id: UUID, chunk_chars: int = None) -> Iterator[str]:
+    """
+    LearningContent.raw_text_content를 substr로 chunk_chars씩 나누어 읽습니다.
+    트랜스크립트 전체를 한 번에 메모리에 올리지 않기 위함입니다.
+    컬럼이 STORAGE EXTERNAL(비압축)이므로 substr은 필요한 위치까지의 TOAST 청크만 읽고,
+    압축된 값처럼 호출마다 전체를 압축 해제하지 않습니다.
+    """
+    chunk_chars = chunk_chars or settings.RAW_TEXT_READ_CHARS
+    start = 1 # SQL substr은 1부터 시작
+    while True:
+        chunk = db.execute(
+            select(func.substr(models.LearningContent.raw_text_content, start, chunk_chars))
+            .where(models.LearningContent.id == content_id)
+        ).scalar()
+        if not chunk:
+            return
+        yield chunk
+        start += len(chunk)
+
+
+def _iter_units(text_chunks: Iterable[str], max_unit_chars: int) -> Iterator[tuple]:
+    """
+    텍스트 청크 스트림을 문장 단위 (timestamp, text)로 나눕니다.
+    마지막 미완성 문장은 다음 청크와 이어 붙여 처리합니다.
+    """
+    buffer = ""
+    for chunk in text_chunks:
+        buffer += chunk
+        parts = _UNIT_BOUNDARY.split(buffer)
+        buffer = parts.pop() # 아직 경계가 나오지 않은 꼬리 부분
+        for part in parts:
+            yield from _split_unit(part, max_unit_chars)
+        # 문장부호/줄바꿈이 없는 긴 텍스트도 메모리가 늘지 않도록 강제로 자름
+        while len(buffer) > max_unit_chars:
+            cut = buffer.rfind(" ", 0, max_unit_chars)
+            cut = cut if cut > 0 else max_unit_chars
+            yield from _split_unit(buffer[:cut], max_unit_chars)
+            buffer = buffer[cut:]
+    if buffer:
+        yield from _split_unit(buffer, max_unit_chars)
+
+
+def _split_unit(part: str, max_unit_chars: int) -> Iterator[tuple]:
+    match = _TIMESTAMP_MARKER.match(part)
+    timestamp = None
+    if match:
+        timestamp = match.group(1)
+        part = part[match.end():]
+    part = part.strip()
+    if not part:
+        if timestamp:
+            yield timestamp, ""
+        return
+    for i in range(0, len(part), max_unit_chars):
+        yield (timestamp if i == 0 else None), part[i:i + max_unit_chars]
+
+
+def iter_sections(
+    text_chunks: Iterable[str],
+    target_chars: int = None,
+    overlap_chars: int = None,
+) -> Iterator[SectionDraft]:
+    """
+    텍스트 스트림을 섹션으로 나누는 스트리밍 제너레이터.
+    - 문장 경계를 기준으로 target_chars 이하의 섹션을 만들고,
+    - target_chars의 절반을 넘은 뒤에는 문장 내용으로 정해지는 "앵커" 문장(해시 % CHUNK_ANCHOR_MODULUS == 0) 뒤에서 자르므로
+      (content-defined chunking) 텍스트 일부가 수정되어도 이후 경계가 곧 원래 위치로 돌아와 바뀌는 섹션 수가 제한되며,
+    - 앞 섹션 끝의 문장들을 overlap_chars 이내로 다음 섹션 앞에 겹쳐 넣으며,
+    - 타임스탬프 표시가 있으면 섹션의 시작/종료 시간으로 사용합니다.
+    종료 시간은 다음 섹션의 시작 시간이므로 섹션 하나를 늦춰서 내보냅니다.
+    """
+    target_chars = target_chars or settings.CHUNK_TARGET_CHARS
+    overlap_chars = settings.CHUNK_OVERLAP_CHARS if overlap_chars is None else overlap_chars
+    max_unit_chars = target_chars
+    min_chars = target_chars // 2
+    anchor_modulus = settings.CHUNK_ANCHOR_MODULUS
+
+    order_index = 0
+    pending: Optional[SectionDraft] = None # 종료 시간을 기다리는 직전 섹션
+    units: List[str] = []
+    length = 0
+    current_start: Optional[str] = None
+    last_timestamp: Optional[str] = None
+    cut_at_anchor = False # 직전 문장이 앵커 -> 다음 문장부터 새 섹션
+
+    def build() -> SectionDraft:
+        return SectionDraft(order_index=order_index, section_text=" ".join(units), start_timestamp=current_start)
+
+    for timestamp, text in _iter_units(text_chunks, max_unit_chars):
+        if timestamp:
+            last_timestamp = timestamp
+        if not text:
+            continue
+        if units and (cut_at_anchor or length + len(text) > target_chars):
+            section = build()
+            if pending is not None:
+                pending.end_timestamp = section.start_timestamp or last_timestamp
+                yield pending
+            pending = section
+            order_index += 1
+            # overlap: 직전 섹션의 마지막 문장들을 overlap_chars 이내로 유지
+            kept: List[str] = []
+            kept_length = 0
+            for unit in reversed(units):
+                if kept_length + len(unit) > overlap_chars:
+                    break
+                kept.insert(0, unit)
+                kept_length += len(unit) + 1
+            units, length = kept, kept_length
+            current_start = None
+        if current_start is None:
+            current_start = timestamp or last_timestamp
+        units.append(text)
+        length += len(text) + 1
+        cut_at_anchor = length >= min_chars and zlib.crc32(text.encode("utf-8")) % anchor_modulus == 0
+
+    last_section = build() if units else None
+    if pending is not None:
+        pending.end_timestamp = (last_section.start_timestamp if last_section else None) or last_timestamp
+        yield pending
+    if last_section is not None:
+        last_section.end_timestamp = last_timestamp if last_timestamp != last_section.start_timestamp else None
+        yield last_section
+
+
+def materialize_sections(
+    db: Session,
+    content_id: UUID,
+    target_chars: int = None,
+    overlap_chars: int = None,
+    batch_size: int = None,
+) -> int:
+    """
+    raw_text_content를 스트리밍으로 분할하여 ContentSection을 batch_size 건씩 bulk insert 합니다.
+    기존 섹션은 같은 트랜잭션에서 삭제 후 다시 생성하며, 성공 시 commit 합니다. (증분 재처리는 sync_sections)
+    order_index는 ORDER_INDEX_STEP 간격으로 부여합니다.
+    한 번에 최대 batch_size 건의 행만 메모리에 유지하므로 트랜스크립트 길이와 무관하게 메모리가 일정합니다.
+    """
+    batch_size = batch_size or settings.SECTION_INSERT_BATCH_SIZE
+    db.execute(delete(models.ContentSection).where(models.ContentSection.content_id == content_id))
+
+    total = 0
+    batch: List[dict] = []
+    for section in iter_sections(iter_raw_text(db, content_id), target_chars, overlap_chars):
+        batch.append(section.to_row(content_id, section.order_index * ORDER_INDEX_STEP))
+        if len(batch) >= batch_size:
+            db.execute(insert(models.ContentSection), batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        db.execute(insert(models.ContentSection), batch)
+        total += len(batch)
+    db.commit()
+    return total
+
+
+@dataclass
+class SectionSyncResult:
+    kept: int = 0
+    inserted: int = 0
+    deleted: int = 0
+    retimed: int = 0 # 텍스트는 같고 타임스탬프만 바뀐 섹션
+    renumbered: bool = False # order_index 간격이 부족해 전체 번호를 다시 매겼는지
+    removed_point_ids: List[UUID] = field(default_factory=list) # 삭제된 섹션의 Qdrant point id
+    reordered_point_ids: Dict[UUID, int] = field(default_factory=dict) # 번호가 바뀐 유지 섹션의 point id -> 새 order_index
+
+
+def _spread(low: Optional[int], high: Optional[int], count: int) -> Optional[List[int]]:
+    """
+    (low, high) 구간 안에 count개의 order_index를 고르게 배정합니다. 간격이 부족하면 None.
+    order_index는 0 이상이어야 하므로 첫 섹션 앞의 삽입은 (-1, high) 구간을 사용합니다. (첫 섹션이 0이면 전체 번호 재부여)
+    """
+    if low is None and high is None:
+        return [i * ORDER_INDEX_STEP for i in range(count)]
+    if low is None:
+        low = -1
+    if high is None:
+        high = low + (count + 1) * ORDER_INDEX_STEP
+    gap = (high - low) // (count + 1)
+    if gap < 1:
+        return None
+    return [low + gap * (i + 1) for i in range(count)]
+
+
+class RawTextChangedError(RuntimeError):
+    def __init__(self, content_id: UUID):
+        super().__init__(f"raw_text_content of content {content_id} changed during section sync")
+        self.content_id = content_id
+
+
+def sync_sections(
+    db: Session,
+    content_id: UUID,
+    target_chars: int = None,
+    overlap_chars: int = None,
+    batch_size: int = None,
+) -> SectionSyncResult:
+    """
+    raw_text_content를 다시 분할하여 기존 ContentSection과 비교하고, 바뀐 섹션만 삽입/삭제합니다. (증분 재처리)
+    - 섹션 텍스트의 해시 목록을 difflib로 비교하여 같은 섹션은 그대로 두고 (id, qdrant_point_id 유지 -> 재임베딩 없음),
+    - 바뀐 구간만 삭제 후 새 섹션을 주변 order_index 사이의 빈 번호로 삽입하며,
+    - 텍스트가 같고 타임스탬프만 달라진 섹션은 시간 컬럼만 UPDATE 합니다.
+    분할은 두 번 수행합니다(1차: 해시/타임스탬프만 수집, 2차: 삽입할 섹션의 텍스트만 사용) - 텍스트 전체를 메모리에 두지 않기 위함.
+    두 분할이 같은 텍스트를 읽도록 콘텐츠 행을 FOR SHARE로 잠가 commit 전까지 raw_text_content 변경(재처리 요청)을 막고,
+    2차 분할의 섹션 해시가 1차와 다르면 RawTextChangedError를 올립니다. (아무것도 commit 하지 않음)
+    새 섹션은 qdrant_point_id가 NULL이므로 이후 embed_content_sections가 바뀐 섹션만 임베딩합니다.
+    삭제된 섹션의 Qdrant point 삭제는 호출 측에서 result.removed_point_ids로 처리합니다. 성공 시 commit 합니다.
+    """
+    batch_size = batch_size or settings.SECTION_INSERT_BATCH_SIZE
+    CS = models.ContentSection
+
+    db.execute(select(models.LearningContent.id).where(models.LearningContent.id == content_id).with_for_update(read=True))
+    old = db.execute(
+        select(CS.id, CS.text_hash, CS.order_index, CS.qdrant_point_id, CS.start_timestamp, CS.end_timestamp)
+        .where(CS.content_id == content_id)
+        .order_by(CS.order_index, CS.id)
+    ).all()
+    new: List[Tuple[str, Optional[str], Optional[str]]] = [
+        (section_text_hash(section.section_text), section.start_timestamp, section.end_timestamp)
+        for section in iter_sections(iter_raw_text(db, content_id), target_chars, overlap_chars)
+    ]
+
+    result = SectionSyncResult()
+    matcher = difflib.SequenceMatcher(None, [row.text_hash for row in old], [h for h, _, _ in new], autojunk=False)
+    opcodes = matcher.get_opcodes()
+
+    # 1) 새 순서 기준으로 각 위치의 order_index 결정 (유지 섹션은 기존 번호, 새 섹션은 주변 번호 사이)
+    new_order: List[Optional[int]] = [None] * len(new)
+    kept_rows: Dict[int, object] = {} # 새 위치 -> 유지되는 기존 행
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            for offset in range(i2 - i1):
+                kept_rows[j1 + offset] = old[i1 + offset]
+                new_order[j1 + offset] = old[i1 + offset].order_index
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag in ("replace", "insert"):
+            low = new_order[j1 - 1] if j1 > 0 else None
+            high = next((new_order[j] for j in range(j2, len(new)) if new_order[j] is not None), None)
+            spread = _spread(low, high, j2 - j1)
+            if spread is None:
+                result.renumbered = True
+                break
+            new_order[j1:j2] = spread
+
+    if result.renumbered:
+        # 간격이 모두 소진된 경우에만 전체 번호 재부여 (텍스트/임베딩은 그대로, order_index만 UPDATE)
+        new_order = [j * ORDER_INDEX_STEP for j in range(len(new))]
+        updates = [
+            {"id": row.id, "order_index": new_order[j]}
+            for j, row in kept_rows.items() if row.order_index != new_order[j]
+        ]
+        if updates:
+            db.execute(update(CS), updates)
+        result.reordered_point_ids = {
+            row.qdrant_point_id: new_order[j]
+            for j, row in kept_rows.items() if row.qdrant_point_id is not None and row.order_index != new_order[j]
+        }
+
+    # 2) 바뀐 구간의 기존 섹션 삭제
+    removed = [row for tag, i1, i2, _, _ in opcodes if tag in ("replace", "delete") for row in old[i1:i2]]
+    for i in range(0, len(removed), batch_size):
+        db.execute(delete(CS).where(CS.id.in_([row.id for row in removed[i:i + batch_size]])))
+    result.deleted = len(removed)
+    result.removed_point_ids = [row.qdrant_point_id for row in removed if row.qdrant_point_id is not None]
+
+    # 3) 유지 섹션 중 타임스탬프만 바뀐 것 UPDATE
+    retimed = [
+        {
+            "id": row.id,
+            "start_timestamp": new[j][1],
+            "end_timestamp": new[j][2],
+            "start_seconds": parse_timestamp_seconds(new[j][1]),
+            "end_seconds": parse_timestamp_seconds(new[j][2]),
+        }
+        for j, row in kept_rows.items() if (row.start_timestamp, row.end_timestamp) != (new[j][1], new[j][2])
+    ]
+    if retimed:
+        db.execute(update(CS), retimed)
+    result.retimed = len(retimed)
+    result.kept = len(kept_rows)
+
+    # 4) 새 섹션 삽입 (2차 분할에서 삽입 위치의 텍스트만 사용, 위치별 해시가 1차와 같은지 확인)
+    batch: List[dict] = []
+    count = 0
+    for j, section in enumerate(iter_sections(iter_raw_text(db, content_id), target_chars, overlap_chars)):
+        count += 1
+        if j >= len(new) or section_text_hash(section.section_text) != new[j][0]:
+            raise RawTextChangedError(content_id)
+        if j in kept_rows:
+            continue
+        batch.append(section.to_row(content_id, new_order[j]))
+        if len(batch) >= batch_size:
+            db.execute(insert(CS), batch)
+            result.inserted += len(batch)
+            batch = []
+    if count != len(new):
+        raise RawTextChangedError(content_id)
+    if batch:
+        db.execute(insert(CS), batch)
+        result.inserted += len(batch)
+    db.commit()
+    return result
@@ -0,0 +1,151 @@
+# certgo-backend/app/services/embedding_cache.py
+
+import hashlib
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import List, Optional, Sequence
+
+import numpy as np
+import redis
+
+from app.core.config import settings
+
+REDIS_KEY_PREFIX = "emb:"
+REDIS_STATS_KEY = "emb:stats" # 워커 전체의 Redis 조회/미스 카운터 (hash, 로컬 LRU 적중은 제외)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    # 같은 내용이면 같은 키가 되도록 유니코드 정규화(NFC) + 공백 정리 (대소문자는 모델이 구분할 수 있으므로 유지)
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def cache_key(model_id: str, text: str) -> str:
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{REDIS_KEY_PREFIX}{model_id}:{digest}"
+
+
+class EmbeddingCache:
+    """
+    (model_id, 정규화된 텍스트 해시) -> 임베딩 벡터 캐시.
+    1차: 프로세스 내 LRU, 2차(선택): 워커 간 공유되는 Redis.
+    내용 주소 기반이므로 무효화가 필요 없고, 벡터는 float32 바이트로 저장합니다.
+    get_many / set_many는 배치 전체를 Redis 왕복 한 번(MGET / pipeline)으로 처리하며,
+    Redis 장애 시에는 캐시 미스로 처리하여 임베딩 provider 호출로 대체합니다.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int, redis_url: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.redis_url = redis_url
+        self._local: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = None
+        self.lookups = 0
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    def _get_redis(self):
+        if self._redis is None:
+            self._redis = redis.from_url(self.redis_url, socket_connect_timeout=1, socket_timeout=1)
+        return self._redis
+
+    # --- 로컬 LRU ---
+
+    def _local_get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._local.get(key)
+            if value is not None:
+                self._local.move_to_end(key)
+            return value
+
+    def _local_set(self, key: str, value: bytes):
+        with self._lock:
+            self._local[key] = value
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    # --- 공개 API ---
+
+    def get_many(self, model_id: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """texts 순서대로 캐시된 벡터(없으면 None) 목록을 반환합니다."""
+        keys = [cache_key(model_id, text) for text in texts]
+        values: List[Optional[bytes]] = [self._local_get(key) for key in keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+        local_hits = len(keys) - len(missing)
+
+        redis_hits = 0
+        if missing and self.redis_url:
+            try:
+                pipe = self._get_redis().pipeline(transaction=False)
+                pipe.mget([keys[i] for i in missing])
+                pipe.hincrby(REDIS_STATS_KEY, "lookups", len(missing))
+                raw_values = pipe.execute()[0]
+            except redis.RedisError:
+                raw_values = [None] * len(missing)
+            for i, raw in zip(missing, raw_values):
+                if raw is not None:
+                    values[i] = raw
+                    self._local_set(keys[i], raw)
+                    redis_hits += 1
+
+        self.lookups += len(keys)
+        self.local_hits += local_hits
+        self.redis_hits += redis_hits
+        self.misses += len(missing) - redis_hits
+        return [np.frombuffer(value, dtype=np.float32).tolist() if value is not None else None for value in values]
+
+    def set_many(self, model_id: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]):
+        """provider로 새로 계산한 벡터를 저장합니다. (get_many의 미스 건수도 함께 기록)"""
+        items = [(cache_key(model_id, text), np.asarray(vector, dtype=np.float32).tobytes()) for text, vector in zip(texts, vectors)]
+        for key, value in items:
+            self._local_set(key, value)
+        if items and self.redis_url:
+            try:
+                pipe = self._get_redis().pipeline(transaction=False)
+                for key, value in items:
+                    pipe.set(key, value, ex=self.ttl_seconds)
+                pipe.hincrby(REDIS_STATS_KEY, "misses", len(items))
+                pipe.execute()
+            except redis.RedisError:
+                pass
+
+    def stats(self) -> dict:
+        local_ratio = (self.local_hits + self.redis_hits) / self.lookups if self.lookups else 0.0
+        result = {
+            "redis_enabled": bool(self.redis_url),
+            "entries": len(self._local),
+            "lookups": self.lookups,
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_ratio": round(local_ratio, 4),
+            "shared": None,
+        }
+        if self.redis_url:
+            try:
+                raw = self._get_redis().hgetall(REDIS_STATS_KEY)
+            except redis.RedisError:
+                raw = None
+            if raw is not None:
+                shared = {k.decode(): int(v) for k, v in raw.items()}
+                lookups = shared.get("lookups", 0)
+                misses = shared.get("misses", 0)
+                result["shared"] = {
+                    "lookups": lookups,
+                    "misses": misses,
+                    "hit_ratio": round((lookups - misses) / lookups, 4) if lookups else 0.0,
+                }
+        return result
+
+
+embedding_cache = EmbeddingCache(
+    max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.EMBEDDING_CACHE_TTL_SECONDS,
+    redis_url=settings.REDIS_URL if settings.EMBEDDING_CACHE_REDIS_ENABLED else None,
+)
@@ -1,19 +1,98 @@
 # certgo-backend/app/services/learning_content_service.py
 
-from sqlalchemy.orm import Session, joinedload
+import re
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload, load_only
 from app.database import models
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 
+from app.database.connection import AsyncSessionLocal
+from app.services.outbox_service import process_content_outbox
+from app.services.pagination import apply_keyset, split_page
+from app.core.task_routing import task_priority
+
+# learningcontent.source_url의 UNIQUE 제약 이름 (초기 마이그레이션의 이름 없는 UniqueConstraint에 PostgreSQL이 붙인 기본 이름)
+SOURCE_URL_CONSTRAINT = "learningcontent_source_url_key"
+
+
+class DuplicateSourceUrlError(ValueError):
+    def __init__(self):
+        super().__init__("Learning content with the same source_url already exists")
+
+
+def integrity_constraint_name(error: IntegrityError) -> Optional[str]:
+    # psycopg2는 orig.diag.constraint_name, asyncpg는 SQLAlchemy 어댑터 예외(orig)가 감싼 원래 예외의 constraint_name
+    diag = getattr(error.orig, "diag", None)
+    if diag is not None:
+        return diag.constraint_name
+    return getattr(getattr(error.orig, "__cause__", None), "constraint_name", None)
+
+# 목록 정렬 키 (keyset 페이지네이션 커서 기준, 결과 순서를 안정적으로 유지)
+CONTENT_SORT = (models.LearningContent.created_at, models.LearningContent.id)
+
+# 목록/상세 응답(LearningContentResponse)에 필요한 컬럼만 조회하는 projection
+# raw_text_content 같은 대용량 컬럼은 SELECT에 포함되지 않으며,
+# raiseload=True로 목록 결과에서 projection 밖의 컬럼에 접근하면 추가 쿼리 대신 에러가 발생함
+# (응답 스키마에 필드를 추가하면 여기에도 컬럼을 추가해야 함)
+CONTENT_RESPONSE_COLUMNS = (
+    models.LearningContent.id,
+    models.LearningContent.certificate_id,
+    models.LearningContent.type,
+    models.LearningContent.source_url,
+    models.LearningContent.title,
+    models.LearningContent.description,
+    models.LearningContent.processing_status,
+    models.LearningContent.duration_minutes,
+    models.LearningContent.qdrant_collection_name,
+    models.LearningContent.created_at, # keyset 커서 생성용
+)
+
+def content_response_projection():
+    return load_only(*CONTENT_RESPONSE_COLUMNS, raiseload=True)
+
+# 섹션 응답(ContentSectionResponse)에 필요한 컬럼
+SECTION_RESPONSE_COLUMNS = (
+    models.ContentSection.id,
+    models.ContentSection.content_id,
+    models.ContentSection.section_title,
+    models.ContentSection.section_text,
+    models.ContentSection.start_timestamp,
+    models.ContentSection.end_timestamp,
+    models.ContentSection.start_seconds,
+    models.ContentSection.end_seconds,
+    models.ContentSection.order_index,
+)
+
+_TIMESTAMP_PATTERN = re.compile(r"^\s*(?:(\d+):)?(?:(\d+):)?(\d+)(?:[.,]\d+)?\s*$")
+
+def parse_timestamp_seconds(value: Optional[str]) -> Optional[int]:
+    """
+    "SS", "MM:SS", "HH:MM:SS" (소수점 이하 버림) 형식의 타임스탬프를 초 단위 정수로 변환합니다.
+    형식이 맞지 않으면 None을 반환합니다.
+    """
+    if not value:
+        return None
+    match = _TIMESTAMP_PATTERN.match(value)
+    if not match:
+        return None
+    parts = [int(p) for p in match.groups() if p is not None]
+    seconds = 0
+    for part in parts:
+        seconds = seconds * 60 + part
+    return seconds
+
 def get_learning_content(db: Session, content_id: UUID):
     # 콘텐츠와 해당 섹션을 함께 로드하도록 joinedload 사용
     return db.query(models.LearningContent).options(joinedload(models.LearningContent.sections)).filter(models.LearningContent.id == content_id).first()
 
 def get_learning_contents_by_certificate(db: Session, certificate_id: UUID, skip: int = 0, limit: int = 100) -> List[models.LearningContent]:
-    return db.query(models.LearningContent).filter(models.LearningContent.certificate_id == certificate_id).offset(skip).limit(limit).all()
+    return db.query(models.LearningContent).options(content_response_projection()).filter(models.LearningContent.certificate_id == certificate_id).order_by(*CONTENT_SORT).offset(skip).limit(limit).all()
 
 def get_all_learning_contents(db: Session, skip: int = 0, limit: int = 100) -> List[models.LearningContent]:
-    return db.query(models.LearningContent).offset(skip).limit(limit).all()
+    return db.query(models.LearningContent).options(content_response_projection()).order_by(*CONTENT_SORT).offset(skip).limit(limit).all()
 
 def create_learning_content(
     db: Session,
@@ -22,7 +101,8 @@ def create_learning_content(
     source_url: str,
     description: Optional[str],
     type: str,
-    duration_minutes: Optional[int]
+    duration_minutes: Optional[int],
+    priority: Optional[int] = None
 ):
     db_content = models.LearningContent(
         certificate_id=certificate_id,
@@ -34,16 +114,270 @@ def create_learning_content(
         processing_status="PENDING" # 초기 상태는 PENDING
     )
     db.add(db_content)
+    db.flush() # id 확보
+    db.execute(process_content_outbox([db_content.id], [priority])) # 처리 태스크는 같은 트랜잭션으로 outbox에 기록
     db.commit()
     db.refresh(db_content)
     return db_content
 
 def update_content_processing_status(db: Session, content_id: UUID, status: str, raw_text: Optional[str] = None):
+    """
+    처리 상태를 바꿉니다. raw_text가 주어지면 원본 텍스트를 교체하고 상태를 PENDING으로 되돌린 뒤
+    재처리 태스크를 같은 트랜잭션으로 outbox에 기록합니다. (섹션이 이전 텍스트 기준으로 남지 않도록)
+    """
     db_content = db.query(models.LearningContent).filter(models.LearningContent.id == content_id).first()
     if db_content:
         db_content.processing_status = status
         if raw_text:
             db_content.raw_text_content = raw_text
+            db_content.processing_status = "PENDING"
+            db.execute(process_content_outbox([content_id], [task_priority(is_premium_content(db, content_id))]))
         db.commit()
         db.refresh(db_content)
-    return db_content
\ No newline at end of file
+    return db_content
+
+def is_premium_content(db: Session, content_id: UUID) -> bool:
+    # 프리미엄 자격증에 속한 콘텐츠인지 (태스크 우선순위 결정용)
+    return bool(db.execute(
+        select(models.Certificate.is_premium)
+        .join(models.LearningContent, models.LearningContent.certificate_id == models.Certificate.id)
+        .where(models.LearningContent.id == content_id)
+    ).scalar())
+
+# 처리 상태 전이 (Celery 태스크용). 조건부 UPDATE로 중복 실행/경합 시에도 한 워커만 전이에 성공함
+
+def mark_content_pending(db: Session, content_id: UUID) -> bool:
+    """재처리 요청: 상태를 PENDING으로 되돌립니다. 처리 중이면 처리 중인 워커가 끝난 뒤 다시 처리합니다."""
+    result = db.execute(
+        update(models.LearningContent).where(models.LearningContent.id == content_id).values(processing_status="PENDING")
+    )
+    db.commit()
+    return result.rowcount == 1
+
+def claim_content_processing(db: Session, content_id: UUID) -> bool:
+    """
+    PENDING -> PROCESSING 전이. 콘텐츠 락을 잡은 워커만 호출하므로, 이미 PROCESSING이면
+    이전 워커가 죽고 락이 만료된 경우로 보고 이어받습니다. COMPLETED/FAILED면 중복 전달이므로 False.
+    """
+    result = db.execute(
+        update(models.LearningContent)
+        .where(models.LearningContent.id == content_id, models.LearningContent.processing_status.in_(("PENDING", "PROCESSING")))
+        .values(processing_status="PROCESSING")
+    )
+    db.commit()
+    return result.rowcount == 1
+
+def finish_content_processing(db: Session, content_id: UUID, status: str) -> bool:
+    """
+    PROCESSING -> COMPLETED/FAILED 전이. 처리 중에 재처리 요청(PENDING)이 들어왔으면 전이하지 않고 False를 반환하며,
+    호출 측은 락을 쥔 채로 다시 처리합니다.
+    """
+    result = db.execute(
+        update(models.LearningContent)
+        .where(models.LearningContent.id == content_id, models.LearningContent.processing_status == "PROCESSING")
+        .values(processing_status=status)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+# --- 비동기 버전 (FastAPI 엔드포인트용) ---
+
+async def get_learning_content_async(db: AsyncSession, content_id: UUID, with_sections: bool = True):
+    stmt = select(models.LearningContent).where(models.LearningContent.id == content_id)
+    if with_sections:
+        # 비동기 세션에서는 lazy load가 불가하므로 섹션을 selectinload로 미리 로드
+        stmt = stmt.options(selectinload(models.LearningContent.sections))
+    else:
+        stmt = stmt.options(content_response_projection())
+    result = await db.execute(stmt)
+    return result.scalars().first()
+
+async def get_learning_contents_by_certificate_async(db: AsyncSession, certificate_id: UUID, skip: int = 0, limit: int = 100) -> List[models.LearningContent]:
+    # offset 방식 (deprecated, 하위 호환용)
+    result = await db.execute(
+        select(models.LearningContent)
+        .options(content_response_projection())
+        .where(models.LearningContent.certificate_id == certificate_id)
+        .order_by(*CONTENT_SORT)
+        .offset(skip).limit(limit)
+    )
+    return list(result.scalars().all())
+
+async def get_learning_contents_by_certificate_page_async(db: AsyncSession, certificate_id: UUID, cursor: Optional[str] = None, limit: int = 100) -> Tuple[List[models.LearningContent], Optional[str]]:
+    # (created_at, id) 기준 keyset 페이지네이션. (현재 페이지, 다음 커서) 반환
+    stmt = (
+        select(models.LearningContent)
+        .options(content_response_projection())
+        .where(models.LearningContent.certificate_id == certificate_id)
+    )
+    result = await db.execute(apply_keyset(stmt, CONTENT_SORT, cursor, limit))
+    return split_page(list(result.scalars().all()), CONTENT_SORT, limit)
+
+async def get_all_learning_contents_async(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[models.LearningContent]:
+    # offset 방식 (deprecated, 하위 호환용)
+    result = await db.execute(select(models.LearningContent).options(content_response_projection()).order_by(*CONTENT_SORT).offset(skip).limit(limit))
+    return list(result.scalars().all())
+
+async def get_all_learning_contents_page_async(db: AsyncSession, cursor: Optional[str] = None, limit: int = 100) -> Tuple[List[models.LearningContent], Optional[str]]:
+    # (created_at, id) 기준 keyset 페이지네이션. (현재 페이지, 다음 커서) 반환
+    stmt = select(models.LearningContent).options(content_response_projection())
+    result = await db.execute(apply_keyset(stmt, CONTENT_SORT, cursor, limit))
+    return split_page(list(result.scalars().all()), CONTENT_SORT, limit)
+
+async def create_learning_content_async(
+    db: AsyncSession,
+    certificate_id: Optional[UUID],
+    title: str,
+    source_url: str,
+    description: Optional[str],
+    type: str,
+    duration_minutes: Optional[int],
+    priority: Optional[int] = None
+):
+    db_content = models.LearningContent(
+        certificate_id=certificate_id,
+        title=title,
+        source_url=source_url,
+        description=description,
+        type=type,
+        duration_minutes=duration_minutes,
+        processing_status="PENDING" # 초기 상태는 PENDING
+    )
+    db.add(db_content)
+    await db.flush() # id 확보
+    # 처리 태스크는 콘텐츠와 같은 트랜잭션으로 outbox에 기록 (commit 후 relay가 Celery로 발행)
+    await db.execute(process_content_outbox([db_content.id], [priority]))
+    await db.commit()
+    await db.refresh(db_content)
+    return db_content
+
+async def create_learning_contents_bulk_async(db: AsyncSession, contents: List[dict], priorities: Optional[List[Optional[int]]] = None):
+    """
+    여러 콘텐츠를 INSERT 한 번과 outbox INSERT 한 번, 하나의 트랜잭션으로 생성합니다.
+    contents: create_learning_content_async의 인자와 같은 키를 가진 dict 목록. 응답 컬럼만 RETURNING으로 반환합니다.
+    priorities: contents와 같은 순서의 처리 태스크 우선순위 (없으면 기본 우선순위)
+    source_url이 이미 있거나 요청 안에서 중복되면 롤백 후 DuplicateSourceUrlError, 다른 제약 위반은 IntegrityError를 그대로 올립니다.
+    """
+    try:
+        result = await db.execute(
+            insert(models.LearningContent)
+            .values([{**content, "processing_status": "PENDING"} for content in contents])
+            .returning(*CONTENT_RESPONSE_COLUMNS)
+        )
+    except IntegrityError as e:
+        await db.rollback()
+        if integrity_constraint_name(e) == SOURCE_URL_CONSTRAINT:
+            raise DuplicateSourceUrlError() from e
+        raise
+    rows = result.all() # INSERT ... VALUES (...), (...) RETURNING은 VALUES 순서대로 반환
+    await db.execute(process_content_outbox([row.id for row in rows], priorities))
+    await db.commit()
+    return rows
+
+async def update_content_processing_status_async(db: AsyncSession, content_id: UUID, status: str, raw_text: Optional[str] = None):
+    # raw_text가 주어지면 동기 버전과 같이 PENDING + 재처리 outbox 기록을 한 트랜잭션으로 처리
+    result = await db.execute(select(models.LearningContent).where(models.LearningContent.id == content_id))
+    db_content = result.scalars().first()
+    if db_content:
+        db_content.processing_status = status
+        if raw_text:
+            db_content.raw_text_content = raw_text
+            db_content.processing_status = "PENDING"
+            premium = await is_premium_content_async(db, content_id)
+            await db.execute(process_content_outbox([content_id], [task_priority(premium)]))
+        await db.commit()
+        await db.refresh(db_content)
+    return db_content
+
+
+async def content_exists_async(db: AsyncSession, content_id: UUID) -> bool:
+    result = await db.execute(select(models.LearningContent.id).where(models.LearningContent.id == content_id))
+    return result.first() is not None
+
+async def get_processing_status_async(db: AsyncSession, content_id: UUID) -> Optional[str]:
+    # 처리 상태만 조회 (진행 이벤트 SSE 연결 시 초기 상태, 콘텐츠가 없으면 None)
+    result = await db.execute(select(models.LearningContent.processing_status).where(models.LearningContent.id == content_id))
+    return result.scalar()
+
+async def is_premium_content_async(db: AsyncSession, content_id: UUID) -> bool:
+    result = await db.execute(
+        select(models.Certificate.is_premium)
+        .join(models.LearningContent, models.LearningContent.certificate_id == models.Certificate.id)
+        .where(models.LearningContent.id == content_id)
+    )
+    return bool(result.scalar())
+
+def content_sections_query(
+    content_id: UUID,
+    from_index: Optional[int] = None,
+    to_index: Optional[int] = None,
+    from_seconds: Optional[int] = None,
+    to_seconds: Optional[int] = None,
+):
+    # order_index 범위 조회 ((content_id, order_index) 인덱스 사용), 양 끝 포함
+    # from_seconds/to_seconds가 주어지면 해당 재생 구간과 겹치는 섹션만 조회
+    stmt = (
+        select(*SECTION_RESPONSE_COLUMNS)
+        .where(models.ContentSection.content_id == content_id)
+        .order_by(models.ContentSection.order_index)
+    )
+    if from_index is not None:
+        stmt = stmt.where(models.ContentSection.order_index >= from_index)
+    if to_index is not None:
+        stmt = stmt.where(models.ContentSection.order_index <= to_index)
+    if to_seconds is not None:
+        stmt = stmt.where(models.ContentSection.start_seconds <= to_seconds)
+    if from_seconds is not None:
+        stmt = stmt.where(func.coalesce(models.ContentSection.end_seconds, models.ContentSection.start_seconds) >= from_seconds)
+    return stmt
+
+async def stream_content_sections(
+    content_id: UUID,
+    from_index: Optional[int] = None,
+    to_index: Optional[int] = None,
+    from_seconds: Optional[int] = None,
+    to_seconds: Optional[int] = None,
+    batch_size: int = 500,
+) -> AsyncIterator[list]:
+    """
+    섹션을 order_index 순서로 batch_size 건씩 나누어 전달하는 비동기 제너레이터.
+    서버 사이드 커서(yield_per)를 사용하므로 섹션 수와 관계없이 메모리 사용량이 일정합니다.
+    StreamingResponse 본문 전송 중에는 요청 의존성 세션이 이미 닫혀 있으므로 별도 세션을 엽니다.
+    """
+    stmt = content_sections_query(content_id, from_index, to_index, from_seconds, to_seconds).execution_options(yield_per=batch_size)
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(stmt)
+        async for partition in result.mappings().partitions():
+            yield partition
+
+
+async def get_sections_by_ids_async(db: AsyncSession, section_ids: List[UUID]) -> dict:
+    """
+    섹션 id 목록을 IN 쿼리 한 번으로 조회해 {id: row} 로 반환합니다. (검색 결과 hydrate용)
+    """
+    if not section_ids:
+        return {}
+    stmt = select(*SECTION_RESPONSE_COLUMNS).where(models.ContentSection.id.in_(section_ids))
+    return {row["id"]: row for row in (await db.execute(stmt)).mappings()}
+
+
+async def get_section_at_async(db: AsyncSession, content_id: UUID, seconds: int):
+    """
+    재생 위치(초)에 해당하는 섹션을 조회합니다.
+    (content_id, start_seconds, order_index) 인덱스를 역순으로 한 번 탐색하므로 섹션 수와 관계없이 O(log n)입니다.
+    시작 시각이 같은 섹션이 여럿이면 order_index가 가장 큰(나중) 섹션을 반환합니다.
+    """
+    stmt = (
+        select(*SECTION_RESPONSE_COLUMNS)
+        .where(models.ContentSection.content_id == content_id, models.ContentSection.start_seconds <= seconds)
+        .order_by(models.ContentSection.start_seconds.desc(), models.ContentSection.order_index.desc())
+        .limit(1)
+    )
+    row = (await db.execute(stmt)).mappings().first()
+    if row is None:
+        return None
+    # 마지막 섹션은 end_seconds가 없을 수 있으며, 섹션 사이 공백 구간이면 None
+    if row["end_seconds"] is not None and seconds >= row["end_seconds"]:
+        return None
+    return row
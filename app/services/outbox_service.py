@@ -0,0 +1,106 @@
+# certgo-backend/app/services/outbox_service.py
+
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import String, cast, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database import models
+from app.core.task_routing import task_priority
+
+PROCESS_CONTENT_TASK = "process_content_task"
+
+
+def process_content_outbox(content_ids: Sequence[UUID], priorities: Optional[Sequence[Optional[int]]] = None):
+    """
+    콘텐츠 처리 태스크를 outbox에 기록하는 INSERT 문. (여러 건을 한 번에)
+    호출 측에서 콘텐츠 INSERT와 같은 트랜잭션으로 execute 한 뒤 commit 합니다. (동기/비동기 세션 모두 사용 가능)
+    priorities: content_ids와 같은 순서의 메시지 우선순위 (app.core.task_routing.task_priority, 없으면 기본 우선순위)
+    """
+    priorities = priorities or [None] * len(content_ids)
+    return insert(models.TaskOutbox).values([
+        {"task_name": PROCESS_CONTENT_TASK, "task_kwargs": {"content_id": str(cid)}, "priority": priority}
+        for cid, priority in zip(content_ids, priorities)
+    ])
+
+
+def relay_outbox(db: Session, publish: Callable[[List[models.TaskOutbox]], None], batch_size: int = None) -> Dict[str, int]:
+    """
+    발행 가능한 outbox 행 batch_size 건을 SELECT ... FOR UPDATE SKIP LOCKED로 가져와 publish로 한 번에 발행하고,
+    발행한 행은 삭제, 발행에 실패하면 attempts를 늘리고 backoff 후 다시 시도하도록 available_at을 미룹니다.
+    SKIP LOCKED 덕분에 relay가 여러 개 실행되어도 같은 행을 동시에 발행하지 않습니다.
+    발행 후 commit 전에 죽으면 다시 발행되므로(at-least-once) 태스크는 중복 실행에 안전해야 합니다.
+    """
+    rows = db.execute(
+        select(models.TaskOutbox)
+        .where(models.TaskOutbox.available_at <= func.now())
+        .order_by(models.TaskOutbox.available_at, models.TaskOutbox.created_at)
+        .limit(batch_size or settings.OUTBOX_RELAY_BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    ).scalars().all()
+    if not rows:
+        db.commit() # 트랜잭션 종료
+        return {"published": 0, "failed": 0}
+
+    ids = [row.id for row in rows]
+    try:
+        publish(rows)
+    except Exception as e: # 브로커 장애: 배치 전체를 backoff 후 재시도
+        backoff = min(2 ** min(row.attempts for row in rows), settings.OUTBOX_MAX_BACKOFF_SECONDS)
+        db.execute(
+            update(models.TaskOutbox)
+            .where(models.TaskOutbox.id.in_(ids))
+            .values(
+                attempts=models.TaskOutbox.attempts + 1,
+                last_error=str(e),
+                available_at=datetime.now(timezone.utc) + timedelta(seconds=backoff),
+            )
+        )
+        db.commit()
+        return {"published": 0, "failed": len(rows)}
+
+    db.execute(delete(models.TaskOutbox).where(models.TaskOutbox.id.in_(ids)))
+    db.commit()
+    return {"published": len(rows), "failed": 0}
+
+
+def requeue_stale_pending_contents(db: Session, stale_minutes: int = None, limit: int = 1000) -> int:
+    """
+    PENDING 상태로 stale_minutes 이상 머물러 있고 outbox에도 없는 콘텐츠의 처리 태스크를 outbox에 다시 기록합니다.
+    (outbox 도입 전에 생성된 콘텐츠, 브로커에서 메시지가 유실된 경우 등)
+    다음 스윕에서 같은 콘텐츠를 바로 다시 넣지 않도록 updated_at을 함께 갱신합니다.
+    """
+    stale_before = datetime.now(timezone.utc) - timedelta(minutes=stale_minutes or settings.CONTENT_STALE_PENDING_MINUTES)
+    queued = (
+        select(models.TaskOutbox.id)
+        .where(
+            models.TaskOutbox.task_name == PROCESS_CONTENT_TASK,
+            models.TaskOutbox.task_kwargs["content_id"].astext == cast(models.LearningContent.id, String),
+        )
+        .exists()
+    )
+    rows = db.execute(
+        select(models.LearningContent.id, models.Certificate.is_premium)
+        .outerjoin(models.Certificate, models.LearningContent.certificate_id == models.Certificate.id)
+        .where(
+            models.LearningContent.processing_status == "PENDING",
+            models.LearningContent.updated_at < stale_before,
+            ~queued,
+        )
+        .order_by(models.LearningContent.updated_at)
+        .limit(limit)
+        .with_for_update(of=models.LearningContent, skip_locked=True)
+    ).all()
+    content_ids = [row.id for row in rows]
+    if content_ids:
+        db.execute(process_content_outbox(content_ids, [task_priority(bool(row.is_premium)) for row in rows]))
+        db.execute(
+            update(models.LearningContent)
+            .where(models.LearningContent.id.in_(content_ids))
+            .values(updated_at=func.now())
+        )
+    db.commit()
+    return len(content_ids)
@@ -0,0 +1,63 @@
+# certgo-backend/app/services/pagination.py
+
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 값 목록을 불투명(opaque) 커서 문자열로 인코딩합니다."""
+    payload = [v.isoformat() if isinstance(v, datetime) else str(v) if isinstance(v, uuid.UUID) else v for v in values]
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[InstrumentedAttribute]) -> List[Any]:
+    """커서를 정렬 컬럼 타입에 맞는 값 목록으로 디코딩합니다. 형식이 맞지 않으면 InvalidCursorError."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(columns):
+            raise InvalidCursorError("Invalid cursor")
+        values = []
+        for column, value in zip(columns, payload):
+            python_type = column.property.columns[0].type.python_type
+            if python_type in (uuid.UUID, datetime):
+                if not isinstance(value, str):
+                    raise InvalidCursorError("Invalid cursor")
+                value = uuid.UUID(value) if python_type is uuid.UUID else datetime.fromisoformat(value)
+            elif isinstance(value, bool) is not (python_type is bool) or not isinstance(value, python_type):
+                # JSON 값의 타입이 정렬 컬럼과 다르면 (예: 문자열 컬럼에 숫자/객체) DB까지 보내지 않고 거부
+                raise InvalidCursorError("Invalid cursor")
+            values.append(value)
+        return values
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def apply_keyset(stmt: Select, columns: Sequence[InstrumentedAttribute], cursor: Optional[str], limit: int) -> Select:
+    """
+    (정렬 컬럼..., id) 기준 keyset 페이지네이션을 적용합니다.
+    다음 페이지 존재 여부를 알기 위해 limit + 1 건을 조회합니다.
+    """
+    if cursor:
+        stmt = stmt.where(tuple_(*columns) > tuple_(*decode_cursor(cursor, columns)))
+    return stmt.order_by(*columns).limit(limit + 1)
+
+
+def split_page(rows: List[Any], columns: Sequence[InstrumentedAttribute], limit: int):
+    """limit + 1 건 조회 결과를 (현재 페이지, 다음 커서)로 나눕니다."""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    last = page[-1]
+    return page, encode_cursor([getattr(last, column.key) for column in columns])
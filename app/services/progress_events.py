@@ -0,0 +1,162 @@
+# certgo-backend/app/services/progress_events.py
+
+import asyncio
+import json
+from typing import AsyncIterator, Dict, Optional, Set
+
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+# 채널: 태스크가 진행 이벤트를 PUBLISH 하고, API 프로세스가 SUBSCRIBE 하여 SSE로 전달
+CHANNEL_PREFIX = "progress:"
+LAST_EVENT_PREFIX = "progress:last:" # 채널별 마지막 이벤트 (SSE 연결 시 초기 상태, TTL 적용)
+OWNER_PREFIX = "progress:owner:" # 채널을 구독할 수 있는 사용자 id (태스크를 요청한 사용자, TTL 적용)
+TERMINAL_STATUSES = ("COMPLETED", "FAILED")
+
+
+def content_channel(content_id) -> str:
+    return f"{CHANNEL_PREFIX}content:{content_id}"
+
+
+def quiz_generation_channel(task_id: str) -> str:
+    return f"{CHANNEL_PREFIX}quiz:{task_id}"
+
+
+def is_terminal(event: dict) -> bool:
+    return event.get("status") in TERMINAL_STATUSES
+
+
+def content_status_event(content_id, processing_status: str) -> dict:
+    """processing_status만 알 때의 진행 이벤트 (Redis에 마지막 이벤트가 없을 때의 초기 상태)"""
+    terminal = processing_status in TERMINAL_STATUSES
+    return {"content_id": str(content_id), "status": processing_status, "stage": processing_status.lower(),
+            "percent": 100 if terminal else 0, "sections_done": None, "sections_total": None}
+
+
+def sse_message(event: dict, event_type: str = "progress") -> str:
+    return f"event: {event_type}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+
+class ProgressHub:
+    """
+    API 프로세스당 Redis pub/sub 연결 하나를 공유하여 채널 이벤트를 SSE 구독자(asyncio.Queue)들에게 나누어 줍니다.
+    SSE 연결마다 Redis 연결을 만들지 않도록, 채널의 첫 구독자가 생길 때 SUBSCRIBE, 마지막 구독자가 떠날 때 UNSUBSCRIBE 합니다.
+    """
+
+    def __init__(self, redis_url: str, queue_size: int = 100):
+        self.redis_url = redis_url
+        self.queue_size = queue_size
+        self._redis = None
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._lock = asyncio.Lock()
+
+    def _get_redis(self):
+        if self._redis is None:
+            self._redis = aioredis.from_url(self.redis_url)
+        return self._redis
+
+    def set_redis(self, client):
+        # 시뮬레이션/스크립트에서 다른 Redis 클라이언트(예: fakeredis)를 사용하기 위함
+        self._redis = client
+
+    async def subscribe(self, channel: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        async with self._lock:
+            if self._pubsub is None:
+                self._pubsub = self._get_redis().pubsub(ignore_subscribe_messages=True)
+            if channel not in self._subscribers:
+                await self._pubsub.subscribe(channel)
+                self._subscribers[channel] = set()
+            self._subscribers[channel].add(queue)
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read())
+        return queue
+
+    async def unsubscribe(self, channel: str, queue: asyncio.Queue):
+        async with self._lock:
+            queues = self._subscribers.get(channel)
+            if queues is None:
+                return
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[channel]
+                try:
+                    await self._pubsub.unsubscribe(channel)
+                except redis.RedisError:
+                    pass
+
+    async def _read(self):
+        while self._subscribers:
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+            except redis.RedisError:
+                await asyncio.sleep(1.0) # 재연결은 redis-py가 다음 명령에서 처리
+                continue
+            if message is None or message.get("type") != "message":
+                continue
+            channel = message["channel"].decode() if isinstance(message["channel"], bytes) else message["channel"]
+            try:
+                event = json.loads(message["data"])
+            except ValueError:
+                continue
+            for queue in list(self._subscribers.get(channel, ())):
+                if queue.full(): # 느린 클라이언트: 오래된 진행 이벤트는 버리고 최신 이벤트 유지
+                    queue.get_nowait()
+                queue.put_nowait(event)
+
+    async def last_event(self, channel: str) -> Optional[dict]:
+        try:
+            raw = await self._get_redis().get(LAST_EVENT_PREFIX + channel)
+        except redis.RedisError:
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    async def set_owner(self, channel: str, user_id):
+        """채널을 요청한 사용자를 기록합니다. (태스크 발행 전에 호출, 이후 owner로 구독 권한 확인)"""
+        await self._get_redis().set(OWNER_PREFIX + channel, str(user_id), ex=settings.PROGRESS_EVENT_TTL_SECONDS)
+
+    async def owner(self, channel: str) -> Optional[str]:
+        """채널을 요청한 사용자 id. 기록이 없으면(없는 태스크, 만료) None"""
+        try:
+            raw = await self._get_redis().get(OWNER_PREFIX + channel)
+        except redis.RedisError:
+            return None
+        return raw.decode() if isinstance(raw, bytes) else raw
+
+    async def close(self):
+        if self._reader is not None:
+            self._reader.cancel()
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+        if self._redis is not None:
+            await self._redis.aclose()
+
+    async def stream(self, channel: str, queue: asyncio.Queue, initial: Optional[dict]) -> AsyncIterator[str]:
+        """
+        SSE 본문 생성기. 초기 상태를 먼저 보내고, 이후 이벤트를 완료(COMPLETED/FAILED) 이벤트까지 전달합니다.
+        이벤트가 없는 동안에는 프록시 유휴 종료를 막기 위해 주석 줄(keep-alive)을 보냅니다.
+        queue는 초기 상태를 읽기 전에 subscribe로 받아 두어야 그 사이의 이벤트를 놓치지 않습니다.
+        """
+        try:
+            if initial is not None:
+                yield sse_message(initial)
+                if is_terminal(initial):
+                    return
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=settings.PROGRESS_SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield sse_message(event)
+                if is_terminal(event):
+                    return
+        finally:
+            await self.unsubscribe(channel, queue)
+
+
+progress_hub = ProgressHub(settings.REDIS_URL)
@@ -0,0 +1,171 @@
+# certgo-backend/app/services/quiz_service.py
+
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database import models
+from app.services.ai_integration_service import CONTEXT_HEADER, PromptContext
+
+QUIZ_OPTION_IDS = ("A", "B", "C", "D")
+QUIZ_GENERATION_PROMPT = (
+    "당신은 자격증 시험 출제자입니다. 아래 참고 자료(강의 섹션)의 내용만으로 객관식 문제 1개를 만드세요. "
+    "보기 4개(A-D), 정답, 해설을 다음 형식의 JSON 객체 하나로만 답하세요: "
+    '{"question": "문제", "options": ["보기 A", "보기 B", "보기 C", "보기 D"], "answer": "A", "explanation": "해설"}'
+)
+
+def build_quiz_generation_messages(context: PromptContext, difficulty: str, number: int, count: int) -> List[dict]:
+    # 퀴즈 생성 프롬프트: raw_text 전체 대신 토큰 예산 안에서 콘텐츠 전체에 고르게 고른 섹션만 사용
+    sources = "\n\n".join(f"({section.get('start_timestamp') or '-'}) {section['section_text']}" for section in context.sections)
+    return [
+        {"role": "system", "content": f"{QUIZ_GENERATION_PROMPT}\n\n{CONTEXT_HEADER}\n{sources}"},
+        {"role": "user", "content": f"난이도 {difficulty}, {count}문항 중 {number}번째 문항 (앞 문항과 다른 부분에서 출제)"},
+    ]
+
+
+def parse_generated_quiz(text: str) -> Optional[dict]:
+    """
+    퀴즈 생성 응답에서 문항 하나를 읽어 Quiz 열 값으로 바꿉니다. 형식이 맞지 않으면 None.
+    응답 앞뒤의 설명이나 코드 블록 표시는 무시하고 첫 '{'부터 마지막 '}'까지를 JSON으로 읽습니다.
+    """
+    start, end = text.find("{"), text.rfind("}")
+    if start < 0 or end < start:
+        return None
+    try:
+        data = json.loads(text[start:end + 1])
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    question, options, answer, explanation = (data.get(key) for key in ("question", "options", "answer", "explanation"))
+    if not isinstance(question, str) or not question.strip():
+        return None
+    if not isinstance(options, list) or len(options) != len(QUIZ_OPTION_IDS) or not all(isinstance(o, str) and o.strip() for o in options):
+        return None
+    if not isinstance(answer, str) or answer.strip().upper() not in QUIZ_OPTION_IDS:
+        return None
+    return {
+        "question_text": question.strip(),
+        "options_json": [{"id": option_id, "text": option.strip()} for option_id, option in zip(QUIZ_OPTION_IDS, options)],
+        "correct_answer_id": answer.strip().upper(),
+        "explanation_text": explanation.strip() if isinstance(explanation, str) and explanation.strip() else None,
+    }
+
+
+def save_generated_quizzes(db: Session, content_id: UUID, difficulty: str, quizzes: Sequence[dict]) -> List[UUID]:
+    """
+    생성된 문항(parse_generated_quiz 결과)을 한 번의 bulk INSERT로 저장하고 commit 합니다. 저장한 quiz id 목록을 반환합니다.
+    자격증은 콘텐츠의 자격증을 따릅니다.
+    """
+    if not quizzes:
+        return []
+    certificate_id = db.execute(
+        select(models.LearningContent.certificate_id).where(models.LearningContent.id == content_id)
+    ).scalar()
+    rows = [
+        {"id": uuid.uuid4(), "content_id": content_id, "certificate_id": certificate_id, "difficulty": difficulty,
+         "question_type": "multiple", "generated_by_ai": True, **quiz} # id는 미리 생성 (RETURNING 왕복 생략)
+        for quiz in quizzes
+    ]
+    db.execute(insert(models.Quiz), rows)
+    db.commit()
+    return [row["id"] for row in rows]
+
+
+# --- 퀴즈 시도 제출 (채점) ---
+
+class UnknownQuizError(LookupError):
+    def __init__(self, quiz_ids: Sequence[UUID]):
+        super().__init__(f"Unknown quiz ids: {', '.join(str(quiz_id) for quiz_id in quiz_ids)}")
+        self.quiz_ids = list(quiz_ids)
+
+
+class UnknownCertificateError(LookupError):
+    def __init__(self, certificate_id: UUID):
+        super().__init__(f"Unknown certificate id: {certificate_id}")
+        self.certificate_id = certificate_id
+
+
+async def get_correct_answers_async(db: AsyncSession, quiz_ids: Sequence[UUID]) -> Dict[UUID, str]:
+    # 제출된 모든 문항의 정답을 IN 쿼리 한 번으로 조회 ({quiz_id: correct_answer_id})
+    result = await db.execute(select(models.Quiz.id, models.Quiz.correct_answer_id).where(models.Quiz.id.in_(quiz_ids)))
+    return {row.id: row.correct_answer_id for row in result}
+
+
+def attempt_time_taken(started_at: datetime, ended_at: datetime) -> int:
+    # 클라이언트가 보낸 시작 시각은 [종료 - 최대 응시 시간, 종료] 범위로 보정 (미래 시각/비정상적으로 긴 응시 방지)
+    if started_at.tzinfo is None:
+        started_at = started_at.replace(tzinfo=timezone.utc)
+    started_at = min(max(started_at, ended_at - timedelta(seconds=settings.QUIZ_ATTEMPT_MAX_SECONDS)), ended_at)
+    return int((ended_at - started_at).total_seconds())
+
+
+async def submit_quiz_attempt_async(
+    db: AsyncSession,
+    user_id: UUID,
+    exam_type: str,
+    started_at: datetime,
+    answers: Sequence[dict],
+    certificate_id: Optional[UUID] = None,
+) -> dict:
+    """
+    퀴즈 시도 하나를 채점해 저장합니다. answers: [{"quiz_id", "user_selected_option_id", "bookmarked"}, ...] (quiz_id 중복 없음)
+    문항 수와 관계없이 DB 왕복은 (자격증 확인 1회) + 정답 조회 1회 + 시도 INSERT 1회 + 답변 bulk INSERT 1회이며,
+    score/correct_count/time_taken_seconds를 계산해 한 트랜잭션으로 commit 합니다.
+    존재하지 않는 quiz_id가 있으면 아무것도 저장하지 않고 UnknownQuizError를,
+    존재하지 않는 certificate_id면 UnknownCertificateError를 발생시킵니다. (외래 키 위반으로 INSERT가 실패하기 전에 확인)
+    """
+    if certificate_id is not None and not (await db.execute(
+        select(select(models.Certificate.id).where(models.Certificate.id == certificate_id).exists())
+    )).scalar():
+        await db.rollback()
+        raise UnknownCertificateError(certificate_id)
+    correct_answers = await get_correct_answers_async(db, [answer["quiz_id"] for answer in answers])
+    unknown = [answer["quiz_id"] for answer in answers if answer["quiz_id"] not in correct_answers]
+    if unknown:
+        await db.rollback()
+        raise UnknownQuizError(unknown)
+
+    attempt_id = uuid.uuid4() # 답변 행과 함께 INSERT 하기 위해 미리 생성 (RETURNING 왕복 생략)
+    graded = [
+        {
+            "attempt_id": attempt_id,
+            "quiz_id": answer["quiz_id"],
+            "user_selected_option_id": answer.get("user_selected_option_id"),
+            "is_correct": answer.get("user_selected_option_id") == correct_answers[answer["quiz_id"]],
+            "bookmarked": bool(answer.get("bookmarked", False)),
+        }
+        for answer in answers
+    ]
+    correct_count = sum(1 for row in graded if row["is_correct"])
+    total_questions = len(graded)
+    ended_at = datetime.now(timezone.utc)
+    time_taken = attempt_time_taken(started_at, ended_at)
+    attempt = {
+        "id": attempt_id,
+        "user_id": user_id,
+        "certificate_id": certificate_id,
+        "exam_type": exam_type,
+        "start_time": ended_at - timedelta(seconds=time_taken),
+        "end_time": ended_at,
+        "time_taken_seconds": time_taken,
+        "score": round(correct_count * 100 / total_questions),
+        "total_questions": total_questions,
+        "correct_count": correct_count,
+    }
+    await db.execute(insert(models.UserQuizAttempt).values(**attempt))
+    # executemany: RETURNING이 없으므로 다중 VALUES로 바뀌지 않고 asyncpg가 준비된 INSERT 하나를 행마다 실행하되,
+    # 행별 Bind/Execute를 한 번에 파이프라인으로 보내 DB 왕복은 1회 (서버에서는 행 수만큼 실행)
+    await db.execute(insert(models.UserAnswer), graded)
+    await db.commit()
+    return {
+        **attempt,
+        "answers": [{**row, "correct_answer_id": correct_answers[row["quiz_id"]]} for row in graded],
+    }
@@ -0,0 +1,304 @@
+# certgo-backend/app/services/result_cache.py
+
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.services.embedding_cache import normalize_text
+
+# AI 생성 결과(섹션 요약, 튜터 답변) 캐시. 값은 Redis(워커 간 공유)에 TTL과 함께 저장하고,
+# 인덱스(sorted set, 점수 = 마지막 접근 시각)로 항목 수를 RESULT_CACHE_MAX_ENTRIES 이하로 유지합니다. (오래 안 쓰인 것부터 제거)
+REDIS_KEY_PREFIX = "airesult:"
+REDIS_INDEX_KEY = "airesult:index"
+REDIS_STATS_KEY = "airesult:stats" # 워커 전체의 조회/적중/생성 카운터 (hash)
+REDIS_LOCK_PREFIX = "airesult:lock:" # 같은 키를 한 워커만 생성하도록 하는 락 (single-flight)
+
+# 값 저장 + 인덱스 갱신 + 만료/초과 항목 제거를 한 번에 (Redis 왕복 1회, 동시에 저장해도 상한 유지)
+_STORE_SCRIPT = """
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+redis.call('ZADD', KEYS[2], ARGV[3], KEYS[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', tonumber(ARGV[3]) - tonumber(ARGV[2]))
+local excess = redis.call('ZCARD', KEYS[2]) - tonumber(ARGV[4])
+if excess <= 0 then
+    return 0
+end
+local evicted = redis.call('ZPOPMIN', KEYS[2], excess)
+for i = 1, #evicted, 2 do
+    redis.call('DEL', evicted[i])
+end
+return excess
+"""
+
+# 락 토큰이 같을 때만 해제 (만료 후 다른 워커가 잡은 락을 지우지 않도록)
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def result_cache_key(
+    kind: str,
+    content_id,
+    start_index: int,
+    end_index: int,
+    template_version: int,
+    model_id: str,
+    extra: Optional[str] = None,
+) -> str:
+    """
+    (종류, 콘텐츠, 섹션 범위(order_index 양 끝 포함), 프롬프트 템플릿 버전, 모델) 캐시 키.
+    템플릿이나 모델이 바뀌면 키가 달라지므로 이전 결과는 무효화 없이 TTL/용량 제한으로 사라집니다.
+    extra(예: 질문/프롬프트)는 정규화 후 해시로 붙입니다.
+    """
+    key = f"{REDIS_KEY_PREFIX}{kind}:{model_id}:v{template_version}:{content_id}:{start_index}-{end_index}"
+    if extra is not None:
+        key += ":" + hashlib.sha256(normalize_text(extra).encode("utf-8")).hexdigest()
+    return key
+
+
+@dataclass
+class CachedResult:
+    text: str
+    cached: bool # 캐시 적중 또는 다른 요청의 생성 결과를 함께 받은 경우 True (LLM을 호출하지 않음)
+    generation_ms: float # 이 결과를 처음 생성할 때 걸린 시간
+
+
+class ResultCache:
+    """
+    AI 생성 결과 캐시 (Redis 공유 계층, TTL + 항목 수 상한).
+    get_or_generate는 같은 키의 동시 요청이 생성을 한 번만 하도록 합니다. (single-flight)
+    - 같은 프로세스: 진행 중인 생성 태스크를 함께 기다림
+    - 다른 워커: Redis 락을 잡은 워커만 생성하고, 나머지는 결과가 저장될 때까지 기다림 (락이 풀렸는데 결과가 없으면 직접 생성)
+    Redis 장애 시에는 캐시 없이 생성합니다. (프로세스 내 single-flight는 유지)
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int, lock_seconds: int, wait_seconds: float, redis_url: Optional[str] = None):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.lock_seconds = lock_seconds
+        self.wait_seconds = wait_seconds
+        self.poll_seconds = 0.05
+        self.redis_url = redis_url
+        self._redis = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.lookups = 0
+        self.hits = 0
+        self.coalesced = 0
+        self.generations = 0
+        self.evictions = 0
+        self.saved_ms = 0.0
+        self.generation_ms = 0.0
+
+    def _get_redis(self):
+        if self._redis is None:
+            self._redis = aioredis.from_url(self.redis_url, socket_connect_timeout=1, socket_timeout=1)
+        return self._redis
+
+    def set_redis(self, client):
+        # 시뮬레이션/스크립트에서 다른 Redis 클라이언트(예: fakeredis)를 사용하기 위함
+        self._redis = client
+
+    async def _record(self, **counters):
+        if not self.redis_url:
+            return
+        try:
+            pipe = self._get_redis().pipeline(transaction=False)
+            for name, value in counters.items():
+                if isinstance(value, float):
+                    pipe.hincrbyfloat(REDIS_STATS_KEY, name, value)
+                else:
+                    pipe.hincrby(REDIS_STATS_KEY, name, value)
+            await pipe.execute()
+        except redis.RedisError:
+            pass
+
+    # --- Redis 계층 ---
+
+    async def get(self, key: str) -> Optional[dict]:
+        if not self.redis_url:
+            return None
+        try:
+            pipe = self._get_redis().pipeline(transaction=False)
+            pipe.get(key)
+            pipe.zadd(REDIS_INDEX_KEY, {key: time.time()}, xx=True) # 적중 시 마지막 접근 시각 갱신 (없는 키는 추가하지 않음)
+            raw = (await pipe.execute())[0]
+        except redis.RedisError:
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, text: str, generation_ms: float):
+        if not self.redis_url:
+            return
+        value = json.dumps({"text": text, "generation_ms": generation_ms}, ensure_ascii=False)
+        try:
+            evicted = await self._get_redis().eval(
+                _STORE_SCRIPT, 2, key, REDIS_INDEX_KEY, value, self.ttl_seconds, time.time(), self.max_entries
+            )
+        except redis.RedisError:
+            return
+        if evicted:
+            self.evictions += int(evicted)
+            await self._record(evictions=int(evicted))
+
+    async def _acquire(self, key: str) -> Optional[str]:
+        # 락을 잡으면 토큰, 다른 워커가 생성 중이면 None. Redis를 쓸 수 없으면 직접 생성하도록 토큰을 반환
+        token = uuid.uuid4().hex
+        if not self.redis_url:
+            return token
+        try:
+            acquired = await self._get_redis().set(REDIS_LOCK_PREFIX + key, token, nx=True, ex=self.lock_seconds)
+        except redis.RedisError:
+            return token
+        return token if acquired else None
+
+    async def _release(self, key: str, token: str):
+        if not self.redis_url:
+            return
+        try:
+            await self._get_redis().eval(_RELEASE_SCRIPT, 1, REDIS_LOCK_PREFIX + key, token)
+        except redis.RedisError:
+            pass
+
+    async def _lock_held(self, key: str) -> bool:
+        try:
+            return bool(await self._get_redis().exists(REDIS_LOCK_PREFIX + key))
+        except redis.RedisError:
+            return False
+
+    # --- 생성 (single-flight) ---
+
+    async def _generate(self, key: str, generate: Callable[[], Awaitable[str]]) -> CachedResult:
+        deadline = time.monotonic() + self.wait_seconds
+        token = await self._acquire(key)
+        while token is None:
+            # 다른 워커가 생성 중: 결과가 저장되거나 락이 풀릴 때까지 대기
+            await asyncio.sleep(self.poll_seconds)
+            entry = await self.get(key)
+            if entry is not None:
+                return CachedResult(entry["text"], True, entry["generation_ms"])
+            if time.monotonic() > deadline:
+                token = uuid.uuid4().hex # 대기 시간 초과: 락 없이 직접 생성
+            elif not await self._lock_held(key):
+                token = await self._acquire(key) # 생성하던 워커가 실패함
+        try:
+            entry = await self.get(key) # 락을 잡기 직전에 다른 워커가 저장했을 수 있음
+            if entry is not None:
+                return CachedResult(entry["text"], True, entry["generation_ms"])
+            started = time.perf_counter()
+            text = await generate()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            await self.set(key, text, elapsed_ms)
+        finally:
+            await self._release(key, token)
+        self.generations += 1
+        self.generation_ms += elapsed_ms
+        await self._record(generations=1, generation_ms=elapsed_ms)
+        return CachedResult(text, False, elapsed_ms)
+
+    async def get_or_generate(self, key: str, generate: Callable[[], Awaitable[str]]) -> CachedResult:
+        """
+        캐시된 결과를 반환하고, 없으면 generate()로 생성해 저장합니다.
+        생성은 요청과 분리된 태스크에서 실행하므로, 먼저 요청한 클라이언트가 연결을 끊어도 함께 기다리는 요청들은 결과를 받습니다.
+        """
+        self.lookups += 1
+        entry = await self.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.saved_ms += entry["generation_ms"]
+            await self._record(lookups=1, hits=1, saved_ms=float(entry["generation_ms"]))
+            return CachedResult(entry["text"], True, entry["generation_ms"])
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._generate(key, generate))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            result = await asyncio.shield(task)
+        else:
+            result = await asyncio.shield(task)
+            result = CachedResult(result.text, True, result.generation_ms)
+        if result.cached:
+            self.coalesced += 1
+            self.saved_ms += result.generation_ms
+            await self._record(lookups=1, coalesced=1, saved_ms=float(result.generation_ms))
+        else:
+            await self._record(lookups=1)
+        return result
+
+    async def put(self, key: str, text: str, generation_ms: float):
+        """get_or_generate 없이 직접 생성한 결과(예: 스트리밍한 답변)를 저장합니다."""
+        self.generations += 1
+        self.generation_ms += generation_ms
+        await self.set(key, text, generation_ms)
+        await self._record(generations=1, generation_ms=generation_ms)
+
+    async def lookup(self, key: str) -> Optional[CachedResult]:
+        """생성하지 않고 캐시만 조회합니다. (미스도 조회 수에 포함)"""
+        self.lookups += 1
+        entry = await self.get(key)
+        if entry is None:
+            await self._record(lookups=1)
+            return None
+        self.hits += 1
+        self.saved_ms += entry["generation_ms"]
+        await self._record(lookups=1, hits=1, saved_ms=float(entry["generation_ms"]))
+        return CachedResult(entry["text"], True, entry["generation_ms"])
+
+    async def stats(self) -> dict:
+        served = self.hits + self.coalesced
+        result = {
+            "redis_enabled": bool(self.redis_url),
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "generations": self.generations,
+            "evictions": self.evictions,
+            "hit_ratio": round(served / self.lookups, 4) if self.lookups else 0.0,
+            "saved_ms": round(self.saved_ms, 1),
+            "generation_ms_avg": round(self.generation_ms / self.generations, 1) if self.generations else 0.0,
+            "shared": None,
+        }
+        if self.redis_url:
+            try:
+                pipe = self._get_redis().pipeline(transaction=False)
+                pipe.hgetall(REDIS_STATS_KEY)
+                pipe.zcard(REDIS_INDEX_KEY)
+                raw, entries = await pipe.execute()
+            except redis.RedisError:
+                raw = None
+            if raw is not None:
+                shared = {k.decode(): float(v) for k, v in raw.items()}
+                lookups = int(shared.get("lookups", 0))
+                served = int(shared.get("hits", 0) + shared.get("coalesced", 0))
+                generations = int(shared.get("generations", 0))
+                result["shared"] = {
+                    "entries": entries,
+                    "lookups": lookups,
+                    "hits": int(shared.get("hits", 0)),
+                    "coalesced": int(shared.get("coalesced", 0)),
+                    "generations": generations,
+                    "evictions": int(shared.get("evictions", 0)),
+                    "hit_ratio": round(served / lookups, 4) if lookups else 0.0,
+                    "saved_ms": round(shared.get("saved_ms", 0.0), 1),
+                    "generation_ms_avg": round(shared.get("generation_ms", 0.0) / generations, 1) if generations else 0.0,
+                }
+        return result
+
+
+result_cache = ResultCache(
+    ttl_seconds=settings.RESULT_CACHE_TTL_SECONDS,
+    max_entries=settings.RESULT_CACHE_MAX_ENTRIES,
+    lock_seconds=settings.RESULT_CACHE_LOCK_SECONDS,
+    wait_seconds=settings.RESULT_CACHE_WAIT_SECONDS,
+    redis_url=settings.REDIS_URL if settings.RESULT_CACHE_ENABLED else None,
+)
@@ -0,0 +1,129 @@
+# certgo-backend/app/services/subscription_service.py
+
+from dataclasses import dataclass
+from sqlalchemy import func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.core.config import settings
+from app.database import models
+from uuid import UUID
+
+def paying_subscription_exists(user_id: UUID):
+    # 만료되지 않은 유료 플랜(월 가격 > 0)의 active 구독이 있는지
+    return (
+        select(models.UserSubscription.id)
+        .join(models.SubscriptionPlan, models.UserSubscription.plan_id == models.SubscriptionPlan.id)
+        .where(
+            models.UserSubscription.user_id == user_id,
+            models.UserSubscription.status == "active",
+            or_(models.UserSubscription.end_date.is_(None), models.UserSubscription.end_date > func.now()),
+            models.SubscriptionPlan.price_per_month > 0,
+        )
+        .exists()
+    )
+
+def is_paying_user(db: Session, user_id: UUID) -> bool:
+    return db.execute(select(paying_subscription_exists(user_id))).scalar()
+
+
+# --- 비동기 버전 (FastAPI 엔드포인트용) ---
+
+async def is_paying_user_async(db: AsyncSession, user_id: UUID) -> bool:
+    return (await db.execute(select(paying_subscription_exists(user_id)))).scalar()
+
+
+# --- AI 요약 사용 한도 ---
+
+@dataclass
+class SummaryCharge:
+    subscription_id: Optional[UUID] = None # 크레딧을 차감한 구독 (per_credit 플랜), 환불 시 되돌림
+
+
+def active_subscription_plan_query(user_id: UUID):
+    # 만료되지 않은 active 구독의 요약 한도 (여러 개면 가장 최근 구독)
+    return (
+        select(models.UserSubscription.id, models.SubscriptionPlan.summary_chat_limit_type, models.SubscriptionPlan.summary_chat_limit_value)
+        .join(models.SubscriptionPlan, models.UserSubscription.plan_id == models.SubscriptionPlan.id)
+        .where(
+            models.UserSubscription.user_id == user_id,
+            models.UserSubscription.status == "active",
+            or_(models.UserSubscription.end_date.is_(None), models.UserSubscription.end_date > func.now()),
+        )
+        .order_by(models.UserSubscription.start_date.desc())
+        .limit(1)
+    )
+
+
+async def _add_summary_count(db: AsyncSession, user_id: UUID, content_id: UUID, delta: int) -> bool:
+    # 사용자-콘텐츠 진행 행 하나의 summary_count를 delta만큼 변경 (행이 없으면 False)
+    progress_id = (
+        select(models.UserLearningProgress.id)
+        .where(models.UserLearningProgress.user_id == user_id, models.UserLearningProgress.content_id == content_id)
+        .limit(1)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        update(models.UserLearningProgress)
+        .where(models.UserLearningProgress.id == progress_id)
+        .values(summary_count=func.greatest(models.UserLearningProgress.summary_count + delta, 0))
+    )
+    return result.rowcount == 1
+
+
+async def charge_summary_quota_async(db: AsyncSession, user_id: UUID, content_id: UUID) -> Optional[SummaryCharge]:
+    """
+    요약 1회를 플랜 한도에서 차감하고 해당 콘텐츠의 summary_count를 1 올립니다. 성공 시 commit 합니다.
+    한도를 넘으면 아무것도 바꾸지 않고 None을 반환합니다. (캐시된 요약을 받아도 차감함)
+    플랜 한도(summary_chat_limit_*)는 요약과 AI 튜터 답변이 함께 쓰므로 튜터 답변도 이 함수로 차감합니다.
+    - unlimited: 한도 없음 (사용 횟수만 기록)
+    - per_credit: 구독의 credits_remaining을 조건부로 1 차감
+    - 그 외(monthly 등): 사용자 전체 summary_count 합계가 summary_chat_limit_value 미만일 때만 허용
+      (summary_count는 누적값이므로 월별 초기화는 별도 작업이 필요)
+    - 구독 없음: SUMMARY_FREE_LIMIT 기준
+    확인과 증가 사이에 같은 사용자의 다른 요청이 끼어들지 않도록 users 행을 잠급니다. (사용자 단위 직렬화, 짧은 트랜잭션)
+    """
+    await db.execute(select(models.User.id).where(models.User.id == user_id).with_for_update())
+    plan = (await db.execute(active_subscription_plan_query(user_id))).first()
+    limit_type = plan.summary_chat_limit_type if plan is not None else "free"
+    limit_value = plan.summary_chat_limit_value if plan is not None else settings.SUMMARY_FREE_LIMIT
+
+    charge = SummaryCharge()
+    if limit_type == "per_credit":
+        result = await db.execute(
+            update(models.UserSubscription)
+            .where(models.UserSubscription.id == plan.id, models.UserSubscription.credits_remaining > 0)
+            .values(credits_remaining=models.UserSubscription.credits_remaining - 1)
+        )
+        if result.rowcount != 1:
+            await db.rollback()
+            return None
+        charge.subscription_id = plan.id
+    elif limit_type != "unlimited" and limit_value is not None:
+        used = (await db.execute(
+            select(func.coalesce(func.sum(models.UserLearningProgress.summary_count), 0))
+            .where(models.UserLearningProgress.user_id == user_id)
+        )).scalar()
+        if used >= limit_value:
+            await db.rollback()
+            return None
+
+    if not await _add_summary_count(db, user_id, content_id, 1):
+        await db.execute(insert(models.UserLearningProgress).values(
+            user_id=user_id, content_id=content_id, last_viewed_at=func.now(), summary_count=1
+        ))
+    await db.commit()
+    return charge
+
+
+async def refund_summary_quota_async(db: AsyncSession, user_id: UUID, content_id: UUID, charge: SummaryCharge):
+    """요약/튜터 답변 생성에 실패했을 때 charge_summary_quota_async의 차감을 되돌립니다. commit 합니다."""
+    await _add_summary_count(db, user_id, content_id, -1)
+    if charge.subscription_id is not None:
+        await db.execute(
+            update(models.UserSubscription)
+            .where(models.UserSubscription.id == charge.subscription_id)
+            .values(credits_remaining=models.UserSubscription.credits_remaining + 1)
+        )
+    await db.commit()
+
@@ -0,0 +1,95 @@
+# certgo-backend/app/services/summary_service.py
+
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database import models
+from app.database.connection import AsyncSessionLocal
+from app.services import ai_integration_service, learning_content_service
+from app.services.ai_integration_service import CONTEXT_HEADER, LLMProvider, PromptContext
+from app.services.result_cache import CachedResult, result_cache, result_cache_key
+
+SECTION_SUMMARY_PROMPT = (
+    "당신은 자격증 학습을 돕는 AI 튜터입니다. 아래 참고 자료(강의 섹션)의 핵심 개념과 시험에 나올 만한 내용을 "
+    "간결하게 요약하세요. 참고 자료에 없는 내용은 쓰지 마세요."
+)
+SECTION_SUMMARY_PROMPT_VERSION = 1 # 요약 프롬프트(템플릿)를 바꾸면 올림 (캐시 키에 포함되어 이전 요약을 재사용하지 않음)
+
+
+def build_section_summary_messages(context: PromptContext) -> List[dict]:
+    sections = "\n\n".join(
+        f"({section.get('start_timestamp') or '-'}) {section['section_text']}" for section in context.sections
+    )
+    return [
+        {"role": "system", "content": f"{SECTION_SUMMARY_PROMPT}\n\n{CONTEXT_HEADER}\n{sections}"},
+        {"role": "user", "content": "위 섹션들을 요약해 주세요."},
+    ]
+
+
+def section_summary_ranges(db: Session, content_id: UUID) -> List[Tuple[int, int]]:
+    """콘텐츠의 섹션을 순서대로 SUMMARY_MAX_SECTIONS개씩 묶은 요약 범위(order_index 양 끝 포함) 목록. (처리 시 요약 미리 생성용)"""
+    order_indexes = db.execute(
+        select(models.ContentSection.order_index)
+        .where(models.ContentSection.content_id == content_id)
+        .order_by(models.ContentSection.order_index)
+    ).scalars().all()
+    size = settings.SUMMARY_MAX_SECTIONS
+    return [(order_indexes[i], order_indexes[min(i + size, len(order_indexes)) - 1]) for i in range(0, len(order_indexes), size)]
+
+
+def section_summary_outline_query(content_id: UUID, start_index: int, end_index: int):
+    # 범위의 섹션 outline. 요약 최대 섹션 수를 넘는지 알 수 있도록 한 행만 더 읽음 (범위가 넓어도 조회 행 수가 일정)
+    return (
+        ai_integration_service.section_outline_query(content_id)
+        .where(models.ContentSection.order_index.between(start_index, end_index))
+        .limit(settings.SUMMARY_MAX_SECTIONS + 1)
+    )
+
+
+async def get_section_summary_outline_async(db: AsyncSession, content_id: UUID, start_index: int, end_index: int) -> list:
+    """요약할 범위(order_index 양 끝 포함)의 섹션 outline. 섹션 수가 SUMMARY_MAX_SECTIONS를 넘으면 SUMMARY_MAX_SECTIONS + 1개"""
+    return (await db.execute(section_summary_outline_query(content_id, start_index, end_index))).all()
+
+
+def summary_cache_key(content_id: UUID, start_index: int, end_index: int, outline: Sequence, model_id: str) -> str:
+    """
+    요약 캐시 키: (콘텐츠, 섹션 범위, 프롬프트 버전, 모델) + 범위에 든 섹션(id, text_hash)의 해시.
+    재처리로 섹션이 바뀌거나(새 id/text_hash) 번호가 다시 매겨지면 키가 달라지므로 이전 요약은 무효화 없이 재사용되지 않습니다.
+    """
+    sections = ",".join(f"{row.id}:{row.text_hash}" for row in outline)
+    return result_cache_key("summary", content_id, start_index, end_index, SECTION_SUMMARY_PROMPT_VERSION, model_id, extra=sections)
+
+
+async def generate_section_summary_async(outline: Sequence, provider: LLMProvider) -> str:
+    """
+    outline의 섹션 본문을 읽어 요약합니다.
+    캐시 생성 태스크에서 실행되어 요청보다 오래 살 수 있으므로 요청 세션 대신 별도 세션을 엽니다.
+    """
+    async with AsyncSessionLocal() as db:
+        texts = await learning_content_service.get_sections_by_ids_async(db, [row.id for row in outline])
+    context = ai_integration_service.assemble_context(list(enumerate(outline)), texts) # 범위 전체 (겹침만 제거)
+    return await provider.complete(build_section_summary_messages(context))
+
+
+async def get_section_summary_async(content_id: UUID, start_index: int, end_index: int, outline: Optional[Sequence] = None) -> CachedResult:
+    """
+    섹션 범위 요약을 캐시에서 가져오거나 생성합니다. 같은 요약을 동시에 요청해도 LLM은 한 번만 호출합니다.
+    outline(get_section_summary_outline_async 결과)을 넘기지 않으면 별도 세션에서 읽습니다.
+    범위에 섹션이 없으면 LookupError, SUMMARY_MAX_SECTIONS를 넘으면 ValueError.
+    (사용 한도 차감은 호출하는 쪽에서 캐시 여부와 관계없이 먼저 처리)
+    """
+    if outline is None:
+        async with AsyncSessionLocal() as db:
+            outline = await get_section_summary_outline_async(db, content_id, start_index, end_index)
+    if not outline:
+        raise LookupError(f"No sections in range {start_index}-{end_index} for content {content_id}")
+    if len(outline) > settings.SUMMARY_MAX_SECTIONS:
+        raise ValueError(f"More than {settings.SUMMARY_MAX_SECTIONS} sections in range {start_index}-{end_index}")
+    provider = ai_integration_service.get_llm_provider()
+    key = summary_cache_key(content_id, start_index, end_index, outline, provider.model_id)
+    return await result_cache.get_or_generate(key, lambda: generate_section_summary_async(outline, provider))
@@ -0,0 +1,119 @@
+# certgo-backend/app/services/tutor_chat_service.py
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from app.database import models
+
+# AI 튜터 대화는 메시지 하나를 한 행으로 추가만 합니다. (tutorchatmessages)
+# 대화 길이와 무관하게 턴당 쓰기는 대화 행(tutorchatthreads)의 순번 증가 1건 + 메시지 INSERT뿐이며,
+# 조회는 (user_id, content_id, seq) 기본키 범위로 최근 N개만 읽습니다.
+
+MESSAGE_COLUMNS = (
+    models.TutorChatMessage.seq,
+    models.TutorChatMessage.role,
+    models.TutorChatMessage.message_text,
+    models.TutorChatMessage.created_at,
+)
+
+def _thread_key(user_id: UUID, content_id: UUID):
+    return (models.TutorChatThread.user_id == user_id, models.TutorChatThread.content_id == content_id)
+
+def _message_key(user_id: UUID, content_id: UUID):
+    return (models.TutorChatMessage.user_id == user_id, models.TutorChatMessage.content_id == content_id)
+
+
+async def append_chat_messages_async(db: AsyncSession, user_id: UUID, content_id: UUID, messages: Sequence[Tuple[str, str]]) -> int:
+    """
+    (role, message_text) 메시지들을 대화 끝에 추가하고 마지막 순번을 반환합니다. 성공 시 commit 합니다.
+    순번은 대화 행의 last_seq를 원자적으로 증가시켜 할당하므로, 같은 대화에 동시에 추가해도 순번이 겹치지 않습니다.
+    (대화 행 잠금은 이 트랜잭션 동안만 유지되며, 학습 진행 행(userlearningprogress)은 건드리지 않음)
+    """
+    count = len(messages)
+    stmt = (
+        pg_insert(models.TutorChatThread)
+        .values(user_id=user_id, content_id=content_id, last_seq=count, summarized_through_seq=0)
+        .on_conflict_do_update(
+            index_elements=[models.TutorChatThread.user_id, models.TutorChatThread.content_id],
+            set_={"last_seq": models.TutorChatThread.last_seq + count, "updated_at": func.now()},
+        )
+        .returning(models.TutorChatThread.last_seq)
+    )
+    last_seq = (await db.execute(stmt)).scalar_one()
+    first_seq = last_seq - count + 1
+    await db.execute(insert(models.TutorChatMessage), [
+        {"user_id": user_id, "content_id": content_id, "seq": first_seq + i, "role": role, "message_text": text}
+        for i, (role, text) in enumerate(messages)
+    ])
+    await db.commit()
+    return last_seq
+
+
+async def get_chat_window_async(db: AsyncSession, user_id: UUID, content_id: UUID, last_n: int) -> dict:
+    """
+    대화 창: 최근 last_n개 메시지(오래된 순)와 그 이전 대화의 누적 요약.
+    대화가 없으면 빈 창을 반환합니다.
+    """
+    thread = (await db.execute(
+        select(models.TutorChatThread.last_seq, models.TutorChatThread.summary_text, models.TutorChatThread.summarized_through_seq)
+        .where(*_thread_key(user_id, content_id))
+    )).first()
+    if thread is None:
+        return {"last_seq": 0, "summary_text": None, "summarized_through_seq": 0, "messages": []}
+    rows = (await db.execute(
+        select(*MESSAGE_COLUMNS)
+        .where(*_message_key(user_id, content_id))
+        .order_by(models.TutorChatMessage.seq.desc())
+        .limit(last_n)
+    )).all()
+    return {
+        "last_seq": thread.last_seq,
+        "summary_text": thread.summary_text,
+        "summarized_through_seq": thread.summarized_through_seq,
+        "messages": [row._mapping for row in reversed(rows)],
+    }
+
+
+async def get_chat_messages_before_async(db: AsyncSession, user_id: UUID, content_id: UUID, before_seq: Optional[int], limit: int) -> List:
+    # 이전 메시지 페이지 (before_seq 미만, 오래된 순). 대화 창 위로 스크롤할 때 사용
+    stmt = select(*MESSAGE_COLUMNS).where(*_message_key(user_id, content_id))
+    if before_seq is not None:
+        stmt = stmt.where(models.TutorChatMessage.seq < before_seq)
+    rows = (await db.execute(stmt.order_by(models.TutorChatMessage.seq.desc()).limit(limit))).all()
+    return [row._mapping for row in reversed(rows)]
+
+
+async def get_messages_to_summarize_async(db: AsyncSession, user_id: UUID, content_id: UUID, keep_last: int) -> List:
+    """누적 요약에 아직 반영되지 않았고 대화 창(최근 keep_last개)에서 벗어난 메시지들 (오래된 순)."""
+    thread = (await db.execute(
+        select(models.TutorChatThread.last_seq, models.TutorChatThread.summarized_through_seq).where(*_thread_key(user_id, content_id))
+    )).first()
+    if thread is None or thread.last_seq - keep_last <= thread.summarized_through_seq:
+        return []
+    rows = (await db.execute(
+        select(*MESSAGE_COLUMNS)
+        .where(
+            *_message_key(user_id, content_id),
+            models.TutorChatMessage.seq > thread.summarized_through_seq,
+            models.TutorChatMessage.seq <= thread.last_seq - keep_last,
+        )
+        .order_by(models.TutorChatMessage.seq)
+    )).all()
+    return [row._mapping for row in rows]
+
+
+async def update_chat_summary_async(db: AsyncSession, user_id: UUID, content_id: UUID, summary_text: str, through_seq: int) -> bool:
+    """
+    누적 요약을 through_seq까지 반영한 내용으로 바꿉니다. 성공 시 commit 합니다.
+    이미 더 최신 메시지까지 요약되어 있으면 (동시에 요약한 경우) 바꾸지 않고 False를 반환합니다.
+    """
+    result = await db.execute(
+        update(models.TutorChatThread)
+        .where(*_thread_key(user_id, content_id), models.TutorChatThread.summarized_through_seq < through_seq)
+        .values(summary_text=summary_text, summarized_through_seq=through_seq)
+    )
+    await db.commit()
+    return result.rowcount == 1
@@ -0,0 +1,112 @@
+# certgo-backend/app/services/tutor_service.py
+
+import json
+import logging
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.services import ai_integration_service, tutor_chat_service
+from app.services.ai_integration_service import CONTEXT_HEADER, LLMProvider
+from app.services.progress_events import sse_message
+from app.services.result_cache import result_cache_key
+
+logger = logging.getLogger(__name__)
+
+TUTOR_SYSTEM_PROMPT = (
+    "당신은 자격증 학습을 돕는 AI 튜터입니다. 아래 참고 자료(강의 섹션)와 이전 대화를 근거로 답하고, "
+    "자료에 없는 내용은 추측하지 말고 모른다고 답하세요."
+)
+TUTOR_PROMPT_VERSION = 1 # 튜터 프롬프트(템플릿)를 바꾸면 올림 (답변 캐시 키에 포함)
+SUMMARY_PROMPT = "다음 대화를 이후 답변에 필요한 내용 위주로 간결하게 요약하세요. 이전 요약이 있으면 함께 반영하세요."
+
+
+def build_tutor_messages(question: str, sections: Sequence[dict], window: dict) -> List[dict]:
+    """
+    튜터 프롬프트: 시스템 지시 + 참고 자료(검색된 섹션, 타임스탬프 포함) + 누적 요약 + 최근 대화 + 질문.
+    대화 전체 대신 대화 창만 넣으므로 대화가 길어져도 프롬프트 길이가 일정합니다.
+    """
+    context = "\n\n".join(
+        f"({section.get('start_timestamp') or '-'}) {section['section_text']}" for section in sections
+    )
+    system = f"{TUTOR_SYSTEM_PROMPT}\n\n"
+    if window["summary_text"]:
+        system += f"[이전 대화 요약]\n{window['summary_text']}\n\n"
+    system += f"{CONTEXT_HEADER}\n{context}"
+    messages = [{"role": "system", "content": system}]
+    messages += [{"role": m["role"], "content": m["message_text"]} for m in window["messages"]]
+    messages.append({"role": "user", "content": question})
+    return messages
+
+
+def answer_cache_key(content_id: UUID, sections: Sequence[dict], messages: Sequence[dict], model_id: str) -> str:
+    """
+    튜터 답변 캐시 키: (콘텐츠, 근거 섹션 범위, 프롬프트 버전, 모델) + 프롬프트 전체의 해시.
+    프롬프트에 대화 창과 요약이 들어가므로, 사실상 같은 콘텐츠의 같은 질문이 대화 처음에 반복될 때 적중합니다.
+    """
+    indexes = [section["order_index"] for section in sections] or [-1]
+    prompt = json.dumps(list(messages), ensure_ascii=False, sort_keys=True)
+    return result_cache_key("answer", content_id, min(indexes), max(indexes), TUTOR_PROMPT_VERSION, model_id, extra=prompt)
+
+
+async def prepare_tutor_turn_async(db: AsyncSession, user_id: UUID, content_id: UUID, question: str, model_id: str) -> Tuple[List[dict], str]:
+    """
+    질문과 관련된 섹션으로 토큰 예산 안의 컨텍스트 조립 + 대화 창 조회 (스트리밍 시작 전, 요청 세션에서 실행)
+    프롬프트 메시지와 답변 캐시 키를 반환합니다.
+    """
+    context = await ai_integration_service.build_query_context_async(db, content_id, question, settings.TUTOR_CONTEXT_TOKEN_BUDGET)
+    window = await tutor_chat_service.get_chat_window_async(db, user_id, content_id, settings.TUTOR_CHAT_WINDOW_MESSAGES)
+    messages = build_tutor_messages(question, context.sections, window)
+    return messages, answer_cache_key(content_id, context.sections, messages, model_id)
+
+
+async def tutor_event_stream(
+    provider: LLMProvider,
+    messages: Sequence[dict],
+    save_turn: Callable[[str], Awaitable[dict]],
+    cached_answer: Optional[str] = None,
+    on_failure: Optional[Callable[[], Awaitable[None]]] = None,
+) -> AsyncIterator[str]:
+    """
+    튜터 답변 SSE 본문 생성기. 토큰이 생성되는 대로 token 이벤트로 보내고,
+    스트림이 끝나면 save_turn(answer)으로 턴(질문 + 답변)을 저장한 뒤 그 결과를 done 이벤트로 보냅니다.
+    생성 중 오류가 나면 on_failure(사용 한도 환불 등)를 호출하고 error 이벤트를 보내며 저장하지 않습니다.
+    (클라이언트가 연결을 끊으면 생성이 취소되고 저장하지 않음)
+    cached_answer가 있으면 LLM을 호출하지 않고 답변 전체를 token 이벤트 하나로 보냅니다.
+    """
+    if cached_answer is not None:
+        yield sse_message({"text": cached_answer}, "token")
+        yield sse_message(await save_turn(cached_answer), "done")
+        return
+    parts = []
+    try:
+        async for token in provider.stream(messages):
+            parts.append(token)
+            yield sse_message({"text": token}, "token")
+    except Exception:
+        logger.exception("Tutor answer generation failed")
+        if on_failure is not None:
+            await on_failure()
+        yield sse_message({"error": "generation_failed"}, "error")
+        return
+    yield sse_message(await save_turn("".join(parts)), "done")
+
+
+async def refresh_chat_summary_async(db: AsyncSession, user_id: UUID, content_id: UUID, provider: LLMProvider) -> bool:
+    """
+    대화 창 밖으로 밀려난 미요약 메시지가 TUTOR_SUMMARY_TRIGGER_MESSAGES 이상 쌓이면 누적 요약을 갱신합니다.
+    매 턴이 아니라 일정 메시지마다 한 번씩 요약하므로 요약 비용이 턴 수에 비례해 늘지 않습니다. 갱신했으면 True.
+    """
+    pending = await tutor_chat_service.get_messages_to_summarize_async(db, user_id, content_id, settings.TUTOR_CHAT_WINDOW_MESSAGES)
+    if len(pending) < settings.TUTOR_SUMMARY_TRIGGER_MESSAGES:
+        return False
+    window = await tutor_chat_service.get_chat_window_async(db, user_id, content_id, 0)
+    transcript = "\n".join(f"{m['role']}: {m['message_text']}" for m in pending)
+    messages = [{"role": "system", "content": SUMMARY_PROMPT}]
+    if window["summary_text"]:
+        messages.append({"role": "user", "content": f"[이전 요약]\n{window['summary_text']}"})
+    messages.append({"role": "user", "content": transcript})
+    summary = await provider.complete(messages)
+    return await tutor_chat_service.update_chat_summary_async(db, user_id, content_id, summary, pending[-1]["seq"])
@@ -1,6 +1,10 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.database.models import User
 from app.core.security import get_password_hash # 비밀번호 해싱 import
+from app.core.principal_cache import principal_cache # 사용자 정보 변경 시 캐시 무효화
+from app.core.hashing import password_hasher # 비동기 경로용 bcrypt 전용 프로세스 풀
 
 def get_user(db: Session, user_id: str):
     return db.query(User).filter(User.id == user_id).first()
@@ -26,6 +30,7 @@ def update_user_profile(db: Session, user: User, name: str = None, bio: str = No
     if theme is not None:
         user.theme = theme
     db.commit()
+    principal_cache.invalidate(user.email)
     db.refresh(user)
     return user
 
@@ -37,16 +42,80 @@ def update_user_notifications(db: Session, user: User, email_notifications: bool
     if marketing_emails is not None:
         user.marketing_emails = marketing_emails
     db.commit()
+    principal_cache.invalidate(user.email)
     db.refresh(user)
     return user
 
 def update_user_password(db: Session, user: User, new_password: str):
     user.password_hash = get_password_hash(new_password)
     db.commit()
+    principal_cache.invalidate(user.email)
     db.refresh(user)
     return user
 
 def delete_user(db: Session, user: User):
+    email = user.email
     db.delete(user)
     db.commit()
-    return {"message": "User deleted successfully"}
\ No newline at end of file
+    principal_cache.invalidate(email)
+    return {"message": "User deleted successfully"}
+
+
+# --- 비동기 버전 (FastAPI 엔드포인트용) ---
+
+async def get_user_async(db: AsyncSession, user_id: str):
+    result = await db.execute(select(User).where(User.id == user_id))
+    return result.scalars().first()
+
+async def get_user_by_email_async(db: AsyncSession, email: str):
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalars().first()
+
+async def create_user_async(db: AsyncSession, email: str, password: str, name: str):
+    # bcrypt 해싱은 전용 프로세스 풀에서 실행 (과부하 시 503 + Retry-After)
+    hashed_password = await password_hasher.hash_password(password)
+    db_user = User(email=email, password_hash=hashed_password, name=name)
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    return db_user
+
+async def update_user_profile_async(db: AsyncSession, user: User, name: str = None, bio: str = None, language: str = None, theme: str = None):
+    if name is not None:
+        user.name = name
+    if bio is not None:
+        user.bio = bio
+    if language is not None:
+        user.language = language
+    if theme is not None:
+        user.theme = theme
+    await db.commit()
+    await principal_cache.ainvalidate(user.email)
+    await db.refresh(user)
+    return user
+
+async def update_user_notifications_async(db: AsyncSession, user: User, email_notifications: bool = None, push_notifications: bool = None, marketing_emails: bool = None):
+    if email_notifications is not None:
+        user.email_notifications = email_notifications
+    if push_notifications is not None:
+        user.push_notifications = push_notifications
+    if marketing_emails is not None:
+        user.marketing_emails = marketing_emails
+    await db.commit()
+    await principal_cache.ainvalidate(user.email)
+    await db.refresh(user)
+    return user
+
+async def update_user_password_async(db: AsyncSession, user: User, new_password: str):
+    user.password_hash = await password_hasher.hash_password(new_password)
+    await db.commit()
+    await principal_cache.ainvalidate(user.email)
+    await db.refresh(user)
+    return user
+
+async def delete_user_async(db: AsyncSession, user: User):
+    email = user.email
+    await db.delete(user)
+    await db.commit()
+    await principal_cache.ainvalidate(email)
+    return {"message": "User deleted successfully"}
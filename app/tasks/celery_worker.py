@@ -1,12 +1,13 @@
 from celery import Celery
 from app.core.config import settings
+from app.tasks.routing import PRIORITY_DEFAULT, PRIORITY_STEPS, QUEUE_CONTENT, TASK_QUEUES, TASK_ROUTES
 
 # Redis URL을 Celery 브로커 URL로 사용
 celery_app = Celery(
     "certgo_tasks",
     broker=settings.REDIS_URL,
     backend=settings.REDIS_URL,
-    include=["app.tasks.content_processing_tasks"] # 처리할 태스크 모듈 지정
+    include=["app.tasks.content_processing_tasks", "app.tasks.outbox_tasks"] # 처리할 태스크 모듈 지정
 )
 
 celery_app.conf.update(
@@ -16,5 +17,35 @@ celery_app.conf.update(
     accept_content=['json'],
     timezone='Asia/Seoul', # 한국 시간대 설정
     enable_utc=True,
-    broker_connection_retry_on_startup=True # Docker Compose 환경에서 Redis 먼저 시작 안 되어도 재시도
+    broker_connection_retry_on_startup=True, # Docker Compose 환경에서 Redis 먼저 시작 안 되어도 재시도
+    # 태스크가 끝난 뒤 ack: 워커가 처리 중에 죽으면 메시지가 큐로 돌아가 다른 워커가 다시 처리
+    # (중복 실행은 태스크의 콘텐츠 락과 조건부 상태 전이가 걸러냄)
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1, # late ack에서 한 워커가 여러 메시지를 쥐고 있지 않도록
+    # ack되지 않은 메시지를 재전달하기까지의 시간 (가장 긴 태스크보다 길게 설정)
+    broker_transport_options={
+        "visibility_timeout": settings.CELERY_VISIBILITY_TIMEOUT_SECONDS,
+        "priority_steps": PRIORITY_STEPS,
+        "queue_order_strategy": "priority", # 여러 큐를 consume할 때도 높은 우선순위부터
+    },
+    # 큐 분리: 긴 콘텐츠 처리가 사용자 대기 태스크(퀴즈 생성)를 막지 않도록 태스크별로 큐를 지정
+    # (워커의 prefetch multiplier는 큐별 워커 실행 시 지정: scripts/run_worker.sh)
+    task_queues=TASK_QUEUES,
+    task_routes=TASK_ROUTES,
+    task_default_queue=QUEUE_CONTENT,
+    task_default_priority=PRIORITY_DEFAULT,
+    task_inherit_parent_priority=True, # chord 하위 태스크도 원래 요청의 우선순위로 처리
+    # 주기 태스크 (celery beat): outbox relay, 오래된 PENDING 콘텐츠 스윕
+    beat_schedule={
+        "relay-outbox": {
+            "task": "relay_outbox_task",
+            "schedule": settings.OUTBOX_RELAY_INTERVAL_SECONDS,
+            "options": {"expires": settings.OUTBOX_RELAY_INTERVAL_SECONDS}, # 밀린 relay 메시지는 버림 (다음 주기에 처리)
+        },
+        "sweep-stale-pending-contents": {
+            "task": "sweep_stale_pending_contents_task",
+            "schedule": settings.CONTENT_SWEEP_INTERVAL_SECONDS,
+        },
+    },
 )
\ No newline at end of file
@@ -1,36 +1,328 @@
+from typing import Iterable, List, Set
+from uuid import UUID
+
+import redis
+from celery import chord
+
+from app.core.config import settings
+from app.tasks import progress
 from app.tasks.celery_worker import celery_app
-# 다른 서비스 및 모델 임포트 (예: from app.services.ai_integration_service import process_content_for_ai)
+from app.tasks.event_loop import run_async
+from app.tasks.routing import route_task
+from app.tasks.task_lock import LeaseLock, LockLostError, get_redis
+from app.database.connection import SessionLocal
+from app.services import ai_integration_service, content_service, learning_content_service, quiz_service, summary_service
+from app.services.result_cache import result_cache
+
+CONTENT_LOCK_KEY = "content:lock:{}" # 콘텐츠별 처리 락 (동시에 한 워커만 처리)
+CONTENT_DISPATCH_KEY = "content:dispatch:{}" # 큐에 이미 처리 메시지가 있는지 표시 (중복 발행 방지)
+
+
+def reserve_content_dispatches(content_ids: List[str]) -> Set[str]:
+    """
+    처리 메시지를 발행할 콘텐츠를 예약합니다. (outbox relay가 발행 직전에 호출)
+    아직 처리되지 않은 메시지가 큐에 있는 콘텐츠는 제외하고, 발행해도 되는 content_id 집합을 반환합니다.
+    표시는 워커가 처리를 시작(claim)할 때 지우므로, 그 이후의 재처리 요청은 새 메시지로 발행됩니다.
+    """
+    if not content_ids:
+        return set()
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for content_id in content_ids:
+            pipe.set(CONTENT_DISPATCH_KEY.format(content_id), "1", nx=True, ex=settings.CONTENT_DISPATCH_DEDUPE_SECONDS)
+        results = pipe.execute()
+    except redis.RedisError:
+        return set(content_ids) # Redis 장애 시에도 처리 요청은 잃지 않음 (중복은 태스크의 락/상태 전이가 걸러냄)
+    return {content_id for content_id, first in zip(content_ids, results) if first}
+
+
+def release_content_dispatches(content_ids: Iterable[str]):
+    """발행에 실패한 콘텐츠의 예약을 해제합니다. (outbox 재시도 때 다시 발행되도록)"""
+    keys = [CONTENT_DISPATCH_KEY.format(content_id) for content_id in content_ids]
+    if not keys:
+        return
+    try:
+        get_redis().delete(*keys)
+    except redis.RedisError:
+        pass
+
+
+def _prepare(db, content_id: UUID, full_rebuild: bool, lock: LeaseLock) -> dict:
+    """섹션 분할/동기화(콘텐츠당 한 번)와 삭제된 섹션의 point 정리. 임베딩할 섹션은 qdrant_point_id가 NULL로 남음"""
+    if full_rebuild:
+        ai_integration_service.delete_content_points(content_id)
+        section_count = content_service.materialize_sections(db, content_id)
+        summary = f"{section_count} sections rebuilt"
+    else:
+        sync = content_service.sync_sections(db, content_id)
+        lock.check()
+        # DB commit 이후 Qdrant 반영 (중간에 실패해도 남는 point는 검색 시 DB 조회에서 걸러짐)
+        ai_integration_service.delete_section_points(sync.removed_point_ids)
+        ai_integration_service.update_section_order(sync.reordered_point_ids)
+        section_count = sync.kept + sync.inserted
+        summary = f"kept={sync.kept} inserted={sync.inserted} deleted={sync.deleted} retimed={sync.retimed} renumbered={sync.renumbered}"
+    lock.check()
+    return {"section_count": section_count, "summary": summary}
+
+
+def _dispatch_chord(content_id: UUID, section_ids: list, summary_ranges: list, lock: LeaseLock, runs: int) -> int:
+    """
+    임베딩할 섹션을 CONTENT_EMBED_GROUP_SIZE 묶음으로 나누어 묶음별 태스크로 fan-out 하고,
+    요약 범위(summary_ranges)마다 요약 생성 태스크도 같은 chord 헤더에 넣어 함께 실행합니다.
+    모두 끝나면 finalize_content_processing_task가 임베딩 결과를 모아 기록합니다.
+    콘텐츠 락은 해제하지 않고 토큰을 chord에 넘깁니다. 임베딩 묶음 수를 반환합니다.
+    """
+    size = settings.CONTENT_EMBED_GROUP_SIZE
+    groups = [[str(sid) for sid in section_ids[i:i + size]] for i in range(0, len(section_ids), size)]
+    token = lock.hand_off(settings.CONTENT_CHORD_LEASE_SECONDS)
+    callback = finalize_content_processing_task.s(str(content_id), token, runs)
+    callback.on_error(content_processing_failed_task.s(str(content_id), token))
+    total = len(section_ids)
+    header = [embed_section_group_task.si(str(content_id), group, token, total) for group in groups]
+    header += [summarize_section_group_task.si(str(content_id), start, end) for start, end in summary_ranges]
+    chord(header)(callback)
+    return len(groups)
+
+
+def _run(db, content_id: UUID, full_rebuild: bool, lock: LeaseLock, runs: int = 0) -> dict:
+    """
+    락을 쥔 상태에서 콘텐츠를 PENDING -> PROCESSING -> COMPLETED/FAILED 로 처리합니다.
+    처리 중에 재처리 요청(PENDING)이 들어오면 락을 쥔 채로 한 번 더 처리합니다.
+    임베딩할 섹션이 묶음 하나보다 많으면 chord로 fan-out 하고 "dispatched"를 반환합니다.
+    (이 경우 락은 chord가 이어받으며, 상태 전이와 락 해제는 마무리 태스크가 함)
+    """
+    content_id_str = str(content_id)
+    while learning_content_service.claim_content_processing(db, content_id):
+        # 발행 표시 해제: 이후 들어오는 재처리 요청은 새 메시지로 발행됨 (이 워커가 끝나면 PENDING을 보고 다시 처리)
+        try:
+            get_redis().delete(CONTENT_DISPATCH_KEY.format(content_id))
+        except redis.RedisError:
+            pass
+        progress.publish_content_progress(content_id, "chunking", 0)
+        try:
+            prepared = _prepare(db, content_id, full_rebuild, lock)
+            section_ids = ai_integration_service.unembedded_section_ids(db, content_id)
+            summary_ranges = summary_service.section_summary_ranges(db, content_id) if _summary_prewarm_enabled() else []
+            db.rollback() # chord 대기 중에 트랜잭션을 열어 두지 않음
+            total = len(section_ids)
+            progress.reset_content_sections_done(content_id)
+            progress.publish_embedding_progress(content_id, 0, total)
+            if len(section_ids) > settings.CONTENT_EMBED_GROUP_SIZE:
+                groups = _dispatch_chord(content_id, section_ids, summary_ranges, lock, runs + 1)
+                print(f"Content ID {content_id_str}: {prepared['summary']}. Embedding {len(section_ids)} sections in {groups} groups, "
+                      f"summarizing {len(summary_ranges)} ranges.")
+                return {"status": "dispatched", "content_id": content_id_str, "section_count": prepared["section_count"], "groups": groups}
+            embedded_count = ai_integration_service.embed_content_sections(
+                db, content_id, on_progress=lambda done: progress.publish_embedding_progress(content_id, done, total),
+            )
+            lock.check()
+        except Exception as e:
+            print(f"Error processing content ID {content_id_str}: {e}")
+            db.rollback()
+            if not lock.lost: # 락을 잃었으면 이어받은 워커가 상태를 관리함
+                if learning_content_service.finish_content_processing(db, content_id, "FAILED"):
+                    progress.publish_content_finished(content_id, "FAILED", error=str(e))
+            return {"status": "failed", "content_id": content_id_str, "error": str(e)}
+        runs += 1
+        full_rebuild = False # 재실행은 증분으로
+        if learning_content_service.finish_content_processing(db, content_id, "COMPLETED"):
+            progress.publish_content_finished(content_id, "COMPLETED", sections_done=embedded_count, sections_total=total)
+            print(f"Content ID {content_id_str} processed successfully. ({prepared['summary']}, {embedded_count} embedded)")
+            return {"status": "completed", "content_id": content_id_str, "section_count": prepared["section_count"],
+                    "embedded_count": embedded_count, "runs": runs}
+        print(f"Content ID {content_id_str} was updated while processing. Processing again.")
+    print(f"Content ID {content_id_str} is not pending. Skipping duplicate delivery.")
+    return {"status": "skipped", "content_id": content_id_str, "reason": "not_pending"}
+
 
 @celery_app.task(name="process_content_task")
-def process_content_task(content_id: str):
+def process_content_task(content_id: str, full_rebuild: bool = False):
     """
     학습 콘텐츠를 AI 처리하는 비동기 태스크.
-    실제 구현에서는 YouTube 다운로드, 텍스트 추출, 임베딩, Qdrant 저장 등의 로직 포함.
+    raw_text_content를 섹션으로 분할해 ContentSection으로 저장하고, 섹션을 임베딩해 Qdrant에 업로드한 뒤,
+    processing_status를 PENDING -> PROCESSING -> COMPLETED/FAILED 로 갱신합니다.
+    기본은 증분 재처리로, 기존 섹션과 비교해 바뀐 섹션만 삽입/삭제하고 새 섹션만 임베딩합니다.
+    full_rebuild=True면 기존 섹션과 point를 모두 지우고 다시 만듭니다.
+    (YouTube 다운로드, 트랜스크립션 등 raw_text 확보 단계는 별도)
+
+    긴 콘텐츠는 분할을 한 번만 하고, 임베딩을 섹션 묶음별 태스크(embed_section_group_task)로 나누어
+    여러 워커가 동시에 처리한 뒤 finalize_content_processing_task가 결과를 한 번에 기록합니다. (chord)
+
+    중복 전달(이중 요청, 재전달)에 안전하도록
+    - 콘텐츠별 Redis 락(lease 자동 연장)을 잡은 워커만 처리하고, 락을 못 잡으면 건너뛰며,
+    - 상태 전이는 조건부 UPDATE로 수행해 이미 끝난 콘텐츠(COMPLETED/FAILED)는 다시 처리하지 않습니다.
+    - 처리 중에 재처리 요청(PENDING)이 들어오면 락을 쥔 채로 한 번 더 처리합니다.
+    task_acks_late 설정으로 워커가 죽으면 메시지가 재전달되고, 만료된 락을 다음 워커가 이어받습니다.
     """
+    cid = UUID(content_id)
+    lock = LeaseLock(CONTENT_LOCK_KEY.format(cid))
+    if not lock.acquire():
+        print(f"Content ID {content_id} is already being processed. Skipping duplicate delivery.")
+        return {"status": "skipped", "content_id": content_id, "reason": "locked"}
+
     print(f"Starting to process content ID: {content_id}")
-    # 여기에 실제 콘텐츠 처리 로직 구현 (예: YouTube 다운로드, 트랜스크립션, 텍스트 추출, 임베딩)
+    db = SessionLocal()
+    result = None
+    try:
+        result = _run(db, cid, full_rebuild, lock)
+        return result
+    finally:
+        db.close()
+        if result is None or result["status"] != "dispatched":
+            lock.release()
+
+
+@celery_app.task(
+    name="embed_section_group_task",
+    autoretry_for=(Exception,),
+    dont_autoretry_for=(LockLostError,),
+    retry_backoff=True,
+    max_retries=settings.CONTENT_GROUP_MAX_RETRIES,
+)
+def embed_section_group_task(content_id: str, section_ids: list, token: str, sections_total: int = 0):
+    """
+    chord의 fan-out 단위: 섹션 묶음 하나를 임베딩해 Qdrant에 업로드하고 업로드한 섹션 id를 반환합니다.
+    실패하면 이 묶음만 재시도합니다. (point id = section id이므로 재시도해도 중복 point가 생기지 않음)
+    넘겨받은 토큰으로 콘텐츠 락을 이어받아, 실행 중에는 lease를 연장합니다.
+    끝나면 묶음들의 임베딩 섹션 수 합계(Redis 카운터)로 진행 이벤트를 발행합니다.
+    """
+    cid = UUID(content_id)
+    lock = LeaseLock(CONTENT_LOCK_KEY.format(cid), ttl_seconds=settings.CONTENT_CHORD_LEASE_SECONDS)
+    if not lock.adopt(token):
+        raise LockLostError(f"Lost lease on content {content_id}")
+    db = SessionLocal()
     try:
-        # ai_integration_service.process_content_for_ai(content_id) # 실제 서비스 호출
-        import time
-        time.sleep(10) # 10초 대기 시뮬레이션
-        print(f"Content ID {content_id} processed successfully.")
-        return {"status": "completed", "content_id": content_id}
+        uploaded = ai_integration_service.embed_section_group(db, cid, [UUID(sid) for sid in section_ids])
+        lock.check()
+        done = progress.add_content_sections_done(cid, len(section_ids))
+        if done is not None and sections_total:
+            progress.publish_embedding_progress(cid, done, sections_total)
+        return [str(sid) for sid in uploaded]
+    finally:
+        db.close()
+        lock.hand_off(settings.CONTENT_CHORD_LEASE_SECONDS)
+
+
+@celery_app.task(name="summarize_section_group_task")
+def summarize_section_group_task(content_id: str, start_index: int, end_index: int):
+    """
+    chord의 fan-out 단위: 섹션 범위(order_index 양 끝 포함) 하나의 요약을 생성해 결과 캐시에 저장합니다.
+    요약은 미리 만들어 두는 것일 뿐이므로 실패해도 chord를 실패시키지 않고 None을 반환합니다. (요청 시 다시 생성)
+    """
+    try:
+        result = run_async(summary_service.get_section_summary_async(UUID(content_id), start_index, end_index))
     except Exception as e:
-        print(f"Error processing content ID {content_id}: {e}")
-        return {"status": "failed", "content_id": content_id, "error": str(e)}
+        print(f"Error summarizing sections {start_index}-{end_index} of content ID {content_id}: {e}")
+        return None
+    return {"start_index": start_index, "end_index": end_index, "cached": result.cached}
+
+
+def _summary_prewarm_enabled() -> bool:
+    # 결과 캐시가 Redis를 쓰지 않으면 워커에서 만든 요약을 API 서버가 읽을 수 없으므로 미리 생성하지 않음
+    return settings.CONTENT_SUMMARY_PREWARM and bool(result_cache.redis_url)
+
 
-@celery_app.task(name="generate_quizzes_task")
-def generate_quizzes_task(content_id: str, difficulty: str, count: int):
+def _finish_chord(content_id: str, token: str, status: str, work) -> dict:
+    """chord 마무리 공통: 락을 이어받아 work(db)를 실행하고 상태를 전이하며, 재처리 요청이 있으면 다시 처리합니다."""
+    cid = UUID(content_id)
+    lock = LeaseLock(CONTENT_LOCK_KEY.format(cid))
+    if not lock.adopt(token):
+        print(f"Content ID {content_id}: lease was lost during fan-out. Leaving it to the new owner.")
+        return {"status": "skipped", "content_id": content_id, "reason": "locked"}
+    db = SessionLocal()
+    result = None
+    try:
+        try:
+            result = work(db, lock)
+        except Exception as e:
+            print(f"Error finalizing content ID {content_id}: {e}")
+            db.rollback()
+            status, result = "FAILED", {"status": "failed", "content_id": content_id, "error": str(e)}
+        if lock.lost:
+            return result
+        if learning_content_service.finish_content_processing(db, cid, status):
+            progress.publish_content_finished(cid, status, **{k: v for k, v in result.items() if k in ("embedded_count", "error")})
+            return result
+        print(f"Content ID {content_id} was updated while processing. Processing again.")
+        result = _run(db, cid, False, lock, result.get("runs", 0))
+        return result
+    finally:
+        db.close()
+        if result is None or result["status"] != "dispatched":
+            lock.release()
+
+
+@celery_app.task(name="finalize_content_processing_task")
+def finalize_content_processing_task(group_results: list, content_id: str, token: str, runs: int):
+    """
+    chord의 fan-in: 모든 묶음의 업로드 결과(point id)를 bulk UPDATE로 기록하고 processing_status를 COMPLETED로 바꿉니다.
+    헤더의 요약 태스크 결과(dict/None)는 건너뛰고 임베딩 묶음 결과(섹션 id 목록)만 모읍니다.
+    """
+    group_results = [uploaded for uploaded in group_results if isinstance(uploaded, list)]
+
+    def work(db, lock):
+        section_ids = [UUID(sid) for uploaded in group_results for sid in uploaded]
+        embedded_count = ai_integration_service.record_section_points(db, UUID(content_id), section_ids)
+        lock.check()
+        print(f"Content ID {content_id} processed successfully. ({len(group_results)} groups, {embedded_count} embedded)")
+        return {"status": "completed", "content_id": content_id, "embedded_count": embedded_count,
+                "groups": len(group_results), "runs": runs}
+    return _finish_chord(content_id, token, "COMPLETED", work)
+
+
+@celery_app.task(name="content_processing_failed_task")
+def content_processing_failed_task(request, exc, traceback, content_id: str, token: str):
+    """chord errback: 재시도를 모두 소진한 묶음이 있으면 콘텐츠를 FAILED로 바꾸고 락을 해제합니다."""
+    def work(db, lock):
+        print(f"Error processing content ID {content_id}: {exc}")
+        return {"status": "failed", "content_id": content_id, "error": str(exc)}
+    return _finish_chord(content_id, token, "FAILED", work)
+
+
+async def _generate_quizzes_async(task_id: str, content_id: str, difficulty: str, count: int, context) -> tuple:
+    """문항을 하나씩 생성해 파싱합니다. 문항마다 진행 이벤트를 발행하고 (파싱된 문항 목록, 형식이 맞지 않은 응답 수)를 반환합니다."""
+    provider = ai_integration_service.get_llm_provider()
+    quizzes, invalid = [], 0
+    for done in range(1, count + 1):
+        messages = quiz_service.build_quiz_generation_messages(context, difficulty, done, count)
+        quiz = quiz_service.parse_generated_quiz(await provider.complete(messages))
+        if quiz is None:
+            invalid += 1
+        else:
+            quizzes.append(quiz)
+        progress.publish_quiz_progress(task_id, content_id, done, count)
+    return quizzes, invalid
+
+
+@celery_app.task(name="generate_quizzes_task", bind=True)
+def generate_quizzes_task(self, content_id: str, difficulty: str, count: int):
     """
     AI를 사용하여 퀴즈를 생성하는 비동기 태스크.
+    프롬프트에는 raw_text_content 전체 대신 콘텐츠 전체에 고르게 고른 섹션을 QUIZ_CONTEXT_TOKEN_BUDGET 안에서 넣습니다.
+    문항을 하나 만들 때마다 진행 이벤트(progress:quiz:{task_id})를 발행하고,
+    응답(JSON)을 파싱해 형식이 맞는 문항만 Quiz로 저장합니다. generated_count는 실제로 저장한 문항 수입니다.
+    LLM 호출은 워커 프로세스의 이벤트 루프 하나에서 실행합니다. (app.tasks.event_loop)
     """
+    task_id = self.request.id
     print(f"Generating {count} quizzes for content ID: {content_id} with difficulty: {difficulty}")
+    progress.publish_quiz_progress(task_id, content_id, 0, count)
     try:
-        # ai_integration_service.generate_quizzes_for_content(content_id, difficulty, count) # 실제 서비스 호출
-        import time
-        time.sleep(5) # 5초 대기 시뮬레이션
-        print(f"Quizzes generated successfully for content ID: {content_id}.")
-        return {"status": "completed", "content_id": content_id, "generated_count": count}
+        db = SessionLocal()
+        try:
+            context = ai_integration_service.build_coverage_context(db, UUID(content_id), settings.QUIZ_CONTEXT_TOKEN_BUDGET)
+            db.rollback() # LLM 호출 동안 트랜잭션을 열어 두지 않음
+            quizzes, invalid = run_async(_generate_quizzes_async(task_id, content_id, difficulty, count, context))
+            if not quizzes:
+                raise ValueError(f"No valid quiz in {count} generated responses")
+            quiz_ids = quiz_service.save_generated_quizzes(db, UUID(content_id), difficulty, quizzes)
+        finally:
+            db.close()
+        print(f"Quizzes generated successfully for content ID: {content_id}. ({len(quiz_ids)} saved, {invalid} invalid, "
+              f"{len(context.sections)} sections, {context.tokens} context tokens)")
+        progress.publish_quiz_progress(task_id, content_id, count, count, status="COMPLETED", generated_count=len(quiz_ids))
+        return {"status": "completed", "content_id": content_id, "generated_count": len(quiz_ids), "invalid_count": invalid,
+                "quiz_ids": [str(quiz_id) for quiz_id in quiz_ids], "context_tokens": context.tokens}
     except Exception as e:
         print(f"Error generating quizzes for content ID {content_id}: {e}")
-        return {"status": "failed", "content_id": content_id, "error": str(e)}
\ No newline at end of file
+        progress.publish_quiz_progress(task_id, content_id, 0, count, status="FAILED", error=str(e))
+        return {"status": "failed", "content_id": content_id, "error": str(e)}
@@ -0,0 +1,23 @@
+# certgo-backend/app/tasks/event_loop.py
+
+import asyncio
+import threading
+from typing import Awaitable, TypeVar
+
+T = TypeVar("T")
+
+_local = threading.local()
+
+
+def run_async(awaitable: Awaitable[T]) -> T:
+    """
+    Celery 태스크에서 코루틴을 실행합니다. 워커 프로세스(스레드)마다 이벤트 루프 하나를 계속 사용합니다.
+    비동기 엔진의 커넥션 풀과 redis.asyncio 클라이언트는 처음 사용한 루프에 묶이므로,
+    태스크(또는 호출)마다 asyncio.run으로 새 루프를 만들면 다음 실행에서 이전 루프의 커넥션을 쓰다 실패합니다.
+    (prefork 워커 기준. threads pool에서는 스레드마다 루프가 달라 비동기 엔진/Redis 클라이언트를 공유할 수 없음)
+    """
+    loop = getattr(_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _local.loop = loop
+    return loop.run_until_complete(awaitable)
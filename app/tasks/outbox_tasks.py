@@ -0,0 +1,73 @@
+import time
+from typing import List
+
+from app.core.config import settings
+from app.tasks.celery_worker import celery_app
+from app.tasks.content_processing_tasks import release_content_dispatches, reserve_content_dispatches
+from app.tasks.routing import PRIORITY_DEFAULT
+from app.database import models
+from app.database.connection import SessionLocal
+from app.services import outbox_service
+
+
+def publish_outbox_rows(rows: List[models.TaskOutbox]):
+    """
+    배치 전체를 브로커 연결 하나(producer)로 발행합니다.
+    콘텐츠 처리 태스크는 같은 콘텐츠의 처리 전 메시지가 이미 큐에 있으면 발행하지 않습니다. (CONTENT_DISPATCH_KEY)
+    그 메시지를 받은 워커가 최신 raw_text로 처리하므로 outbox 행은 발행된 것으로 보고 삭제됩니다.
+    """
+    content_ids = [row.task_kwargs["content_id"] for row in rows if row.task_name == outbox_service.PROCESS_CONTENT_TASK]
+    reserved = reserve_content_dispatches(list(dict.fromkeys(content_ids)))
+    reserved_by_batch = set(reserved)
+    try:
+        with celery_app.producer_or_acquire() as producer:
+            for row in rows:
+                if row.task_name == outbox_service.PROCESS_CONTENT_TASK:
+                    content_id = row.task_kwargs["content_id"]
+                    if content_id not in reserved:
+                        continue
+                    reserved.discard(content_id) # 같은 배치에 같은 콘텐츠가 여러 행이면 한 번만 발행
+                # 큐는 task_routes로 결정, 우선순위는 outbox에 기록된 값
+                # (send_task는 task_default_priority를 적용하지 않으므로 NULL이면 기본 우선순위를 직접 지정)
+                priority = row.priority if row.priority is not None else PRIORITY_DEFAULT
+                celery_app.send_task(row.task_name, kwargs=row.task_kwargs, priority=priority, producer=producer)
+    except Exception:
+        # 발행하지 못한 배치는 outbox에 남아 재시도되므로 예약을 풀어 둠
+        release_content_dispatches(reserved_by_batch)
+        raise
+
+
+@celery_app.task(name="relay_outbox_task", ignore_result=True)
+def relay_outbox_task():
+    """
+    outbox에 쌓인 태스크를 Celery로 발행하는 주기 태스크. (celery beat)
+    적체되어 있으면 OUTBOX_RELAY_TIME_BUDGET_SECONDS 동안 배치를 이어서 발행합니다.
+    """
+    deadline = time.monotonic() + settings.OUTBOX_RELAY_TIME_BUDGET_SECONDS
+    published = failed = 0
+    db = SessionLocal()
+    try:
+        while True:
+            result = outbox_service.relay_outbox(db, publish_outbox_rows)
+            published += result["published"]
+            failed += result["failed"]
+            if result["published"] < settings.OUTBOX_RELAY_BATCH_SIZE or time.monotonic() >= deadline:
+                break
+    finally:
+        db.close()
+    if published or failed:
+        print(f"Outbox relay: published={published} failed={failed}")
+    return {"published": published, "failed": failed}
+
+
+@celery_app.task(name="sweep_stale_pending_contents_task", ignore_result=True)
+def sweep_stale_pending_contents_task():
+    """오래 PENDING에 머문 콘텐츠의 처리 태스크를 outbox에 다시 기록하는 주기 태스크. (celery beat)"""
+    db = SessionLocal()
+    try:
+        requeued = outbox_service.requeue_stale_pending_contents(db)
+    finally:
+        db.close()
+    if requeued:
+        print(f"Requeued {requeued} stale PENDING contents.")
+    return {"requeued": requeued}
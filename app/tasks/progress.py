@@ -0,0 +1,72 @@
+import json
+from typing import Optional
+
+import redis
+
+from app.core.config import settings
+from app.services.progress_events import LAST_EVENT_PREFIX, content_channel, quiz_generation_channel
+from app.tasks.task_lock import get_redis
+
+CONTENT_SECTIONS_DONE_KEY = "progress:content:{}:sections_done" # fan-out 묶음들이 임베딩한 섹션 수 합계
+
+
+def publish(channel: str, event: dict):
+    """
+    진행 이벤트를 PUBLISH 하고 채널의 마지막 이벤트로 저장합니다. (SSE 연결 시 초기 상태)
+    진행 표시는 부가 기능이므로 Redis 장애 시에도 태스크를 실패시키지 않습니다.
+    """
+    data = json.dumps(event)
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.set(LAST_EVENT_PREFIX + channel, data, ex=settings.PROGRESS_EVENT_TTL_SECONDS)
+        pipe.publish(channel, data)
+        pipe.execute()
+    except redis.RedisError:
+        pass
+
+
+def publish_content_progress(
+    content_id,
+    stage: str,
+    percent: int,
+    status: str = "PROCESSING",
+    sections_done: Optional[int] = None,
+    sections_total: Optional[int] = None,
+    **extra,
+):
+    event = {"content_id": str(content_id), "status": status, "stage": stage, "percent": percent,
+             "sections_done": sections_done, "sections_total": sections_total, **extra}
+    publish(content_channel(content_id), event)
+
+
+def publish_embedding_progress(content_id, sections_done: int, sections_total: int):
+    """임베딩 단계 진행률: 분할이 끝난 시점을 10%, 임베딩 완료(마무리 직전)를 95%로 봅니다."""
+    sections_done = min(sections_done, sections_total) # 재전달된 묶음이 두 번 더해진 경우
+    percent = 10 + int(85 * sections_done / sections_total) if sections_total else 95
+    publish_content_progress(content_id, "embedding", percent, sections_done=sections_done, sections_total=sections_total)
+
+
+def publish_content_finished(content_id, status: str, **extra):
+    stage = "completed" if status == "COMPLETED" else "failed"
+    publish_content_progress(content_id, stage, 100, status=status, **extra)
+
+
+def reset_content_sections_done(content_id):
+    try:
+        get_redis().set(CONTENT_SECTIONS_DONE_KEY.format(content_id), 0, ex=settings.PROGRESS_EVENT_TTL_SECONDS)
+    except redis.RedisError:
+        pass
+
+
+def add_content_sections_done(content_id, count: int) -> Optional[int]:
+    """fan-out 묶음이 끝날 때마다 임베딩한 섹션 수를 더하고 합계를 반환합니다. (Redis 장애 시 None)"""
+    try:
+        return get_redis().incrby(CONTENT_SECTIONS_DONE_KEY.format(content_id), count)
+    except redis.RedisError:
+        return None
+
+
+def publish_quiz_progress(task_id: str, content_id: str, done: int, total: int, status: str = "PROCESSING", **extra):
+    event = {"task_id": task_id, "content_id": content_id, "status": status, "stage": "generating",
+             "percent": int(done * 100 / total) if total else 100, "done": done, "total": total, **extra}
+    publish(quiz_generation_channel(task_id), event)
@@ -0,0 +1,15 @@
+# certgo-backend/app/tasks/routing.py
+
+from kombu import Queue
+
+# 큐 이름/우선순위는 app.core.task_routing에 있고, 워커와 태스크는 이 모듈에서 함께 import합니다.
+from app.core.task_routing import (
+    PRIORITY_DEFAULT, PRIORITY_HIGH, PRIORITY_STEPS, QUEUE_CONTENT, QUEUE_INTERACTIVE, QUEUE_MAINTENANCE, TASK_ROUTES,
+    route_task, task_priority,
+)
+
+TASK_QUEUES = (
+    Queue(QUEUE_INTERACTIVE),
+    Queue(QUEUE_CONTENT),
+    Queue(QUEUE_MAINTENANCE),
+)
@@ -0,0 +1,116 @@
+# certgo-backend/app/tasks/task_lock.py
+
+import threading
+from typing import Optional
+
+import redis
+from redis.lock import Lock
+
+from app.core.config import settings
+
+_redis_client = None
+
+
+def get_redis():
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(settings.REDIS_URL)
+    return _redis_client
+
+
+def set_redis(client):
+    # 시뮬레이션/스크립트에서 다른 Redis 클라이언트(예: fakeredis)를 사용하기 위함
+    global _redis_client
+    _redis_client = client
+
+
+class LockLostError(RuntimeError):
+    pass
+
+
+class LeaseLock:
+    """
+    lease(만료 시간)가 있는 Redis 락. 잡고 있는 동안 백그라운드 스레드가 ttl/3 마다 만료 시간을 연장합니다.
+    워커가 죽으면 연장이 멈추고 ttl 후 락이 풀리므로, 재전달된 태스크가 이어서 처리할 수 있습니다.
+    연장에 실패하면(네트워크 장애 등으로 이미 만료) lost가 True가 되며, check()로 작업 중단 여부를 확인합니다.
+    """
+
+    def __init__(self, name: str, ttl_seconds: int = None, client=None):
+        self.ttl_seconds = ttl_seconds or settings.CONTENT_LOCK_TTL_SECONDS
+        # thread_local=False: 토큰을 갱신 스레드와 공유해야 함
+        self._lock = Lock(client or get_redis(), name, timeout=self.ttl_seconds, blocking=False, thread_local=False)
+        self._stop = threading.Event()
+        self._lost = threading.Event()
+        self._renewer: Optional[threading.Thread] = None
+
+    @property
+    def lost(self) -> bool:
+        return self._lost.is_set()
+
+    @property
+    def token(self) -> Optional[str]:
+        token = self._lock.local.token
+        return token.decode() if isinstance(token, bytes) else token
+
+    def acquire(self) -> bool:
+        if not self._lock.acquire():
+            return False
+        self._start_renewer()
+        return True
+
+    def adopt(self, token: str) -> bool:
+        """
+        다른 태스크가 넘겨준(hand_off) 락을 토큰으로 이어받습니다. (chord의 하위 태스크/마무리 태스크용)
+        이미 만료되었거나 다른 워커가 잡은 경우 False.
+        """
+        self._lock.local.token = token.encode()
+        try:
+            if not self._lock.extend(self.ttl_seconds, replace_ttl=True):
+                return False
+        except redis.RedisError:
+            return False
+        self._start_renewer()
+        return True
+
+    def hand_off(self, ttl_seconds: int) -> str:
+        """
+        락을 해제하지 않고 연장만 멈춘 뒤, 만료 시간을 ttl_seconds로 바꾸고 토큰을 반환합니다.
+        이후 작업을 이어서 할 태스크가 adopt(token)으로 이어받습니다.
+        """
+        self._stop_renewer()
+        try:
+            self._lock.extend(ttl_seconds, replace_ttl=True)
+        except redis.RedisError:
+            self._lost.set() # 이미 만료됨: 이어받는 태스크의 adopt가 실패함
+        return self.token
+
+    def _start_renewer(self):
+        self._stop.clear()
+        self._renewer = threading.Thread(target=self._renew, name=f"lease-{self._lock.name}", daemon=True)
+        self._renewer.start()
+
+    def _stop_renewer(self):
+        self._stop.set()
+        if self._renewer is not None:
+            self._renewer.join()
+            self._renewer = None
+
+    def _renew(self):
+        while not self._stop.wait(self.ttl_seconds / 3):
+            try:
+                if not self._lock.extend(self.ttl_seconds, replace_ttl=True):
+                    raise LockLostError(self._lock.name)
+            except (LockLostError, redis.RedisError): # LockError도 RedisError의 하위 클래스
+                self._lost.set()
+                return
+
+    def check(self):
+        if self.lost:
+            raise LockLostError(f"Lost lease on {self._lock.name}")
+
+    def release(self):
+        self._stop_renewer()
+        try:
+            self._lock.release()
+        except redis.RedisError:
+            pass # 이미 만료되어 다른 워커가 잡은 경우: 남의 락은 지우지 않음
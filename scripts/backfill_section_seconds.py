@@ -0,0 +1,57 @@
+"""
+contentsections.start_seconds / end_seconds backfill 스크립트.
+
+start_timestamp/end_timestamp 문자열에서 초 단위 값을 계산해 채웁니다.
+id 순서(keyset)로 batch 단위 처리 후 매번 commit 하므로 긴 트랜잭션/잠금 없이
+운영 중에도 실행할 수 있고, 중단 후 다시 실행해도 남은 행만 처리합니다.
+
+사용법:
+    python -m scripts.backfill_section_seconds --batch-size 5000
+"""
+import argparse
+
+from sqlalchemy import or_, select, update
+
+from app.database.connection import SessionLocal
+from app.database.models import ContentSection
+from app.services.learning_content_service import parse_timestamp_seconds
+
+
+def backfill(batch_size: int) -> int:
+    updated = 0
+    last_id = None
+    with SessionLocal() as db:
+        while True:
+            stmt = (
+                select(ContentSection.id, ContentSection.start_timestamp, ContentSection.end_timestamp)
+                .where(ContentSection.start_seconds.is_(None))
+                .where(or_(ContentSection.start_timestamp.isnot(None), ContentSection.end_timestamp.isnot(None)))
+                .order_by(ContentSection.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                stmt = stmt.where(ContentSection.id > last_id)
+            rows = db.execute(stmt).all()
+            if not rows:
+                break
+            # 기본키 기준 bulk UPDATE (executemany)
+            db.execute(update(ContentSection), [
+                {
+                    "id": row.id,
+                    "start_seconds": parse_timestamp_seconds(row.start_timestamp),
+                    "end_seconds": parse_timestamp_seconds(row.end_timestamp),
+                }
+                for row in rows
+            ])
+            db.commit()
+            updated += len(rows)
+            last_id = rows[-1].id
+            print(f"backfilled {updated} sections")
+    return updated
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+    backfill(args.batch_size)
@@ -0,0 +1,51 @@
+"""
+contentsections.token_count backfill 스크립트.
+
+section_text의 LLM 토큰 수(content_service.count_tokens 근사값)를 계산해 채웁니다.
+id 순서(keyset)로 batch 단위 처리 후 매번 commit 하므로 긴 트랜잭션/잠금 없이
+운영 중에도 실행할 수 있고, 중단 후 다시 실행해도 남은 행만 처리합니다.
+
+사용법:
+    python -m scripts.backfill_section_token_counts --batch-size 2000
+"""
+import argparse
+
+from sqlalchemy import select, update
+
+from app.database.connection import SessionLocal
+from app.database.models import ContentSection
+from app.services.content_service import count_tokens
+
+
+def backfill(batch_size: int) -> int:
+    updated = 0
+    last_id = None
+    with SessionLocal() as db:
+        while True:
+            stmt = (
+                select(ContentSection.id, ContentSection.section_text)
+                .where(ContentSection.token_count.is_(None))
+                .order_by(ContentSection.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                stmt = stmt.where(ContentSection.id > last_id)
+            rows = db.execute(stmt).all()
+            if not rows:
+                break
+            # 기본키 기준 bulk UPDATE (executemany)
+            db.execute(update(ContentSection), [
+                {"id": row.id, "token_count": count_tokens(row.section_text)} for row in rows
+            ])
+            db.commit()
+            updated += len(rows)
+            last_id = rows[-1].id
+            print(f"backfilled {updated} sections")
+    return updated
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=2000)
+    args = parser.parse_args()
+    backfill(args.batch_size)
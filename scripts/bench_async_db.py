@@ -0,0 +1,70 @@
+"""
+동기(Session + 스레드풀) 경로와 비동기(AsyncSession) 경로의 동시 요청 처리량 비교 벤치마크.
+
+FastAPI는 동기 엔드포인트를 AnyIO 스레드풀(기본 40 슬롯)에서 실행하므로,
+같은 제한을 걸고 동일한 조회(certificate 목록 + DB 왕복 지연)를 동시에 실행해 비교합니다.
+
+사용법 (DATABASE_URL 환경 변수 필요):
+    python -m scripts.bench_async_db --requests 2000 --concurrency 200 --latency-ms 5
+"""
+import argparse
+import asyncio
+import time
+
+import anyio
+from sqlalchemy import text
+
+from app.database.connection import SessionLocal, AsyncSessionLocal, engine, async_engine
+from app.services import certificate_service
+
+
+def _sync_request(latency: float):
+    db = SessionLocal()
+    try:
+        db.execute(text("SELECT pg_sleep(:d)"), {"d": latency}) # 네트워크/쿼리 지연 모사
+        certificate_service.get_certificates(db, limit=20)
+    finally:
+        db.close()
+
+
+async def _async_request(latency: float):
+    async with AsyncSessionLocal() as db:
+        await db.execute(text("SELECT pg_sleep(:d)"), {"d": latency})
+        await certificate_service.get_certificates_async(db, limit=20)
+
+
+async def _run(total: int, concurrency: int, call) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await call()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return time.perf_counter() - started
+
+
+async def main(total: int, concurrency: int, latency_ms: float, threadpool: int):
+    latency = latency_ms / 1000
+    anyio.to_thread.current_default_thread_limiter().total_tokens = threadpool
+
+    sync_elapsed = await _run(total, concurrency, lambda: anyio.to_thread.run_sync(_sync_request, latency))
+    async_elapsed = await _run(total, concurrency, lambda: _async_request(latency))
+
+    print(f"requests={total} concurrency={concurrency} latency={latency_ms}ms threadpool={threadpool}")
+    print(f"sync  (threadpool): {total / sync_elapsed:8.1f} req/s ({sync_elapsed:.2f}s)")
+    print(f"async (event loop): {total / async_elapsed:8.1f} req/s ({async_elapsed:.2f}s)")
+
+    engine.dispose()
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--threadpool", type=int, default=40) # Starlette/AnyIO 기본값
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.latency_ms, args.threadpool))
@@ -0,0 +1,64 @@
+"""
+섹션 분할(content_service.iter_sections) 처리량 벤치마크.
+
+합성 트랜스크립트(기본 100 MB)를 1 MB 청크로 흘려 보내며 분할 속도와 최대 메모리(RSS)를 측정합니다.
+DB 없이 분할 단계만 측정하며, 입력을 생성기로 만들기 때문에 텍스트 전체가 메모리에 올라가지 않습니다.
+
+사용법:
+    python -m scripts.bench_chunker --megabytes 100
+"""
+import argparse
+import resource
+import time
+
+from app.core.config import settings
+from app.services.content_service import iter_sections
+
+SENTENCES = [
+    "오늘은 엑셀의 VLOOKUP 함수와 INDEX MATCH 조합을 비교해 보겠습니다.",
+    "정보처리기사 필기 1과목은 소프트웨어 설계 영역입니다.",
+    "개인정보 보호법 제15조는 개인정보의 수집과 이용에 관한 조항입니다.",
+    "This section explains normalization up to the third normal form.",
+    "시험에 자주 나오는 개념이니 꼭 정리해 두세요!",
+]
+
+
+def synthetic_transcript(total_bytes: int, chunk_bytes: int = 1_000_000):
+    produced = 0
+    seconds = 0
+    chunk = []
+    chunk_size = 0
+    i = 0
+    while produced < total_bytes:
+        line = f"[{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}] {SENTENCES[i % len(SENTENCES)]} {SENTENCES[(i * 7) % len(SENTENCES)]}\n"
+        size = len(line.encode("utf-8"))
+        chunk.append(line)
+        chunk_size += size
+        produced += size
+        seconds += 4
+        i += 1
+        if chunk_size >= chunk_bytes:
+            yield "".join(chunk)
+            chunk, chunk_size = [], 0
+    if chunk:
+        yield "".join(chunk)
+
+
+def main(megabytes: int):
+    total_bytes = megabytes * 1_000_000
+    started = time.perf_counter()
+    sections = 0
+    for _ in iter_sections(synthetic_transcript(total_bytes)):
+        sections += 1
+    elapsed = time.perf_counter() - started
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"input={megabytes} MB target_chars={settings.CHUNK_TARGET_CHARS} overlap_chars={settings.CHUNK_OVERLAP_CHARS}")
+    print(f"sections={sections} elapsed={elapsed:.2f}s throughput={megabytes / elapsed:.1f} MB/s ({sections / elapsed:.0f} sections/s)")
+    print(f"max RSS={max_rss_mb:.1f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--megabytes", type=int, default=100)
+    args = parser.parse_args()
+    main(args.megabytes)
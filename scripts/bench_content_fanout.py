@@ -0,0 +1,154 @@
+"""
+긴 콘텐츠 처리의 fan-out(chord) 벤치마크: 워커 수에 따른 time-to-COMPLETED.
+
+process_content_task를 발행한 시점부터 processing_status가 COMPLETED가 될 때까지의 시간을
+워커 동시성(1, 2, 4, 8 ...)별로 측정하고, fan-out 없이 한 워커가 순서대로 처리하는 경우(serial)와 비교합니다.
+브로커/결과 백엔드는 Celery 메모리 transport(memory://, cache+memory://)를 사용하고, 워커는 같은 프로세스의
+threads pool로 실행합니다. 콘텐츠 락은 fakeredis를 사용합니다. (Lua 지원 필요: pip install "fakeredis[lua]")
+
+외부 임베딩 API 호출 지연을 흉내 내기 위해 provider.embed 호출마다 --embed-latency 초를 기다립니다.
+(로컬 hashing 임베더는 GIL을 잡는 순수 Python 연산이라, 지연 없이 측정하면 스레드 워커 수와 무관하게 거의 같음)
+
+사용법 (DATABASE_URL 환경 변수 필요, Qdrant는 프로세스 내 모드 권장):
+    QDRANT_HOST=:memory: python -m scripts.bench_content_fanout --hours 3 --workers 1,2,4,8 --embed-latency 0.2
+"""
+import argparse
+import threading
+import time
+import uuid
+
+import fakeredis
+from celery.contrib.testing.worker import start_worker
+from sqlalchemy import delete, func, select, update
+
+from app.core.config import settings
+from app.database import models
+from app.database.connection import SessionLocal
+from app.services import ai_integration_service
+from app.services.ai_integration_service import EmbeddingProvider
+from app.tasks.celery_worker import celery_app
+from app.tasks.content_processing_tasks import process_content_task
+from app.tasks.task_lock import set_redis
+from scripts.bench_chunker import synthetic_transcript
+
+SECONDS_PER_LINE = 4 # synthetic_transcript는 한 줄에 4초씩 타임스탬프를 증가시킴
+BYTES_PER_LINE = 150 # 한 줄의 대략적인 크기
+
+
+class SlowEmbeddingProvider(EmbeddingProvider):
+    """provider.embed 호출마다 고정 지연을 추가 (원격 임베딩 API 흉내)"""
+
+    def __init__(self, provider: EmbeddingProvider, latency: float):
+        self.provider = provider
+        self.latency = latency
+        self.model_id = provider.model_id
+        self.dimension = provider.dimension
+
+    def embed(self, texts):
+        time.sleep(self.latency)
+        return self.provider.embed(texts)
+
+
+class SerializedClient:
+    """프로세스 내 Qdrant(:memory:)는 스레드 안전하지 않으므로 호출을 직렬화 (서버 Qdrant에서는 불필요)"""
+
+    def __init__(self, client):
+        self._client = client
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+        return call
+
+
+def reset(db, content_id):
+    ai_integration_service.delete_content_points(content_id)
+    db.execute(delete(models.ContentSection).where(models.ContentSection.content_id == content_id))
+    db.execute(update(models.LearningContent).where(models.LearningContent.id == content_id).values(processing_status="PENDING"))
+    db.commit()
+
+
+def time_to_completed(db, content_id, concurrency: int, timeout: float) -> tuple:
+    with start_worker(celery_app, pool="threads", concurrency=concurrency, perform_ping_check=False, loglevel="WARNING"):
+        started = time.perf_counter()
+        process_content_task.delay(str(content_id))
+        status = None
+        while time.perf_counter() - started < timeout:
+            db.rollback() # 새 스냅샷으로 다시 조회
+            status = db.execute(select(models.LearningContent.processing_status).where(models.LearningContent.id == content_id)).scalar()
+            if status in ("COMPLETED", "FAILED"):
+                break
+            time.sleep(0.02)
+        return time.perf_counter() - started, status
+
+
+def main(hours: float, worker_counts: list, embed_latency: float, group_size: int, timeout: float):
+    celery_app.conf.update(
+        broker_url="memory://",
+        result_backend="cache+memory://",
+        task_always_eager=False,
+        # 메모리 transport의 기본 폴링 간격(1초)과 chord 완료 확인 간격(1초)이 측정값을 좌우하지 않도록 줄임
+        # (Redis 브로커/백엔드는 블로킹 조회와 chord 카운터를 사용하므로 이 지연이 없음)
+        broker_transport_options={**celery_app.conf.broker_transport_options, "polling_interval": 0.01},
+        result_chord_retry_interval=0.05,
+        # 메모리 transport는 prefetch 한도가 차 있으면 drain_events 타임아웃(2초)까지 다음 메시지를 확인하지 않으므로
+        # 스레드마다 메시지를 여유 있게 받아 두도록 함
+        worker_prefetch_multiplier=4,
+    )
+    celery_app.loader.import_default_modules()
+    set_redis(fakeredis.FakeRedis())
+    provider = SlowEmbeddingProvider(ai_integration_service.get_embedding_provider(), embed_latency)
+    client = SerializedClient(ai_integration_service.get_qdrant_client())
+    ai_integration_service.get_embedding_provider = lambda: provider
+    ai_integration_service.get_qdrant_client = lambda: client
+    settings.EMBEDDING_BATCH_SIZE = min(settings.EMBEDDING_BATCH_SIZE, group_size) # 묶음당 embed 호출 1회 이상
+    settings.CONTENT_SUMMARY_PREWARM = False # threads pool에서는 스레드마다 이벤트 루프가 달라 비동기 엔진을 공유할 수 없음 (app.tasks.event_loop)
+
+    db = SessionLocal()
+    total_bytes = int(hours * 3600 / SECONDS_PER_LINE * BYTES_PER_LINE)
+    certificate = models.Certificate(name=f"bench-fanout-{uuid.uuid4().hex[:8]}")
+    db.add(certificate)
+    db.flush()
+    content = models.LearningContent(
+        certificate_id=certificate.id, type="video", title="fan-out benchmark",
+        source_url=f"bench://fanout/{uuid.uuid4().hex}", raw_text_content="".join(synthetic_transcript(total_bytes)),
+    )
+    db.add(content)
+    db.commit()
+    content_id = content.id
+
+    print(f"transcript: {hours}h (~{total_bytes / 1e6:.1f} MB), group size {group_size}, embed latency {embed_latency * 1000:.0f} ms/call")
+    print(f"{'mode':>8} {'workers':>8} {'sections':>9} {'seconds':>9} {'speedup':>8}  status")
+    try:
+        runs = [("serial", 1, 10 ** 9)] + [("fan-out", n, group_size) for n in worker_counts]
+        baseline = None
+        for mode, concurrency, size in runs:
+            settings.CONTENT_EMBED_GROUP_SIZE = size
+            reset(db, content_id)
+            elapsed, status = time_to_completed(db, content_id, concurrency, timeout)
+            sections = db.execute(select(func.count()).where(models.ContentSection.content_id == content_id)).scalar()
+            baseline = baseline or elapsed
+            print(f"{mode:>8} {concurrency:>8} {sections:>9} {elapsed:>9.2f} {baseline / elapsed:>7.2f}x  {status}")
+    finally:
+        reset(db, content_id)
+        db.execute(delete(models.LearningContent).where(models.LearningContent.id == content_id))
+        db.execute(delete(models.Certificate).where(models.Certificate.id == certificate.id))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hours", type=float, default=3.0) # 트랜스크립트 길이 (영상 시간)
+    parser.add_argument("--workers", default="1,2,4,8") # 측정할 워커 동시성 목록
+    parser.add_argument("--embed-latency", type=float, default=0.2) # provider.embed 호출당 추가 지연 (초)
+    parser.add_argument("--group-size", type=int, default=settings.CONTENT_EMBED_GROUP_SIZE) # fan-out 묶음 크기 (섹션 수)
+    parser.add_argument("--timeout", type=float, default=600.0) # 실행당 최대 대기 시간 (초)
+    args = parser.parse_args()
+    main(args.hours, [int(n) for n in args.workers.split(",")], args.embed_latency, args.group_size, args.timeout)
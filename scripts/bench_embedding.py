@@ -0,0 +1,60 @@
+"""
+임베딩 + Qdrant upsert 단계(ai_integration_service.embed_and_upsert) 처리량 벤치마크.
+
+합성 섹션을 로컬 해싱 임베더로 임베딩하여 프로세스 내 Qdrant(":memory:")에 업로드하므로
+네트워크나 DB 없이 초당 임베딩/업로드 섹션 수를 측정할 수 있습니다.
+
+사용법:
+    python -m scripts.bench_embedding --sections 20000 --parallel 4
+"""
+import argparse
+import time
+import uuid
+
+from qdrant_client import QdrantClient
+
+from app.core.config import settings
+from app.services.ai_integration_service import (
+    HashingEmbeddingProvider,
+    embed_and_upsert,
+    ensure_collection,
+    shared_collection_name,
+)
+from scripts.bench_chunker import SENTENCES
+
+
+def synthetic_sections(count: int):
+    for i in range(count):
+        text = " ".join(SENTENCES[(i + j) % len(SENTENCES)] for j in range(12))
+        yield uuid.uuid4(), text, i
+
+
+def main(sections: int, batch_size: int, upsert_batch_size: int, parallel: int):
+    provider = HashingEmbeddingProvider()
+    client = QdrantClient(location=":memory:")
+    content_id = uuid.uuid4()
+    collection_name = shared_collection_name(provider)
+    ensure_collection(client, collection_name, provider.dimension)
+
+    started = time.perf_counter()
+    uploaded = 0
+    for section_ids in embed_and_upsert(
+        synthetic_sections(sections), content_id, collection_name, provider, client,
+        batch_size=batch_size, upsert_batch_size=upsert_batch_size, parallel=parallel,
+    ):
+        uploaded += len(section_ids)
+    elapsed = time.perf_counter() - started
+
+    stored = client.count(collection_name=collection_name, exact=True).count
+    print(f"provider={provider.model_id} batch_size={batch_size} upsert_batch_size={upsert_batch_size} parallel={parallel}")
+    print(f"sections={uploaded} stored_points={stored} elapsed={elapsed:.2f}s throughput={uploaded / elapsed:.0f} sections/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sections", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=settings.EMBEDDING_BATCH_SIZE)
+    parser.add_argument("--upsert-batch-size", type=int, default=settings.QDRANT_UPSERT_BATCH_SIZE)
+    parser.add_argument("--parallel", type=int, default=settings.QDRANT_UPLOAD_PARALLEL)
+    args = parser.parse_args()
+    main(args.sections, args.batch_size, args.upsert_batch_size, args.parallel)
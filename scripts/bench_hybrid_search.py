@@ -0,0 +1,132 @@
+"""
+섹션 검색 모드(lexical / vector / hybrid) 품질·지연 비교 harness.
+
+자격증 자료처럼 정확한 용어(법 조항 번호, 엑셀 함수명)가 섞인 합성 코퍼스를 DB와
+프로세스 내 비동기 Qdrant(":memory:")에 넣고, 질의마다 정답 섹션이 상위 k 안에 있는 비율(recall@k)과
+p95 지연을 모드별로 출력합니다.
+- term 질의: 섹션에만 있는 용어 (예: "개인정보 보호법 제137조")
+- topic 질의: 섹션 문장의 일부 단어만 남긴 질의 (의미 검색에 유리)
+
+사용법 (DATABASE_URL 환경 변수 필요, search_vector 마이그레이션 적용 상태):
+    python -m scripts.bench_hybrid_search --sections 5000 --queries 300 --k 10
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client import models as qdrant_models
+from sqlalchemy import delete, insert, select
+
+from app.database import models
+from app.database.connection import AsyncSessionLocal, SessionLocal
+from app.services.ai_integration_service import (
+    SEARCH_MODES,
+    get_embedding_provider,
+    search_sections_async,
+    section_payload,
+    shared_collection_name,
+)
+from scripts.bench_chunker import SENTENCES
+
+FUNCTIONS = ["VLOOKUP", "HLOOKUP", "XLOOKUP", "INDEX", "MATCH", "SUMIFS", "COUNTIFS", "IFERROR", "TEXTJOIN", "OFFSET"]
+LAWS = ["개인정보 보호법", "정보통신망법", "전자서명법", "저작권법", "근로기준법"]
+
+
+def _percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def synthetic_corpus(sections: int, rng: random.Random):
+    """(section_text, term 질의, topic 질의) 목록."""
+    corpus = []
+    for i in range(sections):
+        term = f"{LAWS[i % len(LAWS)]} 제{i}조" if i % 2 else f"{FUNCTIONS[i % len(FUNCTIONS)]}{i} 함수"
+        body = [rng.choice(SENTENCES) for _ in range(4)]
+        text = f"{body[0]} {term}에 대해 설명합니다. {' '.join(body[1:])}"
+        words = body[1].split()
+        topic = " ".join(rng.sample(words, k=max(1, len(words) // 2))) + f" {term.split()[-1]}"
+        corpus.append((text, term, topic))
+    return corpus
+
+
+def _seed_db(corpus):
+    db = SessionLocal()
+    certificate = models.Certificate(name=f"bench-hybrid-{uuid.uuid4().hex[:8]}")
+    db.add(certificate)
+    db.flush()
+    content = models.LearningContent(
+        certificate_id=certificate.id, type="document", title="bench hybrid",
+        source_url=f"bench://hybrid/{uuid.uuid4().hex}",
+    )
+    db.add(content)
+    db.flush()
+    db.execute(insert(models.ContentSection), [
+        {"content_id": content.id, "section_text": text, "order_index": i} for i, (text, _, _) in enumerate(corpus)
+    ])
+    db.commit()
+    ids = dict(db.execute(
+        select(models.ContentSection.order_index, models.ContentSection.id)
+        .where(models.ContentSection.content_id == content.id)
+    ).all())
+    return db, certificate, content, [ids[i] for i in range(len(corpus))]
+
+
+async def main(sections: int, queries: int, k: int, seed: int):
+    rng = random.Random(seed)
+    provider = get_embedding_provider()
+    corpus = synthetic_corpus(sections, rng)
+    db, certificate, content, section_ids = _seed_db(corpus)
+    client = AsyncQdrantClient(location=":memory:")
+    collection_name = shared_collection_name(provider)
+    try:
+        await client.create_collection(
+            collection_name,
+            vectors_config=qdrant_models.VectorParams(size=provider.dimension, distance=qdrant_models.Distance.COSINE),
+        )
+        for i in range(0, sections, 256):
+            vectors = provider.embed([text for text, _, _ in corpus[i:i + 256]])
+            await client.upsert(collection_name, points=[
+                qdrant_models.PointStruct(id=str(section_ids[i + j]), vector=vector, payload=section_payload(content.id, certificate.id, i + j))
+                for j, vector in enumerate(vectors)
+            ])
+
+        sample = rng.sample(range(sections), min(queries, sections))
+        print(f"sections={sections} queries={len(sample)} per kind k={k} provider={provider.model_id}")
+        async with AsyncSessionLocal() as session:
+            for kind, column in (("term", 1), ("topic", 2)):
+                for mode in SEARCH_MODES:
+                    hits, latencies = 0, []
+                    for index in sample:
+                        started = time.perf_counter()
+                        results = await search_sections_async(
+                            session, corpus[index][column], limit=k, content_id=content.id, mode=mode, client=client,
+                        )
+                        latencies.append((time.perf_counter() - started) * 1000)
+                        hits += any(row["id"] == section_ids[index] for row in results)
+                    print(
+                        f"{kind:<5} {mode:<7}: recall@{k}={hits / len(sample):.3f} "
+                        f"p50={statistics.median(latencies):.1f}ms p95={_percentile(latencies, 95):.1f}ms"
+                    )
+    finally:
+        await client.close()
+        db.execute(delete(models.ContentSection).where(models.ContentSection.content_id == content.id))
+        db.delete(content)
+        db.delete(certificate)
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sections", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    asyncio.run(main(args.sections, args.queries, args.k, args.seed))
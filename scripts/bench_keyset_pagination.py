@@ -0,0 +1,93 @@
+"""
+offset 페이지네이션 vs keyset(커서) 페이지네이션 깊은 페이지 지연 비교.
+
+learningcontent에 벤치마크용 행(기본 100만 건)을 넣고,
+페이지 크기 100 기준 1000번째 페이지를 두 방식으로 조회해 시간을 비교합니다.
+벤치마크 행은 source_url 접두사로 구분되며 종료 시 삭제됩니다.
+
+사용법 (DATABASE_URL 환경 변수 필요, alembic upgrade head 적용 상태):
+    python -m scripts.bench_keyset_pagination --rows 1000000 --page 1000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import func, select, text
+
+from app.database import models
+from app.database.connection import AsyncSessionLocal, SessionLocal, async_engine
+from app.services import learning_content_service
+from app.services.learning_content_service import CONTENT_SORT
+from app.services.pagination import encode_cursor
+
+URL_PREFIX = "bench://keyset/"
+
+
+def _seed(rows: int):
+    with SessionLocal() as db:
+        db.execute(text("""
+            INSERT INTO learningcontent (id, type, source_url, title, processing_status, created_at, updated_at)
+            SELECT uuid_generate_v4(), 'video', :prefix || g, 'bench ' || g, 'COMPLETED',
+                   now() - make_interval(secs => g), now()
+            FROM generate_series(1, :rows) AS g
+        """), {"prefix": URL_PREFIX, "rows": rows})
+        db.execute(text("ANALYZE learningcontent"))
+        db.commit()
+
+
+def _cleanup():
+    with SessionLocal() as db:
+        db.execute(text("DELETE FROM learningcontent WHERE source_url LIKE :p"), {"p": URL_PREFIX + "%"})
+        db.commit()
+
+
+async def _time(call, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def main(rows: int, page: int, page_size: int, repeat: int):
+    _seed(rows)
+    try:
+        async with AsyncSessionLocal() as db:
+            skip = (page - 1) * page_size
+            # 1000번째 페이지 직전 행의 정렬 키로 커서 생성 (클라이언트가 999페이지를 넘겨 받은 상태와 동일)
+            anchor = (await db.execute(
+                select(*CONTENT_SORT).order_by(*CONTENT_SORT).offset(skip - 1).limit(1)
+            )).one()
+            cursor = encode_cursor(list(anchor))
+
+            offset_ms = await _time(lambda: learning_content_service.get_all_learning_contents_async(db, skip=skip, limit=page_size), repeat)
+            keyset_ms = await _time(lambda: learning_content_service.get_all_learning_contents_page_async(db, cursor=cursor, limit=page_size), repeat)
+
+            offset_rows = await learning_content_service.get_all_learning_contents_async(db, skip=skip, limit=page_size)
+            keyset_rows, _ = await learning_content_service.get_all_learning_contents_page_async(db, cursor=cursor, limit=page_size)
+            assert [r.id for r in offset_rows] == [r.id for r in keyset_rows], "두 방식의 페이지 결과가 다릅니다"
+
+        total = await _count()
+        print(f"rows={total} page={page} page_size={page_size} (median of {repeat})")
+        print(f"offset: {offset_ms:8.2f} ms")
+        print(f"keyset: {keyset_ms:8.2f} ms")
+    finally:
+        _cleanup()
+        await async_engine.dispose()
+
+
+async def _count() -> int:
+    async with AsyncSessionLocal() as db:
+        return (await db.execute(select(func.count()).select_from(models.LearningContent))).scalar_one()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.page, args.page_size, args.repeat))
@@ -0,0 +1,86 @@
+"""
+동시 로그인 부하 중 /certificates 응답 지연(p50/p99) 측정.
+
+로그인 요청이 bcrypt를 전용 프로세스 풀에서 처리하므로, 로그인 폭주 중에도
+/certificates 같은 일반 GET 요청이 밀리지 않는지 확인합니다.
+(대기 상한을 넘은 로그인은 503으로 거절되며 그 수도 함께 출력합니다.)
+
+사용법 (DATABASE_URL 환경 변수 필요):
+    python -m scripts.bench_login_load --logins 64 --duration 10
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+import httpx
+
+from app.core.config import settings
+from app.core.hashing import password_hasher
+from app.database.connection import SessionLocal
+from app.main import app
+from app.services import user_service
+
+PASSWORD = "bench-password"
+
+
+def _percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _login_loop(client: httpx.AsyncClient, email: str, deadline: float, counters: dict):
+    while time.perf_counter() < deadline:
+        response = await client.post(
+            f"{settings.API_V1_STR}/auth/login",
+            data={"username": email, "password": PASSWORD},
+        )
+        counters[response.status_code] = counters.get(response.status_code, 0) + 1
+
+
+async def _certificate_loop(client: httpx.AsyncClient, deadline: float, latencies: list):
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await client.get(f"{settings.API_V1_STR}/certificates/", params={"limit": 20})
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0.01)
+
+
+async def main(logins: int, readers: int, duration: float):
+    email = f"bench-{uuid.uuid4().hex[:8]}@certgo.local"
+    db = SessionLocal()
+    user = user_service.create_user(db, email=email, password=PASSWORD, name="bench")
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            # 로그인 부하 없이 기준 지연 측정
+            baseline = []
+            await asyncio.gather(*(_certificate_loop(client, time.perf_counter() + duration / 2, baseline) for _ in range(readers)))
+
+            under_load, counters = [], {}
+            deadline = time.perf_counter() + duration
+            await asyncio.gather(
+                *(_login_loop(client, email, deadline, counters) for _ in range(logins)),
+                *(_certificate_loop(client, deadline, under_load) for _ in range(readers)),
+            )
+
+        print(f"login workers={logins} readers={readers} duration={duration}s hash_workers={settings.PASSWORD_HASH_WORKERS}")
+        for label, values in (("baseline", baseline), ("under login load", under_load)):
+            print(f"/certificates {label:>17}: n={len(values)} p50={statistics.median(values):.1f}ms p99={_percentile(values, 99):.1f}ms")
+        print(f"login responses by status: {counters}")
+    finally:
+        password_hasher.shutdown()
+        user_service.delete_user(db, user)
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=64) # 동시 로그인 클라이언트 수
+    parser.add_argument("--readers", type=int, default=8) # 동시 /certificates 클라이언트 수
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.readers, args.duration))
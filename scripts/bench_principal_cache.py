@@ -0,0 +1,64 @@
+"""
+인증 요청당 DB 쿼리 수 측정 (principal 캐시 사용 전/후 비교).
+
+벤치마크용 사용자를 만들고 /api/v1/users/me 를 반복 호출하면서
+비동기 엔진에서 실행된 SQL 문 수를 셉니다.
+
+사용법 (DATABASE_URL 환경 변수 필요):
+    python -m scripts.bench_principal_cache --requests 500
+"""
+import argparse
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.principal_cache import principal_cache
+from app.core.security import create_access_token
+from app.database.connection import SessionLocal, async_engine
+from app.main import app
+from app.services import user_service
+
+
+def _measure(client: TestClient, headers: dict, total: int) -> float:
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count)
+    try:
+        for _ in range(total):
+            response = client.get(f"{settings.API_V1_STR}/users/me", headers=headers)
+            response.raise_for_status()
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", count)
+    return len(statements) / total
+
+
+def main(total: int):
+    email = f"bench-{uuid.uuid4().hex[:8]}@certgo.local"
+    db = SessionLocal()
+    user = user_service.create_user(db, email=email, password="bench-password", name="bench")
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': email})}"}
+    try:
+        with TestClient(app) as client:
+            settings.PRINCIPAL_CACHE_ENABLED = False
+            without_cache = _measure(client, headers, total)
+            settings.PRINCIPAL_CACHE_ENABLED = True
+            with_cache = _measure(client, headers, total)
+        print(f"requests={total}")
+        print(f"queries/request without cache: {without_cache:.3f}")
+        print(f"queries/request with cache:    {with_cache:.3f}")
+        print(f"cache stats: {principal_cache.stats()}")
+    finally:
+        user_service.delete_user(db, user)
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    main(args.requests)
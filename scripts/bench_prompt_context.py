@@ -0,0 +1,107 @@
+"""
+프롬프트 컨텍스트 조립(토큰 예산) 벤치마크.
+
+합성 강의 트랜스크립트를 섹션으로 분할한 뒤,
+- 조립 시간: 섹션 선택(select_context_sections) + 본문 조립/겹침 제거(assemble_context)
+  저장된 token_count를 쓰는 경우(cached)와 조립할 때마다 후보 섹션 전체를 토큰화하는 경우(retokenize)를 비교
+- 프롬프트 토큰: raw_text 전체를 보낼 때 대비 튜터(질문 기반)/퀴즈(전체 고르게) 컨텍스트의 토큰 수
+를 출력합니다. 검색 점수는 hashing 임베딩의 코사인 유사도로 대신하므로 DB/Qdrant 없이 실행됩니다.
+
+사용법:
+    python -m scripts.bench_prompt_context --hours 3 --tutor-budget 2000 --quiz-budget 4000
+"""
+import argparse
+import time
+import uuid
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.ai_integration_service import (
+    HashingEmbeddingProvider, assemble_context, coverage_scores, select_context_sections,
+)
+from app.services.content_service import count_tokens, iter_sections, section_text_hash
+from scripts.bench_chunker import SENTENCES
+
+SECONDS_PER_LINE = 4
+QUERY = "개인정보 보호법 제15조 수집 이용"
+
+
+def lecture_transcript(hours: float) -> str:
+    # 줄마다 고유한 예제 번호를 넣어 섹션 본문이 서로 다르도록 함 (강의에서 반복되는 문장은 그대로 유지)
+    lines = []
+    for i in range(int(hours * 3600 / SECONDS_PER_LINE)):
+        seconds = i * SECONDS_PER_LINE
+        lines.append(
+            f"[{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}] "
+            f"{SENTENCES[i % len(SENTENCES)]} 예제 {i}번을 보면 {SENTENCES[(i * 7) % len(SENTENCES)]}\n"
+        )
+    return "".join(lines)
+
+
+def timed(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations
+
+
+def main(hours: float, tutor_budget: int, quiz_budget: int, iterations: int):
+    text = lecture_transcript(hours)
+    sections = list(iter_sections(iter([text])))
+    outline, texts = [], {}
+    for section in sections:
+        section_id = uuid.uuid4()
+        outline.append(SimpleNamespace(
+            id=section_id, order_index=section.order_index, text_hash=section_text_hash(section.section_text),
+            token_count=count_tokens(section.section_text),
+        ))
+        texts[section_id] = {"id": section_id, "section_text": section.section_text, "start_timestamp": section.start_timestamp}
+
+    # 검색 점수 대용: 질문과 섹션의 hashing 임베딩 코사인 유사도 상위 후보
+    provider = HashingEmbeddingProvider()
+    vectors = np.array(provider.embed([texts[row.id]["section_text"] for row in outline]))
+    similarity = vectors @ np.array(provider.embed([QUERY])[0])
+    top = np.argsort(-similarity)[:settings.CONTEXT_RETRIEVAL_CANDIDATES]
+    scores = {outline[i].id: float(similarity[i]) for i in top}
+    quiz_scores = coverage_scores(outline)
+
+    def retokenized_outline():
+        # token_count 캐시가 없을 때: 조립할 때마다 섹션 본문을 다시 토큰화
+        return [SimpleNamespace(id=row.id, order_index=row.order_index, text_hash=row.text_hash,
+                                token_count=count_tokens(texts[row.id]["section_text"])) for row in outline]
+
+    def build(budget, section_scores, adjacency, rows):
+        selected = select_context_sections(rows, section_scores, budget, adjacency)
+        return assemble_context(selected, {row.id: texts[row.id] for _, row in selected})
+
+    full_tokens = count_tokens(text)
+    print(f"transcript: {hours}h, {len(text) / 1e6:.2f} MB, {len(outline)} sections, {full_tokens} tokens (full prompt)")
+    print(f"{'prompt':>7} {'budget':>7} {'sections':>9} {'tokens':>8} {'saved':>7} {'cached ms':>10} {'retokenize ms':>14}")
+    for name, budget, section_scores, adjacency in (
+        ("tutor", tutor_budget, scores, None),
+        ("quiz", quiz_budget, quiz_scores, 0),
+    ):
+        context = build(budget, section_scores, adjacency, outline)
+        cached = timed(lambda: build(budget, section_scores, adjacency, outline), iterations)
+        retokenize = timed(lambda: build(budget, section_scores, adjacency, retokenized_outline()), max(1, iterations // 10))
+        saved = 1 - context.tokens / full_tokens
+        print(f"{name:>7} {budget:>7} {len(context.sections):>9} {context.tokens:>8} {saved:>6.1%} {cached * 1000:>10.2f} {retokenize * 1000:>14.2f}")
+
+    # 겹침 제거 효과: 인접 섹션이 함께 선택됐을 때 빠지는 토큰 수 (예산이 클수록 검색 섹션의 앞뒤 섹션까지 들어감)
+    for budget in (tutor_budget, tutor_budget * 2, tutor_budget * 4):
+        selected = select_context_sections(outline, scores, budget)
+        raw_tokens = sum(row.token_count for _, row in selected)
+        context = assemble_context(selected, {row.id: texts[row.id] for _, row in selected})
+        print(f"overlap dedupe (tutor, budget {budget}): {len(selected)} sections, {raw_tokens} -> {context.tokens} tokens")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hours", type=float, default=3.0) # 강의 길이 (영상 시간)
+    parser.add_argument("--tutor-budget", type=int, default=settings.TUTOR_CONTEXT_TOKEN_BUDGET)
+    parser.add_argument("--quiz-budget", type=int, default=settings.QUIZ_CONTEXT_TOKEN_BUDGET)
+    parser.add_argument("--iterations", type=int, default=200) # 조립 시간 측정 반복 횟수
+    args = parser.parse_args()
+    main(args.hours, args.tutor_budget, args.quiz_budget, args.iterations)
@@ -0,0 +1,127 @@
+"""
+Qdrant 컬렉션 레이아웃 비교 벤치마크: 콘텐츠별 컬렉션 vs 공유 컬렉션(payload 인덱스).
+
+합성 벡터로 두 레이아웃을 각각 채운 뒤
+- 적재 후 메모리 증가량 (tracemalloc, 프로세스 내 Qdrant 기준)
+- 콘텐츠 단위 검색 지연 (콘텐츠 컬렉션 직접 검색 vs content_id 필터)
+- 자격증 단위 검색 지연 (콘텐츠 컬렉션 fan-out + 병합 vs certificate_id 필터)
+을 비교합니다. 프로세스 내 Qdrant는 HNSW와 payload 인덱스 없이 Python으로 전수 검색/필터링하므로
+메모리 비교에만 의미가 있고, 필터 검색 지연은 --url로 실제 Qdrant 서버에서 측정해야 합니다
+(서버 모드에서는 메모리를 서버 지표로 확인).
+
+사용법:
+    python -m scripts.bench_qdrant_layout --contents 500 --sections 40 --certificates 10
+"""
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+import uuid
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client import models as qdrant_models
+
+from app.core.config import settings
+from app.services.ai_integration_service import (
+    content_collection_name,
+    ensure_collection,
+    section_filter,
+    section_payload,
+)
+
+SHARED_COLLECTION = "bench_sections_shared"
+
+
+def _percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _vectors(rng: np.random.Generator, count: int, dimension: int):
+    vectors = rng.standard_normal((count, dimension)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _points(content_id, certificate_id, vectors):
+    return [
+        qdrant_models.PointStruct(id=str(uuid.uuid4()), vector=vector.tolist(), payload=section_payload(content_id, certificate_id, i))
+        for i, vector in enumerate(vectors)
+    ]
+
+
+def _timed(fn, queries):
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        fn(query)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def main(contents: int, sections: int, certificates: int, queries: int, dimension: int, url: str):
+    rng = np.random.default_rng(42)
+    certificate_ids = [uuid.uuid4() for _ in range(certificates)]
+    corpus = [(uuid.uuid4(), certificate_ids[i % certificates]) for i in range(contents)]
+    contents_by_certificate = {c: [cid for cid, cert in corpus if cert == c] for c in certificate_ids}
+    vectors = {content_id: _vectors(rng, sections, dimension) for content_id, _ in corpus}
+
+    def new_client():
+        return QdrantClient(url=url) if url else QdrantClient(location=":memory:")
+
+    # --- 콘텐츠별 컬렉션 ---
+    tracemalloc.start()
+    per_content = new_client()
+    for content_id, certificate_id in corpus:
+        name = content_collection_name(content_id)
+        ensure_collection(per_content, name, dimension, payload_indexes=False)
+        per_content.upsert(name, points=_points(content_id, certificate_id, vectors[content_id]), wait=True)
+    per_content_mb = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+    tracemalloc.stop()
+
+    # --- 공유 컬렉션 + payload 인덱스 ---
+    tracemalloc.start()
+    shared = new_client()
+    ensure_collection(shared, SHARED_COLLECTION, dimension)
+    for content_id, certificate_id in corpus:
+        shared.upsert(SHARED_COLLECTION, points=_points(content_id, certificate_id, vectors[content_id]), wait=True)
+    shared_mb = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+    tracemalloc.stop()
+
+    query_vectors = _vectors(rng, queries, dimension)
+    content_queries = [(random.choice(corpus)[0], q) for q in query_vectors]
+    certificate_queries = [(random.choice(certificate_ids), q) for q in query_vectors]
+
+    def per_content_certificate_search(query):
+        certificate_id, vector = query
+        hits = []
+        for content_id in contents_by_certificate[certificate_id]:
+            hits.extend(per_content.search(content_collection_name(content_id), query_vector=vector, limit=10))
+        return sorted(hits, key=lambda h: h.score, reverse=True)[:10]
+
+    results = {
+        "per-content / content": _timed(lambda q: per_content.search(content_collection_name(q[0]), query_vector=q[1], limit=10), content_queries),
+        "shared      / content": _timed(lambda q: shared.search(SHARED_COLLECTION, query_vector=q[1], query_filter=section_filter(content_id=q[0]), limit=10), content_queries),
+        "per-content / certificate (fan-out)": _timed(per_content_certificate_search, certificate_queries),
+        "shared      / certificate": _timed(lambda q: shared.search(SHARED_COLLECTION, query_vector=q[1], query_filter=section_filter(certificate_id=q[0]), limit=10), certificate_queries),
+    }
+
+    print(f"contents={contents} sections/content={sections} certificates={certificates} dim={dimension} target={'server ' + url if url else 'in-memory'}")
+    if not url:
+        print(f"memory after load: per-content={per_content_mb:.1f} MB shared={shared_mb:.1f} MB")
+    for label, latencies in results.items():
+        print(f"{label:<36}: p50={statistics.median(latencies):.2f}ms p95={_percentile(latencies, 95):.2f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--contents", type=int, default=500)
+    parser.add_argument("--sections", type=int, default=40) # 콘텐츠당 섹션 수
+    parser.add_argument("--certificates", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dimension", type=int, default=settings.EMBEDDING_DIMENSION)
+    parser.add_argument("--url", default=None) # 예: http://localhost:6333 (미지정 시 프로세스 내 Qdrant)
+    args = parser.parse_args()
+    main(args.contents, args.sections, args.certificates, args.queries, args.dimension, args.url)
@@ -0,0 +1,149 @@
+"""
+퀴즈 시도 제출 벤치마크: 100문항 "full" 모의고사 답안 제출을 동시에 실행해 비교합니다.
+
+- naive: 문항마다 Quiz SELECT 1회 + UserAnswer INSERT 1회 (문항 수에 비례하는 DB 왕복)
+- bulk: quiz_service.submit_quiz_attempt_async (자격증 확인 1회 + 정답 IN 조회 1회 + 시도 INSERT + 답변 executemany INSERT, 한 트랜잭션)
+제출당 실행된 SQL 문 수, 처리량, 응답 시간(p50/p95)을 출력합니다.
+--rtt-ms를 주면 DB 호출(await)마다 그만큼 기다려 API 서버와 DB 사이의 네트워크 왕복 지연을 흉내 냅니다.
+벤치마크용 자격증/문항/사용자를 만들고 끝나면 삭제합니다.
+
+사용법 (DATABASE_URL 환경 변수 필요):
+    python -m scripts.bench_quiz_submit --questions 100 --attempts 500 --concurrency 50 --rtt-ms 1
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, event, insert, update
+
+from app.database import models
+from app.database.connection import AsyncSessionLocal, async_engine
+from app.services import quiz_service
+
+OPTIONS = ["A", "B", "C", "D"]
+
+
+class RttSession:
+    """AsyncSession의 DB 호출마다 rtt 만큼 기다리는 래퍼 (네트워크 왕복 지연 모사)"""
+
+    def __init__(self, session, rtt: float):
+        self._session = session
+        self._rtt = rtt
+
+    def __getattr__(self, name):
+        attr = getattr(self._session, name)
+        if name not in ("execute", "get", "flush", "commit", "rollback"):
+            return attr
+
+        async def call(*args, **kwargs):
+            if self._rtt:
+                await asyncio.sleep(self._rtt)
+            return await attr(*args, **kwargs)
+        return call
+
+
+async def naive_submit(db, user_id, exam_type, started_at, answers, certificate_id=None) -> dict:
+    # 문항마다 정답을 조회하고 답변을 하나씩 INSERT 하는 방식 (비교용)
+    attempt = models.UserQuizAttempt(
+        user_id=user_id, certificate_id=certificate_id, exam_type=exam_type, start_time=started_at, total_questions=len(answers)
+    )
+    db.add(attempt)
+    await db.flush()
+    correct_count = 0
+    for answer in answers:
+        quiz = await db.get(models.Quiz, answer["quiz_id"])
+        is_correct = answer["user_selected_option_id"] == quiz.correct_answer_id
+        correct_count += is_correct
+        db.add(models.UserAnswer(attempt_id=attempt.id, quiz_id=quiz.id, user_selected_option_id=answer["user_selected_option_id"], is_correct=is_correct))
+        await db.flush()
+    ended_at = datetime.now(timezone.utc)
+    await db.execute(
+        update(models.UserQuizAttempt)
+        .where(models.UserQuizAttempt.id == attempt.id)
+        .values(end_time=ended_at, time_taken_seconds=int((ended_at - started_at).total_seconds()),
+                score=round(correct_count * 100 / len(answers)), correct_count=correct_count)
+    )
+    await db.commit()
+    return {"correct_count": correct_count}
+
+
+async def setup(questions: int, users: int):
+    certificate_id = uuid.uuid4()
+    quiz_rows = [
+        {"id": uuid.uuid4(), "certificate_id": certificate_id, "question_text": f"bench question {i}", "options_json": OPTIONS,
+         "correct_answer_id": random.choice(OPTIONS), "difficulty": "normal", "question_type": "multiple"}
+        for i in range(questions)
+    ]
+    user_ids = [uuid.uuid4() for _ in range(users)]
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(models.Certificate).values(id=certificate_id, name=f"bench-quiz-submit-{certificate_id}"))
+        await db.execute(insert(models.Quiz), quiz_rows)
+        await db.execute(insert(models.User), [
+            {"id": user_id, "email": f"bench-{user_id}@example.com", "password_hash": "x", "name": "bench"} for user_id in user_ids
+        ])
+        await db.commit()
+    return certificate_id, [row["id"] for row in quiz_rows], user_ids
+
+
+async def cleanup(certificate_id, user_ids):
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(models.User).where(models.User.id.in_(user_ids))) # 시도/답변은 CASCADE
+        await db.execute(delete(models.Certificate).where(models.Certificate.id == certificate_id)) # 문항은 CASCADE
+        await db.commit()
+
+
+async def run(submit, attempts: int, concurrency: int, rtt: float, certificate_id, quiz_ids, user_ids) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i: int):
+        answers = [{"quiz_id": quiz_id, "user_selected_option_id": random.choice(OPTIONS), "bookmarked": False} for quiz_id in quiz_ids]
+        started_at = datetime.now(timezone.utc) - timedelta(minutes=90)
+        async with semaphore:
+            started = time.perf_counter()
+            async with AsyncSessionLocal() as session:
+                await submit(RttSession(session, rtt), user_ids[i % len(user_ids)], "full", started_at, answers, certificate_id=certificate_id)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(attempts)))
+    wall = time.perf_counter() - started
+    q = statistics.quantiles(latencies, n=100)
+    return {"wall": wall, "p50": q[49], "p95": q[94]}
+
+
+async def main(questions: int, attempts: int, concurrency: int, rtt_ms: float, users: int):
+    statements = 0
+
+    def count_statement(*_):
+        nonlocal statements
+        statements += 1
+
+    certificate_id, quiz_ids, user_ids = await setup(questions, users)
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        print(f"{questions} questions per attempt, {attempts} attempts, concurrency {concurrency}, rtt {rtt_ms} ms")
+        print(f"{'mode':>6} {'stmts/attempt':>14} {'attempts/s':>11} {'p50 ms':>8} {'p95 ms':>8}")
+        for name, submit in (("naive", naive_submit), ("bulk", quiz_service.submit_quiz_attempt_async)):
+            statements = 0
+            r = await run(submit, attempts, concurrency, rtt_ms / 1000, certificate_id, quiz_ids, user_ids)
+            print(f"{name:>6} {statements / attempts:>14.1f} {attempts / r['wall']:>11.1f} {r['p50'] * 1000:>8.1f} {r['p95'] * 1000:>8.1f}")
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", count_statement)
+        await cleanup(certificate_id, user_ids)
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--questions", type=int, default=100) # full 모의고사 문항 수
+    parser.add_argument("--attempts", type=int, default=500) # 제출 횟수
+    parser.add_argument("--concurrency", type=int, default=50) # 동시 제출 수
+    parser.add_argument("--rtt-ms", type=float, default=1.0) # DB 왕복 지연 (0이면 지연 없음)
+    parser.add_argument("--users", type=int, default=50) # 제출하는 사용자 수
+    args = parser.parse_args()
+    asyncio.run(main(args.questions, args.attempts, args.concurrency, args.rtt_ms, args.users))
@@ -0,0 +1,121 @@
+"""
+섹션 의미 검색(ai_integration_service.search_sections_async) 지연 예산 확인.
+
+합성 섹션을 DB에 넣고 같은 섹션을 프로세스 내 비동기 Qdrant(":memory:")에 임베딩한 뒤,
+질의 임베딩 + 필터 검색 + IN 쿼리 hydrate 전체의 p50/p95를 측정합니다.
+(지연 예산 확인은 DB 없이 tests/services/test_search_latency.py에서 실행)
+
+사용법 (DATABASE_URL 환경 변수 필요):
+    python -m scripts.bench_search_latency --sections 5000 --queries 200 --budget-ms 50
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client import models as qdrant_models
+from sqlalchemy import delete, insert, select
+
+from app.database import models
+from app.database.connection import AsyncSessionLocal, SessionLocal
+from app.services.ai_integration_service import (
+    SECTION_PAYLOAD_INDEXES,
+    get_embedding_provider,
+    search_sections_async,
+    section_payload,
+    shared_collection_name,
+)
+from scripts.bench_chunker import SENTENCES
+
+
+def _percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _seed_db(sections: int):
+    db = SessionLocal()
+    certificate = models.Certificate(name=f"bench-search-{uuid.uuid4().hex[:8]}")
+    db.add(certificate)
+    db.flush()
+    content = models.LearningContent(
+        certificate_id=certificate.id, type="video", title="bench search",
+        source_url=f"bench://search/{uuid.uuid4().hex}",
+    )
+    db.add(content)
+    db.flush()
+    rows = [
+        {
+            "content_id": content.id,
+            "section_text": f"{SENTENCES[i % len(SENTENCES)]} {SENTENCES[(i * 3) % len(SENTENCES)]} #{i}",
+            "start_seconds": i * 30,
+            "end_seconds": (i + 1) * 30,
+            "order_index": i,
+        }
+        for i in range(sections)
+    ]
+    db.execute(insert(models.ContentSection), rows)
+    db.commit()
+    seeded = db.execute(
+        select(models.ContentSection.id, models.ContentSection.section_text, models.ContentSection.order_index)
+        .where(models.ContentSection.content_id == content.id)
+    ).all()
+    return db, certificate, content, seeded
+
+
+async def main(sections: int, queries: int, limit: int, budget_ms: float) -> int:
+    provider = get_embedding_provider()
+    db, certificate, content, seeded = _seed_db(sections)
+    client = AsyncQdrantClient(location=":memory:")
+    collection_name = shared_collection_name(provider)
+    try:
+        await client.create_collection(
+            collection_name,
+            vectors_config=qdrant_models.VectorParams(size=provider.dimension, distance=qdrant_models.Distance.COSINE),
+        )
+        for field_name, field_schema in SECTION_PAYLOAD_INDEXES.items():
+            await client.create_payload_index(collection_name, field_name=field_name, field_schema=field_schema)
+        for i in range(0, len(seeded), 256):
+            batch = seeded[i:i + 256]
+            vectors = provider.embed([text for _, text, _ in batch])
+            await client.upsert(collection_name, points=[
+                qdrant_models.PointStruct(id=str(sid), vector=vector, payload=section_payload(content.id, certificate.id, order_index))
+                for (sid, _, order_index), vector in zip(batch, vectors)
+            ])
+
+        latencies = []
+        async with AsyncSessionLocal() as session:
+            for i in range(queries):
+                started = time.perf_counter()
+                results = await search_sections_async(
+                    session, SENTENCES[i % len(SENTENCES)], limit=limit, certificate_id=certificate.id, client=client,
+                )
+                latencies.append((time.perf_counter() - started) * 1000)
+                assert results, "search returned no sections"
+
+        p95 = _percentile(latencies, 95)
+        print(f"sections={sections} queries={queries} limit={limit} provider={provider.model_id}")
+        print(f"search latency: p50={statistics.median(latencies):.1f}ms p95={p95:.1f}ms budget={budget_ms:.0f}ms")
+        print("over budget" if p95 > budget_ms else "within budget")
+        return 0
+    finally:
+        await client.close()
+        db.execute(delete(models.ContentSection).where(models.ContentSection.content_id == content.id))
+        db.delete(content)
+        db.delete(certificate)
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sections", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=50.0) # p95 지연 예산
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.sections, args.queries, args.limit, args.budget_ms)))
@@ -0,0 +1,95 @@
+"""
+AI 튜터 스트리밍 벤치마크: time-to-first-token(TTFT)과 동시 스트림 수에 따른 처리 시간.
+
+- stream: 튜터 엔드포인트와 같은 경로(tutor_event_stream)로 토큰을 SSE 이벤트로 전달하고, 끝나면 턴을 저장 (비동기)
+- blocking: 답변 전체를 만든 뒤 한 번에 응답하는 동기 방식. 요청마다 스레드 하나를 생성 시간 내내 점유하며,
+  스레드 풀(--threads, FastAPI 동기 엔드포인트 기본 40개) 크기를 넘는 요청은 대기함
+를 동시 요청 수별로 비교합니다. LLM은 FakeLLMProvider(첫 토큰/토큰 간 지연을 흉내 내는 결정적 로컬 LLM)를 사용하고,
+턴 저장은 --save-latency 만큼의 지연으로 대신하므로 DB/Redis/Qdrant 없이 실행됩니다.
+
+사용법:
+    python -m scripts.bench_tutor_stream --concurrency 1,10,100,1000 --first-token 0.3 --token 0.02
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.ai_integration_service import FakeLLMProvider
+from app.services.tutor_service import build_tutor_messages, tutor_event_stream
+from scripts.bench_chunker import synthetic_transcript
+
+
+def sample_messages() -> list:
+    text = "".join(synthetic_transcript(20_000))
+    sections = [{"start_timestamp": None, "section_text": text[i:i + 1200]} for i in range(0, 6000, 1200)]
+    window = {"summary_text": None, "messages": []}
+    return build_tutor_messages("VLOOKUP 함수와 INDEX/MATCH의 차이는?", sections, window)
+
+
+def percentile(values: list, q: float) -> float:
+    return statistics.quantiles(values, n=100)[int(q) - 1] if len(values) > 1 else values[0]
+
+
+async def run_stream(provider, messages, save_latency: float) -> tuple:
+    async def save_turn(answer: str) -> dict:
+        await asyncio.sleep(save_latency)
+        return {"seq": 2, "message_text": answer}
+
+    started = time.perf_counter()
+    first = None
+    events = 0
+    async for event in tutor_event_stream(provider, messages, save_turn):
+        if first is None:
+            first = time.perf_counter() - started
+        events += 1
+    return first, time.perf_counter() - started, events
+
+
+def blocking_answer(provider, tokens: int, save_latency: float):
+    # 동기 LLM 클라이언트: 생성이 끝날 때까지 스레드를 점유
+    time.sleep(provider.first_token_seconds + provider.token_seconds * (tokens - 1) + save_latency)
+
+
+async def run_blocking(pool, provider, tokens: int, save_latency: float) -> tuple:
+    started = time.perf_counter()
+    await asyncio.get_running_loop().run_in_executor(pool, blocking_answer, provider, tokens, save_latency)
+    elapsed = time.perf_counter() - started
+    return elapsed, elapsed, 1 # 첫 바이트 = 전체 응답
+
+
+async def measure(mode: str, concurrency: int, provider, messages, tokens: int, save_latency: float, threads: int) -> dict:
+    started = time.perf_counter()
+    if mode == "stream":
+        results = await asyncio.gather(*(run_stream(provider, messages, save_latency) for _ in range(concurrency)))
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            results = await asyncio.gather(*(run_blocking(pool, provider, tokens, save_latency) for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+    ttft = [first for first, _, _ in results]
+    return {"wall": wall, "ttft_p50": percentile(ttft, 50), "ttft_p95": percentile(ttft, 95),
+            "total_p50": percentile([total for _, total, _ in results], 50)}
+
+
+async def main(concurrency_levels: list, first_token: float, token: float, save_latency: float, threads: int):
+    provider = FakeLLMProvider(first_token_seconds=first_token, token_seconds=token)
+    messages = sample_messages()
+    tokens = len([t async for t in FakeLLMProvider(0, 0).stream(messages)])
+    print(f"answer: {tokens} tokens, first token {first_token * 1000:.0f} ms, {token * 1000:.0f} ms/token, save {save_latency * 1000:.0f} ms, blocking pool {threads} threads")
+    print(f"{'mode':>9} {'streams':>8} {'ttft p50':>9} {'ttft p95':>9} {'total p50':>10} {'wall':>8}")
+    for concurrency in concurrency_levels:
+        for mode in ("stream", "blocking"):
+            r = await measure(mode, concurrency, provider, messages, tokens, save_latency, threads)
+            print(f"{mode:>9} {concurrency:>8} {r['ttft_p50']:>9.3f} {r['ttft_p95']:>9.3f} {r['total_p50']:>10.3f} {r['wall']:>8.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", default="1,10,100,1000") # 동시 요청 수 목록
+    parser.add_argument("--first-token", type=float, default=0.3) # 첫 토큰 지연 (초)
+    parser.add_argument("--token", type=float, default=0.02) # 토큰 간 지연 (초)
+    parser.add_argument("--save-latency", type=float, default=0.005) # 턴 저장 지연 (초)
+    parser.add_argument("--threads", type=int, default=40) # blocking 방식의 스레드 풀 크기
+    args = parser.parse_args()
+    asyncio.run(main([int(n) for n in args.concurrency.split(",")], args.first_token, args.token, args.save_latency, args.threads))
@@ -0,0 +1,136 @@
+"""
+처리 진행 이벤트(Redis pub/sub -> SSE) 확인.
+
+- 태스크 쪽 발행(app.tasks.progress)이 채널로 PUBLISH 되고 마지막 이벤트가 저장되는지
+- SSE 스트림이 초기 상태 -> 진행 이벤트 -> 완료 이벤트 순서로 전달하고 완료 이벤트에서 끝나는지
+- 같은 채널의 SSE 연결 여러 개가 Redis 구독 하나를 공유하고, 마지막 연결이 끝나면 구독을 해제하는지
+- fan-out 묶음의 섹션 수 카운터로 진행률이 계산되는지 (재전달로 두 번 더해져도 100%를 넘지 않음)
+를 확인하고, SSE 연결 수에 따른 이벤트 전달 시간을 출력합니다. 하나라도 실패하면 종료 코드 1로 끝납니다.
+Redis는 fakeredis를 사용하므로 필요 없습니다. (DB도 사용하지 않음)
+
+사용법:
+    python -m scripts.check_progress_events --listeners 1000
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+
+import fakeredis
+from fakeredis import aioredis as fake_aioredis
+
+from app.services.progress_events import LAST_EVENT_PREFIX, ProgressHub, content_channel, progress_hub
+from app.tasks import progress
+from app.tasks.task_lock import set_redis
+
+failures = []
+
+
+def check(condition: bool, message: str):
+    print(f"{'OK  ' if condition else 'FAIL'} {message}")
+    if not condition:
+        failures.append(message)
+
+
+def parse_sse(chunks: list) -> list:
+    # "event: progress\ndata: {...}\n\n" 형식에서 data만 꺼냄 (keep-alive 주석 제외)
+    return [json.loads(line[len("data: "):]) for chunk in chunks for line in chunk.splitlines() if line.startswith("data: ")]
+
+
+async def collect(hub: ProgressHub, channel: str, queue, initial) -> list:
+    return [chunk async for chunk in hub.stream(channel, queue, initial)]
+
+
+async def wait_subscribed(server_client, channel: str, expected: int):
+    for _ in range(200):
+        if (await server_client.pubsub_numsub(channel))[0][1] == expected:
+            return
+        await asyncio.sleep(0.01)
+
+
+async def check_stream(server):
+    hub = ProgressHub("redis://unused")
+    hub.set_redis(fake_aioredis.FakeRedis(server=server))
+    content_id = uuid.uuid4()
+    channel = content_channel(content_id)
+
+    # 태스크 쪽 발행 (동기 클라이언트)
+    progress.publish_content_progress(content_id, "chunking", 0)
+    stored = server_client_sync(server).get(LAST_EVENT_PREFIX + channel)
+    check(stored is not None and json.loads(stored)["stage"] == "chunking", "last event is stored for the initial snapshot")
+
+    queues = [await hub.subscribe(channel) for _ in range(3)]
+    initial = await hub.last_event(channel)
+    check(initial is not None and initial["stage"] == "chunking", "snapshot comes from Redis without touching the DB")
+    readers = [asyncio.create_task(collect(hub, channel, queue, initial)) for queue in queues]
+    await wait_subscribed(hub._get_redis(), channel, 1)
+    check(len(hub._subscribers[channel]) == 3, "three SSE connections share one Redis subscription")
+
+    progress.reset_content_sections_done(content_id)
+    progress.publish_embedding_progress(content_id, 0, 100)
+    for group in (40, 40, 40): # 마지막 묶음이 재전달되어 두 번 더해진 경우 포함
+        done = progress.add_content_sections_done(content_id, group)
+        progress.publish_embedding_progress(content_id, done, 100)
+    progress.publish_content_finished(content_id, "COMPLETED", embedded_count=100)
+
+    results = await asyncio.wait_for(asyncio.gather(*readers), timeout=5)
+    events = parse_sse(results[0])
+    stages = [event["stage"] for event in events]
+    check(stages == ["chunking", "embedding", "embedding", "embedding", "embedding", "completed"], f"stream order {stages}")
+    check(all(parse_sse(chunks) == events for chunks in results), "every connection receives the same events")
+    percents = [event["percent"] for event in events]
+    check(percents == sorted(percents) and percents[-2] == 95 and percents[-1] == 100, f"percent is monotonic and capped {percents}")
+    check(events[-2]["sections_done"] == 100, "sections_done is capped at sections_total")
+    check(channel not in hub._subscribers, "subscription is released after the terminal event")
+
+    # 이미 끝난 처리: 초기 상태가 완료 이벤트면 바로 종료
+    queue = await hub.subscribe(channel)
+    chunks = await asyncio.wait_for(collect(hub, channel, queue, await hub.last_event(channel)), timeout=5)
+    check([event["status"] for event in parse_sse(chunks)] == ["COMPLETED"], "stream ends immediately when already completed")
+    await hub.close()
+
+
+def server_client_sync(server):
+    return fakeredis.FakeRedis(server=server)
+
+
+async def bench(server, listeners: int):
+    hub = ProgressHub("redis://unused")
+    hub.set_redis(fake_aioredis.FakeRedis(server=server))
+    content_id = uuid.uuid4()
+    channel = content_channel(content_id)
+    queues = [await hub.subscribe(channel) for _ in range(listeners)]
+    readers = [asyncio.create_task(collect(hub, channel, queue, None)) for queue in queues]
+    await wait_subscribed(hub._get_redis(), channel, 1)
+    started = time.perf_counter()
+    for done in range(0, 101, 10):
+        progress.publish_embedding_progress(content_id, done, 100)
+    progress.publish_content_finished(content_id, "COMPLETED")
+    results = await asyncio.wait_for(asyncio.gather(*readers), timeout=60)
+    elapsed = time.perf_counter() - started
+    delivered = sum(len(parse_sse(chunks)) for chunks in results)
+    check(delivered == listeners * 12, f"{listeners} connections received all events ({delivered})")
+    print(f"{listeners} SSE connections, 12 events: {elapsed * 1000:.1f} ms, 1 Redis subscription, 0 DB queries")
+    await hub.close()
+
+
+def main(listeners: int) -> int:
+    server = fakeredis.FakeServer()
+    set_redis(fakeredis.FakeRedis(server=server))
+    check(progress_hub is not None, "module-level hub is importable")
+    asyncio.run(check_stream(server))
+    asyncio.run(bench(server, listeners))
+    if failures:
+        print(f"{len(failures)} check(s) failed")
+        return 1
+    print("ALL OK")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--listeners", type=int, default=1000) # 같은 콘텐츠를 구독하는 SSE 연결 수
+    args = parser.parse_args()
+    sys.exit(main(args.listeners))
@@ -0,0 +1,181 @@
+"""
+AI 생성 결과 캐시(요약/튜터 답변) 확인.
+
+- 같은 키의 동시 요청이 생성을 한 번만 하는지 (같은 프로세스 / Redis를 공유하는 다른 워커)
+- 생성된 결과가 이후 요청에 적중하고, 절약한 생성 시간이 집계되는지
+- 생성이 실패하면 기다리던 요청 모두에 오류가 전달되고, 저장/락이 남지 않아 다음 요청이 다시 생성하는지
+- 항목 수가 max_entries를 넘지 않는지 (오래 안 쓰인 것부터 제거)
+를 확인하고, 인기 섹션에 요청이 몰리는(Zipf) 부하에서 적중률과 응답 시간을 캐시 사용/미사용으로 비교합니다.
+하나라도 실패하면 종료 코드 1로 끝납니다. Redis는 fakeredis, LLM은 FakeLLMProvider를 사용하므로 DB/Redis 없이 실행됩니다.
+
+사용법:
+    python -m scripts.check_result_cache --requests 2000 --concurrency 100 --sections 200
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+import uuid
+
+import fakeredis
+from fakeredis import aioredis as fake_aioredis
+
+from app.services.ai_integration_service import FakeLLMProvider
+from app.services.result_cache import REDIS_INDEX_KEY, REDIS_KEY_PREFIX, ResultCache, result_cache_key
+
+failures = []
+
+
+def check(condition: bool, message: str):
+    print(f"{'OK  ' if condition else 'FAIL'} {message}")
+    if not condition:
+        failures.append(message)
+
+
+def new_cache(server, max_entries: int = 1000, redis_enabled: bool = True) -> ResultCache:
+    cache = ResultCache(ttl_seconds=600, max_entries=max_entries, lock_seconds=30, wait_seconds=10,
+                        redis_url="redis://unused" if redis_enabled else None)
+    cache.set_redis(fake_aioredis.FakeRedis(server=server))
+    return cache
+
+
+class CountingLLM(FakeLLMProvider):
+    def __init__(self, first_token_seconds: float, token_seconds: float):
+        super().__init__(first_token_seconds, token_seconds)
+        self.calls = 0
+
+    async def complete(self, messages, max_tokens=None) -> str:
+        self.calls += 1
+        return await super().complete(messages, max_tokens)
+
+
+def summary_key(content_id, index: int, model_id: str) -> str:
+    return result_cache_key("summary", content_id, index, index + 4, 1, model_id)
+
+
+def summarize(provider: CountingLLM, index: int):
+    messages = [{"role": "system", "content": f"[참고 자료]\n섹션 {index}의 내용입니다. 개인정보 보호법 제15조는 수집 이용 요건을 정합니다."},
+                {"role": "user", "content": "요약해 주세요."}]
+    return lambda: provider.complete(messages)
+
+
+async def check_single_flight(server):
+    provider = CountingLLM(0.2, 0.001)
+    content_id = uuid.uuid4()
+    key = summary_key(content_id, 0, provider.model_id)
+
+    cache = new_cache(server)
+    results = await asyncio.gather(*(cache.get_or_generate(key, summarize(provider, 0)) for _ in range(100)))
+    check(provider.calls == 1, f"100 concurrent identical requests in one process -> {provider.calls} LLM call")
+    check(len({r.text for r in results}) == 1 and sum(not r.cached for r in results) == 1, "one generated result, 99 shared")
+
+    # 다른 워커(같은 Redis를 쓰는 별도 캐시 인스턴스)
+    provider.calls = 0
+    key = summary_key(content_id, 5, provider.model_id)
+    workers = [new_cache(server) for _ in range(4)]
+    results = await asyncio.gather(*(workers[i % 4].get_or_generate(key, summarize(provider, 5)) for i in range(40)))
+    check(provider.calls == 1, f"40 concurrent requests across 4 workers -> {provider.calls} LLM call")
+    check(len({r.text for r in results}) == 1, "every worker returns the same result")
+
+    hit = await new_cache(server).get_or_generate(key, summarize(provider, 5))
+    check(hit.cached and provider.calls == 1, "later request is a cache hit without an LLM call")
+    stats = await cache.stats()
+    check(stats["shared"]["saved_ms"] > 0 and stats["shared"]["hit_ratio"] > 0.9, f"shared stats {stats['shared']}")
+
+
+async def check_failure(server):
+    cache = new_cache(server)
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        raise RuntimeError("llm unavailable")
+
+    key = summary_key(uuid.uuid4(), 0, "check")
+    results = await asyncio.gather(*(cache.get_or_generate(key, failing) for _ in range(10)), return_exceptions=True)
+    check(calls == 1 and all(isinstance(r, RuntimeError) for r in results), "a failed generation is reported to every waiter")
+    client = fakeredis.FakeRedis(server=server)
+    check(client.get(key) is None and not client.keys("airesult:lock:*"), "nothing cached and no lock left behind")
+
+    async def ok():
+        return "recovered"
+
+    result = await cache.get_or_generate(key, ok)
+    check(result.text == "recovered" and not result.cached, "next request generates again")
+
+
+async def check_eviction(server):
+    cache = new_cache(server, max_entries=50)
+    content_id = uuid.uuid4()
+    popular = summary_key(content_id, 0, "evict")
+    for i in range(200):
+        await cache.get_or_generate(summary_key(content_id, i, "evict"), lambda i=i: asyncio.sleep(0, f"summary {i}"))
+        await asyncio.sleep(0.001)
+        await cache.lookup(popular) # 계속 쓰이는 항목은 남아야 함
+    client = fakeredis.FakeRedis(server=server)
+    values = [k for k in client.keys(f"{REDIS_KEY_PREFIX}summary:evict:*")]
+    check(client.zcard(REDIS_INDEX_KEY) <= 50 and len(values) <= 50, f"entries bounded by max_entries ({len(values)} values)")
+    check(cache.evictions == 150, f"evicted least recently used entries ({cache.evictions})")
+    check(client.get(summary_key(content_id, 199, "evict")) is not None, "most recent entry is kept")
+    check(client.get(popular) is not None, "frequently read entry survives eviction")
+
+
+async def run_load(cache, provider, content_id, indexes, concurrency: int) -> list:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(index: int):
+        async with semaphore:
+            started = time.perf_counter()
+            await cache.get_or_generate(summary_key(content_id, index, provider.model_id), summarize(provider, index))
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one(index) for index in indexes))
+    return latencies
+
+
+async def bench(requests: int, concurrency: int, sections: int):
+    # 섹션 범위별 요청 빈도가 Zipf 분포(소수의 인기 구간에 몰림)인 부하
+    rng = random.Random(7)
+    weights = [1 / (rank + 1) for rank in range(sections)]
+    indexes = rng.choices(range(sections), weights=weights, k=requests)
+    content_id = uuid.uuid4()
+    print(f"{requests} summary requests, {sections} section ranges (Zipf), concurrency {concurrency}, LLM 0.3s + 20ms/token")
+    print(f"{'mode':>9} {'llm calls':>10} {'hit ratio':>10} {'p50 ms':>8} {'p95 ms':>8} {'wall s':>7} {'saved s':>8}")
+    for mode in ("no-cache", "cache"):
+        provider = CountingLLM(0.3, 0.02)
+        server = fakeredis.FakeServer()
+        cache = new_cache(server, max_entries=sections * 2, redis_enabled=(mode == "cache"))
+        if mode == "no-cache":
+            cache.get_or_generate = lambda key, generate: generate() # 캐시/single-flight 없이 매번 생성
+        started = time.perf_counter()
+        latencies = await run_load(cache, provider, content_id, indexes, concurrency)
+        wall = time.perf_counter() - started
+        stats = await cache.stats()
+        q = statistics.quantiles(latencies, n=100)
+        print(f"{mode:>9} {provider.calls:>10} {stats['hit_ratio']:>10.3f} {q[49] * 1000:>8.1f} {q[94] * 1000:>8.1f} {wall:>7.2f} {stats['saved_ms'] / 1000:>8.1f}")
+        if mode == "cache":
+            check(provider.calls <= len(set(indexes)), f"at most one LLM call per distinct section range ({provider.calls} / {len(set(indexes))})")
+
+
+def main(requests: int, concurrency: int, sections: int) -> int:
+    server = fakeredis.FakeServer()
+    asyncio.run(check_single_flight(server))
+    asyncio.run(check_failure(server))
+    asyncio.run(check_eviction(fakeredis.FakeServer()))
+    asyncio.run(bench(requests, concurrency, sections))
+    print("ALL OK" if not failures else f"{len(failures)} FAILED")
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000) # 요약 요청 수
+    parser.add_argument("--concurrency", type=int, default=100) # 동시 요청 수
+    parser.add_argument("--sections", type=int, default=200) # 서로 다른 섹션 범위 수
+    args = parser.parse_args()
+    sys.exit(main(args.requests, args.concurrency, args.sections))
@@ -0,0 +1,76 @@
+"""
+콘텐츠별 Qdrant 컬렉션(content_{id})을 임베딩 모델별 공유 컬렉션으로 옮기는 마이그레이션 도구.
+
+각 콘텐츠 컬렉션을 scroll로 batch 단위로 읽어 공유 컬렉션에 upsert 하고
+(content_id / certificate_id / order_index payload 포함),
+LearningContent.qdrant_collection_name을 공유 컬렉션 이름으로 갱신합니다.
+point id가 섹션 id와 같으므로 중간에 중단되어도 다시 실행하면 됩니다.
+--delete-source를 주면 옮긴 뒤 원본 컬렉션을 삭제합니다.
+
+사용법 (DATABASE_URL, QDRANT_HOST 환경 변수 필요):
+    python -m scripts.migrate_qdrant_collections --batch-size 256 [--delete-source] [--dry-run]
+"""
+import argparse
+import time
+import uuid
+
+from sqlalchemy import select, update
+
+from app.database import models
+from app.database.connection import SessionLocal
+from app.services.ai_integration_service import (
+    LEGACY_COLLECTION_PREFIX,
+    ensure_collection,
+    get_embedding_provider,
+    get_qdrant_client,
+    migrate_content_collection,
+    shared_collection_name,
+)
+
+
+def main(batch_size: int, delete_source: bool, dry_run: bool):
+    client = get_qdrant_client()
+    provider = get_embedding_provider()
+    target = shared_collection_name(provider)
+    sources = [c.name for c in client.get_collections().collections if c.name.startswith(LEGACY_COLLECTION_PREFIX)]
+    print(f"target={target} source collections={len(sources)}")
+    if dry_run:
+        return
+    ensure_collection(client, target, provider.dimension)
+
+    db = SessionLocal()
+    started = time.perf_counter()
+    total = 0
+    try:
+        for i, source in enumerate(sources, 1):
+            try:
+                content_id = uuid.UUID(source[len(LEGACY_COLLECTION_PREFIX):])
+            except ValueError:
+                print(f"skip {source}: not a content collection")
+                continue
+            certificate_id = db.execute(
+                select(models.LearningContent.certificate_id).where(models.LearningContent.id == content_id)
+            ).scalar()
+            moved = migrate_content_collection(client, source, target, content_id, certificate_id, batch_size)
+            db.execute(
+                update(models.LearningContent)
+                .where(models.LearningContent.id == content_id)
+                .values(qdrant_collection_name=target)
+            )
+            db.commit()
+            if delete_source:
+                client.delete_collection(source)
+            total += moved
+            print(f"[{i}/{len(sources)}] {source}: {moved} points")
+    finally:
+        db.close()
+    print(f"moved {total} points in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--delete-source", action="store_true")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    main(args.batch_size, args.delete_source, args.dry_run)
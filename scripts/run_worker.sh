@@ -0,0 +1,50 @@
+#!/bin/sh
+# 큐별 Celery 워커 실행 (큐 정의: app/tasks/routing.py)
+#
+# 사용법: scripts/run_worker.sh [content|interactive|maintenance|all] [추가 celery worker 인자...]
+#   content      긴 콘텐츠 처리. late ack + 태스크가 길어 prefetch 1 (메시지를 미리 쥐고 있지 않도록)
+#   interactive  사용자가 기다리는 짧은 태스크 (퀴즈 생성). 왕복을 줄이도록 prefetch를 크게, 주기 태스크도 함께 처리
+#   maintenance  주기 태스크 (outbox relay, 스윕)만 처리
+#   all          모든 큐 (개발용)
+# 동시성/prefetch는 환경 변수로 조정: <QUEUE>_CONCURRENCY, <QUEUE>_PREFETCH_MULTIPLIER (예: CONTENT_CONCURRENCY=4)
+set -e
+
+PROFILE=${1:-all}
+[ $# -gt 0 ] && shift
+
+case "$PROFILE" in
+  content)
+    QUEUES=content
+    CONCURRENCY=${CONTENT_CONCURRENCY:-2}
+    PREFETCH=${CONTENT_PREFETCH_MULTIPLIER:-1}
+    ;;
+  interactive)
+    QUEUES=interactive,maintenance
+    CONCURRENCY=${INTERACTIVE_CONCURRENCY:-4}
+    PREFETCH=${INTERACTIVE_PREFETCH_MULTIPLIER:-4}
+    ;;
+  maintenance)
+    QUEUES=maintenance
+    CONCURRENCY=${MAINTENANCE_CONCURRENCY:-1}
+    PREFETCH=${MAINTENANCE_PREFETCH_MULTIPLIER:-1}
+    ;;
+  all)
+    QUEUES=interactive,content,maintenance
+    CONCURRENCY=${ALL_CONCURRENCY:-2}
+    PREFETCH=${ALL_PREFETCH_MULTIPLIER:-1}
+    ;;
+  *)
+    echo "Unknown worker profile: $PROFILE (content|interactive|maintenance|all)" >&2
+    exit 1
+    ;;
+esac
+
+# DB 커넥션 풀을 Celery 워커 기준으로 설정 (app/database/connection.py, 예산: CELERY_WORKER_PROCESSES x (DB_CELERY_CONNECTIONS_PER_PROCESS + 1))
+export DB_POOL_ROLE=worker
+
+exec celery -A app.tasks.celery_worker worker -l info \
+  -Q "$QUEUES" \
+  -n "$PROFILE@%h" \
+  --concurrency "$CONCURRENCY" \
+  --prefetch-multiplier "$PREFETCH" \
+  "$@"
@@ -0,0 +1,69 @@
+# certgo-backend/tests/api/v1/test_content_events.py
+"""
+콘텐츠 처리 진행 SSE(/learning-content/{content_id}/events)의 초기 상태 테스트. (Redis는 fakeredis, DB 상태는 메모리)
+
+- 처리가 끝난(COMPLETED) 콘텐츠를 재처리 요청하면 Redis에 남은 이전 완료 이벤트 대신 PENDING을 먼저 보내는지
+- 마지막 이벤트가 현재 상태와 같으면(처리 중 진행률) 그 이벤트를 보내는지
+"""
+import asyncio
+import json
+import uuid
+
+import fakeredis
+import pytest
+from fakeredis import aioredis as fake_aioredis
+
+from app.api.v1.learning_content import endpoints
+from app.services.progress_events import ProgressHub
+from app.tasks import progress
+from app.tasks.task_lock import set_redis
+
+
+@pytest.fixture
+def content(monkeypatch):
+    server = fakeredis.FakeServer()
+    set_redis(fakeredis.FakeRedis(server=server)) # 태스크 쪽 발행 (app.tasks.progress)
+    monkeypatch.setattr(endpoints, "progress_hub", ProgressHub("redis://unused"))
+    endpoints.progress_hub.set_redis(fake_aioredis.FakeRedis(server=server))
+    statuses = {}
+
+    async def get_processing_status_async(db, content_id):
+        return statuses.get(content_id)
+
+    monkeypatch.setattr(endpoints.learning_content_service, "get_processing_status_async", get_processing_status_async)
+    content_id = uuid.uuid4()
+    yield content_id, statuses
+    set_redis(None)
+
+
+async def first_event(content_id) -> dict:
+    # fakeredis 비동기 클라이언트는 처음 사용한 이벤트 루프에 묶이므로 테스트마다 한 루프에서 호출
+    response = await endpoints.stream_content_events(content_id, db=None)
+    try:
+        message = await response.body_iterator.__anext__()
+    finally:
+        await response.body_iterator.aclose()
+    return json.loads(message.split("data: ", 1)[1])
+
+
+def test_reprocessed_content_starts_with_pending(content):
+    content_id, statuses = content
+    statuses[content_id] = "COMPLETED"
+    progress.publish_content_finished(content_id, "COMPLETED", sections_done=3, sections_total=3)
+
+    async def run():
+        before = await first_event(content_id)
+        statuses[content_id] = "PENDING" # 재처리 요청 (raw_text 변경)
+        return before, await first_event(content_id)
+
+    before, after = asyncio.run(run())
+    assert before["status"] == "COMPLETED"
+    assert after["status"] == "PENDING" and after["percent"] == 0
+
+
+def test_progress_event_is_used_while_processing(content):
+    content_id, statuses = content
+    statuses[content_id] = "PROCESSING"
+    progress.publish_embedding_progress(content_id, 16, 32)
+    event = asyncio.run(first_event(content_id))
+    assert event["stage"] == "embedding" and event["sections_done"] == 16
@@ -0,0 +1,68 @@
+# certgo-backend/tests/api/v1/test_quiz_events.py
+"""
+퀴즈 생성 진행 SSE(/quizzes/generate/{task_id}/events) 권한 테스트. (Redis는 fakeredis)
+
+- 인증 없이 구독하면 401
+- 없는(만료된) 태스크, 다른 사용자의 태스크는 404
+- 요청한 사용자는 마지막 이벤트부터 받고, 완료 이벤트 후 스트림이 닫힘
+"""
+import json
+import uuid
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+from fakeredis import aioredis as fake_aioredis
+from fastapi.testclient import TestClient
+
+from app.core.dependencies import get_current_user
+from app.main import app
+from app.services.progress_events import LAST_EVENT_PREFIX, OWNER_PREFIX, progress_hub, quiz_generation_channel
+
+OWNER = SimpleNamespace(id=uuid.uuid4())
+
+
+@pytest.fixture
+def client():
+    server = fakeredis.FakeServer()
+    progress_hub.set_redis(fake_aioredis.FakeRedis(server=server))
+    with TestClient(app) as test_client:
+        yield SimpleNamespace(http=test_client, redis=fakeredis.FakeRedis(server=server)) # 상태 준비용 동기 클라이언트
+    app.dependency_overrides.clear()
+    progress_hub.set_redis(None)
+
+
+def login(user):
+    app.dependency_overrides[get_current_user] = lambda: user
+
+
+def url(task_id: str) -> str:
+    return f"/api/v1/quizzes/generate/{task_id}/events"
+
+
+def test_requires_authentication(client):
+    assert client.http.get(url(str(uuid.uuid4()))).status_code == 401
+
+
+def test_unknown_task_is_not_found(client):
+    login(OWNER)
+    assert client.http.get(url(str(uuid.uuid4()))).status_code == 404
+
+
+def test_other_users_task_is_not_found(client):
+    task_id = str(uuid.uuid4())
+    client.redis.set(OWNER_PREFIX + quiz_generation_channel(task_id), str(OWNER.id))
+    login(SimpleNamespace(id=uuid.uuid4()))
+    assert client.http.get(url(task_id)).status_code == 404
+
+
+def test_owner_receives_events_until_completed(client):
+    task_id = str(uuid.uuid4())
+    channel = quiz_generation_channel(task_id)
+    event = {"task_id": task_id, "status": "COMPLETED", "done": 3, "total": 3}
+    client.redis.set(OWNER_PREFIX + channel, str(OWNER.id))
+    client.redis.set(LAST_EVENT_PREFIX + channel, json.dumps(event))
+    login(OWNER)
+    response = client.http.get(url(task_id))
+    assert response.status_code == 200
+    assert response.text == f"event: progress\ndata: {json.dumps(event)}\n\n"
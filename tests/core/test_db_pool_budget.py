@@ -0,0 +1,33 @@
+# certgo-backend/tests/core/test_db_pool_budget.py
+
+import pytest
+
+from app.core.config import Settings
+
+
+def total_connections(settings: Settings) -> int:
+    # API 워커: 동기 + 비동기 엔진 최대치, Celery 워커: 동기 엔진 + 비동기 엔진 1개 (db_celery_connections)
+    api_worker = settings.DB_API_SYNC_POOL_SIZE + settings.db_pool_size + settings.db_max_overflow
+    return settings.WEB_CONCURRENCY * api_worker + settings.db_celery_connections
+
+
+@pytest.mark.parametrize("web_concurrency, max_connections, celery_processes", [
+    (4, 80, 6),
+    (8, 100, 6),
+    (2, 40, 3),
+    (16, 200, 12),
+])
+def test_pool_sizes_fit_max_connections(web_concurrency, max_connections, celery_processes):
+    settings = Settings(WEB_CONCURRENCY=web_concurrency, DB_MAX_CONNECTIONS=max_connections, CELERY_WORKER_PROCESSES=celery_processes)
+    assert total_connections(settings) <= max_connections
+
+
+def test_celery_role_uses_celery_pool_size():
+    settings = Settings(DB_POOL_ROLE="worker", DB_CELERY_CONNECTIONS_PER_PROCESS=3)
+    assert settings.db_sync_pool_size == 3
+    assert Settings(DB_POOL_ROLE="api", DB_API_SYNC_POOL_SIZE=2).db_sync_pool_size == 2
+
+
+def test_explicit_async_pool_overrides():
+    settings = Settings(DB_POOL_SIZE=7, DB_MAX_OVERFLOW=0)
+    assert (settings.db_pool_size, settings.db_max_overflow) == (7, 0)
@@ -0,0 +1,69 @@
+# certgo-backend/tests/core/test_principal_cache.py
+
+import asyncio
+import uuid
+
+import fakeredis
+import pytest
+from fakeredis import aioredis as fake_aioredis
+from sqlalchemy.orm.exc import DetachedInstanceError
+
+from app.core.principal_cache import PrincipalCache, user_from_cache, user_to_cache
+from app.database.models import User
+
+
+def new_user(name: str = "before") -> User:
+    return User(id=uuid.uuid4(), email="cache@example.com", password_hash="$2b$12$secret", name=name)
+
+
+def new_cache(server=None) -> PrincipalCache:
+    cache = PrincipalCache(ttl_seconds=300, local_ttl_seconds=15, max_entries=100, redis_url="redis://unused" if server else None)
+    if server is not None:
+        cache._redis = fakeredis.FakeRedis(server=server)
+        cache._aredis = fake_aioredis.FakeRedis(server=server)
+    return cache
+
+
+def test_credentials_are_not_cached():
+    data = user_to_cache(new_user())
+    assert "password_hash" not in data
+    user = user_from_cache(data)
+    assert user.name == "before"
+    with pytest.raises(DetachedInstanceError):
+        user.password_hash
+
+
+def test_local_ttl_is_short_without_redis():
+    assert new_cache().local_ttl_seconds == 15
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_refill_after_invalidate_is_dropped(shared):
+    async def run():
+        server = fakeredis.FakeServer() if shared else None
+        cache = new_cache(server)
+        cached, token = await cache.aget("cache@example.com")
+        assert cached is None
+        # DB 조회 중에 다른 요청이 사용자 정보를 바꾸고 무효화
+        await cache.ainvalidate("cache@example.com")
+        await cache.aset("cache@example.com", new_user("before"), token)
+        assert (await cache.aget("cache@example.com"))[0] is None
+
+        _, token = await cache.aget("cache@example.com")
+        await cache.aset("cache@example.com", new_user("after"), token)
+        assert (await cache.aget("cache@example.com"))[0]["name"] == "after"
+
+    asyncio.run(run())
+
+
+def test_refill_is_dropped_after_invalidate_in_another_worker():
+    async def run():
+        server = fakeredis.FakeServer()
+        reader, writer = new_cache(server), new_cache(server)
+        _, token = await reader.aget("cache@example.com")
+        writer.invalidate("cache@example.com") # 다른 워커 (동기 경로)
+        await reader.aset("cache@example.com", new_user("before"), token)
+        assert (await new_cache(server).aget("cache@example.com"))[0] is None
+        assert (await reader.aget("cache@example.com"))[0] is None
+
+    asyncio.run(run())
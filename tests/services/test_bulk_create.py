@@ -0,0 +1,65 @@
+# certgo-backend/tests/services/test_bulk_create.py
+"""
+콘텐츠 일괄 생성의 제약 위반 처리 테스트. (DB 대신 INSERT에서 IntegrityError를 내는 세션)
+
+- source_url UNIQUE 제약 위반만 DuplicateSourceUrlError(409)로 바꾸는지 (psycopg2 diag, asyncpg 원래 예외 모두)
+- 다른 제약 위반(외래 키 등)은 IntegrityError를 그대로 올리는지, 어느 경우든 롤백하는지
+"""
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.services import learning_content_service
+
+
+class AsyncpgError(Exception):
+    def __init__(self, constraint_name):
+        super().__init__(constraint_name)
+        self.constraint_name = constraint_name
+
+
+def psycopg2_error(constraint_name) -> IntegrityError:
+    return IntegrityError("INSERT", {}, SimpleNamespace(diag=SimpleNamespace(constraint_name=constraint_name)))
+
+
+def asyncpg_error(constraint_name) -> IntegrityError:
+    # SQLAlchemy asyncpg 어댑터는 원래 예외를 __cause__로 감싼 DBAPI 예외를 orig로 둠
+    orig = Exception("adapted")
+    orig.__cause__ = AsyncpgError(constraint_name)
+    return IntegrityError("INSERT", {}, orig)
+
+
+class FailingSession:
+    def __init__(self, error: IntegrityError):
+        self.error = error
+        self.rolled_back = False
+
+    async def execute(self, statement, *args):
+        raise self.error
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+def create(db):
+    content = {"certificate_id": uuid.uuid4(), "title": "t", "source_url": "https://example.com/a", "type": "web"}
+    return asyncio.run(learning_content_service.create_learning_contents_bulk_async(db, [content]))
+
+
+@pytest.mark.parametrize("make_error", [psycopg2_error, asyncpg_error])
+def test_duplicate_source_url_is_reported_as_conflict(make_error):
+    db = FailingSession(make_error(learning_content_service.SOURCE_URL_CONSTRAINT))
+    with pytest.raises(learning_content_service.DuplicateSourceUrlError):
+        create(db)
+    assert db.rolled_back
+
+
+@pytest.mark.parametrize("make_error", [psycopg2_error, asyncpg_error])
+def test_other_constraint_violation_is_not_a_conflict(make_error):
+    db = FailingSession(make_error("learningcontent_certificate_id_fkey"))
+    with pytest.raises(IntegrityError):
+        create(db)
+    assert db.rolled_back
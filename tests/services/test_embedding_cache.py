@@ -0,0 +1,70 @@
+# certgo-backend/tests/services/test_embedding_cache.py
+
+import uuid
+
+import fakeredis
+import pytest
+from qdrant_client import QdrantClient
+
+from app.services.ai_integration_service import (
+    CachedEmbeddingProvider,
+    HashingEmbeddingProvider,
+    embed_and_upsert,
+    ensure_collection,
+    shared_collection_name,
+)
+from app.services.embedding_cache import EmbeddingCache, cache_key
+from scripts.bench_chunker import SENTENCES
+
+SECTIONS = 300
+
+
+class CountingProvider(HashingEmbeddingProvider):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self.texts = 0
+
+    def embed(self, texts):
+        self.calls += 1
+        self.texts += len(texts)
+        return super().embed(texts)
+
+
+def section_texts() -> list:
+    # 섹션마다 고유한 텍스트 (재처리 시 같은 텍스트의 섹션이 새 id로 다시 만들어짐)
+    return [f"[{i}] {SENTENCES[i % len(SENTENCES)]} {SENTENCES[(i * 7) % len(SENTENCES)]}" for i in range(SECTIONS)]
+
+
+def run_once(provider, client, collection_name, texts) -> int:
+    content_id = uuid.uuid4()
+    sections = ((uuid.uuid4(), text, i) for i, text in enumerate(texts))
+    return sum(len(ids) for ids in embed_and_upsert(sections, content_id, collection_name, provider, client))
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_reprocessing_makes_zero_provider_calls(shared):
+    texts = section_texts()
+    inner = CountingProvider()
+    cache = EmbeddingCache(max_entries=SECTIONS * 2, ttl_seconds=600, redis_url="redis://unused" if shared else None)
+    if shared:
+        cache._redis = fakeredis.FakeRedis()
+    provider = CachedEmbeddingProvider(inner, cache)
+    client = QdrantClient(location=":memory:")
+    collection_name = shared_collection_name(provider)
+    ensure_collection(client, collection_name, provider.dimension, payload_indexes=False)
+
+    assert run_once(provider, client, collection_name, texts) == SECTIONS
+    assert inner.texts == SECTIONS
+    if shared:
+        cache._local.clear() # 다른 워커에서 처리하는 상황: Redis 계층만으로 적중해야 함
+    inner.calls = inner.texts = 0
+    assert run_once(provider, client, collection_name, texts) == SECTIONS
+    assert inner.calls == 0
+    assert cache.stats()["redis_hits" if shared else "local_hits"] == SECTIONS
+
+
+def test_cache_key_normalizes_whitespace_and_unicode():
+    assert cache_key("m", "정보처리기사  필기\n") == cache_key("m", "정보처리기사 필기")
+    assert cache_key("m", "\u1100\u1161") == cache_key("m", "가") # NFD -> NFC
+    assert cache_key("m", "a") != cache_key("other-model", "a")
@@ -0,0 +1,95 @@
+# certgo-backend/tests/services/test_learning_content_queries.py
+
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session, undefer
+
+from app.database import models
+from app.services import learning_content_service
+
+CERTIFICATE_ID = uuid.uuid4()
+
+
+class _Stop(Exception):
+    pass
+
+
+def compiled_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class RecordingAsyncSession:
+    """실행된 문장만 기록하고 빈 결과를 돌려주는 AsyncSession 대용 (DB 불필요)"""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement, *args, **kwargs):
+        self.statements.append(statement)
+        return self
+
+    def scalars(self):
+        return self
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return []
+
+    def first(self):
+        return None
+
+
+@pytest.mark.parametrize("list_async", [
+    lambda db: learning_content_service.get_all_learning_contents_async(db),
+    lambda db: learning_content_service.get_all_learning_contents_page_async(db),
+    lambda db: learning_content_service.get_learning_contents_by_certificate_async(db, CERTIFICATE_ID),
+    lambda db: learning_content_service.get_learning_contents_by_certificate_page_async(db, CERTIFICATE_ID),
+])
+def test_async_list_queries_skip_raw_text(list_async):
+    db = RecordingAsyncSession()
+    asyncio.run(list_async(db))
+    assert len(db.statements) == 1
+    sql = compiled_sql(db.statements[0])
+    assert "learningcontent.title" in sql
+    assert "raw_text_content" not in sql
+
+
+@pytest.mark.parametrize("list_sync", [
+    lambda db: learning_content_service.get_all_learning_contents(db),
+    lambda db: learning_content_service.get_learning_contents_by_certificate(db, CERTIFICATE_ID),
+])
+def test_sync_list_queries_skip_raw_text(list_sync):
+    db = Session()
+    statements = []
+
+    @event.listens_for(db, "do_orm_execute")
+    def record(orm_execute_state):
+        statements.append(orm_execute_state.statement)
+        raise _Stop()
+
+    with pytest.raises(_Stop):
+        list_sync(db)
+    sql = compiled_sql(statements[0])
+    assert "learningcontent.title" in sql
+    assert "raw_text_content" not in sql
+
+
+def test_undeferred_select_includes_raw_text():
+    # 위 검사가 의미 있는지 확인: 컬럼을 명시적으로 로드하면 SELECT에 포함됨
+    stmt = select(models.LearningContent).options(undefer(models.LearningContent.raw_text_content))
+    assert "raw_text_content" in compiled_sql(stmt)
+
+
+def test_section_at_breaks_start_seconds_ties_by_order_index():
+    db = RecordingAsyncSession()
+    assert asyncio.run(learning_content_service.get_section_at_async(db, uuid.uuid4(), 90)) is None
+    sql = compiled_sql(db.statements[0])
+    assert "ORDER BY contentsections.start_seconds DESC, contentsections.order_index DESC" in sql
+    index = next(i for i in models.ContentSection.__table__.indexes if i.name == "ix_contentsections_content_id_start_seconds_order_index")
+    assert [c.name for c in index.columns] == ["content_id", "start_seconds", "order_index"]
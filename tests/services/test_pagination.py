@@ -0,0 +1,36 @@
+# certgo-backend/tests/services/test_pagination.py
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.services.certificate_service import CERTIFICATE_SORT
+from app.services.learning_content_service import CONTENT_SORT
+from app.services.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    values = [datetime(2024, 5, 1, tzinfo=timezone.utc), uuid.uuid4()]
+    assert decode_cursor(encode_cursor(values), CONTENT_SORT) == values
+    values = ["정보처리기사", uuid.uuid4()]
+    assert decode_cursor(encode_cursor(values), CERTIFICATE_SORT) == values
+
+
+@pytest.mark.parametrize("columns, payload", [
+    (CERTIFICATE_SORT, [123, str(uuid.uuid4())]), # 문자열 컬럼에 숫자
+    (CERTIFICATE_SORT, [{"a": 1}, str(uuid.uuid4())]), # 문자열 컬럼에 객체
+    (CERTIFICATE_SORT, [None, str(uuid.uuid4())]),
+    (CERTIFICATE_SORT, ["name", 42]), # UUID 컬럼에 숫자
+    (CONTENT_SORT, [1714521600, str(uuid.uuid4())]), # datetime 컬럼에 숫자
+    (CONTENT_SORT, ["not a date", str(uuid.uuid4())]),
+    (CONTENT_SORT, [datetime.now(timezone.utc).isoformat()]), # 값 개수 불일치
+])
+def test_cursor_values_must_match_sort_columns(columns, payload):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor(payload), columns)
+
+
+def test_garbage_cursor():
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("%%%not-base64", CERTIFICATE_SORT)
@@ -0,0 +1,77 @@
+# certgo-backend/tests/services/test_query_context.py
+"""
+AI 튜터 컨텍스트 조립이 콘텐츠 전체 outline 대신 검색된 섹션과 그 앞/뒤 섹션만 읽는지 확인합니다.
+(SQLite 메모리 DB에 조회에 필요한 contentsections 열만 만들어 실행)
+"""
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, Text, create_engine, event
+from sqlalchemy.orm import Session
+
+from app.database import models
+from app.services import ai_integration_service
+from app.services.ai_integration_service import section_neighborhood_query
+
+SECTIONS = 50
+ORDER_STEP = 1024 # order_index 간격 (중간 삽입용)
+
+
+@pytest.fixture
+def content():
+    columns = models.ContentSection.__table__.c
+    metadata = MetaData()
+    table = Table(
+        "contentsections", metadata,
+        Column("id", columns.id.type, primary_key=True), Column("content_id", columns.content_id.type),
+        Column("order_index", Integer), Column("text_hash", String), Column("token_count", Integer), Column("section_text", Text),
+    )
+    engine = create_engine("sqlite://")
+    event.listen(engine, "connect", lambda conn, _: conn.create_function("char_length", 1, len))
+    metadata.create_all(engine)
+    content_id = uuid.uuid4()
+    ids = [uuid.uuid4() for _ in range(SECTIONS)]
+    with engine.begin() as conn:
+        conn.execute(table.insert(), [
+            {"id": section_id, "content_id": content_id, "order_index": i * ORDER_STEP, "text_hash": f"h{i}",
+             "token_count": 10, "section_text": f"section {i}"}
+            for i, section_id in enumerate(ids)
+        ])
+        conn.execute(table.insert(), [{"id": uuid.uuid4(), "content_id": uuid.uuid4(), "order_index": 0, "text_hash": "x",
+                                       "token_count": 10, "section_text": "other content"}])
+    return SimpleNamespace(id=content_id, sections=ids, session=Session(engine))
+
+
+def test_neighborhood_loads_ranked_sections_and_neighbors(content):
+    ranked = [content.sections[10], content.sections[11], content.sections[30], content.sections[0]]
+    rows = content.session.execute(section_neighborhood_query(content.id, ranked)).all()
+    assert [row.id for row in rows] == [content.sections[i] for i in (0, 1, 9, 10, 11, 12, 29, 30, 31)]
+    assert [row.position for row in rows] == [1, 2, 10, 11, 12, 13, 30, 31, 32]
+
+
+def test_query_context_uses_content_positions(content, monkeypatch):
+    ranked = [(content.sections[5], 1.0), (content.sections[20], 0.9)]
+    statements = []
+
+    async def rank(db, query, limit, **kwargs):
+        return ranked
+
+    async def texts(db, section_ids):
+        return {section_id: {"id": section_id, "section_text": "text"} for section_id in section_ids}
+
+    class Recording:
+        async def execute(self, statement):
+            statements.append(statement)
+            return content.session.execute(statement)
+
+    monkeypatch.setattr(ai_integration_service, "rank_sections_async", rank)
+    monkeypatch.setattr(ai_integration_service.learning_content_service, "get_sections_by_ids_async", texts)
+    assembled = []
+    monkeypatch.setattr(ai_integration_service, "assemble_context",
+                        lambda selected, section_texts: assembled.extend(selected) or ai_integration_service.PromptContext([], 0))
+    asyncio.run(ai_integration_service.build_query_context_async(Recording(), content.id, "질문", 1000))
+
+    assert len(statements) == 1
+    assert [position for position, _ in assembled] == [5, 6, 7, 20, 21, 22]
@@ -0,0 +1,81 @@
+# certgo-backend/tests/services/test_quiz_submit.py
+"""
+퀴즈 시도 제출 검증 테스트. (DB 대신 정해진 결과를 돌려주는 세션)
+
+- 존재하지 않는 certificate_id는 INSERT 전에 UnknownCertificateError (외래 키 위반 500 대신 404)
+- 존재하지 않는 quiz_id는 UnknownQuizError, 어느 경우든 아무것도 저장하지 않음
+"""
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.sql.dml import Insert
+
+from app.services import quiz_service
+
+QUIZ_ID = uuid.uuid4()
+
+
+class ScriptedSession:
+    """exists 조회에는 certificate_exists, 정답 조회에는 answers를 돌려주고 실행된 INSERT를 기록"""
+
+    def __init__(self, certificate_exists: bool, answers: dict):
+        self.certificate_exists = certificate_exists
+        self.answers = answers
+        self.inserts = []
+        self.rolled_back = False
+
+    async def execute(self, statement, *args):
+        if isinstance(statement, Insert):
+            self.inserts.append(statement)
+            return None
+        if "EXISTS" in str(statement):
+            return ScriptedResult(scalar=self.certificate_exists)
+        return ScriptedResult(rows=[type("Row", (), {"id": quiz_id, "correct_answer_id": answer}) for quiz_id, answer in self.answers.items()])
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+class ScriptedResult:
+    def __init__(self, scalar=None, rows=()):
+        self._scalar = scalar
+        self._rows = rows
+
+    def scalar(self):
+        return self._scalar
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+def submit(db, certificate_id=None, quiz_id=QUIZ_ID) -> dict:
+    answers = [{"quiz_id": quiz_id, "user_selected_option_id": "A", "bookmarked": False}]
+    return asyncio.run(quiz_service.submit_quiz_attempt_async(
+        db, uuid.uuid4(), "quick", datetime.now(timezone.utc), answers, certificate_id=certificate_id
+    ))
+
+
+def test_unknown_certificate_is_rejected_before_insert():
+    db = ScriptedSession(certificate_exists=False, answers={QUIZ_ID: "A"})
+    with pytest.raises(quiz_service.UnknownCertificateError):
+        submit(db, certificate_id=uuid.uuid4())
+    assert db.inserts == [] and db.rolled_back
+
+
+def test_unknown_quiz_is_rejected_before_insert():
+    db = ScriptedSession(certificate_exists=True, answers={})
+    with pytest.raises(quiz_service.UnknownQuizError):
+        submit(db, certificate_id=uuid.uuid4())
+    assert db.inserts == [] and db.rolled_back
+
+
+def test_valid_attempt_is_graded_and_saved():
+    db = ScriptedSession(certificate_exists=True, answers={QUIZ_ID: "A"})
+    result = submit(db, certificate_id=uuid.uuid4())
+    assert result["correct_count"] == 1 and result["score"] == 100
+    assert len(db.inserts) == 2
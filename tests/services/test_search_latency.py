@@ -0,0 +1,90 @@
+# certgo-backend/tests/services/test_search_latency.py
+
+import asyncio
+import time
+import uuid
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client import models as qdrant_models
+
+from app.services.ai_integration_service import (
+    SECTION_PAYLOAD_INDEXES,
+    HashingEmbeddingProvider,
+    search_sections_async,
+    section_payload,
+    shared_collection_name,
+)
+from scripts.bench_chunker import SENTENCES
+
+SECTIONS = 500 # 프로세스 내 Qdrant(":memory:")는 필터/거리 계산을 Python으로 전수 처리하므로 작게 유지
+QUERIES = 100
+BUDGET_MS = 50.0 # 질의 임베딩 + 필터 검색 + hydrate의 p95 지연 예산
+
+
+class HydratingSession:
+    """get_sections_by_ids_async의 IN 쿼리에 메모리의 섹션 행으로 응답하는 AsyncSession 대용 (Postgres 불필요)"""
+
+    def __init__(self, rows: dict):
+        self.rows = rows
+        self.statements = 0
+
+    async def execute(self, statement, *args, **kwargs):
+        self.statements += 1
+        section_ids = statement.whereclause.right.value # ContentSection.id.in_(section_ids)
+        self._result = [self.rows[section_id] for section_id in section_ids if section_id in self.rows]
+        return self
+
+    def mappings(self):
+        return iter(self._result)
+
+
+async def seed(client: AsyncQdrantClient, provider, certificate_id, content_id) -> dict:
+    collection_name = shared_collection_name(provider)
+    await client.create_collection(
+        collection_name,
+        vectors_config=qdrant_models.VectorParams(size=provider.dimension, distance=qdrant_models.Distance.COSINE),
+    )
+    for field_name, field_schema in SECTION_PAYLOAD_INDEXES.items():
+        await client.create_payload_index(collection_name, field_name=field_name, field_schema=field_schema)
+    rows = {}
+    for i in range(SECTIONS):
+        section_id = uuid.uuid4()
+        rows[section_id] = {
+            "id": section_id, "content_id": content_id, "order_index": i,
+            "section_text": f"{SENTENCES[i % len(SENTENCES)]} {SENTENCES[(i * 3) % len(SENTENCES)]} #{i}",
+        }
+    items = list(rows.values())
+    for i in range(0, len(items), 256):
+        batch = items[i:i + 256]
+        vectors = provider.embed([row["section_text"] for row in batch])
+        await client.upsert(collection_name, points=[
+            qdrant_models.PointStruct(id=str(row["id"]), vector=vector, payload=section_payload(content_id, certificate_id, row["order_index"]))
+            for row, vector in zip(batch, vectors)
+        ])
+    return rows
+
+
+def test_vector_search_p95_within_budget():
+    async def run():
+        provider = HashingEmbeddingProvider()
+        certificate_id, content_id = uuid.uuid4(), uuid.uuid4()
+        client = AsyncQdrantClient(location=":memory:")
+        try:
+            db = HydratingSession(await seed(client, provider, certificate_id, content_id))
+            latencies = []
+            for i in range(QUERIES):
+                started = time.perf_counter()
+                results = await search_sections_async(
+                    db, SENTENCES[i % len(SENTENCES)], limit=10, certificate_id=certificate_id,
+                    mode="vector", provider=provider, client=client,
+                )
+                latencies.append((time.perf_counter() - started) * 1000)
+                assert results and all(result["content_id"] == content_id for result in results)
+            return db.statements, sorted(latencies)
+        finally:
+            await client.close()
+
+    statements, latencies = asyncio.run(run())
+    assert statements == QUERIES # 검색마다 hydrate IN 쿼리 한 번
+    p95 = latencies[int(0.95 * (len(latencies) - 1))]
+    assert p95 <= BUDGET_MS, f"search p95 {p95:.1f}ms over {BUDGET_MS}ms budget"
@@ -0,0 +1,97 @@
+# certgo-backend/tests/services/test_section_sync.py
+"""
+증분 재처리(content_service.sync_sections) 테스트.
+(SQLite 메모리 DB에 동기화에 필요한 learningcontent/contentsections 열만 만들어 실행)
+
+- 첫 섹션 앞에 텍스트가 추가되어도 order_index가 0 이상이고 순서가 유지되며, 기존 섹션은 그대로 남는지
+- 2차 분할 결과가 1차와 다르면(동기화 중 raw_text_content 변경) 아무것도 반영하지 않고 RawTextChangedError를 올리는지
+"""
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, Text, create_engine, event, select, update
+from sqlalchemy.orm import Session
+
+from app.database import models
+from app.services import content_service
+
+TARGET_CHARS = 40
+
+
+def sentences(*names) -> str:
+    return " ".join(f"{name} 문장은 섹션 하나를 채울 만큼 충분히 깁니다." for name in names)
+
+
+@pytest.fixture
+def content():
+    sections = models.ContentSection.__table__.c
+    metadata = MetaData()
+    contents = Table("learningcontent", metadata, Column("id", models.LearningContent.__table__.c.id.type, primary_key=True),
+                     Column("raw_text_content", Text))
+    Table(
+        "contentsections", metadata,
+        Column("id", sections.id.type, primary_key=True), Column("content_id", sections.content_id.type),
+        Column("section_title", String), Column("section_text", Text), Column("start_timestamp", String),
+        Column("end_timestamp", String), Column("start_seconds", Integer), Column("end_seconds", Integer),
+        Column("order_index", Integer), Column("text_hash", String), Column("token_count", Integer),
+        Column("qdrant_point_id", sections.qdrant_point_id.type),
+    )
+    engine = create_engine("sqlite://")
+    event.listen(engine, "connect", lambda conn, _: conn.create_function("uuid_generate_v4", 0, lambda: uuid.uuid4().hex))
+    metadata.create_all(engine)
+    content_id = uuid.uuid4()
+    db = Session(engine)
+    db.execute(contents.insert().values(id=content_id, raw_text_content=sentences("둘째", "셋째", "넷째")))
+    db.commit()
+    content_service.materialize_sections(db, content_id, TARGET_CHARS, 0)
+    return SimpleNamespace(id=content_id, db=db, table=contents)
+
+
+def set_raw_text(content, text: str):
+    content.db.execute(update(content.table).where(content.table.c.id == content.id).values(raw_text_content=text))
+    content.db.commit()
+
+
+def section_rows(content) -> list:
+    CS = models.ContentSection
+    return content.db.execute(select(CS.id, CS.order_index, CS.section_text).where(CS.content_id == content.id).order_by(CS.order_index)).all()
+
+
+def test_insert_before_first_section_keeps_order_non_negative(content):
+    before = section_rows(content)
+    assert before[0].order_index == 0
+    set_raw_text(content, sentences("새 첫째", "둘째", "셋째", "넷째"))
+    result = content_service.sync_sections(content.db, content.id, TARGET_CHARS, 0)
+
+    after = section_rows(content)
+    assert result.inserted == 1 and result.kept == len(before) and result.deleted == 0
+    assert result.renumbered # 첫 섹션이 0이라 앞에 빈 번호가 없음
+    assert all(row.order_index >= 0 for row in after)
+    assert after[0].section_text.startswith("새 첫째")
+    assert [row.id for row in after[1:]] == [row.id for row in before]
+
+
+def test_text_change_between_passes_is_rejected(content, monkeypatch):
+    before = section_rows(content)
+    set_raw_text(content, sentences("둘째", "셋째", "새 넷째"))
+    reads = []
+    iter_raw_text = content_service.iter_raw_text
+
+    def changing_iter_raw_text(db, content_id, chunk_chars=None):
+        reads.append(1)
+        if len(reads) == 2: # 2차 분할 직전에 다른 트랜잭션이 텍스트를 바꾼 상황
+            yield sentences("다른", "셋째", "새 넷째")
+            return
+        yield from iter_raw_text(db, content_id, chunk_chars)
+
+    monkeypatch.setattr(content_service, "iter_raw_text", changing_iter_raw_text)
+    with pytest.raises(content_service.RawTextChangedError):
+        content_service.sync_sections(content.db, content.id, TARGET_CHARS, 0)
+    content.db.rollback()
+    assert section_rows(content) == before
+
+
+def test_spread_never_goes_below_zero():
+    assert content_service._spread(None, 0, 1) is None # 첫 섹션이 0이면 전체 번호 재부여
+    assert content_service._spread(None, 3 * content_service.ORDER_INDEX_STEP, 2) == [1023, 2047]
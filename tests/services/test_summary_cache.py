@@ -0,0 +1,99 @@
+# certgo-backend/tests/services/test_summary_cache.py
+"""
+AI 요약/튜터 답변 캐시 테스트. (Redis는 fakeredis, LLM 생성은 가짜 함수)
+
+- 요약 캐시 키가 범위에 든 섹션(id, text_hash)에 따라 바뀌어, 재처리로 섹션이 바뀌면 이전 요약을 재사용하지 않는지
+- 범위의 섹션 수(order_index 폭이 아님)로 SUMMARY_MAX_SECTIONS를 확인하는지
+- 튜터 답변 생성이 실패하면 사용 한도 환불(on_failure)을 호출하는지
+"""
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fakeredis import aioredis as fake_aioredis
+
+from app.core.config import settings
+from app.services import summary_service, tutor_service
+from app.services.result_cache import ResultCache
+
+CONTENT_ID = uuid.uuid4()
+ORDER_STEP = 1024
+
+
+def outline(count: int, version: str = "v1") -> list:
+    return [SimpleNamespace(id=uuid.UUID(int=i + 1), order_index=i * ORDER_STEP, text_hash=f"{version}-{i}", token_count=10)
+            for i in range(count)]
+
+
+@pytest.fixture
+def summaries(monkeypatch):
+    cache = ResultCache(ttl_seconds=600, max_entries=100, lock_seconds=30, wait_seconds=5, redis_url="redis://unused")
+    cache.set_redis(fake_aioredis.FakeRedis())
+    generated = []
+
+    async def generate(rows, provider):
+        generated.append([row.text_hash for row in rows])
+        return f"summary {len(generated)}"
+
+    monkeypatch.setattr(summary_service, "result_cache", cache)
+    monkeypatch.setattr(summary_service, "generate_section_summary_async", generate)
+    return generated
+
+
+def summarize(rows) -> str:
+    end = rows[-1].order_index if rows else 0
+    return asyncio.run(summary_service.get_section_summary_async(CONTENT_ID, 0, end, rows)).text
+
+
+def test_rewritten_sections_miss_previous_summary(summaries):
+    async def run():
+        # fakeredis 비동기 클라이언트는 처음 사용한 이벤트 루프에 묶이므로 한 루프에서 요청
+        return [(await summary_service.get_section_summary_async(CONTENT_ID, 0, 2 * ORDER_STEP, rows)).text
+                for rows in (outline(3), outline(3), outline(3, version="v2"))] # 마지막: 같은 범위, 바뀐 섹션 내용
+
+    assert asyncio.run(run()) == ["summary 1", "summary 1", "summary 2"]
+    assert len(summaries) == 2
+
+
+def test_range_is_limited_by_section_count(summaries):
+    # order_index 폭은 SUMMARY_MAX_SECTIONS보다 훨씬 넓지만 섹션 수는 한도 이내
+    rows = outline(settings.SUMMARY_MAX_SECTIONS)
+    assert rows[-1].order_index + 1 > settings.SUMMARY_MAX_SECTIONS
+    assert summarize(rows) == "summary 1"
+    with pytest.raises(ValueError):
+        summarize(outline(settings.SUMMARY_MAX_SECTIONS + 1))
+    with pytest.raises(LookupError):
+        summarize([])
+
+
+def test_outline_query_reads_one_row_past_the_limit():
+    statement = summary_service.section_summary_outline_query(CONTENT_ID, 0, 10 ** 9)
+    assert statement._limit == settings.SUMMARY_MAX_SECTIONS + 1
+
+
+class FailingLLM:
+    async def stream(self, messages, max_tokens=None):
+        yield "부분"
+        raise RuntimeError("llm unavailable")
+
+
+async def collect(stream) -> list:
+    return [event async for event in stream]
+
+
+def test_tutor_failure_refunds_quota():
+    refunds, saved = [], []
+
+    async def refund():
+        refunds.append(1)
+
+    async def save_turn(answer):
+        saved.append(answer)
+        return {"seq": 2, "message_text": answer}
+
+    events = asyncio.run(collect(tutor_service.tutor_event_stream(FailingLLM(), [], save_turn, on_failure=refund)))
+    assert events[-1].startswith("event: error") and refunds == [1] and saved == []
+
+    events = asyncio.run(collect(tutor_service.tutor_event_stream(FailingLLM(), [], save_turn, "캐시된 답변", refund)))
+    assert events[-1].startswith("event: done") and refunds == [1] and saved == ["캐시된 답변"]
@@ -0,0 +1,47 @@
+# certgo-backend/tests/services/test_vector_search.py
+"""
+vector_search_async의 컬렉션 존재 캐시(_existing_collections) 테스트. (프로세스 내 Qdrant ":memory:")
+
+- 존재를 확인한 컬렉션이 이후 삭제되면 캐시에서 빼고 빈 결과를 반환하며, 다시 생성되면 검색되는지
+"""
+import asyncio
+import uuid
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client import models as qdrant_models
+
+from app.services import ai_integration_service
+from app.services.ai_integration_service import HashingEmbeddingProvider, shared_collection_name, vector_search_async
+
+
+async def create_collection(client: AsyncQdrantClient, provider, section_id: uuid.UUID):
+    collection_name = shared_collection_name(provider)
+    await client.create_collection(
+        collection_name,
+        vectors_config=qdrant_models.VectorParams(size=provider.dimension, distance=qdrant_models.Distance.COSINE),
+    )
+    await client.upsert(collection_name, points=[
+        qdrant_models.PointStruct(id=str(section_id), vector=provider.embed(["개인정보 수집 동의"])[0], payload={})
+    ])
+
+
+def test_deleted_collection_is_dropped_from_cache():
+    provider = HashingEmbeddingProvider()
+    collection_name = shared_collection_name(provider)
+    section_id = uuid.uuid4()
+
+    async def run():
+        client = AsyncQdrantClient(":memory:")
+        await create_collection(client, provider, section_id)
+        first = await vector_search_async("개인정보", 5, provider=provider, client=client)
+        await client.delete_collection(collection_name) # 확인 이후 삭제 (캐시에는 남아 있음)
+        after_delete = await vector_search_async("개인정보", 5, provider=provider, client=client)
+        cached_after_delete = collection_name in ai_integration_service._existing_collections
+        await create_collection(client, provider, section_id)
+        recreated = await vector_search_async("개인정보", 5, provider=provider, client=client)
+        return first, after_delete, cached_after_delete, recreated
+
+    first, after_delete, cached_after_delete, recreated = asyncio.run(run())
+    assert [hit_id for hit_id, _ in first] == [section_id]
+    assert after_delete == [] and not cached_after_delete
+    assert [hit_id for hit_id, _ in recreated] == [section_id]
@@ -0,0 +1,24 @@
+# certgo-backend/tests/tasks/conftest.py
+
+import fakeredis
+import pytest
+
+from app.tasks.celery_worker import celery_app
+from app.tasks.task_lock import set_redis
+
+
+@pytest.fixture(scope="session", autouse=True)
+def memory_broker():
+    # Redis 없이 실행: 브로커/결과 백엔드를 프로세스 내 메모리로 교체 (라우팅/우선순위 설정은 그대로)
+    celery_app.conf.update(broker_url="memory://", result_backend="cache+memory://")
+    celery_app.loader.import_default_modules()
+    return celery_app
+
+
+@pytest.fixture(autouse=True)
+def fake_redis():
+    # 락/발행 중복 표시/진행 이벤트용 Redis (app.tasks.task_lock.get_redis)
+    client = fakeredis.FakeRedis()
+    set_redis(client)
+    yield client
+    set_redis(None)
@@ -0,0 +1,183 @@
+# certgo-backend/tests/tasks/test_duplicate_deliveries.py
+"""
+process_content_task 중복 전달 테스트. (Redis는 fakeredis, DB 대신 조건부 상태 전이를 흉내 내는 메모리 저장소)
+
+- outbox relay: 처리 전 메시지가 큐에 있는 콘텐츠는 다시 발행하지 않는지 (CONTENT_DISPATCH_KEY)
+- 동시 중복 전달: 정확히 한 번만 처리되고 나머지는 건너뛰는지 (콘텐츠 락)
+- 완료 후 재전달: 다시 처리하지 않는지 (조건부 상태 전이)
+- 처리 중 재처리 요청: 처리 중인 워커가 한 번 더 처리하는지
+- 워커 사망: 락 lease가 만료된 뒤 재전달된 태스크가 PROCESSING 상태를 이어받는지
+"""
+import threading
+import time
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from app.tasks import content_processing_tasks
+from app.tasks.celery_worker import celery_app
+from app.tasks.content_processing_tasks import CONTENT_DISPATCH_KEY, CONTENT_LOCK_KEY, process_content_task
+from app.tasks.outbox_tasks import publish_outbox_rows
+from app.tasks.routing import QUEUE_CONTENT
+from app.tasks.task_lock import LeaseLock, get_redis
+
+STAGE_DELAY = 0.3 # 처리 구간을 늘려 동시 전달이 실제로 겹치도록 함
+
+
+class ContentStates:
+    """learning_content_service의 조건부 UPDATE 상태 전이를 메모리에서 같은 규칙으로 수행"""
+
+    def __init__(self):
+        self.statuses = {}
+        self._lock = threading.Lock()
+
+    def _transition(self, content_id, allowed, status) -> bool:
+        with self._lock:
+            if content_id not in self.statuses or (allowed is not None and self.statuses[content_id] not in allowed):
+                return False
+            self.statuses[content_id] = status
+            return True
+
+    def mark_content_pending(self, db, content_id) -> bool:
+        return self._transition(content_id, None, "PENDING")
+
+    def claim_content_processing(self, db, content_id) -> bool:
+        return self._transition(content_id, ("PENDING", "PROCESSING"), "PROCESSING")
+
+    def finish_content_processing(self, db, content_id, status) -> bool:
+        return self._transition(content_id, ("PROCESSING",), status)
+
+
+class NullSession:
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def content(monkeypatch):
+    states = ContentStates()
+    service = content_processing_tasks.learning_content_service
+    for name in ("mark_content_pending", "claim_content_processing", "finish_content_processing"):
+        monkeypatch.setattr(service, name, getattr(states, name))
+    embeddings = []
+
+    def prepare(db, content_id, full_rebuild, lock):
+        time.sleep(STAGE_DELAY)
+        return {"section_count": 3, "summary": "3 sections"}
+
+    def embed(db, content_id, on_progress=None):
+        embeddings.append(content_id)
+        return 3
+
+    monkeypatch.setattr(content_processing_tasks, "SessionLocal", NullSession)
+    monkeypatch.setattr(content_processing_tasks, "_prepare", prepare)
+    monkeypatch.setattr(content_processing_tasks.ai_integration_service, "unembedded_section_ids", lambda db, cid: [uuid.uuid4()] * 3)
+    monkeypatch.setattr(content_processing_tasks.ai_integration_service, "embed_content_sections", embed)
+    monkeypatch.setattr(content_processing_tasks.summary_service, "section_summary_ranges", lambda db, cid: [])
+    content_id = uuid.uuid4()
+    states.statuses[content_id] = "PENDING"
+    return SimpleNamespace(id=content_id, states=states, embeddings=embeddings)
+
+
+def deliver(content_id) -> dict:
+    return process_content_task.apply(args=[str(content_id)]).get()
+
+
+def deliver_concurrently(content_id, workers: int) -> list:
+    barrier = threading.Barrier(workers)
+    results = [None] * workers
+
+    def run(i):
+        barrier.wait()
+        results[i] = deliver(content_id)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def test_concurrent_deliveries_process_once(content):
+    statuses = sorted(result["status"] for result in deliver_concurrently(content.id, 8))
+    assert statuses.count("completed") == 1, statuses
+    assert content.states.statuses[content.id] == "COMPLETED"
+    assert content.embeddings == [content.id]
+
+    # 완료 후 재전달
+    result = deliver(content.id)
+    assert (result["status"], result["reason"]) == ("skipped", "not_pending")
+    assert len(content.embeddings) == 1
+
+
+def test_update_while_processing_reruns_in_holder(content):
+    holder = {}
+    t = threading.Thread(target=lambda: holder.update(deliver(content.id)))
+    t.start()
+    while content.states.statuses[content.id] != "PROCESSING":
+        time.sleep(0.01)
+    content.states.mark_content_pending(None, content.id)
+    duplicate = deliver(content.id)
+    t.join()
+    assert (duplicate["status"], duplicate["reason"]) == ("skipped", "locked")
+    assert holder["status"] == "completed" and holder["runs"] == 2
+
+
+def test_redelivery_takes_over_after_lease_expiry(content):
+    # 워커 사망: 락을 잡고 PROCESSING으로 바꾼 뒤 release 없이 lease 연장만 멈춤
+    crashed = LeaseLock(CONTENT_LOCK_KEY.format(content.id), ttl_seconds=1)
+    assert crashed.acquire()
+    content.states.claim_content_processing(None, content.id)
+    crashed._stop.set() # 프로세스가 죽어 연장 스레드도 멈춘 상태
+    result = deliver(content.id)
+    assert (result["status"], result["reason"]) == ("skipped", "locked")
+    time.sleep(1.2)
+    assert deliver(content.id)["status"] == "completed"
+
+
+def drain(queue_name: str) -> list:
+    messages = []
+    with celery_app.connection_for_read() as conn:
+        queue = conn.SimpleQueue(queue_name)
+        while True:
+            try:
+                message = queue.get(block=False)
+            except queue.Empty:
+                break
+            messages.append(message.payload[1]["content_id"])
+            message.ack()
+        queue.close()
+    return messages
+
+
+def test_relay_skips_content_with_queued_message(content, monkeypatch):
+    drain(QUEUE_CONTENT)
+    cid = str(content.id)
+    row = lambda: SimpleNamespace(task_name="process_content_task", task_kwargs={"content_id": cid}, priority=None)
+
+    publish_outbox_rows([row(), row()]) # 같은 배치에 같은 콘텐츠 두 번
+    publish_outbox_rows([row()]) # 처리 전 메시지가 큐에 있는 동안 다시 요청
+    assert drain(QUEUE_CONTENT) == [cid]
+
+    # 워커가 처리를 시작하면 표시가 지워지고, 이후 요청은 새 메시지로 발행됨
+    assert deliver(content.id)["status"] == "completed"
+    assert get_redis().get(CONTENT_DISPATCH_KEY.format(cid)) is None
+    publish_outbox_rows([row()])
+    assert drain(QUEUE_CONTENT) == [cid]
+
+
+def test_failed_publish_releases_reservation(content, monkeypatch):
+    cid = str(content.id)
+
+    def broken_send_task(*args, **kwargs):
+        raise ConnectionError("broker unavailable")
+
+    monkeypatch.setattr(celery_app, "send_task", broken_send_task)
+    with pytest.raises(ConnectionError):
+        publish_outbox_rows([SimpleNamespace(task_name="process_content_task", task_kwargs={"content_id": cid}, priority=None)])
+    assert get_redis().get(CONTENT_DISPATCH_KEY.format(cid)) is None
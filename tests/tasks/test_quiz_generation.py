@@ -0,0 +1,92 @@
+# certgo-backend/tests/tasks/test_quiz_generation.py
+"""
+generate_quizzes_task 테스트. (LLM은 정해진 응답을 돌려주는 가짜, DB 저장은 기록만)
+
+- 응답(JSON)을 파싱해 형식이 맞는 문항만 저장하고, generated_count가 저장한 문항 수인지
+- 모든 LLM 호출이 같은 이벤트 루프에서 실행되는지
+- 저장할 문항이 없으면 실패로 보고하는지
+"""
+import asyncio
+import json
+import uuid
+
+import pytest
+
+from app.services import quiz_service
+from app.services.ai_integration_service import PromptContext
+from app.tasks import content_processing_tasks
+from app.tasks.content_processing_tasks import generate_quizzes_task
+
+VALID = json.dumps({"question": "개인정보 수집 요건은?", "options": ["동의", "고지", "위탁", "파기"], "answer": "a", "explanation": "제15조"},
+                   ensure_ascii=False)
+
+
+class ScriptedLLM:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.loops = []
+
+    async def complete(self, messages, max_tokens=None) -> str:
+        self.loops.append(asyncio.get_running_loop())
+        return self.responses.pop(0)
+
+
+class NullSession:
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def generation(monkeypatch):
+    saved = []
+
+    def save(db, content_id, difficulty, quizzes):
+        saved.extend(quizzes)
+        return [uuid.uuid4() for _ in quizzes]
+
+    monkeypatch.setattr(content_processing_tasks, "SessionLocal", NullSession)
+    monkeypatch.setattr(content_processing_tasks.ai_integration_service, "build_coverage_context",
+                        lambda db, content_id, budget: PromptContext(sections=[], tokens=0))
+    monkeypatch.setattr(content_processing_tasks.quiz_service, "save_generated_quizzes", save)
+
+    def run(responses):
+        provider = ScriptedLLM(responses)
+        monkeypatch.setattr(content_processing_tasks.ai_integration_service, "get_llm_provider", lambda: provider)
+        result = generate_quizzes_task.apply(args=[str(uuid.uuid4()), "normal", len(responses)]).get()
+        return result, provider
+    run.saved = saved
+    return run
+
+
+def test_saves_parsed_quizzes_and_reports_saved_count(generation):
+    result, provider = generation([VALID, "문제를 만들 수 없습니다.", f"```json\n{VALID}\n```"])
+    assert result["status"] == "completed"
+    assert result["generated_count"] == 2 and result["invalid_count"] == 1
+    assert [quiz["correct_answer_id"] for quiz in generation.saved] == ["A", "A"]
+    assert len(set(provider.loops)) == 1
+
+
+def test_fails_when_no_quiz_is_valid(generation):
+    result, _ = generation(["{}", "not json"])
+    assert result["status"] == "failed"
+    assert generation.saved == []
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    json.dumps({"question": "q", "options": ["a", "b", "c"], "answer": "A"}),
+    json.dumps({"question": "q", "options": ["a", "b", "c", "d"], "answer": "E"}),
+    json.dumps({"question": " ", "options": ["a", "b", "c", "d"], "answer": "A"}),
+    json.dumps(["a", "b"]),
+])
+def test_parse_rejects_malformed_quiz(text):
+    assert quiz_service.parse_generated_quiz(text) is None
+
+
+def test_parse_maps_options_to_ids():
+    quiz = quiz_service.parse_generated_quiz(VALID)
+    assert quiz["options_json"][1] == {"id": "B", "text": "고지"}
+    assert quiz["explanation_text"] == "제15조"
@@ -0,0 +1,78 @@
+# certgo-backend/tests/tasks/test_summary_prewarm.py
+"""
+콘텐츠 처리 chord의 요약 미리 생성 테스트. (브로커는 메모리, 요약 생성은 가짜 함수)
+
+- chord 헤더에 임베딩 묶음 태스크와 함께 요약 범위별 태스크가 들어가는지
+- 요약 태스크가 실패해도 chord를 실패시키지 않는지
+- 마무리 태스크가 요약 결과를 건너뛰고 임베딩 결과만 기록하는지
+- 요약 태스크들이 같은 이벤트 루프를 재사용하는지 (비동기 엔진/Redis 클라이언트가 루프에 묶임)
+"""
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+from app.core.config import settings
+from app.tasks import content_processing_tasks
+from app.tasks.content_processing_tasks import finalize_content_processing_task, summarize_section_group_task
+from app.tasks.event_loop import run_async
+from app.tasks.task_lock import LeaseLock
+
+
+def test_chord_header_includes_summary_groups(monkeypatch):
+    headers = []
+
+    def fake_chord(header):
+        headers.append(header)
+        return lambda callback: None
+
+    monkeypatch.setattr(content_processing_tasks, "chord", fake_chord)
+    content_id = uuid.uuid4()
+    lock = LeaseLock(content_processing_tasks.CONTENT_LOCK_KEY.format(content_id))
+    assert lock.acquire()
+    section_ids = [uuid.uuid4() for _ in range(settings.CONTENT_EMBED_GROUP_SIZE * 2 + 1)]
+    groups = content_processing_tasks._dispatch_chord(content_id, section_ids, [(0, 29), (30, 40)], lock, 1)
+
+    assert groups == 3
+    names = [signature.task for signature in headers[0]]
+    assert names == ["embed_section_group_task"] * 3 + ["summarize_section_group_task"] * 2
+    assert headers[0][-1].args == (str(content_id), 30, 40)
+
+
+def test_summary_failure_does_not_fail_chord(monkeypatch):
+    loops = []
+
+    async def summarize(content_id, start_index, end_index):
+        loops.append(asyncio.get_running_loop())
+        if start_index:
+            raise RuntimeError("llm unavailable")
+        return SimpleNamespace(cached=False)
+
+    monkeypatch.setattr(content_processing_tasks.summary_service, "get_section_summary_async", summarize)
+    content_id = str(uuid.uuid4())
+    assert summarize_section_group_task.apply(args=[content_id, 0, 29]).get() == {"start_index": 0, "end_index": 29, "cached": False}
+    assert summarize_section_group_task.apply(args=[content_id, 30, 40]).get() is None
+    assert loops[0] is loops[1]
+
+
+def test_finalize_records_only_embedding_groups(monkeypatch):
+    recorded = []
+    section_id = str(uuid.uuid4())
+
+    def record(db, content_id, section_ids):
+        recorded.extend(section_ids)
+        return len(section_ids)
+
+    monkeypatch.setattr(content_processing_tasks.ai_integration_service, "record_section_points", record)
+    monkeypatch.setattr(content_processing_tasks, "_finish_chord",
+                        lambda content_id, token, status, work: work(None, SimpleNamespace(check=lambda: None)))
+    result = finalize_content_processing_task([[section_id], {"start_index": 0, "end_index": 29, "cached": False}, None],
+                                              str(uuid.uuid4()), "token", 1)
+    assert recorded == [uuid.UUID(section_id)]
+    assert result["groups"] == 1
+
+
+def test_run_async_reuses_loop():
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    assert run_async(current_loop()) is run_async(current_loop())
@@ -0,0 +1,77 @@
+# certgo-backend/tests/tasks/test_task_routing.py
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from app.tasks.celery_worker import celery_app
+from app.tasks.routing import (
+    PRIORITY_DEFAULT, PRIORITY_HIGH, PRIORITY_STEPS, QUEUE_CONTENT, QUEUE_INTERACTIVE, QUEUE_MAINTENANCE, route_task,
+)
+
+EXPECTED_QUEUES = {
+    "generate_quizzes_task": QUEUE_INTERACTIVE,
+    "process_content_task": QUEUE_CONTENT,
+    "embed_section_group_task": QUEUE_CONTENT,
+    "summarize_section_group_task": QUEUE_CONTENT,
+    "finalize_content_processing_task": QUEUE_CONTENT,
+    "content_processing_failed_task": QUEUE_CONTENT,
+    "relay_outbox_task": QUEUE_MAINTENANCE,
+    "sweep_stale_pending_contents_task": QUEUE_MAINTENANCE,
+}
+
+
+def drain(queue_name: str) -> list:
+    # 큐에 쌓인 메시지의 (태스크 이름, priority) 목록
+    messages = []
+    with celery_app.connection_for_read() as conn:
+        queue = conn.SimpleQueue(queue_name)
+        while True:
+            try:
+                message = queue.get(block=False)
+            except queue.Empty:
+                break
+            messages.append((message.headers["task"], message.properties.get("priority")))
+            message.ack()
+        queue.close()
+    return messages
+
+
+@pytest.mark.parametrize("task_name, expected", EXPECTED_QUEUES.items())
+def test_task_routes(memory_broker, task_name, expected):
+    assert task_name in memory_broker.tasks
+    assert memory_broker.amqp.router.route({}, task_name)["queue"].name == expected
+
+
+def test_priority_policy():
+    assert route_task("process_content_task", premium=True) == {"queue": QUEUE_CONTENT, "priority": PRIORITY_HIGH}
+    assert route_task("process_content_task") == {"queue": QUEUE_CONTENT, "priority": PRIORITY_DEFAULT}
+    assert route_task("generate_quizzes_task", premium=True)["queue"] == QUEUE_INTERACTIVE
+    assert PRIORITY_HIGH < PRIORITY_DEFAULT # Redis 브로커는 작은 숫자가 먼저
+    assert PRIORITY_HIGH in PRIORITY_STEPS and PRIORITY_DEFAULT in PRIORITY_STEPS
+    options = celery_app.conf.broker_transport_options
+    assert options.get("priority_steps") == PRIORITY_STEPS and options.get("queue_order_strategy") == "priority"
+
+
+def test_published_messages_land_on_queue_with_priority(memory_broker):
+    from app.tasks.content_processing_tasks import generate_quizzes_task, process_content_task
+    from app.tasks.outbox_tasks import publish_outbox_rows
+
+    for queue_name in (QUEUE_CONTENT, QUEUE_INTERACTIVE):
+        drain(queue_name)
+
+    content_id = str(uuid.uuid4())
+    process_content_task.apply_async(args=[content_id, False], **route_task(process_content_task.name, premium=True))
+    process_content_task.apply_async(args=[content_id, False], **route_task(process_content_task.name))
+    generate_quizzes_task.apply_async(args=[content_id, "medium", 5], **route_task(generate_quizzes_task.name, premium=True))
+    publish_outbox_rows([ # relay는 콘텐츠당 처리 전 메시지를 하나만 발행하므로 서로 다른 콘텐츠로
+        SimpleNamespace(task_name="process_content_task", task_kwargs={"content_id": str(uuid.uuid4())}, priority=PRIORITY_HIGH),
+        SimpleNamespace(task_name="process_content_task", task_kwargs={"content_id": str(uuid.uuid4())}, priority=None),
+    ])
+
+    assert sorted(drain(QUEUE_CONTENT)) == sorted([
+        ("process_content_task", PRIORITY_HIGH), ("process_content_task", PRIORITY_DEFAULT),
+        ("process_content_task", PRIORITY_HIGH), ("process_content_task", PRIORITY_DEFAULT),
+    ])
+    assert drain(QUEUE_INTERACTIVE) == [("generate_quizzes_task", PRIORITY_HIGH)]